@@ -1,5 +1,14 @@
-"""Extracts destination names from json/airports.json
-and creates python file with code-to-name dictionary.
+"""Extracts reference data from json/cities.json and json/airports.json
+and creates lookup table files, which are looked up by wf.iata_converters:
+    city_code_to_name - city code to russian and english names
+    airport_to_city - airport code to city code, latitude and longitude of the airport
+    airport_to_name - airport code to russian and english names
+    country_to_city_codes - country code to codes of its cities
+    code_to_location - city or airport code to latitude, longitude and time zone,
+        city wins, if a city and an airport have the same code
+Every source file is read once, as a stream of entries, and all tables are built in one pass.
+Run from the project root, wf package should be importable,
+so either install it with `pip install -e .` or run: PYTHONPATH=. python json/extract.py
 
 https://support.travelpayouts.com/hc/ru/articles/203956163#11
 
@@ -38,31 +47,92 @@ json format examples:
 """
 
 import json
+import re
 
+import wf.iata_converters
 
-def create_code_to_name_dict(source_file):
-    """Creates code-to-name dictionary from airports.json file
-    in format {'code': ('russian_name', 'english_name')}
+# whitespace and commas between entries of JSON array
+SEPARATORS = re.compile(r'[\s,]*')
+
+
+def iter_entries(source_file, chunk_size=65536):
+    """Yields entries of JSON array from the file one by one,
+    reading the file by chunks of chunk_size characters instead of loading it whole.
     """
+    decoder = json.JSONDecoder()
 
     with open(source_file, 'r', encoding='utf-8') as json_file:
-        entries = json.loads(json_file.read())
-        result_dict = {}
+        buffer = json_file.read(chunk_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"{source_file} should contain JSON array.")
+        position = 1
+
+        while True:
+            position = SEPARATORS.match(buffer, position).end()
+            if buffer.startswith(']', position):
+                return
+
+            try:
+                entry, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                chunk = json_file.read(chunk_size)
+                if not chunk:
+                    raise
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+
+            yield entry
+
 
-        for entry in entries:
-            result_dict[entry['code']] = (entry['name'], entry['name_translations']['en'])
+def get_location(entry):
+    """Returns tuple of latitude, longitude and time zone of the entry, missing ones are None."""
+
+    coordinates = entry.get('coordinates') or {}
+    latitude = coordinates.get('lat')
+    longitude = coordinates.get('lon')
+
+    return (
+        None if latitude is None else repr(float(latitude)),
+        None if longitude is None else repr(float(longitude)),
+        entry.get('time_zone'),
+    )
+
+
+def create_tables(cities_file, airports_file):
+    """Creates lookup tables from cities.json and airports.json files,
+    returns dict of table name and dict of code and tuple of fields, see the module docstring.
+    """
+    tables = {
+        'city_code_to_name': {},
+        'airport_to_city': {},
+        'airport_to_name': {},
+        'country_to_city_codes': {},
+        'code_to_location': {},
+    }
+    country_city_codes = {}
 
-        return result_dict
+    for entry in iter_entries(airports_file):
+        location = get_location(entry)
+        tables['airport_to_city'][entry['code']] = (entry.get('city_code'),) + location[:2]
+        tables['airport_to_name'][entry['code']] = (
+            entry['name'], entry['name_translations'].get('en'))
+        tables['code_to_location'][entry['code']] = location
 
+    for entry in iter_entries(cities_file):
+        code = entry['code']
+        tables['city_code_to_name'][code] = (entry['name'], entry['name_translations']['en'])
+        tables['code_to_location'][code] = get_location(entry)
+        if entry.get('country_code'):
+            country_city_codes.setdefault(entry['country_code'], []).append(code)
 
-def write_dict_to_file(filename, dictionary):
-    """Creates a file and writes given dictionary to the file."""
+    for country_code, city_codes in country_city_codes.items():
+        tables['country_to_city_codes'][country_code] = (
+            wf.iata_converters.CODES_SEPARATOR.join(sorted(city_codes)),)
 
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write('CODE_TO_NAME = ')
-        f.write(str(dictionary))
+    return tables
 
 
 if __name__ == "__main__":
-    dictionary = create_code_to_name_dict('json/cities.json')
-    write_dict_to_file('iata_converters.py', dictionary)
+    for name, table in create_tables('json/cities.json', 'json/airports.json').items():
+        wf.iata_converters.write_code_table(wf.iata_converters.get_table_path(name), table)
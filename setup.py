@@ -13,6 +13,12 @@ setup(
     author="Rouslan Gaisin",
     author_email="rouslan.gaisin@gmail.com",
     packages=find_packages(),
+    # lookup tables generated by json/extract.py, see wf.iata_converters
+    package_data={"wf": ["data/*.bin"]},
+    extras_require={
+        # vectorized filtering of flights, see wf.batch
+        "numpy": ["numpy"],
+    },
     entry_points={
         "console_scripts": [
             "start-wf-parser = wf.app:run_parser_loop",
@@ -4,89 +4,96 @@
 Describes basic logic of cheap weekend flights search.
 """
 
-import threading
+import os
 import time
 
+from datetime import datetime
+
 import schedule
 
-import wf.db
 import wf.flights
+import wf.jobs
 import wf.notifications
+import wf.pipeline
+import wf.planner
 import wf.utils
 import wf.searches
+import wf.storage
+import wf.transport
 
 LOG = wf.utils.set_logger()
 
+# flights searching runs every FIND_FLIGHTS_EVERY_MINUTES minutes,
+# runs, which are longer than deadlines, are reported, see wf.jobs
+FIND_FLIGHTS_EVERY_MINUTES = int(os.environ.get('WF_FIND_FLIGHTS_EVERY_MINUTES', 60))
+FIND_FLIGHTS_DEADLINE = FIND_FLIGHTS_EVERY_MINUTES * 60  # seconds
+POST_NEW_FLIGHTS_DEADLINE = 10 * 60  # seconds
+
+# number of threads filtering and formatting fetched pages in find_flights()
+SEARCH_WORKERS = int(os.environ.get('WF_SEARCH_WORKERS', 4))
+
 
 def find_flights():
-    """Runs cheap flights searching."""
+    """Runs cheap flights searching.
+
+    Every unique page of latest flights is requested once, see wf.planner,
+    and is filtered, formatted and saved as soon as it is fetched, see wf.pipeline.
+    Failure of one search doesn't affect others.
+    Returns list of reports about searches, see wf.planner.create_report().
+    """
 
     try:
-        searches = wf.searches.get_all()
-
-        for search in searches:
-            if not search.get("is_active"):
-                continue
-
-            destinations = search["destinations"]
-            max_price = search["max_price"]
-            trip_type = search["trip_type"]
-
-            if trip_type == "weekends":
-                next_x_months = search["next_x_months"]
-                months = wf.utils.get_next_months(next_x_months)
-                date_pairs = wf.utils.get_date_pairs(on_weekends=True, next_x_months=next_x_months)
-
-            elif trip_type == "vacation":
-                departure_date = search["departure_date"]
-                arrival_date = search["arrival_date"]
-                months = wf.utils.get_months_from_dates(departure_date, arrival_date)
-                date_pairs = wf.utils.get_date_pairs(
-                    departure_date=departure_date,
-                    arrival_date=arrival_date,
-                    trip_min_length=int(search["trip_min_length"]),
-                    trip_max_length=int(search["trip_max_length"]),
-                )
-
-            latest_flights = wf.flights.get_latest(destinations, months)
-            filtered_flights = wf.flights.filter_flights(
-                latest_flights,
-                date_pairs,
-                max_price
-            )
-            formatted_flights = wf.flights.format_flights(filtered_flights)
-            wf.flights.save_unique_flights(search["_id"], formatted_flights)
+        wf.storage.get_backend().expire_flights()
+        active_searches = wf.searches.get_active()
+
+        plan = wf.planner.make_plan(active_searches)
+        pages = wf.planner.schedule(plan, budget=wf.flights.TRAVELPAYOUTS_LIMITER.remaining(),
+                                    retries=wf.transport.MAX_RETRIES)
+
+        pipeline = wf.pipeline.Pipeline(plan, now=datetime.now())
+        reports = wf.planner.get_failure_reports(plan)
+        reports += pipeline.run(pages, workers=SEARCH_WORKERS)
+
+        wf.planner.log_reports(reports)
+        return reports
 
     except Exception as e:
         LOG.exception(f"While flights searching exception happened: {e}")
+        return []
 
 
 def post_new_flights():
     """Posts new flights."""
 
-    searches = wf.searches.get_all()
+    searches = wf.searches.get_active()
 
     for search in searches:
-        if not search.get("is_active"):
-            continue
         new_flights = wf.flights.get_new_flights(search["_id"])
         wf.notifications.post_bulk_to_channel(new_flights, search["name"])
 
 
-def run_threaded(job_func):
-    job_thread = threading.Thread(target=job_func)
-    job_thread.start()
-
-
 def run_parser_loop():
     """Run infinite loop for checking events periodically.
     Documentation for "Schedule": http://schedule.readthedocs.io/.
     """
 
-    schedule.every().hour.do(run_threaded, find_flights)
-    schedule.every().day.at("08:00").do(run_threaded, post_new_flights)
-    schedule.every().day.at("16:00").do(run_threaded, post_new_flights)
-    schedule.every().day.at("21:30").do(run_threaded, post_new_flights)
+    # overlapping searching cycles would request the same flights twice, so they are skipped;
+    # new flights are claimed atomically, so triggers of posting are merged into one run
+    job_runner = wf.jobs.JobRunner(max_workers=2)
+    job_runner.add("find_flights", find_flights,
+                   policy="skip", deadline=FIND_FLIGHTS_DEADLINE)
+    job_runner.add("post_new_flights", post_new_flights,
+                   policy="coalesce", deadline=POST_NEW_FLIGHTS_DEADLINE)
+
+    schedule.every(FIND_FLIGHTS_EVERY_MINUTES).minutes.do(job_runner.submit, "find_flights")
+    schedule.every().day.at("08:00").do(job_runner.submit, "post_new_flights")
+    schedule.every().day.at("16:00").do(job_runner.submit, "post_new_flights")
+    schedule.every().day.at("21:30").do(job_runner.submit, "post_new_flights")
+
+    try:
+        wf.storage.get_backend().initiate()
+    except Exception as e:
+        LOG.exception(f"While database initiation exception happened: {e}")
 
     LOG.info('Starting cheap flights search...')
 
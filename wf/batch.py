@@ -0,0 +1,146 @@
+"""Columnar batches of raw Travelpayouts flights for vectorized filtering.
+
+Fields, which flights are filtered by, are kept as parallel NumPy arrays,
+so filter conditions are evaluated as array masks instead of a Python check per flight.
+Filtering of hundreds of thousands of flights for many searches is made
+with a few array operations per search, when a batch is shared between searches.
+
+NumPy is optional: if it is not installed, is_available() is False,
+make_batch() returns flights as is, and wf.flights.filter_flights() checks flights one by one.
+Making a batch costs a Python call per flight, so only pages shared by several searches
+are worth it, see wf.pipeline.BATCH_MIN_SIZE.
+"""
+
+import functools
+
+from datetime import date
+
+import wf.utils
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def is_available():
+    """Checks if NumPy is installed and batches can be made."""
+
+    return numpy is not None
+
+
+def make_batch(flights_data):
+    """Returns FlightBatch of given flights, if NumPy is installed, or flights as is."""
+
+    if numpy is None or isinstance(flights_data, FlightBatch):
+        return flights_data
+    return FlightBatch(flights_data)
+
+
+class FlightBatch():
+    """Raw flights from Travelpayouts with parallel arrays of their fields:
+        prices - price of a flight
+        departure_ordinals, arrival_ordinals - ordinals of dates, -1 for malformed dates
+        found_at - time of flight finding as POSIX timestamp
+        destination_ids - index of destination code in destination_codes
+
+    Iterating over a batch gives the original flights dicts.
+    """
+
+    def __init__(self, flights_data):
+        if numpy is None:
+            raise RuntimeError("NumPy is required for flight batches.")
+
+        self.flights_data = list(flights_data)
+        destination_ids = {}
+
+        size = len(self.flights_data)
+        self.prices = numpy.fromiter(
+            (flight["value"] for flight in self.flights_data), dtype=numpy.float64, count=size)
+        self.departure_ordinals = numpy.fromiter(
+            (_get_ordinal(flight["depart_date"]) for flight in self.flights_data),
+            dtype=numpy.int64, count=size)
+        self.arrival_ordinals = numpy.fromiter(
+            (_get_ordinal(flight["return_date"]) for flight in self.flights_data),
+            dtype=numpy.int64, count=size)
+        self.found_at = numpy.fromiter(
+            (wf.utils.parse_found_at(flight["found_at"]).timestamp()
+             for flight in self.flights_data),
+            dtype=numpy.float64, count=size)
+        self.destination_ids = numpy.fromiter(
+            (destination_ids.setdefault(flight["destination"], len(destination_ids))
+             for flight in self.flights_data),
+            dtype=numpy.int64, count=size)
+        self.destination_codes = list(destination_ids)
+
+    def __repr__(self):
+        return f"FlightBatch({len(self)} flights)"
+
+    def __len__(self):
+        return len(self.flights_data)
+
+    def __iter__(self):
+        return iter(self.flights_data)
+
+    def select(self, mask):
+        """Returns list of flights dicts, which are marked by boolean mask."""
+
+        return [self.flights_data[index] for index in numpy.flatnonzero(mask)]
+
+    def filter(self, date_pairs, max_price, found_since, unwilling_destinations=()):
+        """Returns boolean mask of flights suitable for given conditions,
+        see wf.flights.filter_flights() for conditions.
+
+        :param found_since: datetime, flights found earlier are not suitable
+        """
+
+        mask = self.prices <= max_price
+        mask &= self.found_at >= found_since.timestamp()
+
+        unwilling_ids = [
+            destination_id
+            for destination_id, destination_code in enumerate(self.destination_codes)
+            if destination_code in unwilling_destinations
+        ]
+        if unwilling_ids:
+            mask &= ~numpy.isin(self.destination_ids, unwilling_ids)
+
+        mask &= self._contains_date_pairs(date_pairs, mask)
+        return mask
+
+    def _contains_date_pairs(self, date_pairs, mask):
+        """Returns boolean mask of flights, which dates are in date_pairs.
+        Only flights marked by mask are checked.
+
+        Every unique pair of dates of the batch is checked once,
+        so number of checks is limited by calendar, not by number of flights.
+        """
+
+        contained = numpy.zeros(len(self), dtype=bool)
+        if not mask.any():
+            return contained
+
+        indexes = numpy.flatnonzero(mask)
+        pair_keys = (
+            (self.departure_ordinals[indexes] + 1) << 32 | (self.arrival_ordinals[indexes] + 1))
+        _, first_indexes, inverse = numpy.unique(
+            pair_keys, return_index=True, return_inverse=True)
+
+        unique_contained = numpy.fromiter(
+            ((self.flights_data[indexes[index]]["depart_date"],
+              self.flights_data[indexes[index]]["return_date"]) in date_pairs
+             for index in first_indexes),
+            dtype=bool, count=len(first_indexes))
+
+        contained[indexes] = unique_contained[inverse.reshape(-1)]
+        return contained
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_ordinal(date_string):
+    """Returns ordinal of date in YYYY-MM-DD format or -1 for malformed date."""
+
+    try:
+        return date.fromisoformat(date_string).toordinal()
+    except (TypeError, ValueError):
+        return -1
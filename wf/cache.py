@@ -0,0 +1,159 @@
+"""Cache of responses of external APIs.
+
+Made for latest flights pages of Travelpayouts, which are refreshed
+on the order of hours, so repeated requests within a cycle window are wasted quota.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+
+LOG = logging.getLogger(__name__)
+
+
+class TTLCache():
+    """Thread-safe LRU cache, where entries expire in `ttl` seconds after they are set.
+
+    Keeps at most `maxsize` entries in memory, the least recently used entries are evicted.
+    If `maxweight` is given, total weight of values in memory is limited too,
+    weight of a value is counted by `weigh` function, e.g. number of rows of a page.
+    If `path` is given, entries are also stored in SQLite database at the path,
+    so they survive restarts and eviction from memory.
+    Keys and values have to be JSON serializable.
+    """
+
+    def __init__(self, ttl, maxsize, path=None, maxweight=None, weigh=len):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.weight = 0  # total weight of values in memory
+        self.hits = 0
+        self.misses = 0
+
+        self.__weigh = weigh
+        self.__entries = OrderedDict()  # key -> (stored_at, value)
+        self.__lock = threading.Lock()
+        self.__connection = None
+
+        if path is not None:
+            LOG.debug(f"Storing cache entries at {path}")
+            self.__connection = sqlite3.connect(path, check_same_thread=False)
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, stored_at REAL, value TEXT)")
+            self.__connection.execute(
+                "DELETE FROM cache WHERE stored_at <= ?", (time.time() - self.ttl,))
+            self.__connection.commit()
+
+    def __repr__(self):
+        return f"TTLCache(ttl={self.ttl}, maxsize={self.maxsize}, maxweight={self.maxweight})"
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        """Checks if key has not expired entry in memory or in the database,
+        doesn't affect LRU order and stats.
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None and self.__connection is not None:
+                entry = self._load(key)
+            return entry is not None and not self._is_expired(entry)
+
+    def get(self, key, default=None):
+        """Returns value of not expired entry or default."""
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None and self.__connection is not None:
+                entry = self._load(key)
+                if entry is not None:
+                    self._put(key, entry)
+
+            if entry is None or self._is_expired(entry):
+                self.misses += 1
+                if entry is not None:
+                    self._delete(key)
+                return default
+
+            if key in self.__entries:  # entry heavier than maxweight is only stored
+                self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        """Sets value of the key, resetting its expiration time."""
+
+        entry = (time.time(), value)
+
+        with self.__lock:
+            self._put(key, entry)
+            if self.__connection is not None:
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO cache (key, stored_at, value) VALUES (?, ?, ?)",
+                    (json.dumps(key), entry[0], json.dumps(value)))
+                self.__connection.commit()
+
+    def clear(self):
+        """Removes all entries, including stored ones."""
+
+        with self.__lock:
+            self.__entries.clear()
+            self.weight = 0
+            if self.__connection is not None:
+                self.__connection.execute("DELETE FROM cache")
+                self.__connection.commit()
+
+    def _is_expired(self, entry):
+        return entry[0] <= time.time() - self.ttl
+
+    def _put(self, key, entry):
+        """Puts entry into memory and evicts the least recently used entries,
+        entry heavier than maxweight is not put.
+        """
+
+        self._pop(key)
+        weight = self._weigh(entry[1])
+        if self.maxweight is not None and weight > self.maxweight:
+            return
+
+        self.__entries[key] = entry
+        self.weight += weight
+
+        while self.__entries and (
+                len(self.__entries) > self.maxsize or
+                (self.maxweight is not None and self.weight > self.maxweight)):
+            self._pop(next(iter(self.__entries)))
+
+    def _pop(self, key):
+        """Removes entry from memory."""
+
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            self.weight -= self._weigh(entry[1])
+
+    def _weigh(self, value):
+        """Returns weight of the value, values are not weighed, if weight is not limited."""
+
+        return self.__weigh(value) if self.maxweight is not None else 0
+
+    def _load(self, key):
+        """Returns stored entry or None."""
+
+        row = self.__connection.execute(
+            "SELECT stored_at, value FROM cache WHERE key = ?", (json.dumps(key),)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def _delete(self, key):
+        self._pop(key)
+        if self.__connection is not None:
+            self.__connection.execute("DELETE FROM cache WHERE key = ?", (json.dumps(key),))
+            self.__connection.commit()
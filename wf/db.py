@@ -2,48 +2,192 @@
 
 import os
 import logging
+import threading
 
 import pymongo.collection
+import pymongo.monitoring
 
 from pymongo import MongoClient
 
+from wf.storage.base import (
+    DEDUP_MODE, FLIGHT_ROUTE_KEY, FLIGHT_TTL, FLIGHT_UNIQUE_KEY, ROUTE_KEY,
+)
+
 LOG = logging.getLogger(__name__)
 
-DB_LOGIN = os.environ['DB_LOGIN']
-DB_PASS = os.environ['DB_PASS']
-DB_ADDRESS = os.environ['DB_ADDRESS']
+# connection pool size of the client, shared by all threads of the process
+DB_MAX_POOL_SIZE = int(os.environ.get('WF_DB_MAX_POOL_SIZE', 50))
+DB_MIN_POOL_SIZE = int(os.environ.get('WF_DB_MIN_POOL_SIZE', 0))
+
+
+class PoolStatsListener(pymongo.monitoring.ConnectionPoolListener):
+    """Counts connection pool events of the client, see get_pool_stats()."""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__stats = {}
+        self.reset()
+
+    def reset(self):
+        with self.__lock:
+            self.__stats = {
+                "pools_created": 0,
+                "pools_cleared": 0,
+                "connections_created": 0,
+                "connections_closed": 0,
+                "checkouts": 0,
+                "checkout_failures": 0,
+                "checkins": 0,
+            }
+
+    def get_stats(self):
+        with self.__lock:
+            stats = dict(self.__stats)
+
+        stats["connections_open"] = stats["connections_created"] - stats["connections_closed"]
+        stats["connections_in_use"] = stats["checkouts"] - stats["checkins"]
+        return stats
+
+    def _count(self, key):
+        with self.__lock:
+            self.__stats[key] += 1
+
+    def pool_created(self, event):
+        self._count("pools_created")
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._count("pools_cleared")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._count("connections_created")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._count("connections_closed")
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._count("checkout_failures")
+
+    def connection_checked_out(self, event):
+        self._count("checkouts")
+
+    def connection_checked_in(self, event):
+        self._count("checkins")
+
+
+POOL_STATS = PoolStatsListener()
+
+_client = None
+_databases = {}
+_lock = threading.Lock()
+
+
+def get_client():
+    """Returns client to MongoDB server, shared by the whole process.
+    The client is created on the first call, MongoClient is thread-safe.
+    Credentials are read from DB_LOGIN, DB_PASS and DB_ADDRESS environmental variables.
+    """
+
+    global _client
+
+    with _lock:
+        if _client is None:
+            LOG.info("Connecting to MongoDB...")
+            _client = MongoClient(
+                "mongodb+srv://{}:{}@{}/"
+                "test?retryWrites=true&w=majority"
+                .format(os.environ['DB_LOGIN'], os.environ['DB_PASS'], os.environ['DB_ADDRESS']),
+                maxPoolSize=DB_MAX_POOL_SIZE,
+                minPoolSize=DB_MIN_POOL_SIZE,
+                event_listeners=[POOL_STATS],
+            )
+
+    return _client
+
+
+def get_database(name):
+    """Returns Database wrapper, created once per process for each name."""
+
+    with _lock:
+        database = _databases.get(name)
+
+    if database is None:
+        database = Database(name)
+        with _lock:
+            database = _databases.setdefault(name, database)
+
+    return database
+
+
+def close_client():
+    """Closes the shared client, next get_client() call creates a new one."""
+
+    global _client
+
+    with _lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+        _databases.clear()
+
+
+def get_pool_stats():
+    """Returns statistics of the connection pool of the shared client, e.g. {
+        "max_pool_size": 50,
+        "pools_created": 1,  # one pool for each server of the cluster
+        "pools_cleared": 0,
+        "connections_created": 3,
+        "connections_closed": 0,
+        "connections_open": 3,
+        "connections_in_use": 1,
+        "checkouts": 120,
+        "checkout_failures": 0,
+        "checkins": 119,
+    }
+    """
+
+    stats = POOL_STATS.get_stats()
+    stats["max_pool_size"] = DB_MAX_POOL_SIZE
+    return stats
 
 
 class Database():
     """Wrapper over mongo database.
 
     Made for handling database connection using environmental variables.
+    Uses the shared client and caches collection wrappers,
+    use get_database() to get the wrapper.
     """
     def __init__(self, name):
         self.__name = name
-        self.__database = self._get_client()[self.__name]
+        self.__database = get_client()[self.__name]
+        self.__collections = {}
 
     def __getattr__(self, name):
+        collection = self.__collections.get(name)
+        if collection is not None:
+            return collection
+
         result = getattr(self.__database, name)
         if isinstance(result, pymongo.collection.Collection):
-            return Collection(name, result)
+            return self.__collections.setdefault(name, Collection(name, result))
         else:
             return result
 
     def __repr__(self):
         return f"Database({self.__name})"
 
-    def _get_client(self):
-        """Returns connected client to MongoDB server."""
-
-        client = MongoClient(
-            "mongodb+srv://{}:{}@{}/"
-            "test?retryWrites=true&w=majority"
-            .format(DB_LOGIN, DB_PASS, DB_ADDRESS)
-        )
-
-        return client
-
 
 class Collection():
     """Wrapper over mongo collection.
@@ -63,33 +207,124 @@ class Collection():
         return f"Collection({self.__name})"
 
 
+# Indexes of all collections, create_indexes() makes sure they exist.
+# Every query the package issues should be covered by one of them, see QUERY_SHAPES.
+INDEXES = [
+    # flights deduplication, see wf.flights.save_unique_flights(),
+    # in "route" mode also reading of flights marked new by wf.storage.mongo.MongoStorage
+    {
+        "collection": "flights",
+        "keys": [
+            (field, 1)
+            for field in (FLIGHT_ROUTE_KEY if DEDUP_MODE == "route" else FLIGHT_UNIQUE_KEY)
+        ],
+        "options": {"unique": True},
+    },
+    # TTL index to delete flights after 30 days
+    {
+        "collection": "flights",
+        "keys": [("added_at", 1)],
+        "options": {"expireAfterSeconds": FLIGHT_TTL},
+    },
+    # claiming of new flights, see wf.flights.get_new_flights(),
+    # only new flights are indexed, so the index stays small
+    {
+        "collection": "flights",
+        "keys": [("search_id", 1), ("is_new", 1)],
+        "options": {"partialFilterExpression": {"is_new": True}},
+    },
+    # reading of claimed flights, see wf.flights.get_new_flights()
+    {
+        "collection": "flights",
+        "keys": [("claim_id", 1)],
+        "options": {"partialFilterExpression": {"claim_id": {"$exists": True}}},
+    },
+    # searches are unique by name, removed by name, see wf.searches.remove()
+    {
+        "collection": "searches",
+        "keys": [("name", 1)],
+        "options": {"unique": True},
+    },
+    # active searches, see wf.searches.get_active()
+    {
+        "collection": "searches",
+        "keys": [("is_active", 1)],
+        "options": {},
+    },
+    # price history is one document per route, see wf.prices
+    {
+        "collection": "prices",
+        "keys": [(field, 1) for field in ROUTE_KEY],
+        "options": {"unique": True},
+    },
+]
+
+# Shapes of queries the package issues, verify_query_plans() checks they use indexes.
+# Values of filters are only examples, plans depend on the fields and operators.
+QUERY_SHAPES = [
+    {"collection": "flights", "filter": {"search_id": "", "is_new": True}},
+    {"collection": "flights", "filter": {"claim_id": ""}},
+    {"collection": "searches", "filter": {"name": ""}},
+    {"collection": "searches", "filter": {"is_active": True}},
+    {"collection": "prices", "filter": {field: "" for field in ROUTE_KEY}},
+]
+if DEDUP_MODE == "route":
+    QUERY_SHAPES += [
+        {"collection": "flights", "filter": {field: "" for field in FLIGHT_ROUTE_KEY}},
+        {"collection": "flights", "filter": {"destination": {"$in": [""]}, "save_id": ""}},
+    ]
+
+
 def initiate_db():
     """Initiates database."""
 
     create_indexes()
+    verify_query_plans()
 
 
 def create_indexes():
-    """Sets indexes and unique keys."""
-
-    db = Database("wf")
-
-    # flights collection index
-    db.flights.create_index([
-        ("destination", 1),
-        ("price", 1),
-        ("departure_date", 1),
-        ("arrival_date", 1),
-    ], unique=True)
-
-    # searches collection index
-    db.searches.create_index(
-        [("name", 1)],
-        unique=True
-    )
-
-    # flights collection TTL index to delete documents after 30 days
-    month_in_seconds = 2630000
-    db.flights.create_index([
-        ("added_at", 1),
-    ], expireAfterSeconds=month_in_seconds)
+    """Sets indexes and unique keys from INDEXES."""
+
+    db = get_database("wf")
+
+    for index in INDEXES:
+        collection = getattr(db, index["collection"])
+        collection.create_index(index["keys"], **index["options"])
+
+
+def verify_query_plans():
+    """Checks with explain() that queries of QUERY_SHAPES use indexes.
+    Returns list of query shapes, which would scan the whole collection (COLLSCAN).
+    """
+
+    db = get_database("wf")
+
+    collscan_shapes = []
+
+    for shape in QUERY_SHAPES:
+        collection = getattr(db, shape["collection"])
+        plan = collection.find(shape["filter"]).explain()
+        stages = set(_get_stages(plan["queryPlanner"]["winningPlan"]))
+
+        if "COLLSCAN" in stages:
+            LOG.warning(f"Query {shape['filter']} on {shape['collection']} collection "
+                        f"scans the whole collection, index is missing")
+            collscan_shapes.append(shape)
+        else:
+            LOG.debug(f"Query {shape['filter']} on {shape['collection']} collection "
+                      f"uses stages {stages}")
+
+    return collscan_shapes
+
+
+def _get_stages(plan):
+    """Yields names of all stages of the query plan."""
+
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan["stage"]
+        for value in plan.values():
+            yield from _get_stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from _get_stages(value)
@@ -6,31 +6,81 @@ flight model: {
     departure_date: basestring, e.g. "2019-12-28"
     arrival_date: basestring, e.g. "2020-01-07"
     found_at: integer, e.g. 15844858457847
+    notified_price: integer, e.g. 4500
+        only in "route" deduplication mode, price of the flight, when it was marked new,
+        see wf.storage.base.DEDUP_MODE
 }
+Formatted flights are Flight records, which are converted to the model by to_document().
 """
 
 import logging
 import os
-import requests
+import time
 
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-from pymongo.errors import DuplicateKeyError
-
-import wf.db
+import wf.batch
+import wf.cache
+import wf.iata_converters
+import wf.ratelimit
+import wf.storage
+import wf.storage.base
+import wf.transport
 import wf.utils
 
 from wf.iata_converters import CITY_CODE_TO_NAME
 
 TRAVELPAYOUTS_TOKEN = os.environ['TRAVELPAYOUTS_TOKEN']
+TRAVELPAYOUTS_LATEST_URL = 'http://api.travelpayouts.com/v2/prices/latest'
+
+# all flights are searched from Moscow
+ORIGIN = 'MOW'
+
+# number of concurrent requests to Travelpayouts made by get_latest()
+FETCH_WORKERS = int(os.environ.get('WF_FETCH_WORKERS', 8))
+
+# latest flights pages are cached by (origin, destination, beginning_of_period, period_type),
+# WF_PAGES_CACHE_PATH is a path to SQLite file to keep the cache between restarts,
+# memory keeps only recent pages with up to WF_PAGES_CACHE_ROWS flights in total,
+# so pages streamed through wf.pipeline are released, others are kept in the file
+PAGES_CACHE = wf.cache.TTLCache(
+    ttl=int(os.environ.get('WF_PAGES_CACHE_TTL', 3600)),  # seconds
+    maxsize=int(os.environ.get('WF_PAGES_CACHE_SIZE', 4096)),
+    maxweight=int(os.environ.get('WF_PAGES_CACHE_ROWS', 20000)),
+    path=os.environ.get('WF_PAGES_CACHE_PATH'),
+)
+
+# number of flights inserted to database in one request by save_unique_flights()
+SAVE_BATCH_SIZE = int(os.environ.get('WF_SAVE_BATCH_SIZE', 500))
+
+# in "route" deduplication mode a flight is new again, when its price drops
+# by at least PRICE_DROP_AMOUNT and PRICE_DROP_PERCENT below the notified price,
+# 0 disables a threshold, see wf.storage.base.DEDUP_MODE
+PRICE_DROP_AMOUNT = int(os.environ.get('WF_PRICE_DROP_AMOUNT', 0))
+PRICE_DROP_PERCENT = float(os.environ.get('WF_PRICE_DROP_PERCENT', 0))
+wf.storage.base.check_price_drop(PRICE_DROP_AMOUNT, PRICE_DROP_PERCENT)
+
+# limits of Travelpayouts requests, 0 means no limit, every retry is a request too;
+# requests of a UTC day are counted in the storage backend, so restarts don't reset the quota
+TRAVELPAYOUTS_LIMITER = wf.ratelimit.RateLimiter(
+    rate=float(os.environ.get('WF_TRAVELPAYOUTS_RPS', 10)),
+    daily_quota=int(os.environ.get('WF_TRAVELPAYOUTS_DAILY_QUOTA', 0)),
+    name="travelpayouts",
+)
 
 LOG = logging.getLogger(__name__)
 
 
-def get_latest(destination_codes, months):
+def get_latest(destination_codes, months, workers=None, report=None):
     """Get flights found for last 48 hours.
     Documentation: https://support.travelpayouts.com/hc/ru/articles/203956163#02
 
+    Every pair of destination and month is a separate request,
+    requests are made concurrently by a pool of `workers` threads.
+    Flights are returned in the same order as if requests were made one by one.
+
     :param destination_codes: list of codes of airports, cities or counrties.
     :param months: list of months, when flights are searched.
         Months are presented as the dict of months name and the first date of the month,
@@ -40,80 +90,188 @@ def get_latest(destination_codes, months):
             'may': '2019-05-01',
         }
         Note: first date should be in YYYY-MM-DD format.
-    :param trip_duration: trip duration in weeks, needed for Travelpayouts API
+    :param workers: maximum number of concurrent requests, FETCH_WORKERS by default,
+        1 makes requests strictly one by one.
+    :param report: optional list, extended with a record for every made request: {
+            "origin": "MOW",
+            "destination": "OPO",
+            "beginning_of_period": "2019-03-01",
+            "latency": 0.35,  # seconds
+            "cached": False,  # True, if flights were taken from PAGES_CACHE
+            "error": None,  # or error description, if request failed
+        }
     """
 
     LOG.info('Getting latest flights...')
     LOG.debug(f"\tlooking for flights to {destination_codes} for {months.keys()}")
 
-    travelpayouts_api_url = 'http://api.travelpayouts.com/v2/prices/latest'
+    pages = get_pages(destination_codes, months)
+    fetched_pages = fetch_pages(pages, workers=workers, report=report)
 
     found_flights = []
-
-    for key in months:
-        for destination_code in destination_codes:
-            LOG.debug('\tsearching for flights MOW - %s at %s', destination_code, key)
-            payload = {
-                'token': TRAVELPAYOUTS_TOKEN,
-                'origin': 'MOW',
-                'destination': destination_code,
-                'beginning_of_period': months[key],
-                'period_type': 'month',
-                'limit': 1000,
-                'show_to_affiliates': False,
-            }
-            response = requests.get(travelpayouts_api_url, params=payload)
-            flights_data = response.json()['data']
-            found_flights += flights_data
+    for page in pages:
+        found_flights += fetched_pages[page]
 
     LOG.info(f"\tfound {len(found_flights)} latest flights")
     return found_flights
 
 
+def get_pages(destination_codes, months, origin=ORIGIN):
+    """Returns list of pages of latest flights to request for given destinations and months.
+    Each page is a tuple (origin, destination_code, beginning_of_period).
+    """
+
+    # dict keeps the first occurrence of every page in order
+    pages = dict.fromkeys(
+        (origin, destination_code, months[key])
+        for key in months
+        for destination_code in destination_codes
+    )
+
+    return list(pages)
+
+
+def fetch_pages(pages, workers=None, report=None):
+    """Requests given pages of latest flights concurrently, see get_pages() for pages format.
+    Returns dict of page and flights data of the page.
+
+    :param workers: maximum number of concurrent requests, FETCH_WORKERS by default.
+    :param report: optional list, extended with a record for every made request,
+        see get_latest() for the format.
+    """
+
+    workers = workers or FETCH_WORKERS
+
+    if workers > 1 and len(pages) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(pages))) as executor:
+            fetched_pages = list(executor.map(
+                lambda page: fetch_latest_page(page[1], page[2], origin=page[0]), pages))
+    else:
+        fetched_pages = [
+            fetch_latest_page(destination_code, beginning_of_period, origin=origin)
+            for origin, destination_code, beginning_of_period in pages
+        ]
+
+    records = [record for _, record in fetched_pages]
+    if report is not None:
+        report.extend(records)
+
+    failed_number = sum(1 for record in records if record["error"])
+    cached_number = sum(1 for record in records if record["cached"])
+    slowest = max((record["latency"] for record in records), default=0)
+    LOG.info(f"\tgot {len(records)} pages of latest flights, {cached_number} from cache, "
+             f"{failed_number} failed, the slowest took {slowest:.2f}s")
+
+    return {page: flights_data for page, (flights_data, _) in zip(pages, fetched_pages)}
+
+
+def is_page_cached(page):
+    """Checks if page of latest flights is in PAGES_CACHE, see get_pages() for page format."""
+
+    return page + ('month',) in PAGES_CACHE
+
+
+def fetch_latest_page(destination_code, beginning_of_period, origin=ORIGIN):
+    """Requests latest flights to destination for the month starting at beginning_of_period.
+
+    Returns flights data and a record about the request, see get_latest() for the format.
+    Successful responses are cached in PAGES_CACHE.
+    Requests, which are not cached, are limited by TRAVELPAYOUTS_LIMITER, including retries.
+    Failed request is logged and results in empty flights data.
+    """
+    LOG.debug('\tsearching for flights %s - %s at %s',
+              origin, destination_code, beginning_of_period)
+    payload = {
+        'token': TRAVELPAYOUTS_TOKEN,
+        'origin': origin,
+        'destination': destination_code,
+        'beginning_of_period': beginning_of_period,
+        'period_type': 'month',
+        'limit': 1000,
+        'show_to_affiliates': False,
+    }
+
+    record = {
+        "origin": origin,
+        "destination": destination_code,
+        "beginning_of_period": beginning_of_period,
+        "latency": None,
+        "cached": False,
+        "error": None,
+    }
+
+    cache_key = (origin, destination_code, beginning_of_period, payload['period_type'])
+    started_at = time.monotonic()
+
+    flights_data = PAGES_CACHE.get(cache_key)
+    if flights_data is not None:
+        record["cached"] = True
+        record["latency"] = time.monotonic() - started_at
+        return flights_data, record
+
+    flights_data = []
+    try:
+        response = wf.transport.get(
+            TRAVELPAYOUTS_LATEST_URL, params=payload, limiter=TRAVELPAYOUTS_LIMITER)
+        response.raise_for_status()
+        flights_data = response.json()['data']
+        PAGES_CACHE.set(cache_key, flights_data)
+    except Exception as e:
+        LOG.exception(f"Failed to get flights {origin} - {destination_code} "
+                      f"at {beginning_of_period}: {e}")
+        record["error"] = repr(e)
+    record["latency"] = time.monotonic() - started_at
+
+    return flights_data, record
+
+
 def filter_flights(flights_data, date_pairs, max_price,
-                   max_hours_passed=6, unwilling_destinations=None):
+                   max_hours_passed=6, unwilling_destinations=None, now=None):
     """Filter given flights list according to settings.
     For each flights in flights_data
 
-    :flights_data: list of flights, each flights is a dictionary
-    :date_pairs: list of tuples, where each tuple is a pair of suitable dates
+    :flights_data: list of flights, each flights is a dictionary, or wf.batch.FlightBatch,
+        lists are checked one by one, since making a batch costs more than checking
+        flights for one search, see wf.pipeline for batches shared by searches
+    :date_pairs: list of tuples, where each tuple is a pair of suitable dates,
+        or wf.utils.DatePairsIndex of them
     :max_price: maximum price of a flight
     :max_hours_passed: maximum hours passed since flight finding
     :unwilling_destinations: list of IATA codes of not suitable destinations,
         needed if search made for whole country, but some of destinations are not suitable
+    :now: time, hours passed since flight finding are counted from, current time by default,
+        made to use the same time for all searches of a cycle
     """
     LOG.debug("Filtering flights...")
     LOG.debug(f"\tgot {len(flights_data)} flights and {len(date_pairs)} date pairs")
     LOG.debug(f"\tmax price is {max_price}, max hours passed is {max_hours_passed}")
     LOG.debug(f"\tunwillings destinations are {unwilling_destinations}")
-    unwilling_destinations = unwilling_destinations or []
-
-    filtered_flights = []
-
-    for flight in flights_data:
-        found_at = flight['found_at']
-        try:
-            found_at_datetime = datetime.strptime(found_at, '%Y-%m-%dT%H:%M:%S')
-        except ValueError:
-            found_at_datetime = datetime.strptime(found_at, '%Y-%m-%dT%H:%M:%S.%f')
-
-        time_now = datetime.now()
-        time_difference = time_now - found_at_datetime
-        time_difference_in_hours = time_difference / timedelta(hours=1)
-        if time_difference_in_hours > max_hours_passed:
-            continue
-
-        if (flight['value'] <= max_price and
-           flight['destination'] not in unwilling_destinations and
-           (flight["depart_date"], flight["return_date"]) in date_pairs):
-            filtered_flights.append(flight)
+    unwilling_destinations = set(unwilling_destinations or [])
+    date_pairs = wf.utils.index_date_pairs(date_pairs)
+
+    if now is None:
+        now = datetime.now()
+    found_since = now - timedelta(hours=max_hours_passed)
+
+    if isinstance(flights_data, wf.batch.FlightBatch):
+        mask = flights_data.filter(date_pairs, max_price, found_since, unwilling_destinations)
+        filtered_flights = flights_data.select(mask)
+    else:
+        filtered_flights = []
+
+        for flight in flights_data:
+            if (flight['value'] <= max_price and
+               flight['destination'] not in unwilling_destinations and
+               wf.utils.parse_found_at(flight['found_at']) >= found_since and
+               (flight["depart_date"], flight["return_date"]) in date_pairs):
+                filtered_flights.append(flight)
 
     LOG.debug(f"\t{len(filtered_flights)} left after filtering")
     return filtered_flights
 
 
 def format_flights(flights):
-    """Formats flights dict: adds link, weekday names, gets rid of redundant information.
+    """Formats raw flights from Travelpayouts to Flight records, see Flight.from_raw().
     Converts fields from
         value, trip_class, show_to_affiliates
         return_date, origin, number_of_changes
@@ -129,117 +287,197 @@ def format_flights(flights):
         price is rounded by nudreds, e.g. 4251 -> 4200, 4248 -> 4200
         found_at converted to timestamp
     """
-    formatted_flights = []
+    return [Flight.from_raw(flight) for flight in flights]
 
-    for flight in flights:
-        try:
-            origin = CITY_CODE_TO_NAME[flight['origin']][1]
-        except KeyError:
-            origin = flight['origin']
 
-        try:
-            destination = CITY_CODE_TO_NAME[flight['destination']][1]
-        except KeyError:
-            destination = flight['destination']
+class Flight(Mapping):
+    """Formatted flight: compact read-only record with fields of a flight document.
 
-        departure_weekday = wf.utils.get_weekday(flight['depart_date'])
-        arrival_weekday = wf.utils.get_weekday(flight['return_date'])
+    Only source fields are stored, derived fields (names of cities, weekdays, link)
+    are computed on access, so a record takes a few slots instead of a dict of nine keys.
+    The record is a mapping of FIELDS, so flight['price'] works as for flight documents.
+    """
+
+    __slots__ = (
+        "origin_code", "destination_code", "departure_date", "arrival_date", "price", "found_at",
+    )
+
+    FIELDS = (
+        "origin", "destination",
+        "departure_date", "departure_weekday",
+        "arrival_date", "arrival_weekday",
+        "price", "link", "found_at",
+    )
+
+    def __init__(self, origin_code, destination_code, departure_date, arrival_date,
+                 price, found_at):
+        self.origin_code = origin_code
+        self.destination_code = destination_code
+        self.departure_date = departure_date
+        self.arrival_date = arrival_date
+        self.price = price
+        self.found_at = found_at
+
+    def __repr__(self):
+        return (f"Flight({self.origin_code} - {self.destination_code}, "
+                f"{self.departure_date} - {self.arrival_date}, {self.price})")
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    @classmethod
+    def from_raw(cls, flight):
+        """Returns Flight made from raw flight dict of Travelpayouts."""
+
+        return cls(
+            origin_code=flight['origin'],
+            destination_code=flight['destination'],
+            departure_date=flight['depart_date'],
+            arrival_date=flight['return_date'],
+            # round price to least hundred
+            price=flight['value'] - flight['value'] % 100,
+            found_at=wf.utils.parse_found_at(flight["found_at"]),
+        )
 
-        # round price to least hundred
-        rounded_price = flight['value'] - flight['value'] % 100
+    @property
+    def origin(self):
+        return get_city_name(self.origin_code)
 
-        link = wf.utils.create_aviasales_link(
-            flight['origin'], flight['depart_date'],
-            flight['destination'], flight['return_date'],
+    @property
+    def destination(self):
+        return get_city_name(self.destination_code)
+
+    @property
+    def departure_weekday(self):
+        return wf.utils.get_weekday(self.departure_date)
+
+    @property
+    def arrival_weekday(self):
+        return wf.utils.get_weekday(self.arrival_date)
+
+    @property
+    def link(self):
+        return wf.utils.create_aviasales_link(
+            self.origin_code, self.departure_date,
+            self.destination_code, self.arrival_date,
         )
 
-        try:
-            found_at_datetime = datetime.strptime(flight["found_at"], '%Y-%m-%dT%H:%M:%S')
-        except ValueError:
-            found_at_datetime = datetime.strptime(flight["found_at"], '%Y-%m-%dT%H:%M:%S.%f')
-
-        flight_dict = {
-            'origin': origin,
-            'destination': destination,
-            'departure_date': flight['depart_date'],
-            'departure_weekday': departure_weekday,
-            'arrival_date': flight['return_date'],
-            'arrival_weekday': arrival_weekday,
-            'price': rounded_price,
-            'link': link,
-            'found_at': found_at_datetime,
-        }
-        formatted_flights.append(flight_dict)
+    def to_document(self, **fields):
+        """Returns flight document to store with given additional fields,
+        e.g. flight.to_document(search_id=search_id, is_new=True).
+        """
+
+        document = {field: getattr(self, field) for field in self.FIELDS}
+        document.update(fields)
+        return document
 
-    return formatted_flights
 
+def get_city_name(code):
+    """Returns English name of the city by city or airport IATA code
+    or the code, if the city is unknown.
+    """
+    city_code = wf.iata_converters.get_city_code(code)
+    if city_code is None:
+        return code
 
-def get_collection():
-    """Returns flights collection."""
+    return CITY_CODE_TO_NAME[city_code][1]
 
-    db = wf.db.Database("wf")
-    return db.flights
+
+def to_document(flight, **fields):
+    """Returns flight document to store made of Flight or flight dict with given fields."""
+
+    if isinstance(flight, Flight):
+        return flight.to_document(**fields)
+
+    document = dict(flight)
+    document.update(fields)
+    return document
 
 
 def add(search_id, flight):
-    """Adds a flight documents to a flights collection."""
+    """Adds a flight documents to a flights collection.
+    Returns False, if the flight is already stored.
+    """
 
-    flight.update({
-        "search_id": search_id,
-        "added_at": datetime.now(),  # for TTL
-        "is_new": True,
-    })
+    document = to_document(
+        flight,
+        search_id=search_id,
+        added_at=datetime.now(),  # for TTL
+        is_new=True,
+    )
 
-    flights_collection = get_collection()
-    flights_collection.insert_one(flight)
+    return bool(_store(wf.storage.get_backend(), [document]))
 
 
 def get_all(filter_query=None):
     """Returns list of all flights, where each flight is a dict."""
 
-    if filter_query is None:
-        filter_query = {}
+    return wf.storage.get_backend().find_flights(filter_query)
 
-    flights_collection = get_collection()
-    return list(flights_collection.find(filter_query))
 
+def save_unique_flights(search_id, flights_data, batch_size=None):
+    """Saves to DB flights, that are not in the flights database yet.
+    Flights are Flight records or formatted flights dicts, they are not changed.
+    Returns list of saved (unique) flights documents.
 
-def save_unique_flights(search_id, flights_data):
-    """Saves to DB flights, that are not in the flights database yet."""
+    Flights are inserted in batches of batch_size flights, SAVE_BATCH_SIZE by default,
+    see wf.storage for details of insertion. In "route" deduplication mode flights
+    of stored routes are updated and returned only if their price dropped enough.
+    """
 
     LOG.info("Saving unique flights...")
     LOG.info(f"\tGot {len(flights_data)} flights")
 
+    batch_size = batch_size or SAVE_BATCH_SIZE
+    added_at = datetime.now()
+    storage = wf.storage.get_backend()
+
     unique_flights = []
 
-    for flight in flights_data:
-        try:
-            add(search_id, flight)
-        except DuplicateKeyError:
-            pass
-        else:
-            unique_flights.append(flight)
+    for batch_start in range(0, len(flights_data), batch_size):
+        batch = [
+            to_document(
+                flight,
+                search_id=search_id,
+                added_at=added_at,  # for TTL
+                is_new=True,
+            )
+            for flight in flights_data[batch_start:batch_start + batch_size]
+        ]
+        unique_flights += _store(storage, batch)
 
     LOG.info(f"\t{len(unique_flights)} of them are unique")
     return unique_flights
 
 
+def _store(storage, documents):
+    """Stores flights documents by deduplication mode, returns new flights."""
+
+    if wf.storage.base.DEDUP_MODE == "price":
+        return storage.insert_unique_flights(documents)
+
+    if wf.storage.base.DEDUP_MODE == "route":
+        return storage.upsert_route_flights(documents, PRICE_DROP_AMOUNT, PRICE_DROP_PERCENT)
+
+    raise ValueError(f"Deduplication mode '{wf.storage.base.DEDUP_MODE}' is not supported.")
+
+
 def get_new_flights(search_id):
-    """Returns list of new flights and mark those flights as not new."""
+    """Returns list of new flights and mark those flights as not new.
+    Concurrent callers never get the same flight.
+    """
 
     LOG.info("Getting new flights for '{}' search...".format(search_id))
 
-    new_flights = []
-
-    flights_collection = get_collection()
-    new_flight = True
-    while new_flight:
-        new_flight = flights_collection.find_one_and_update(
-            {"search_id": search_id, "is_new": True},
-            {"$set": {"is_new": False}})
-        LOG.info("new flight: {}".format(new_flight))
-        if new_flight:
-            new_flights.append(new_flight)
+    new_flights = wf.storage.get_backend().claim_new_flights(search_id)
 
     LOG.info("Got {} new (unposted) flights".format(len(new_flights)))
 
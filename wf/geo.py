@@ -0,0 +1,132 @@
+"""Geospatial lookups of airports, e.g. airports within 300 km of Lisbon.
+
+Airports are put into a grid of CELL_SIZE x CELL_SIZE degrees cells by their coordinates,
+so only airports of cells, which a radius covers, are checked for distance,
+instead of all ten thousand airports of wf.iata_converters.AIRPORT_TO_CITY.
+"""
+
+import logging
+import math
+import threading
+
+import wf.iata_converters
+
+LOG = logging.getLogger(__name__)
+
+EARTH_RADIUS = 6371.0  # km
+KM_PER_DEGREE = math.pi * EARTH_RADIUS / 180
+
+# size of grid cells in degrees
+CELL_SIZE = 1.0
+
+_airports_index = None
+_lock = threading.Lock()
+
+
+def get_distance(latitude, longitude, other_latitude, other_longitude):
+    """Returns great-circle distance between two points in km."""
+
+    latitude, longitude, other_latitude, other_longitude = map(
+        math.radians, (latitude, longitude, other_latitude, other_longitude))
+
+    haversine = (
+        math.sin((other_latitude - latitude) / 2) ** 2 +
+        math.cos(latitude) * math.cos(other_latitude) *
+        math.sin((other_longitude - longitude) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(haversine)))
+
+
+class GridIndex():
+    """Index of points by their coordinates in a grid of cell_size degrees cells.
+    Points are given as tuples (code, latitude, longitude).
+    """
+
+    def __init__(self, points=(), cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.__columns_number = math.ceil(360 / cell_size)
+        self.__cells = {}  # (row, column) -> [(code, latitude, longitude)]
+        self.__size = 0
+
+        for code, latitude, longitude in points:
+            self.add(code, latitude, longitude)
+
+    def __repr__(self):
+        return f"GridIndex({self.__size} points, cell_size={self.cell_size})"
+
+    def __len__(self):
+        return self.__size
+
+    def add(self, code, latitude, longitude):
+        """Adds a point to the index."""
+
+        cell = (self._get_row(latitude), self._get_column(longitude))
+        self.__cells.setdefault(cell, []).append((code, latitude, longitude))
+        self.__size += 1
+
+    def find_within(self, latitude, longitude, radius):
+        """Returns list of (distance, code) of points within radius km from the given point,
+        the nearest first.
+        """
+        latitude_span = radius / KM_PER_DEGREE
+        rows = range(self._get_row(max(-90.0, latitude - latitude_span)),
+                     self._get_row(min(90.0, latitude + latitude_span)) + 1)
+
+        # degrees of longitude get shorter to the poles, so the widest span is at the edge
+        edge_latitude = min(90.0, abs(latitude) + latitude_span)
+        edge_cos = math.cos(math.radians(edge_latitude))
+        if edge_cos * 180 <= latitude_span:
+            columns = range(self.__columns_number)
+        else:
+            longitude_span = latitude_span / edge_cos
+            columns = {
+                self._get_column(longitude + offset * self.cell_size)
+                for offset in range(-math.ceil(longitude_span / self.cell_size) - 1,
+                                    math.ceil(longitude_span / self.cell_size) + 2)
+            }
+
+        found = []
+        for row in rows:
+            for column in columns:
+                for code, point_latitude, point_longitude in self.__cells.get((row, column), []):
+                    distance = get_distance(latitude, longitude, point_latitude, point_longitude)
+                    if distance <= radius:
+                        found.append((distance, code))
+
+        return sorted(found)
+
+    def _get_row(self, latitude):
+        return math.floor(latitude / self.cell_size)
+
+    def _get_column(self, longitude):
+        return math.floor(longitude / self.cell_size) % self.__columns_number
+
+
+def get_airports_index():
+    """Returns GridIndex of all airports with known coordinates, builds it on the first call."""
+
+    global _airports_index
+
+    with _lock:
+        if _airports_index is None:
+            points = []
+            for code, (_, latitude, longitude) in wf.iata_converters.AIRPORT_TO_CITY.items():
+                if latitude is not None and longitude is not None:
+                    points.append((code, float(latitude), float(longitude)))
+            _airports_index = GridIndex(points)
+            LOG.debug(f"Indexed {len(_airports_index)} airports")
+
+        return _airports_index
+
+
+def get_nearby_city_codes(latitude, longitude, radius):
+    """Returns list of codes of cities, which have airports within radius km
+    from the given point, cities with the nearest airports first.
+    """
+    city_codes = []
+    for _, airport_code in get_airports_index().find_within(latitude, longitude, radius):
+        city_code = wf.iata_converters.AIRPORT_TO_CITY[airport_code][0]
+        if city_code is not None and city_code not in city_codes:
+            city_codes.append(city_code)
+
+    return city_codes
@@ -1,9409 +1,213 @@
-CITY_CODE_TO_NAME = {
-    'LFQ': ('Линьфэнь', 'Linfen'),
-    'UKT': ('Квакертаун', 'Quakertown'),
-    'AAC': ('Эль-Ариш', 'El Arish'),
-    'ORP': ('Орапа', 'Orapa'),
-    'VDO': ('Ван Дон', 'Van Don'),
-    'VAM': ('Маамигили', 'Maamigili'),
-    'SLH': ('Сола', 'Sola'),
-    'YBI': ('Блэк Тикл', 'Black Tickle'),
-    'AAQ': ('Анапа', 'Anapa'),
-    'SLY': ('Салехард', 'Salekhard'),
-    'BKK': ('Бангкок', 'Bangkok'),
-    'ABK': ('Кабри Дар', 'Kabri Dar'),
-    'UMB': (None, 'Umnak Island'),
-    'ABO': ('Абуассо', 'Aboisso'),
-    'XGU': (None, 'Asker'),
-    'IEV': ('Киев', 'Kyiv'),
-    'SUN': ('Сан-Валли', 'Sun Valley'),
-    'MHT': ('Манчестер', 'Manchester'),
-    'GTA': ('Остров Нггатока', 'Gatokae'),
-    'UPL': ('Упала', 'Upala'),
-    'AMN': ('Алма', 'Alma'),
-    'BEX': (None, 'Benson'),
-    'RIG': ('Рио Гранде', 'Rio Grande'),
-    'PCD': ('Прейри дю Чиен', 'Prairie Du Chien'),
-    'KRR': ('Краснодар', 'Krasnodar'),
-    'YCZ': ('Фэрмонт Хот Спрингс', 'Fairmont Hot Springs'),
-    'VIE': ('Вена', 'Vienna'),
-    'GVW': ('Грандвью', 'Grandview'),
-    'XHS': (None, 'Chemainus'),
-    'CEK': ('Челябинск', 'Chelyabinsk'),
-    'UTC': ('Утрехт', 'Utrecht'),
-    'ALC': ('Аликанте', 'Alicante'),
-    'YFA': ('Форт Олбани', 'Fort Albany'),
-    'KLJ': ('Паланга', 'Palanga'),
-    'UTI': ('Валкеала', 'Valkeala'),
-    'MNQ': ('Монто', 'Monto'),
-    'ATH': ('Афины', 'Athens'),
-    'HAK': ('Хайкоу', 'Haikou'),
-    'GRV': ('Грозный', 'Groznyy'),
-    'VAB': ('Яварате', 'Yavarate'),
-    'AGG': ('Ангорам', 'Angoram'),
-    'BUE': ('Буэнос-Айрес', 'Buenos Aires'),
-    'AGQ': ('Агринион', 'Agrinion'),
-    'AIR': ('Арипуанан', 'Aripuana'),
-    'AJK': ('Арак', 'Araak'),
-    'CSY': ('Чебоксары', 'Cheboksary'),
-    'YHB': ('Худзон Бэй', 'Hudson Bay'),
-    'ARH': ('Архангельск', 'Arkhangelsk'),
-    'JUH': ('Чичжоу', 'Chizhou'),
-    'HAV': ('Гавана', 'Havana'),
-    'LPC': ('Ломпок', 'Lompoc'),
-    'HAW': ('Хаверфордуэст', 'Haverfordwest'),
-    'OPO': ('Порту', 'Porto'),
-    'AKP': ('Анактавак', 'Anaktuvuk'),
-    'AKV': ('Акуливик', 'Akulivik'),
-    'MFN': ('Милфорд-Саунд', 'Milford Sound'),
-    'BQS': ('Благовещенск', 'Blagoveschensk'),
-    'TDS': ('Сазерем', 'Sasereme'),
-    'HBC': ('Ханус Бэй', 'Hanus Bay'),
-    'YIG': ('Биг Бэй Марина', 'Big Bay Marina'),
-    'BHK': ('Бухара', 'Bukhara'),
-    'HBI': ('Харбор Айленд', 'Harbour Island'),
-    'ANJ': ('Занага', 'Zanaga'),
-    'ALT': ('Аленкер', 'Alenquer'),
-    'VBV': ('Вануа-Мбалаву', 'Vanuabalavu'),
-    'MFU': ('Мфуве', 'Mfuwe'),
-    'PLC': ('Планета Рики', 'Planeta Rica'),
-    'ALX': ('Александер Сити', 'Alexander City'),
-    'CAI': ('Каир', 'Cairo'),
-    'YMA': ('Мейо', 'Mayo'),
-    'CFU': ('Корфу', 'Kerkyra'),
-    'HBR': ('Хобарт', 'Hobart'),
-    'BRI': ('Бари', 'Bari'),
-    'CLT': ('Шарлотт', 'Charlotte'),
-    'AMC': ('Ам-Тиман', 'Am Timan'),
-    'PUY': ('Пула', 'Pula'),
-    'OLQ': ('Олсобип', 'Olsobip'),
-    'VLE': ('Валле', 'Valle'),
-    'EIN': ('Эйндховен', 'Eindhoven'),
-    'ANF': ('Антофагаста', 'Antofagasta'),
-    'VLR': ('Вальенар', 'Vallenar'),
-    'HMA': ('Ханты-Мансийск', 'Khanty-Mansiysk'),
-    'APB': ('Аполо', 'Apolo'),
-    'TON': ('Тону', 'Tonu'),
-    'APP': ('Асапа', 'Asapa'),
-    'PNO': ('Пинотепа-Насиональ', 'Pinotepa Nacional'),
-    'AGO': ('Магнолиа', 'Magnolia'),
-    'CEB': ('Себу', 'Cebu City'),
-    'ARQ': ('Араукита', 'Arauquita'),
-    'AQM': ('Арикемис', 'Ariquemes'),
-    'THZ': ('Тахуа', 'Tahoua'),
-    'DBV': ('Дубровник', 'Dubrovnik'),
-    'YRJ': ('Роберваль', 'Roberval'),
-    'ZAG': ('Загреб', 'Zagreb'),
-    'ARP': ('Араджип', 'Aragip'),
-    'YTR': ('Трентон', 'Trenton'),
-    'CAG': ('Кальяри', 'Cagliari'),
-    'ASO': ('Асоса', 'Asosa'),
-    'LSU': ('Лонг Суканг', 'Long Sukang'),
-    'ATG': ('Атток', 'Attock'),
-    'BKM': ('Бакалалан', 'Bakalalan'),
-    'TNK': ('Танунак', 'Tununak'),
-    'AZN': ('Андижан', 'Andizhan'),
-    'TKU': ('Турку', 'Turku'),
-    'KQT': ('Курган-Тюбе', 'Kurgon-Tyube'),
-    'ATY': ('Уотертаун (Южная Дакота)', 'Watertown'),
-    'WAC': ('Вака', 'Waca'),
-    'OWA': ('Оватонна', 'Owatonna'),
-    'AUJ': ('Амбунти', 'Ambunti'),
-    'OZH': ('Запорожье', 'Zaporozhye'),
-    'WAF': ('Вана', 'Wana'),
-    'WAZ': ('Уорик', 'Warwick'),
-    'BDU': ('Бардуфосс', 'Bardufoss'),
-    'HCM': ('Эли', 'Eil'),
-    'AUZ': ('Аврора', 'Aurora'),
-    'KZO': ('Кызылорда', 'Kzyl-Orda'),
-    'SZZ': ('Щецин', 'Szczecin'),
-    'QJY': (None, 'Kolobrzeg'),
-    'AVI': ('Сьего де Авила', 'Ciego De Avila'),
-    'LLK': ('Ленкорань', 'Lankaran'),
-    'BHX': ('Бирмингем', 'Birmingham'),
-    'BGD': ('Борджер', 'Borger'),
-    'IZM': ('Измир', 'Izmir'),
-    'AVP': ('Уилкс-Барре', 'Wilkes-Barre'),
-    'HCR': ('Холи-Кросс', 'Holy Cross'),
-    'ANC': ('Анкоридж', 'Anchorage'),
-    'BAY': ('Бая Маре', 'Baia Mare'),
-    'TPK': ('Тапактуан', 'Tapaktuan'),
-    'DMB': ('Тараз', 'Taraz'),
-    'BRE': ('Бремен', 'Bremen'),
-    'BCA': ('Баракоа', 'Baracoa'),
-    'BDF': ('Брэдфорд', 'Bradford'),
-    'ULK': ('Ленск', 'Lensk'),
-    'PEN': ('Пенанг', 'Penang'),
-    'BHR': ('Бхаратпур', 'Bharatpur'),
-    'AEG': ('Аек Годанг', 'Aek Godang'),
-    'COK': ('Кочин', 'Kochi'),
-    'WGU': ('Вагау', 'Wagau'),
-    'URE': ('Курессааре', 'Kuressaare'),
-    'AUS': ('Остин', 'Austin'),
-    'ZRJ': ('Раунд Лейк', 'Round Lake'),
-    'BGK': ('Биг-Крик', 'Big Creek'),
-    'ODO': ('Бодайбо', 'Bodaybo'),
-    'AUA': ('Аруба', 'Aruba'),
-    'NOU': ('Нумеа', 'Noumea'),
-    'WIK': ('Серфдейл', 'Surfdale'),
-    'CCU': ('Калькутта', 'Kolkata'),
-    'ZTK': (None, 'Thun'),
-    'SLC': ('Солт-Лейк-Сити', 'Salt Lake City'),
-    'WHU': ('Уху', 'Wuhu'),
-    'MQR': ('Москуэра', 'Mosquera'),
-    'HEL': ('Хельсинки', 'Helsinki'),
-    'WJF': ('Ланкастер', 'Lancaster'),
-    'BIY': ('Бишо', 'Bisho'),
-    'BUF': ('Буффало', 'Buffalo'),
-    'TSJ': ('Цусима', 'Tsushima'),
-    'MBT': ('Масбейт Сити', 'Masbate'),
-    'BFS': ('Белфаст', 'Belfast'),
-    'BLI': ('Беллингхем', 'Bellingham'),
-    'WKA': ('Ванака', 'Wanaka'),
-    'PTP': ('Пуэнт-а-Питр', 'Abymes'),
-    'JDR': (None, 'Sao Joao Del Rei'),
-    'BKX': ('Брукингс', 'Brookings'),
-    'CBR': ('Канберра', 'Canberra'),
-    'WLC': ('Уолча', 'Walcha'),
-    'UUN': ('Баруун-Урт', 'Baruun-Urt'),
-    'BLL': ('Биллунн', 'Billund'),
-    'HGH': ('Ханчжоу', 'Hangzhou'),
-    'BLX': ('Беллуно', 'Belluno'),
-    'VIV': ('Вивигани', 'Vivigani'),
-    'WLR': ('Лоринг', 'Loring'),
-    'HGT': ('Джолон', 'Jolon'),
-    'BLY': ('Белмаллет', 'Belmullet'),
-    'BQJ': ('Батагай', 'Batagay'),
-    'WMB': ('Уоррнамбул', 'Warrnambool'),
-    'BMK': ('Боркум', 'Borkum'),
-    'BNQ': ('Баганга', 'Baganga'),
-    'MUH': ('Мерса-Матрух', 'Mersa Matruh'),
-    'PIX': ('Пику', 'Pico Island (Azores)'),
-    'WSG': ('Вашингтон', 'Washington'),
-    'NUW': (None, 'Whidbey Island'),
-    'HIE': ('Уайтфилд', 'Whitefield'),
-    'PJA': ('Паяла', 'Pajala'),
-    'HIG': ('Хайбари', 'Highbury'),
-    'SRZ': ('Санта-Крус-де-ла-Сьерра', 'Santa Cruz'),
-    'WSA': ('Васуа', 'Wasua'),
-    'LOP': ('Ломбок', 'Praya'),
-    'BMI': ('Блумингтон', 'Bloomington'),
-    'NLE': ('Найлс', 'Niles'),
-    'ABJ': ('Абиджан', 'Abidjan'),
-    'WVL': ('Уотервилл', 'Waterville'),
-    'PND': ('Пунта Горда', 'Punta Gorda'),
-    'PKM': ('Порт Каитума', 'Port Kaituma'),
-    'BOX': ('Борролоола', 'Borroloola'),
-    'PBI': ('Уэст-Палм-Бич', 'West Palm Beach'),
-    'WWA': ('Василла', 'Wasilla'),
-    'PKP': ('Пекапека', 'Puka Puka'),
-    'AAM': ('Мала Мала', 'Mala Mala'),
-    'BDA': ('Бермудские Острова', 'Bermuda'),
-    'PLO': ('Порт-Линкольн', 'Port Lincoln'),
-    'WUX': ('Уси', 'Wuxi'),
-    'WBE': ('Беаланана', 'Bealanana'),
-    'WWT': ('Ньюток', 'Newtok'),
-    'HKB': ('Хили Лейк', 'Healy Lake'),
-    'UAX': ('Уашактун', 'Uaxactun'),
-    'ABZ': ('Абердин', 'Aberdeen'),
-    'HKG': ('Гонконг', 'Hong Kong'),
-    'GZT': ('Газиантеп', 'Gaziantep'),
-    'WYA': ('Уайалла', 'Whyalla'),
-    'PMG': ('Понта-Поран', 'Ponta Pora'),
-    'BQT': ('Брест', 'Brest'),
-    'WHL': ('Велшпул', 'Welshpool'),
-    'XUG': (None, 'Holmestrand'),
-    'ANL': ('Андуло', 'Andulo'),
-    'HKT': ('Пхукет', 'Phuket'),
-    'WJA': ('Воджа', 'Woja'),
-    'WYN': ('Виндхам', 'Wyndham'),
-    'PMT': ('Парамакотои', 'Paramakotoi'),
-    'NAS': ('Нассау', 'Nassau'),
-    'MKO': (None, 'Muskogee'),
-    'BRS': ('Бристоль', 'Bristol'),
-    'PNJ': ('Пенг Лай', 'Peng Lai'),
-    'XBB': ('Блаббер Бэй', 'Blubber Bay'),
-    'CHL': ('Чаллис', 'Challis'),
-    'AEU': ('Абу Муса', 'Abu Musa'),
-    'PAP': ('Порт-о-Пренс', 'Port Au Prince'),
-    'HMR': ('Хамар', 'Hamar'),
-    'AMQ': ('Амбон', 'Ambon'),
-    'ADE': ('Аден', 'Aden'),
-    'PAU': ('Паук', 'Pauk'),
-    'AES': ('Олесунн', 'Aalesund'),
-    'BWC': ('Броли', 'Brawley'),
-    'XDJ': ('Джибо', 'Djibo'),
-    'BRY': ('Бардстаун', 'Bardstown'),
-    'AAL': ('Ольборг', 'Aalborg'),
-    'OMA': ('Омаха', 'Omaha'),
-    'HMV': ('Хемаван', 'Hemavan'),
-    'AFT': ('Афутара', 'Afutara'),
-    'MMH': ('Маммот Лейкс', 'Mammoth Lakes'),
-    'APW': ('Апиа', 'Apia'),
-    'BUG': ('Бенгела', 'Benguela'),
-    'BSS': ('Альтбальсас', 'Balsas'),
-    'AGM': ('Тасиилак', 'Tasiilaq'),
-    'MXB': ('Масамба', 'Masamba'),
-    'XEQ': ('Тазиуасак', 'Tasiuasaq'),
-    'HNL': ('Гонолулу', 'Honolulu'),
-    'BTL': ('Батл Крик', 'Battle Creek'),
-    'BVC': ('Боа-Вишта', 'Boa Vista'),
-    'POD': ('Подор', 'Podor'),
-    'KHN': ('Наньчан', 'Nanchang'),
-    'BBA': ('Бальмаседа', 'Balmaceda'),
-    'BVU': ('Бельюга', 'Beluga'),
-    'BWG': ('Боулинг Грин', 'Bowling Green'),
-    'XGN': ('Ксангонго', 'Xangongo'),
-    'CAO': ('Клейтон', 'Clayton'),
-    'HRG': ('Хургада', 'Hurghada'),
-    'AIU': ('Атиу', 'Atiu Island'),
-    'VRN': ('Верона', 'Verona'),
-    'XLO': ('Лонгсюен', 'Long Xuyen'),
-    'BYC': ('Якуиба', 'Yacuiba'),
-    'POG': ('Порт-Жантиль', 'Port Gentil'),
-    'SIA': ('Сиань', 'Xian'),
-    'NBL': ('Сан Блас', 'San Blas'),
-    'CBC': ('Черрабан', 'Cherrabun'),
-    'CDD': ('Каукира', 'Cauquira'),
-    'LIL': ('Лилль', 'Lille'),
-    'MSY': ('Новый Орлеан', 'New Orleans'),
-    'PPK': ('Петропавловск', 'Petropavlovsk'),
-    'LTU': (None, 'Latur'),
-    'PAR': ('Париж', 'Paris'),
-    'CDI': ('Качоэйро-Итапемирим', 'Cachoeiro Itapemirim'),
-    'NDA': ('Банданаира', 'Bandanaira'),
-    'PSJ': ('Посо', 'Poso'),
-    'MEL': ('Мельбурн', 'Melbourne'),
-    'XGX': (None, 'Levi'),
-    'XPR': ('Пайн Ридж', 'Pine Ridge'),
-    'HSZ': ('Синьчжу', 'Hsinchu'),
-    'AJS': ('Арбеохос', 'Abreojos'),
-    'YXU': ('Лондон', 'London'),
-    'XPU': ('Запад Купарек', 'West Kuparuk'),
-    'HUJ': ('Хьюго', 'Hugo'),
-    'CNS': ('Кэрнс', 'Cairns'),
-    'BPB': ('Бориди', 'Boridi'),
-    'XSO': ('Сиокон', 'Siocon'),
-    'BLR': ('Бангалор', 'Bengaluru'),
-    'CFK': ('Шлеф', 'Chlef'),
-    'HZB': ('Азебрук', 'Hazebrouck'),
-    'XRR': ('Росс Ривер', 'Ross River'),
-    'MYV': ('Мэрисвилл', 'Marysville'),
-    'CAE': ('Колумбия', 'Columbia'),
-    'HIJ': ('Хиросима', 'Hiroshima'),
-    'MRT': ('Мороак', 'Moroak'),
-    'NGK': ('Ноглики', 'Nogliki'),
-    'SEL': ('Сеул', 'Seoul'),
-    'HEK': ('Хэйхэ', 'Heihe'),
-    'IDK': ('Индалкана', 'Indulkana'),
-    'ARV': ('Миноккуа', 'Minocqua'),
-    'CRO': ('Коркоран', 'Corcoran'),
-    'CGP': ('Читтагонг', 'Chittagong'),
-    'CWR': ('Ковари', 'Cowarie'),
-    'IBZ': ('Ибица', 'Ibiza'),
-    'AMJ': ('Альменара', 'Almenara'),
-    'LXA': ('Лхаса', 'Lhasa'),
-    'CGT': ('Шингети', 'Chinguitti'),
-    'NST': ('Накхонситхаммарат', 'Nakhon Si Thammarat'),
-    'NGX': ('Мананг', 'Manang'),
-    'YAG': ('Форт-Франсес', 'Fort Frances'),
-    'CYC': ('Кайе-Шапел', 'Caye Chapel'),
-    'NHK': ('Патуксент Ривер', 'Patuxent River'),
-    'IRO': ('Бирао', 'Birao'),
-    'YAH': ('Лагранде 4', 'Lagrande 4'),
-    'PTV': ('Портервилл', 'Porterville'),
-    'YAQ': ('Мэпл Бэй', 'Maple Bay'),
-    'APR': ('Эйприл-Ривер', 'April River'),
-    'YAU': ('Каттиник', 'Kattiniq'),
-    'AUQ': ('Хива-Оа', 'Atuona'),
-    'JLA': ('Купер Лодж', 'Cooper Lodge'),
-    'BAS': ('Балала', 'Balalae'),
-    'NNX': ('Нункан', 'Nunukan'),
-    'YLL': ('Ллойдминстер', 'Lloydminster'),
-    'NLP': ('Мбомбела', 'Nelspruit'),
-    'CIG': ('Крейг', 'Craig'),
-    'FAI': ('Фэрбанкс', 'Fairbanks'),
-    'AVN': ('Авиньон', 'Avignon'),
-    'CLW': (None, 'Clearwater'),
-    'YAV': ('Майнерс Бэй', 'Miners Bay'),
-    'PTX': ('Питалито', 'Pitalito'),
-    'YAY': ('Сейнт Энтони', 'St Anthony'),
-    'ASL': ('Маршалл', 'Marshall'),
-    'AKI': ('Акиак', 'Akiak'),
-    'YBQ': ('Телеграф Харбор', 'Telegraph Harbour'),
-    'APZ': ('Сапала', 'Zapala'),
-    'SKT': ('Сиялкот', 'Sialkot'),
-    'MTU': ('Монтепвезе', 'Montepuez'),
-    'AQI': ('Кайсумах', 'Qaisumah'),
-    'YBY': ('Боннивилл', 'Bonnyville'),
-    'YDJ': ('Хатчет Лейк', 'Hatchet Lake'),
-    'JOK': ('Йошкар-Ола', 'Yoshkar-Ola'),
-    'YSC': ('Шербрук', 'Sherbrooke'),
-    'ATW': ('Аплтон', 'Appleton'),
-    'NNM': ('Нарьян-Мар', 'Naryan-Mar'),
-    'CET': ('Шоле', 'Cholet'),
-    'YCR': ('Кросс Лейк', 'Cross Lake'),
-    'SBW': ('Сибу', 'Sibu'),
-    'ABF': ('Абаианг', 'Abaiang'),
-    'CLE': ('Кливленд', 'Cleveland'),
-    'ZIR': (None, 'Randers'),
-    'VGZ': ('Виллагарзьон', 'Villagarzon'),
-    'RTW': ('Саратов', 'Saratov'),
-    'COB': ('Кулиба', 'Coolibah'),
-    'YXF': ('Снейк', 'Snake River'),
-    'JSR': ('Джессор', 'Jessore'),
-    'SST': ('Санта Тересита', 'Santa Teresita'),
-    'BQN': ('Агуадилья', 'Aguadilla'),
-    'SFH': ('Сан-Фелипе', 'San Felipe'),
-    'XEK': (None, 'Melville'),
-    'YDX': ('Док Крик', 'Doc Creek'),
-    'RAA': ('Раканда', 'Rakanda'),
-    'NTA': ('Натадола', 'Natadola'),
-    'OER': ('Эрншёльдсвик', 'Ornskoldsvik'),
-    'HOU': ('Хьюстон', 'Houston'),
-    'SLP': ('Сан-Луис-Потоси', 'San Luis Potosi'),
-    'HRE': ('Хараре', 'Harare'),
-    'BJX': ('Леон', 'Leon/Guanajuato'),
-    'SDL': ('Сундсвалль', 'Sundsvall'),
-    'BZY': ('Бельцы', 'Beltsy'),
-    'SHN': ('Шелтон', 'Shelton'),
-    'COP': ('Куперстаун', 'Cooperstown'),
-    'COW': ('Кокимбо', 'Coquimbo'),
-    'TPS': ('Трапани', 'Trapani'),
-    'REH': ('Рехобот Бич', 'Rehoboth Beach'),
-    'YEC': ('Йечеон', 'Yecheon'),
-    'POM': ('Порт-Морсби', 'Port Moresby'),
-    'CMF': ('Шамбери', 'Chambery'),
-    'CPD': ('Кубер-Педи', 'Coober Pedy'),
-    'SDR': ('Сантандер', 'Santander'),
-    'VKG': ('Ратьзя', 'Rach Gia'),
-    'EKS': ('Шахтёрск', 'Shakhtyorsk'),
-    'YES': ('Ясуж', 'Yasouj'),
-    'KEO': ('Одиенне', 'Odienne'),
-    'BZV': ('Браззавиль', 'Brazzaville'),
-    'YEV': ('Инувик', 'Inuvik'),
-    'SWD': ('Сьюард', 'Seward'),
-    'GSP': ('Гринвилл', 'Greenville'),
-    'CPN': ('Капе-Родней', 'Cape Rodney'),
-    'CPU': ('Курурупу', 'Cururupu'),
-    'GCN': ('Гранд Каньон Виллидж', 'Flagstaff'),
-    'KGL': ('Кигали', 'Kigali'),
-    'YNX': (None, 'Snap Lake'),
-    'PBH': ('Паро', 'Paro'),
-    'KGR': ('Кулджера', 'Kulgera'),
-    'VPE': ('Онджива', 'Ondjiva'),
-    'BWN': ('Бруней', 'Bandar Seri Begawan'),
-    'CVF': ('Куршевель', 'Courchevel'),
-    'KGX': ('Грейлинг', 'Grayling'),
-    'SLS': ('Силистра', 'Silistra'),
-    'INV': ('Инвернесс', 'Inverness'),
-    'KHW': ('Хвай Ривер Лодж', 'Khwai River Lodge'),
-    'RTP': ('Рутланд Плейнс', 'Rutland Plains'),
-    'IRM': ('Игрим', 'Igrim'),
-    'KSL': ('Кассала', 'Kassala'),
-    'SGI': ('Саргодха', 'Sargodha'),
-    'TUL': ('Талса', 'Tulsa'),
-    'CRB': ('Колларенбри', 'Collarenebri'),
-    'CIH': ('Чанчжи', 'Changzhi'),
-    'KJK': ('Кортрейк', 'Kortrijk'),
-    'PNQ': ('Пуна', 'Pune'),
-    'KJP': ('Керама', 'Kerama'),
-    'AXE': ('Шаншере', 'Xanxere'),
-    'CRP': ('Корпус-Кристи', 'Corpus Christi'),
-    'SIJ': ('Сиглюфьордюр', 'Siglufjordur'),
-    'CSK': ('Кап-Скирринг', 'Cap Skirring'),
-    'KKA': ('Коюк', 'Koyuk'),
-    'SIN': ('Сингапур', 'Singapore'),
-    'AYC': ('Аякучо', 'Ayacucho'),
-    'KKN': ('Киркенес', 'Kirkenes'),
-    'YFC': ('Фредериктон', 'Fredericton'),
-    'CSM': (None, 'Clinton'),
-    'KNW': ('Нью Стуиахок', 'New Stuyahok'),
-    'ORI': ('Порт Лайонс', 'Port Lions'),
-    'BAN': ('Басонго', 'Basongo'),
-    'SJS': ('Сан Хосе', 'San Jose'),
-    'PEG': ('Перуджа', 'Perugia'),
-    'SJU': ('Сан-Хуан', 'San Juan'),
-    'KOA': ('Каилуа-Кона', 'Kailua-Kona'),
-    'SNY': ('Сидней', 'Sidney'),
-    'CJU': ('Чеджу', 'Jeju'),
-    'SLV': ('Шимла', 'Simla'),
-    'OTL': ('Боултилимит', 'Boutilimit'),
-    'KOD': ('Котабанган', 'Kotabangun'),
-    'BQA': ('Балер', 'Baler'),
-    'DED': ('Дехрадун', 'Dehra Dun'),
-    'AAE': ('Аннаба', 'Annaba'),
-    'SNP': ('Остров Святого Павла', 'Saint Paul Island'),
-    'CUT': ('Кутраль Ко', 'Cutral'),
-    'KRW': ('Туркменбашы', 'Turkmanbashi'),
-    'SNT': ('Сабана Де Торрес', 'Sabana De Torres'),
-    'KPY': ('Порт Бейли', 'Port Bailey'),
-    'KTC': ('Касьола', 'Katiola'),
-    'SNX': ('Сабана де ла Мар', 'Sabana De Mar'),
-    'KRA': ('Керанг', 'Kerang'),
-    'JHB': ('Джохор-Бару', 'Johor Bharu'),
-    'AEA': ('Абемама', 'Abemama Atoll'),
-    'NKI': ('Наукити', 'Naukiti'),
-    'SOL': ('Соломон', 'Solomon'),
-    'UBJ': ('Убе', 'Ube'),
-    'SPC': ('Санта-Крус-де-Ла-Пальма', 'Santa Cruz De La Palma'),
-    'DAV': ('Давид', 'David'),
-    'BSA': ('Босаасо', 'Bossaso'),
-    'YGB': ('Гиллис Бэй', 'Gillies Bay'),
-    'YFE': ('Форествилль', 'Forestville'),
-    'CWG': ('Каллавей Гарденс', 'Callaway Gardens'),
-    'PAD': ('Падерборн', 'Paderborn'),
-    'XNN': ('Синин', 'Xining'),
-    'SRN': ('Страхан', 'Strahan'),
-    'NNA': ('Кенитра', 'Kenitra'),
-    'DFW': ('Даллас', 'Dallas'),
-    'ADZ': ('Остров Сан-Андрес', 'San Andres Island'),
-    'HFT': ('Хаммерфест', 'Hammerfest'),
-    'DFI': ('Дефианс', 'Defiance'),
-    'GEO': ('Джорджтаун', 'Georgetown'),
-    'TZL': ('Тузла', 'Tuzla'),
-    'SXW': ('Сурен', 'Sauren'),
-    'SYX': ('Санья', 'Sanya'),
-    'DGC': ('Дегабер', 'Degahbur'),
-    'CWL': ('Кардифф', 'Cardiff'),
-    'BCJ': ('Крестон', 'Baca Grande'),
-    'SZX': ('Шэньчжэнь', 'Shenzhen'),
-    'ATL': ('Атланта', 'Atlanta'),
-    'XUO': (None, 'Nordagutu'),
-    'FEN': ('Фернанду-ди-Норонья', 'Fernando De Noronha'),
-    'TFL': ('Теофилу-Отони', 'Teofilo Otoni'),
-    'NJF': ('Эн-Наджаф', 'Al-Najaf'),
-    'DIE': ('Анцеранана', 'Antsiranana'),
-    'ACH': ('Санкт-Галлен', 'Altenrhein'),
-    'KRC': ('Керинчи', 'Kerinci'),
-    'AFR': ('Афор', 'Afore'),
-    'ZKP': ('Зырянка', 'Zyryanka'),
-    'TLE': ('Тулиара', 'Tulear'),
-    'AND': ('Андерсон', 'Anderson'),
-    'YGA': ('Гагнон', 'Gagnon'),
-    'CYO': ('Ларго-дель-Сур', 'Cayo Largo Del Sur'),
-    'SBQ': ('Сиби', 'Sibi'),
-    'WPL': ('оз. Пауэлл', 'Powell Lake'),
-    'GBE': ('Габороне', 'Gaborone'),
-    'PJG': ('Панджгур', 'Panjgur'),
-    'HIR': ('Хониара', 'Honiara'),
-    'ZKE': ('Кащечтеван', 'Kaschechewan'),
-    'PIP': ('Пайлот Пойнт', 'Pilot Point'),
-    'NSZ': (None, 'Nansha'),
-    'AYP': ('Аякучо', 'Ayacucho'),
-    'KRL': ('Корла', 'Korla'),
-    'SMI': ('Самос', 'Samos'),
-    'COX': ('Конго Таун', 'Congo Town'),
-    'AMV': ('Амдерма', 'Amderma'),
-    'TRV': ('Тривандрам', 'Thiruvananthapuram'),
-    'AAH': ('Ахен', 'Aachen'),
-    'SMA': ('Санта-Мария', 'Santa Maria (Azores)'),
-    'AYU': ('Аиюра', 'Aiyura'),
-    'YFS': ('Форт Симпсон', 'Fort Simpson'),
-    'TSN': ('Тяньцзинь', 'Tianjin'),
-    'AYZ': ('Амитивилль', 'Amityville'),
-    'KSU': ('Кристиансанн', 'Kristiansund'),
-    'IEG': ('Зелёна-Гура', 'Zielona Gora'),
-    'KUX': ('Куйол', 'Kuyol'),
-    'KIN': ('Кингстон', 'Kingston'),
-    'TSY': ('Тасикмалая', 'Tasikmalaya'),
-    'AHZ': ("Альп-д'Юэз", 'Alpe D Huez'),
-    'ARI': ('Арика', 'Arica'),
-    'TTG': ('Тартагал', 'Tartagal'),
-    'UCN': ('Бьюкенен', 'Buchanan'),
-    'BAQ': ('Барранкилья', 'Barranquilla'),
-    'TUE': ('Тупиле', 'Tupile'),
-    'BCM': ('Бакэу', 'Bacau'),
-    'TUW': ('Тубала', 'Tubala'),
-    'BAX': ('Барнаул', 'Barnaul'),
-    'WRE': ('Фангареи', 'Whangarei'),
-    'TYP': ('Тобермори', 'Tobermorey'),
-    'UCY': ('Юнион Сити', 'Union City'),
-    'KUN': ('Каунас', 'Kaunas'),
-    'YZM': ('Баканс', 'Buchans'),
-    'SGP': ('Шай Гап', 'Shay Gap'),
-    'HLE': ('Джеймстаун', 'Jamestown'),
-    'AOK': ('Карпатос', 'Karpathos'),
-    'KVK': ('Кировск (Апатиты)', 'Kirovsk'),
-    'ULZ': ('Улясутай', 'Uliastai'),
-    'AIT': ('Аитутаки', 'Aitutaki'),
-    'PLZ': ('Порт-Элизабет', 'Port Elizabeth'),
-    'DOP': ('Долпа', 'Dolpa'),
-    'UMM': ('Саммит', 'Summit'),
-    'BBM': ('Баттамбанг', 'Battambang'),
-    'CNN': ('Каннур', 'Kannur'),
-    'CCK': ('Кокосовые острова', 'Cocos Islands'),
-    'ADO': ('Андамука', 'Andamooka'),
-    'EUN': ('Эль-Аюн', 'Laayoune'),
-    'LBA': ('Лидс', 'Leeds'),
-    'YHF': ('Хирст', 'Hearst'),
-    'UTW': ('Квинстаун', 'Queenstown'),
-    'PUP': ('По', 'Po'),
-    'BIE': ('Биатрис', 'Beatrice'),
-    'LBR': ('Лабреа', 'Labrea'),
-    'BZR': ('Безье', 'Beziers'),
-    'BBQ': ('Барбуда', 'Barbuda'),
-    'YIO': ('Понд-Инлет', 'Pond Inlet'),
-    'AHN': ('Атенс', 'Athens'),
-    'DUG': ('Дуглас', 'Douglas'),
-    'RNB': ('Роннебю', 'Ronneby'),
-    'BBS': ('Йатли', 'Yateley'),
-    'UVO': ('Увол', 'Uvol'),
-    'MGM': ('Монтгомери', 'Montgomery'),
-    'BBT': ('Берберати', 'Berberati'),
-    'MSN': ('Мадисон', 'Madison'),
-    'PWD': ('Плентивуд', 'Plentywood'),
-    'BLZ': ('Блантайр', 'Blantyre'),
-    'DUQ': (None, 'Duncan/Quam'),
-    'UZH': ('Унайза', 'Unayzah'),
-    'JCN': (None, 'Incheon'),
-    'LBB': ('Лаббок', 'Lubbock'),
-    'XNV': (None, 'Nuneaton'),
-    'SIL': ('Сила', 'Sila'),
-    'IAG': ('Ниагара-Фолс', 'Niagara Falls'),
-    'BBZ': ('Замбези', 'Zambezi'),
-    'YIV': ('Айленд Лейк', 'Island Lake'),
-    'BBO': ('Бербера', 'Berbera'),
-    'EIA': ('Эйя', 'Eia'),
-    'BLV': ('Белльвилль', 'Belleville'),
-    'RBQ': ('Рурренабаке', 'Rurrenabaque'),
-    'NTL': ('Ньюкасл', 'Newcastle'),
-    'RAX': ('Орам', 'Oram'),
-    'CUS': ('Колумбус', 'Columbus'),
-    'LMH': ('Лимон', 'Limon'),
-    'YLF': ('Лафорджес', 'LaForges'),
-    'VLC': ('Валенсия', 'Valencia'),
-    'LNK': ('Линкольн', 'Lincoln'),
-    'RBT': ('Марсабит', 'Marsabit'),
-    'AKX': ('Актобе', 'Aktyubinsk'),
-    'VLG': ('Вилья Хесель', 'Villa Gesell'),
-    'LPJ': ('Пихигуаос', 'Pijiguaos'),
-    'VTB': ('Витебск', 'Vitebsk'),
-    'UDR': ('Удайпур', 'Udaipur'),
-    'LRA': ('Лариса', 'Larisa'),
-    'YLN': ('Йилан', 'Yilan'),
-    'BUM': ('Батлер', 'Butler'),
-    'LSA': ('Лосуиа', 'Losuia'),
-    'YLR': ('Лиф Рапидс', 'Leaf Rapids'),
-    'TUZ': ('Тукума', 'Tucuma'),
-    'ERO': ('Элдед Рок', 'Eldred Rock'),
-    'AOG': ('Аньшань', 'Anshan'),
-    'ZZV': ('Занесвилл', 'Zanesville'),
-    'EGX': ('Эгиджик', 'Egegik'),
-    'VUP': ('Вальедупар', 'Valledupar'),
-    'CBB': ('Кочабамба', 'Cochabamba'),
-    'VVO': ('Владивосток', 'Vladivostok'),
-    'BZO': ('Больцано', 'Bolzano'),
-    'PMV': ('Порламар', 'Porlamar'),
-    'LSE': ('Ла-Кросс', 'La Crosse'),
-    'SKS': ('Войенс', 'Vojens'),
-    'BIU': ('Билдудалур', 'Bildudalur'),
-    'XKA': ('Кантчари', 'Kantchari'),
-    'BLP': ('Беллависта', 'Bellavista'),
-    'LSS': ('Терре-де-Хаус', 'Terre-de-Haut'),
-    'VIT': ('Витория', 'Vitoria'),
-    'ZSH': ('Санта-Фе', 'Santa Fe'),
-    'ALL': ('Альбенга', 'Albenga'),
-    'LTD': ('Гадамес', 'Ghadames'),
-    'WAH': ('Уопетон', 'Wahpeton'),
-    'TWU': ('Тавау', 'Tawau'),
-    'LTB': ('Латроб', 'Latrobe'),
-    'ELU': ('Эль-Уэд', 'El Oued'),
-    'DUD': ('Данидин', 'Dunedin'),
-    'SBN': ('Саут-Бенд', 'South Bend'),
-    'ZHE': (None, 'Frauenfeld'),
-    'RJK': ('Риека', 'Rijeka'),
-    'BOB': ('Бора-Бора', 'Bora Bora'),
-    'WAM': ('Амбатундразака', 'Ambatondrazaka'),
-    'LMO': ('Лоссимонт', 'Lossiemouth'),
-    'WAN': ('Вейверни', 'Waverney'),
-    'AGS': ('Огаста', 'Augusta'),
-    'CAH': ('Камау', 'Kamau'),
-    'TVU': ('Тавеуни', 'Taveuni'),
-    'WBC': ('Ваполу', 'Wapolu'),
-    'YQG': ('Виндзор', 'Windsor'),
-    'ENT': ('Эниветок', 'Enewetak Island'),
-    'YMB': ('Мерритт', 'Merritt'),
-    'LUW': ('Лувук', 'Luwuk'),
-    'BEY': ('Бейрут', 'Beirut'),
-    'LVO': ('Лавертон', 'Laverton'),
-    'WDG': ('Энид', 'Enid'),
-    'YCD': ('Нанаймо', 'Nanaimo'),
-    'AAF': ('Апалачикола', 'Apalachicola'),
-    'WDH': ('Виндхук', 'Windhoek'),
-    'LWC': ('Лоуренс', 'Lawrence'),
-    'EPG': ('Уипинг Уотер', 'Weeping Water'),
-    'PNL': ('Пантеллерия', 'Pantelleria'),
-    'SNR': ('Сен-Назер', 'Saint Nazaire'),
-    'AAZ': ('Кесальтенанго', 'Quetzaltenango'),
-    'AVB': ('Авиано', 'Aviano'),
-    'WEI': ('Уэйпа', 'Weipa'),
-    'SYD': ('Сидней', 'Sydney'),
-    'BFB': ('Блу Фокс Бэй', 'Blue Fox Bay'),
-    'YVR': ('Ванкувер', 'Vancouver'),
-    'FRL': ('Форли', 'Forli'),
-    'CAQ': ('Кавказ', 'Caucasia'),
-    'EVD': ('Эва-Даунс', 'Eva Downs'),
-    'UET': ('Кветта', 'Quetta'),
-    'AMI': ('Матарам', 'Mataram'),
-    'CWP': ('Камббеллпоре', 'Campbellpore'),
-    'WEL': ('Велком', 'Welkom'),
-    'BFC': ('Блумфилд', 'Bloomfield'),
-    'MAD': ('Мадрид', 'Madrid'),
-    'WGN': ('Уэйтанги', 'Waitangi'),
-    'ATZ': ('Асьют', 'Assiut'),
-    'DKA': (None, 'Katsina'),
-    'ADF': ('Адыяман', 'Adiyaman'),
-    'ABT': ('Аль-Баха', 'Al-Baha'),
-    'BWL': ('Блэкуэлл', 'Blackwell'),
-    'BFG': ('Буллфрог Бейсин', 'Bullfrog Basin'),
-    'MAJ': ('Маджуро', 'Majuro'),
-    'WHK': ('Факатане', 'Whakatane'),
-    'MAN': ('Манчестер', 'Manchester'),
-    'YIW': ('Иу', 'Yiwu'),
-    'ERH': ('Эр-Рашидия', 'Errachidia'),
-    'MBA': ('Момбаса', 'Mombasa'),
-    'WHS': ('Уолсей', 'Whalsay'),
-    'BAV': ('Баотоу', 'Baotou'),
-    'WNU': ('Ванума', 'Wanuma'),
-    'CWS': ('Остров Сентер', 'Center Island'),
-    'DRO': ('Дуранго', 'Durango'),
-    'WOD': ('Вуд Ривер', 'Wood River'),
-    'BJA': ('Беджая', 'Bejaia'),
-    'YTY': ('Янчжоу', 'Yangzhou'),
-    'WOK': ('Вонкен', 'Wonken'),
-    'ABN': ('Албина', 'Albina'),
-    'WSD': ('Уайт Сэндс', 'White Sands'),
-    'QYI': ('Хилверсюм', 'Hilversum'),
-    'ABR': ('Абердин', 'Aberdeen'),
-    'RUK': ('Рукумкот', 'Rukumkot'),
-    'BUZ': ('Бушир', 'Bushehr'),
-    'WSH': ('Ширли', 'Shirley'),
-    'KUD': ('Кудат', 'Kudat'),
-    'ESG': ('Марискаль Хосе Феликс Эстигаррибия', 'Mariscal Estigarribia'),
-    'ARA': ('Нью Иберия', 'New Iberia'),
-    'MAF': ('Мидленд', 'Midland'),
-    'BGG': ('Бингёль', 'Bingol'),
-    'ABV': ('Абуджа', 'Abuja'),
-    'MDG': ('Муданьцзян', 'Mudanjiang'),
-    'WVN': ('Вильгельмсхафен', 'Wilhelmshaven'),
-    'CCM': ('Крисиума', 'Criciuma'),
-    'GAV': ('Гаг-Айленд', 'Gag Island'),
-    'WWR': ('Вудворд', 'Woodward'),
-    'SBY': ('Ошен Сити', 'Salisbury-Ocean City'),
-    'CUU': ('Чиуауа', 'Chihuahua'),
-    'WWY': ('Запад Уайалонг', 'West Wyalong'),
-    'MDJ': ('Мадрас', 'Madras'),
-    'STM': ('Сантарен', 'Santarem'),
-    'ACD': ('Аканди', 'Acandi'),
-    'LDB': ('Лондрина', 'Londrina'),
-    'BLJ': ('Батна', 'Batna'),
-    'SCD': ('Сулако', 'Sulaco'),
-    'INX': ('Инанватан', 'Inanwatan'),
-    'CFG': ('Сьенфуэгос', 'Cienfuegos'),
-    'CPX': ('Кулебра', 'Culebra'),
-    'BIK': ('Биак', 'Biak'),
-    'SCX': ('Салина Крус', 'Salina Cruz'),
-    'MEJ': ('Мэадвилль', 'Meadville'),
-    'TAC': ('Таклобан', 'Tacloban'),
-    'XGL': ('оз. Гранвилл', 'Granville Lake'),
-    'ACN': ('Акунья', 'Acuna'),
-    'VXO': ('Векшё', 'Vaxjo'),
-    'XAP': ('Шапеко', 'Chapeco'),
-    'GMB': ('Гамбела', 'Gambela'),
-    'GNV': ('Гейнсвилл', 'Gainesville'),
-    'XKC': ('Санднес', 'Sandnes'),
-    'JRS': ('Иерусалим', 'Jerusalem'),
-    'BGP': ('Бонго', 'Bongo'),
-    'BWO': ('Балаково', 'Balakovo'),
-    'IQQ': ('Икике', 'Iquique'),
-    'MFJ': ('Острова Моала', 'Moala'),
-    'YMG': ('Манитувадж', 'Manitouwadge'),
-    'MHY': ('Морехэд', 'Morehead'),
-    'MFO': ('Мангуна', 'Manguna'),
-    'EXT': ('Эксетер', 'Exeter'),
-    'MFP': ('Маннерс Крик', 'Manners Creek'),
-    'BSK': ('Бискра', 'Biskra'),
-    'OCC': ('Франсиско де Орельяна', 'Coca'),
-    'XKO': ('Кемано', 'Kemano'),
-    'ADQ': ('Кадьяк', 'Kodiak'),
-    'ADX': ('Сент-Эндрюс', 'St Andrews'),
-    'PTQ': ('Порту-ди-Мос', 'Porto de Moz'),
-    'PBC': ('Пуэбла', 'Puebla'),
-    'HNY': ('Хэнъян', 'Hengyang'),
-    'SHU': ('Смит Поинт', 'Smith Point'),
-    'BXD': ('Баде', 'Bade'),
-    'ADY': ('Олдэйс', 'Alldays'),
-    'PSE': ('Понсе', 'Ponce'),
-    'XML': ('Минлатон', 'Minlaton'),
-    'SIP': ('Симферополь (Крым)', 'Simferopol'),
-    'MHE': ('Митчелл', 'Mitchell'),
-    'BHP': ('Бхойпур', 'Bhojpur'),
-    'FAO': ('Фару', 'Faro'),
-    'SPI': ('Спрингфилд', 'Springfield'),
-    'FEC': ('Фейра-ди-Санта', 'Feira De Santana'),
-    'XII': (None, 'Prescott'),
-    'YFX': ('Фокс Харбор', 'Fox Harbour (St Lewis)'),
-    'BAL': ('Батман', 'Batman'),
-    'OSA': ('Осака', 'Osaka'),
-    'JKG': ('Йёнчёпинг', 'Jonkoping'),
-    'FAS': ('Фаскрудсфьордур', 'Faskrudsfjordur'),
-    'MHK': ('Манхэттен', 'Manhattan'),
-    'AEO': ('Аюн-эль-Атрус', 'Aioun El Atrouss'),
-    'VTA': ('Виктория', 'Victoria'),
-    'ZFL': ('оз. Юг Траут', 'South Trout Lake'),
-    'SKE': ('Скиен', 'Skien'),
-    'ROM': ('Рим', 'Rome'),
-    'MHL': ('Маршалл', 'Marshall'),
-    'BNU': ('Блуменау', 'Blumenau'),
-    'XPL': ('Комаягуа', 'Comayagua'),
-    'SFR': ('Сан-Фернандо', 'San Fernando'),
-    'AFL': ('Алта-Флореста', 'Alta Floresta'),
-    'XZB': (None, 'Casselman'),
-    'XSM': ('Сент-Мэрис', 'St Marys'),
-    'AFN': ('Джаффри', 'Jaffrey'),
-    'SAC': ('Сакраменто', 'Sacramento'),
-    'XTR': ('Тара', 'Tara'),
-    'FKB': ('Карлсруэ', 'Karlsruhe/Baden Baden'),
-    'PGD': ('Пунта Горда', 'Punta Gorda'),
-    'MGZ': ('Мьей', 'Myeik'),
-    'BJH': ('Баджханг', 'Bajhang'),
-    'GFB': ('Тоджиак', 'Togiak Fish'),
-    'MHZ': ('Милденхолл', 'Mildenhall'),
-    'AGA': ('Агадир', 'Agadir'),
-    'XWQ': ('Экнгопинг', 'Enkoping'),
-    'SGD': ('Сённерборг', 'Sonderborg'),
-    'AGF': ('Ажен', 'Agen'),
-    'XQW': (None, 'Motherwell'),
-    'SPT': ('Сипитанг', 'Sipitang'),
-    'KVR': ('Кавалерово', 'Kavalerovo'),
-    'HGN': ('Мэхонгсон', 'Mae Hong Son'),
-    'SOR': ('Аль Тора', 'Al Thaurah'),
-    'SOU': ('Саутгемптон', 'Southampton'),
-    'YDI': ('Дэвис Инлет', 'Davis Inlet'),
-    'MSP': ('Миннеаполис', 'Minneapolis'),
-    'BDJ': ('Банджармасин', 'Banjarmasin'),
-    'PKN': ('Пангкаланбун', 'Pangkalanbun'),
-    'FNL': ('Форт Коллинс', 'Fort Collins'),
-    'DNH': ('Дуньхуан', 'Dunhuang'),
-    'FSL': ('Фоссил-Даунс', 'Fossil Downs'),
-    'YDW': ('Обре Лейк', 'Obre Lake'),
-    'BJU': ('Баджура', 'Bajura'),
-    'ZAM': ('Замбоанга', 'Zamboanga'),
-    'WSO': ('Вашабо', 'Washabo'),
-    'SPR': ('Сан Педро', 'San Pedro'),
-    'GFY': ('Хрутфонтейн', 'Grootfontein'),
-    'SQY': ('Сан-Лоренсу-ду-Сул', 'Sao Lourenco Do Sul'),
-    'WKJ': ('Вакканай', 'Wakkanai'),
-    'VIJ': ('Верджин-Горда', 'Virgin Gorda'),
-    'THS': ('Сукхотхай', 'Sukhothai'),
-    'SGR': (None, 'Sugar Land'),
-    'BVE': ('Брив-ла-Гайард', 'Brive-La-Gaillarde'),
-    'KWG': ('Кривой Рог', 'Krivoy Rog'),
-    'WTR': ('Уайтривер', 'White River'),
-    'AKJ': ('Асахикава', 'Asahikawa'),
-    'WUZ': ('Учжоу', 'Wuzhou'),
-    'YLM': ('Клинтон Крик', 'Clinton Creek'),
-    'JTY': ('Астипалея', 'Astypalaia Island'),
-    'XYN': ('Кристинехамн', 'Kristinehamn'),
-    'TGT': ('Танга', 'Tanga'),
-    'QPV': (None, 'Perisher Valley'),
-    'XEO': ('Окатсут', 'Oqatsut'),
-    'YXY': ('Уайтхорс', 'Whitehorse'),
-    'SHK': ('Сехонгхонг', 'Sehonghong'),
-    'GOH': ('Нуук', 'Nuuk'),
-    'AGN': ('Ангун', 'Angoon'),
-    'YSB': ('Грейтер-Садбери', 'Sudbury'),
-    'YGS': ('Германстен', 'Germansen'),
-    'PMR': ('Палмерстон-Норт', 'Palmerston North'),
-    'ZEI': (None, 'Garmisch-Partenkirchen'),
-    'GPI': ('Гуапи', 'Guapi'),
-    'BET': ('Бетел', 'Bethel'),
-    'MIF': ('Монаханс', 'Monahans'),
-    'YXX': ('Абботсфорд', 'Abbotsford'),
-    'XMD': ('Мадисон', 'Madison'),
-    'MIG': ('Мяньян', 'Mian Yang'),
-    'BLH': ('Блайт', 'Blythe'),
-    'SVC': ('Силвер-Сити', 'Silver City'),
-    'MIH': ('Митчелл Плато', 'Mitchell Plateau'),
-    'ALA': ('Алматы', 'Almaty'),
-    'ZLU': (None, 'Ludwigslust'),
-    'BTK': ('Братск', 'Bratsk'),
-    'MII': ('Марилия', 'Marilia'),
-    'XYR': ('Йеллоу Ривер', 'Yellow River'),
-    'HLN': ('Хелена', 'Helena'),
-    'LDS': ('Ичунь', 'Yichun'),
-    'BVK': ('Хуакарайе', 'Huacaraje'),
-    'CCP': ('Консепсьон', 'Concepcion'),
-    'PGZ': ('Понта-Гроса', 'Ponta Grossa'),
-    'MIW': ('Маршолтаун', 'Marshalltown'),
-    'MLA': ('Мальта', 'Malta'),
-    'MIY': ('Миттиба-Крик', 'Mittiebah'),
-    'TBU': ('Нукуалофа', "Nuku'alofa"),
-    'IGD': ('Ыгдыр', 'Igdir'),
-    'MJF': ('Мушёэн', 'Mosjoen'),
-    'AGX': ('Агатти', 'Agatti Island'),
-    'MJR': ('Мирамар', 'Miramar'),
-    'XOD': (None, 'Oppdal'),
-    'MMV': ('Мал', 'Mal'),
-    'YBC': ('Бэ-Комо', 'Baie Comeau'),
-    'CSG': ('Колумбус', 'Columbus'),
-    'HUX': ('Уатулько', 'Huatulco'),
-    'EIE': ('Енисейск', 'Eniseysk'),
-    'YHG': ('Шарлоттаун', 'Charlottetown'),
-    'EAP': ('Базель', 'Basel, Switzerland/Mulhouse'),
-    'MLM': ('Морелия', 'Morelia'),
-    'YBE': ('Ераниум Сити', 'Uranium City'),
-    'MLN': ('Мелилья', 'Melilla'),
-    'YMN': ('Маккавик', 'Makkovik'),
-    'YBM': ('Бронсон Крик', 'Bronson Creek'),
-    'MLR': ('Миллисент', 'Millicent'),
-    'YCE': ('Сентралия', 'Centralia'),
-    'ABM': ('Бамага', 'Bamaga'),
-    'YCP': ('Ко-оп Поинт', 'Co-op Point'),
-    'AID': ('Андерсон', 'Anderson'),
-    'MLW': ('Монровия', 'Monrovia'),
-    'MLX': ('Малатья', 'Malatya'),
-    'BEJ': ('Танжунгредеб', 'Berau'),
-    'MMF': ('Мамфе', 'Mamfe'),
-    'YCU': ('Юньчэн', 'Yuncheng'),
-    'MMK': ('Мурманск', 'Murmansk'),
-    'MPG': ('Макини', 'Makini'),
-    'YDC': ('Драйтон-Валли', 'Drayton Valley'),
-    'TKS': ('Токусима', 'Tokushima'),
-    'YDK': ('Остров Мейн Дак', 'Main Duck Island'),
-    'AIO': ('Атлантик', 'Atlantic'),
-    'YER': ('Форт Северн', 'Fort Severn'),
-    'BZG': ('Быдгощ', 'Bydgoszcz'),
-    'AJA': ('Аяччо', 'Ajaccio'),
-    'MOM': ('Мауджерия', 'Moudjeria'),
-    'XLV': (None, 'Niagara Falls'),
-    'MOT': ('Майнот', 'Minot'),
-    'AJR': ('Арвидсъяур', 'Arvidsjaur'),
-    'TFT': ('Тафтан', 'Taftan'),
-    'YHD': ('Драйден', 'Dryden'),
-    'MPM': ('Мапуту', 'Maputo'),
-    'MPS': ('Маунт Плезант', 'Mount Pleasant'),
-    'YFB': ('Икалуит', 'Iqaluit'),
-    'YHN': ('Хорнипейн', 'Hornepayne'),
-    'YNI': ('Ничкон', 'Nitchequon'),
-    'TOL': ('Толедо', 'Toledo'),
-    'MPZ': ('Маунт Плезант', 'Mount Pleasant'),
-    'YHZ': ('Галифакс', 'Halifax'),
-    'MQG': ('Мидгард', 'Midgard'),
-    'AKQ': ('Ганунг Батин', 'Astraksetra'),
-    'MQN': ('Му-и-Рана', 'Mo i Rana'),
-    'CAK': ('Акрон', 'Akron'),
-    'YKD': ('Кинкардин', 'Kincardine'),
-    'YKT': ('Клемту', 'Klemtu'),
-    'GIS': ('Гисборн', 'Gisborne'),
-    'YNF': ('Корнер-Брук', 'Corner Brook'),
-    'CUC': ('Кукута', 'Cucuta'),
-    'AKR': ('Акуре', 'Akure'),
-    'ZAP': (None, 'Appenzell'),
-    'MRQ': ('Мариндуке', 'Marinduque'),
-    'MCE': ('Мерсед', 'Merced'),
-    'MRU': ('Маврикий', 'Mauritius'),
-    'YBN': ('Борден', 'Borden'),
-    'TGQ': ('Тангара де Сьерра', 'Tangara da Serra'),
-    'LUD': ('Людериц', 'Luderitz'),
-    'THN': ('Тролльхеттан', 'Trollhattan'),
-    'MSI': ('Масалембо', 'Masalembo'),
-    'YNB': ('Янбу', 'Yanbu'),
-    'MSQ': ('Минск', 'Minsk'),
-    'YNN': ('Яндикоогина', 'Yandicoogina'),
-    'BXU': ('Бутуан', 'Butuan'),
-    'FNB': ('Неубранденбург', 'Neubrandenburg'),
-    'MTA': ('Матамата', 'Matamata'),
-    'MUP': ('Малга Парк', 'Mulga Park'),
-    'PVI': ('Паранаваи', 'Paranavai'),
-    'AKY': ('Ситуэ', 'Sittwe'),
-    'YMR': ('Мерри Айленд', 'Merry Island'),
-    'MTL': ('Мейтленд', 'Maitland'),
-    'YMQ': ('Монреаль', 'Montreal'),
-    'AMD': ('Ахмадабад', 'Ahmedabad'),
-    'YOP': ('Рейнбоу Лейк', 'Rainbow Lake'),
-    'XKH': ('Пхонсаван', 'Xieng Khouang'),
-    'QJE': ('Китсиссуарсуит', 'Kitsissuarsuit'),
-    'YNY': ('Янъян', 'Yangyang'),
-    'PRG': ('Прага', 'Prague'),
-    'QKS': ('Кейстоун', 'Keystone'),
-    'BPS': ('Порту-Сегуру', 'Porto Seguro'),
-    'MGR': ('Молтри', 'Moultrie'),
-    'YPE': ('Пис Ривер', 'Peace River'),
-    'YOG': ('Огоки', 'Ogoki'),
-    'YQT': ('Тандер-Бей', 'Thunder Bay'),
-    'LKS': ('Лейксайд', 'Lakeside'),
-    'YOJ': ('Хай Левел', 'High Level'),
-    'JNB': ('Йоханнесбург', 'Johannesburg'),
-    'ANQ': ('Ангола', 'Angola'),
-    'YOW': ('Оттава', 'Ottawa'),
-    'YSL': ('Сент Леонард', 'St Leonard'),
-    'MVC': ('Монровилл', 'Monroeville'),
-    'YXP': ('Пангниртанг', 'Pangnirtung'),
-    'BVY': ('Беверли', 'Beverly'),
-    'MVH': ('Макксвилл', 'Macksville'),
-    'APL': ('Нампула', 'Nampula'),
-    'YOY': ('Валкатьер', 'Valcartier'),
-    'ANW': ('Айнсворт', 'Ainsworth'),
-    'SFG': ('Сен-Мартен', 'Saint Martin'),
-    'YPC': ('Полатук', 'Paulatuk'),
-    'ACV': ('Арката', 'Arcata'),
-    'CBD': ('Никобар', 'Car Nicobar'),
-    'TRI': ('Бристол', 'Bristol, VA/Johnson City/Kingsport'),
-    'TVS': ('Таншань', 'Tangshan'),
-    'XVL': ('Винх Лонг', 'Vinh Long'),
-    'YTA': ('Пемброк', 'Pembroke'),
-    'DJG': ('Джане', 'Djanet'),
-    'MVW': ('Маунт Вернон', 'Mount Vernon'),
-    'YSX': ('Шеаруотер', 'Shearwater'),
-    'MWZ': ('Мванза', 'Mwanza'),
-    'AOR': ('Алор-Сетар', 'Alor Setar'),
-    'MXK': ('Миндик', 'Mindik'),
-    'PZB': ('Питермарицбург', 'Pietermaritzburg'),
-    'YDQ': ('Досон-Крик', 'Dawson Creek'),
-    'SMS': ('Остров Сент-Мари', 'Sainte Marie'),
-    'ASE': ('Аспен', 'Aspen'),
-    'AOT': ('Аоста', 'Aosta'),
-    'MXU': ('Маллева', 'Mullewa'),
-    'SBS': ('Стимбот Спрингс', 'Steamboat Springs'),
-    'JGS': ('Цзиань', "Ji'An"),
-    'ULP': ('Квилпи', 'Quilpie'),
-    'COU': ('Колумбия', 'Columbia'),
-    'ZOS': ('Осорно', 'Osorno'),
-    'WDA': ('Вади Аин', 'Wadi Ain'),
-    'FLA': ('Флоренсия', 'Florencia'),
-    'JHY': (None, 'Cambridge'),
-    'YXZ': ('Вава', 'Wawa'),
-    'MZD': ('Мендес', 'Mendez'),
-    'YWK': ('Вабуш', 'Wabush'),
-    'YXK': ('Римуски', 'Rimouski'),
-    'TRD': ('Тронхейм', 'Trondheim'),
-    'WJR': ('Ваджир', 'Wajir'),
-    'MZE': ('Манати', 'Manatee'),
-    'CMI': ('Шампейн', 'Champaign'),
-    'CCA': ('Форт Чаффи', 'Fort Chaffee'),
-    'MZO': ('Мансанильо', 'Manzanillo'),
-    'YPP': ('Пайн Поинт', 'Pine Point'),
-    'NAQ': ('Каанаак', 'Qaanaaq'),
-    'YYJ': ('Виктория', 'Victoria'),
-    'XWZ': ('Нючёпинг', 'Nykoping'),
-    'CEG': ('Честер', 'Chester'),
-    'YYW': ('Армстронг', 'Armstrong'),
-    'YZH': ('Слейв Лейк', 'Slave Lake'),
-    'NAT': ('Натал', 'Natal'),
-    'AAO': ('Анако', 'Anaco'),
-    'TTI': ('Тетиароа', 'Tetiaroa Island'),
-    'JHC': (None, 'Garden City'),
-    'LLI': ('Лалибела', 'Lalibela'),
-    'SDS': ('Садо Шима', 'Sado Shima'),
-    'AQP': ('Арекипа', 'Arequipa'),
-    'YVG': ('Вермилен', 'Vermilion'),
-    'NBC': ('Набережные Челны (Нижнекамск)', 'Naberezhnye Chelny'),
-    'BSR': ('Басра', 'Basra'),
-    'YQD': ('Зе Пас', 'The Pas'),
-    'YGJ': ('Йонаго', 'Yonago'),
-    'TOX': ('Тобольск', 'Tobolsk'),
-    'VEV': ('Баракома', 'Barakoma'),
-    'TYE': ('Тайонк', 'Tyonek'),
-    'BPT': ('Бомонт', 'Beaumont'),
-    'UBR': ('Убруб', 'Ubrub'),
-    'ARK': ('Аруша', 'Arusha'),
-    'YQB': ('Квебек', 'Quebec'),
-    'NDE': ('Мандере', 'Mandera'),
-    'ZAL': ('Вальдивия', 'Valdivia'),
-    'ZGA': ('Гера', 'Gera'),
-    'BZZ': ('Брайз-Нортон', 'Brize Norton'),
-    'ENY': ('Яньань', "Yan'an"),
-    'NDS': ('Сандстон', 'Sandstone'),
-    'YQN': ('Накина', 'Nakina'),
-    'BZE': ('Белиз', 'Belize City'),
-    'TAP': ('Тапачула', 'Tapachula'),
-    'NEU': ('Самныа', 'Sam Neua'),
-    'EKB': ('Экибастуз', 'Ekibastuz'),
-    'ZQF': ('Тиер', 'Trier'),
-    'NGO': ('Нагоя', 'Nagoya'),
-    'DXB': ('Дубай', 'Dubai'),
-    'ZUH': ('Чжухай', 'Zhuhai'),
-    'ARU': ('Арасатуба', 'Aracatuba'),
-    'PNS': ('Пенсакола', 'Pensacola'),
-    'ASI': ('Джорджтаун', 'Georgetown'),
-    'UII': ('Утила', 'Utila'),
-    'YQY': ('Сидней', 'Sydney'),
-    'NLD': ('Нуэво-Ларедо', 'Nuevo Laredo'),
-    'ZVA': ('Миандривазо', 'Miandrivazo'),
-    'UMT': ('Юмиат', 'Umiat'),
-    'IDR': ('Индор', 'Indore'),
-    'YBT': ('Брошет', 'Brochet'),
-    'RRG': ('Родригес', 'Rodrigues Island'),
-    'CVO': (None, 'Albany'),
-    'BTM': ('Бьютт', 'Butte'),
-    'YRB': ('Резольют', 'Resolute'),
-    'ASU': ('Асунсьон', 'Asuncion'),
-    'KBJ': ('Кингс Каньон', 'Kings Canyon'),
-    'NNI': ('Намутони', 'Namutoni'),
-    'CAC': ('Каскавел', 'Cascavel'),
-    'APT': ('Джаспер', 'Jasper'),
-    'NNK': ('Нейкнек', 'Naknek'),
-    'WXN': ('Ваньчжоу', 'Wanxian'),
-    'ANP': ('Аннаполис', 'Annapolis'),
-    'MRB': ('Мартинсберг', 'Martinsburg'),
-    'CDV': ('Кордова', 'Cordova'),
-    'YTS': ('Тимминс', 'Timmins'),
-    'KLY': ('Калима', 'Kalima'),
-    'AQJ': ('Акаба', 'Aqaba'),
-    'BID': ('Блок', 'Block Island'),
-    'YBH': ('Булл Харбор', 'Bull Harbour'),
-    'UNT': ('Анст', 'Unst Shetland Island'),
-    'CDZ': ('Кадис', 'Cadiz'),
-    'LTS': (None, 'Altus'),
-    'BDP': ('Бхадрапур', 'Bhadrapur'),
-    'TPH': ('Тонопа', 'Tonopah'),
-    'USI': ('Мабарума', 'Mabaruma'),
-    'NOS': ('Нуси-Бе', 'Nossi-be'),
-    'USL': ('Уселесс Луп', 'Useless Loop'),
-    'ZYM': (None, 'Arnhem'),
-    'AYQ': ('Улуру', 'Ayers Rock'),
-    'NQI': ('Кингсвилль', 'Kingsville'),
-    'EYW': ('Ки-Уэст', 'Key West'),
-    'XVV': (None, 'Belleville'),
-    'AJI': ('Агры', 'Agri'),
-    'DIB': ('Дибругарх', 'Dibrugarh'),
-    'NRB': ('Мэйпорт', 'Mayport'),
-    'CKM': ('Кларксдейл', 'Clarksdale'),
-    'YSI': ('Санс Сауси', 'Sans Souci'),
-    'NSO': ('Скон', 'Scone'),
-    'ZPL': (None, 'Recklinghausen'),
-    'BUV': ('Белья Уньон', 'Bella Union'),
-    'NTE': ('Нант', 'Nantes'),
-    'NUF': ('Хаттон', 'Hatton'),
-    'ATN': ('Наматанаи', 'Namatanai'),
-    'BRL': ('Берлингтон', 'Burlington'),
-    'NUU': ('Накуру', 'Nakuru'),
-    'CYW': (None, 'Celaya'),
-    'GLN': ('Гулимин', 'Goulimime'),
-    'SMZ': ('Стоелманс Эиланд', 'Stoelmans Eiland'),
-    'NVP': ('Нову-Арипуан', 'Novo Aripuana'),
-    'BWA': ('Сиддхартханагар', 'Bhairawa'),
-    'YTD': ('Сикет Портадж', 'Thicket Portage'),
-    'YSY': ('Сачс Харбор', 'Sachs Harbour'),
-    'NYG': ('Квантико', 'Quantico'),
-    'CGB': ('Куяба', 'Cuiaba'),
-    'CGM': ('Камигин', 'Camiguin'),
-    'ETE': ('Дженда Ууха', 'Genda Wuha'),
-    'KMW': ('Кострома', 'Kostroma'),
-    'SJI': ('Сан-Хосе', 'San Jose'),
-    'ATM': ('Алтамира', 'Altamira'),
-    'STO': ('Стокгольм', 'Stockholm'),
-    'ZDZ': (None, 'Einsiedeln'),
-    'ETN': ('Истленд', 'Eastland'),
-    'ZIN': (None, 'Interlaken'),
-    'FZO': (None, 'Filton'),
-    'VAI': ('Ванимо', 'Vanimo'),
-    'ZAT': ('Чжаотун', 'Zhaotong'),
-    'SJY': ('Сейняйоки', 'Seinajoki'),
-    'KTB': ('Торн Бэй', 'Thorne Bay'),
-    'ZYO': (None, 'Roosendaal'),
-    'CIK': ('Чалкиитзик', 'Chalkyitsik'),
-    'SIT': ('Ситка', 'Sitka'),
-    'GAJ': ('Ямагата', 'Yamagata'),
-    'XEW': (None, 'Flemingsberg'),
-    'OAL': ('Какоал', 'Cacoal'),
-    'FOP': ('Форест Парк', 'Forest Park'),
-    'YTB': ('Хартли Бэй', 'Hartley Bay'),
-    'OBE': ('Окичоби', 'Okeechobee'),
-    'CQF': ('Кале', 'Calais'),
-    'XLS': ('Сент-Луис', 'St Louis'),
-    'YTF': ('Алма', 'Alma'),
-    'KVX': ('Киров', 'Kirov'),
-    'PAZ': ('Поса-Рика', 'Poza Rica'),
-    'AUV': ('Аумо', 'Aumo'),
-    'RME': (None, 'Rome'),
-    'OCN': ('Оушенсайд', 'Oceanside'),
-    'YTI': ('Трипл Айленд', 'Triple Island'),
-    'YSW': ('Салюи', 'Salluit'),
-    'ZPF': (None, 'Passau'),
-    'DBA': ('Далбандин', 'Dalbandin'),
-    'ZIL': (None, 'Horsens'),
-    'OHO': ('Охотск', 'Okhotsk'),
-    'ODJ': ('Уанда Джалле', 'Ouanda Djalle'),
-    'FBA': ('Фонте Боа', 'Fonte Boa'),
-    'ADW': ('Камп Спрингс', 'Camp Springs'),
-    'FJR': ('Эль-Фуджайра', 'Al-fujairah'),
-    'HUW': ('Хумайта', 'Humaita'),
-    'COS': ('Колорадо-Спрингс', 'Colorado Springs'),
-    'CKA': ('Чероки', 'Cherokee'),
-    'KIM': ('Кимберли', 'Kimberley'),
-    'LSJ': ('Остров Лонг', 'Long Island'),
-    'CKC': ('Черкассы', 'Cherkassy'),
-    'OEO': ('Осеола', 'Osceola'),
-    'OKN': ('Оконжа', 'Okondja'),
-    'VLD': ('Валдоста', 'Valdosta'),
-    'MVN': ('Маунт Вернон', 'Mount Vernon'),
-    'VXE': ('Сан-Висенти', 'Sao Vicente'),
-    'OKY': ('Оки', 'Oakey'),
-    'IVI': (None, 'Isla Viveros'),
-    'CJA': ('Кахамарка', 'Cajamarca'),
-    'PNP': ('Попондетта', 'Popondetta'),
-    'WAB': ('Вабаг', 'Wabag'),
-    'IBR': ('Ибараки', 'Omitami'),
-    'CLP': ('Кларкс Пойнт', 'Clarks Point'),
-    'BSC': ('Баия Солано', 'Bahia Solano'),
-    'FUL': ('Фуллертон', 'Fullerton'),
-    'WAO': ('Вабо', 'Wabo'),
-    'UPB': ('Гавана', 'Havana'),
-    'MQB': ('Макомб', 'Macomb'),
-    'OLC': ('Сан-Паулу-ди-Оливенса', 'Sao Paulo de Olivenca'),
-    'SLQ': ('Слитмут', 'Sleetmute'),
-    'CFS': ('Кофс-Харбор', 'Coffs Harbour'),
-    'ALW': ('Уолла Уолла', 'Walla Walla'),
-    'QUO': ('Уйо', 'Uyo'),
-    'CMM': (None, 'Carmelita'),
-    'CDW': ('Колдуэлл', 'Caldwell'),
-    'OMF': ('Мафрак', 'Mafraq'),
-    'XKK': (None, 'Larvik'),
-    'PAH': ('Падака', 'Paducah'),
-    'DAU': ('Дару', 'Daru'),
-    'WKI': ('Хванге', 'Hwange'),
-    'CKS': ('Караджас', 'Carajas'),
-    'BGB': ('Боуэ', 'Booue'),
-    'WOA': ('Воненара', 'Wonenara'),
-    'ISA': ('Маунт-Айза', 'Mount Isa'),
-    'LKW': (None, 'Lekhwair'),
-    'ZJL': (None, 'Lyss'),
-    'GTE': ('Грут-Айленд', 'Groote Island'),
-    'TIU': ('Тимару', 'Timaru'),
-    'MSC': ('Меса', 'Mesa'),
-    'CQS': ('Коста-Маркис', 'Costa Marques'),
-    'ILD': ('Льейда', 'Alguaire'),
-    'OPL': ('Опелусас', 'Opelousas'),
-    'APX': ('Арапонгас', 'Arapongas'),
-    'CAS': ('Касабланка', 'Casablanca'),
-    'SHD': ('Стонтон', 'Staunton'),
-    'ZLV': (None, 'Luosto'),
-    'XMZ': (None, 'Macclesfield'),
-    'SAZ': ('Сасстаун', 'Sasstown'),
-    'BLU': ('Блу Каньон', 'Blue Canyon'),
-    'TCZ': ('Тенчун', 'Tengchong'),
-    'AWM': ('Запад Мемфис', 'West Memphis'),
-    'AUI': ('Ауа', 'Aua Island'),
-    'PIR': ('Пирр', 'Pierre'),
-    'ORC': ('Орокуэ', 'Orocue'),
-    'YMV': (None, 'Mary River'),
-    'AUG': ('Огаста', 'Augusta'),
-    'GLH': ('Гринвилл', 'Greenville'),
-    'MAG': ('Маданг', 'Madang'),
-    'ORL': ('Орландо', 'Orlando'),
-    'ORN': ('Оран', 'Oran'),
-    'CUG': ('Кадал', 'Cudal'),
-    'CNQ': ('Корриентес', 'Corrientes'),
-    'CVN': ('Кловис', 'Clovis'),
-    'CSW': ('Колораду-ду-Уэсти', 'Colorado do Oeste'),
-    'DPL': ('Диполог', 'Dipolog'),
-    'AXP': ('Спринг Пойнт', 'Spring Point'),
-    'XSI': ('оз. Саутерн Индиан', 'South Indian Lake'),
-    'OSD': ('Эстерсунд', 'Ostersund'),
-    'XUL': (None, 'Nesbyen'),
-    'XTO': ('Тарум', 'Taroom'),
-    'IOS': ('Ильеус', 'Ilheus'),
-    'YXL': ('Су-Лукаут', 'Sioux Lookout'),
-    'NYA': ('Нягань', 'Nyagan'),
-    'SDQ': ('Санто-Доминго', 'Santo Domingo'),
-    'VCE': ('Венеция', 'Venice'),
-    'QCU': ('Акуннаак', 'Akunnaaq'),
-    'BAK': ('Баку', 'Baku'),
-    'AGH': ('Энгельхольм', 'Angelholm/Helsingborg'),
-    'SIR': ('Сьон', 'Sion'),
-    'VIC': ('Виченца', 'Vicenza'),
-    'QHX': (None, 'Qionghai'),
-    'MIZ': ('Маинору', 'Mainoru'),
-    'SVD': ('Сент-Винсент', 'Saint Vincent'),
-    'YBO': ('Бобкинн Лейк', 'Bobquinn Lake'),
-    'OTJ': ('Отьиваронго', 'Otjiwarongo'),
-    'HSP': ('Хот Спрингс', 'Hot Springs'),
-    'BKE': ('Бейкер', 'Baker'),
-    'BUH': ('Бухарест', 'Bucharest'),
-    'YEQ': ('Йенкис', 'Yenkis'),
-    'FNU': (None, 'Oristano'),
-    'MNE': ('Мангерани', 'Mungeranie'),
-    'BUW': ('Баубау', 'Baubau'),
-    'YEU': ('Эврика', 'Eureka'),
-    'OTV': ('Онтонг Джава', 'Ontong Java'),
-    'YRT': ('Ранкин-Инлет', 'Rankin Inlet'),
-    'ZSK': (None, 'Pasewalk'),
-    'SYN': ('Стэнтон', 'Stanton'),
-    'HKK': ('Хокитика', 'Hokitika'),
-    'XJR': ('Лорка', 'Lorca'),
-    'YGT': ('Иглулик', 'Igloolik'),
-    'YHC': ('Хакай Пасс', 'Hakai Pass'),
-    'ZKM': ('Сетте Кама', 'Sette Cama'),
-    'TUP': ('Тьюпело', 'Tupelo'),
-    'BEU': ('Бедори', 'Bedourie'),
-    'XPX': (None, 'Pointe-aux-Trembles'),
-    'CHY': ('Шуазёль', 'Choiseul Bay'),
-    'EQS': ('Эскель', 'Esquel'),
-    'CBI': ('Кейп-Баррен', 'Cape Barren Island'),
-    'YBG': ('Сагеней', 'La Baie'),
-    'OUU': ('Уанга', 'Ouanga'),
-    'BTP': ('Батлер', 'Butler'),
-    'BDD': ('Баду', 'Badu Island'),
-    'OVG': ('Оверберг', 'Overberg'),
-    'YPM': ('Пайкангикум', 'Pikangikum'),
-    'LSF': (None, 'Fort Benning'),
-    'MUJ': ('Муи', 'Mui'),
-    'BEL': ('Белен', 'Belem'),
-    'MQD': ('Макинчао', 'Maquinchao'),
-    'BDL': ('Хартфорд', 'Hartford'),
-    'BDO': ('Бандунг', 'Bandung'),
-    'OVL': ('Овалье', 'Ovalle'),
-    'ARB': ('Анн Арбор', 'Ann Arbor'),
-    'CYE': ('оз. Кристал', 'Crystal Lake'),
-    'YQH': ('Уотсон Лейк', 'Watson Lake'),
-    'PBZ': ('Плеттенберг-Бей', 'Plettenberg Bay'),
-    'CBJ': ('Кабо Рохо', 'Cabo Rojo'),
-    'OZU': ('Монтилья', 'Montilla'),
-    'OZC': ('Озамис Сити', 'Ozamis City'),
-    'ZBR': ('Чехбехар', 'Chah-Bahar'),
-    'DUJ': ('дю Буа', 'Du Bois'),
-    'CBQ': ('Калабар', 'Calabar'),
-    'XTJ': ('Толедо', 'Toledo'),
-    'BEA': ('Берейна', 'Bereina'),
-    'CCB': ('Апленд', 'Upland'),
-    'SUJ': ('Сату-Маре', 'Satu Mare'),
-    'YUA': ('Юанмоу', 'Yuanmou'),
-    'CVT': ('Ковентри', 'Coventry'),
-    'PAY': ('Памол', 'Pamol'),
-    'CZN': ('Чизана', 'Chisana'),
-    'YVO': ("Валь-д'Ор", "Val D'Or"),
-    'ILN': ('Уилмингтон', 'Wilmington'),
-    'PBM': ('Парамарибо', 'Paramaribo'),
-    'CZP': ('Капе-Поле', 'Cape Pole'),
-    'YWB': ('Канжикужуак', 'Kangiqsujuaq'),
-    'YKG': ('Кангирсук', 'Kangirsuk'),
-    'PCF': (None, 'Potchefstroom'),
-    'CBY': ('Каноби', 'Canobie'),
-    'BOD': ('Бордо', 'Bordeaux'),
-    'BFN': ('Блумфонтейн', 'Bloemfontein'),
-    'PDO': ('Пендопо', 'Pendopo'),
-    'ESK': ('Ескисехир', 'Eskisehir'),
-    'PEB': ('Пебане', 'Pebane'),
-    'PEC': ('Пеликан', 'Pelican'),
-    'YQK': ('Кенора', 'Kenora'),
-    'BFQ': ('Бахиа-Пинас', 'Bahia Pinas'),
-    'PEE': ('Пермь', 'Perm'),
-    'BJS': ('Пекин', 'Beijing'),
-    'CYT': ('Якатага', 'Yakataga'),
-    'ZSM': (None, 'Santa Clara'),
-    'BFR': ('Бедфорд', 'Bedford'),
-    'PEM': ('Пуэрто-Мальдонадо', 'Puerto Maldonado'),
-    'CNL': ('Синдал', 'Sindal'),
-    'PER': ('Перт', 'Perth'),
-    'DAR': ('Дар-эс-Салам', 'Dar Es Salaam'),
-    'DEN': ('Денвер', 'Denver'),
-    'PEY': ('Пенонг', 'Penong'),
-    'YTX': ('Телеграф Крик', 'Telegraph Creek'),
-    'YTQ': ('Тазиужак', 'Tasiujuaq'),
-    'PFB': ('Пасу-Фунду', 'Passo Fundo'),
-    'PIF': ('Пиндун', 'Pingtung'),
-    'CDA': ('Куинда', 'Cooinda'),
-    'CNU': ('Чанат', 'Chanute'),
-    'PFQ': ('Парсабад', 'Parsabad'),
-    'PGA': ('Пейдж', 'Page'),
-    'PHY': ('Пхетчабун', 'Phetchabun'),
-    'EBB': ('Энтеббе', 'Entebbe'),
-    'CQP': ('Капе-Флаттери', 'Cape Flattery'),
-    'STT': ('Сент-Томас', 'Saint Thomas'),
-    'YPH': ('Энукжуук', 'Inukjuak'),
-    'PHK': ('Пахоки', 'Pahokee'),
-    'BFV': ('Бурирам', 'Buri Ram'),
-    'ZRM': ('Сарми', 'Sarmi'),
-    'DLA': ('Дуала', 'Douala'),
-    'AAV': ('Сураллах', 'Surallah'),
-    'AAN': ('Аль-Айн', 'Al Ain'),
-    'PIC': ('Пайн Кей', 'Pine Cay'),
-    'DBU': ('Дамбула', 'Dambula'),
-    'YPN': ('Пор-Менье', 'Port Menier'),
-    'HTG': ('Хатанга', 'Hatanga'),
-    'YPX': ('Пювирнитюк', 'Povungnituk'),
-    'OLZ': ('Олёкминск', 'Olokminsk'),
-    'HUB': ('Хумберт Ривер', 'Humbert River'),
-    'GLA': ('Глазго', 'Glasgow'),
-    'ABQ': ('Альбукерке', 'Albuquerque'),
-    'DPU': ('Дампу', 'Dumpu'),
-    'PJS': ('Порт Сан Хуан', 'Port San Juan'),
-    'BGI': ('Бриджтаун', 'Bridgetown'),
-    'BIH': ('Бишоп', 'Bishop'),
-    'ABC': ('Альбасете', 'Albacete'),
-    'PLF': ('Пала', 'Pala'),
-    'PKV': ('Псков', 'Pskov'),
-    'DRU': ('Драммонд', 'Drummond'),
-    'PLS': ('Провиденсиалес', 'Providenciales'),
-    'DUN': ('Дандас', 'Dundas'),
-    'ACB': ('Беллер', 'Bellaire'),
-    'XIM': (None, 'Saint Hyacinthe'),
-    'DVO': ('Давао', 'Davao'),
-    'PMA': ('Пемба', 'Pemba'),
-    'OSH': ('Ошкош', 'Oshkosh'),
-    'ZMY': ('Хуангпгу', 'Huangpu'),
-    'BRV': ('Бремерхафен', 'Bremerhaven'),
-    'PNC': ('Понка Сити', 'Ponca City'),
-    'YTU': ('Тасу', 'Tasu'),
-    'ODE': ('Оденсе', 'Odense'),
-    'DGN': ('Далгрен', 'Dahlgren'),
-    'PNK': ('Понтианак', 'Pontianak'),
-    'BGX': ('Баг', 'Bage'),
-    'EAL': ('Кваджалейн', 'Kwajalein Atoll'),
-    'MIE': ('Манси', 'Muncie'),
-    'GOV': ('Нуланбеи', 'Gove'),
-    'DHD': ('Дурхам-Даунс', 'Durham Downs'),
-    'EAU': ('О-Клэр', 'Eau Claire'),
-    'LWV': ('Лоренсевилл', 'Lawrenceville'),
-    'EBD': ('Ел Обеид', 'El Obeid'),
-    'CNH': ('Клермонт', 'Claremont'),
-    'PPH': ('Пераитепуй', 'Peraitepuy'),
-    'CNR': ('Чаньяраль', 'Chanaral'),
-    'PPW': ('Папа-Уэстрей', 'Papa Westray'),
-    'NGQ': ('Ши Кван Хи', 'Shiquanhe'),
-    'CPL': ('Чапарраль', 'Chaparral'),
-    'HUZ': ('Хойчжоу', 'Huizhou'),
-    'PPY': ('Позу Алегри', 'Pouso Alegre'),
-    'DBQ': ('Дабек', 'Dubuque'),
-    'EDB': ('Элдебба', 'Eldebba'),
-    'PRM': ('Портимао', 'Portimao'),
-    'EDD': ('Эрлданда', 'Erldunda'),
-    'AAX': ('Араша', 'Araxa'),
-    'EDL': ('Элдорет', 'Eldoret'),
-    'OTZ': ('Коцебу', 'Kotzebue'),
-    'ABE': ('Аллентаун', 'Allentown'),
-    'EDQ': ('Эрандике', 'Erandique'),
-    'PSI': ('Пасни', 'Pasni'),
-    'PSS': ('Посадас', 'Posadas'),
-    'EFL': ('Кефалиния', 'Kefallinia'),
-    'PTK': ('Понтиак', 'Pontiac'),
-    'PSU': ('Путуссибау', 'Putussibau'),
-    'RUE': (None, 'Butembo'),
-    'NRY': ('Ньюри', 'Newry'),
-    'SNZ': ('Санта-Круз', 'Santa Cruz'),
-    'ERM': ('Эрешин', 'Erechim'),
-    'ZVD': (None, 'Drangedal'),
-    'DHN': ('Дотан', 'Dothan'),
-    'BIG': ('Биг Дельта', 'Big Delta'),
-    'PSX': ('Паласиос', 'Palacios'),
-    'BIL': ('Биллингс', 'Billings'),
-    'PSY': ('Порт-Стэнли', 'Port Stanley'),
-    'ZAW': (None, 'Nykobing Mors'),
-    'CAD': ('Кадиллак', 'Cadillac'),
-    'CTO': ('Калвертон', 'Calverton'),
-    'PTD': ('Порт Александр', 'Port Alexander'),
-    'BIO': ('Бильбао', 'Bilbao'),
-    'AUC': ('Араука', 'Arauca'),
-    'SPK': ('Саппоро', 'Sapporo'),
-    'YUX': ('Холл Бич', 'Hall Beach'),
-    'CMG': ('Корумба', 'Corumba'),
-    'AEI': ('Альхесирас', 'Algeciras'),
-    'XCI': (None, 'Chambord'),
-    'OMD': ('Ораньемунд', 'Oranjemund'),
-    'AHE': ('Ахе', 'Ahe'),
-    'MNN': ('Мэрион', 'Marion'),
-    'IAQ': ('Бареган', 'Bahregan'),
-    'BIS': ('Бисмарк', 'Bismarck'),
-    'PTW': ('Потстаун', 'Pottstown'),
-    'ELK': ('Элк Сити', 'Elk City'),
-    'QGN': ('Таррагона', 'Tarragona'),
-    'ONP': ('Ньюпорт', 'Newport'),
-    'JKT': ('Джакарта', 'Jakarta'),
-    'MBD': ('Ммабато', 'Mmabatho'),
-    'CQT': ('Какуэтаниа', 'Caquetania'),
-    'PUS': ('Пусан', 'Busan'),
-    'AEY': ('Акюрейри', 'Akureyri'),
-    'PVH': ('Порту-Велью', 'Porto Velho'),
-    'BVA': ('Бове', 'Paris'),
-    'EOZ': ('Элорса', 'Elorza'),
-    'PYB': ('Джейупоре', 'Jeypore'),
-    'DIL': ('Дили', 'Dili'),
-    'CRD': ('Комодоро-Ривадавия', 'Comodoro Rivadavia'),
-    'PXL': ('Полакка', 'Polacca'),
-    'PYH': ('Пуэрто-Аякучо', 'Puerto Ayacucho'),
-    'BDG': ('Бландинг', 'Blanding'),
-    'YXN': ('Уол Ков', 'Whale Cove'),
-    'FLR': ('Флоренция', 'Florence'),
-    'BJW': ('Баджава', 'Bajawa'),
-    'CXB': ('Кокс-Базар', 'Coxs Bazar'),
-    'AFZ': ('Себзевар', 'Sabzevar'),
-    'QRO': ('Керетаро', 'Queretaro'),
-    'EPA': ('Эль Паломар', 'El Palomar'),
-    'SQL': ('Сан Карлос', 'San Carlos'),
-    'ZTF': ('Стэмфорд (жд-станция)', 'Stamford'),
-    'BWK': ('Бол', 'Bol'),
-    'QEW': ('Лестер', 'Leicester'),
-    'YRC': ('Рефьюджс-Кав', 'Refuge Cove'),
-    'DRV': ('Дхаравандхоо', 'Dharavandhoo Island'),
-    'QUP': ('Саккак', 'Saqqaq'),
-    'TCP': ('Таба', 'Taba'),
-    'CEY': ('Мюррей', 'Murray'),
-    'VLO': ('Валехо', 'Vallejo'),
-    'RAP': ('Рапид-Сити', 'Rapid City'),
-    'ERZ': ('Эрзурум', 'Erzurum'),
-    'AGE': ('Вангероге', 'Wangerooge'),
-    'WOS': (None, 'Wonsan'),
-    'OGM': ('Уступу Айленд', 'Ustupu Island'),
-    'RCM': ('Ричмонд', 'Richmond'),
-    'ZBH': (None, 'Severac-le-Chateau'),
-    'CUL': ('Кульякан', 'Culiacan'),
-    'RCN': ('Американ Ривер', 'American River'),
-    'ZLA': (None, 'Villars-sur-Ollon'),
-    'RSA': ('Санта-Роса', 'Santa Rosa'),
-    'JJA': ('Яяо', 'Jajao'),
-    'KSH': ('Керманшах', 'Kermanshah'),
-    'RCQ': ('Реконкиста', 'Reconquista'),
-    'RDG': ('Рединг', 'Reading'),
-    'AAA': ('Анаа', 'Anaa'),
-    'ZLB': (None, 'Visp'),
-    'SDZ': ('Шетландские острова', 'Shetland Islands'),
-    'RGA': ('Рио-Гранде', 'Rio Grande'),
-    'RDC': ('Реденсан', 'Redencao'),
-    'PGM': ('Порт Грейам', 'Port Graham'),
-    'GZO': ('Гизо', 'Gizo'),
-    'YXJ': ('Форт-Сент-Джон', 'Fort St. John'),
-    'AGP': ('Малага', 'Malaga'),
-    'BNO': ('Бернс', 'Burns'),
-    'CLC': ('Клир Лейк', 'Clearlake'),
-    'DON': ('Дос Лагунас', 'Dos Lagunas'),
-    'ZKO': (None, 'Sierre/Siders'),
-    'REX': ('Рейноса', 'Reynosa'),
-    'RER': ('Реталулеу', 'Retalhuleu'),
-    'FAA': ('Фаранах', 'Faranah'),
-    'XWE': (None, 'Wellingborough'),
-    'REU': ('Реус', 'Reus'),
-    'FAG': ('Фагурхолсмыри', 'Fagurholsmyri'),
-    'KCO': ('Измит', 'Izmit'),
-    'IRU': (None, 'Iranamadu'),
-    'SQM': ('Сан-Мигель-де-Арагао', 'São Miguel de Aragao'),
-    'AUX': ('Арагуаина', 'Araguaina'),
-    'SFY': (None, 'Springfield'),
-    'RMI': ('Римини', 'Rimini'),
-    'GPZ': ('Гранд Рапидс', 'Grand Rapids'),
-    'IFH': ('Хеса', 'Hesa'),
-    'CVM': ('Сьюдад-Виктория', 'Ciudad Victoria'),
-    'BLF': ('Принстон', 'Princeton'),
-    'CDB': ('Колд-Бей', 'Cold Bay'),
-    'BMS': ('Брумаду', 'Brumado'),
-    'BME': ('Брум', 'Broome'),
-    'BBB': ('Бенсон', 'Benson'),
-    'RNU': ('Ранау', 'Ranau'),
-    'LAL': ('Лейкленд', 'Lakeland'),
-    'FAV': ('Факарава', 'Fakarava'),
-    'WWS': (None, 'Wildwood'),
-    'TUB': ('Табуай', 'Tubuai'),
-    'MOU': ('Маунтин-Виллидж', 'Mountain Village'),
-    'KNG': ('Каймана', 'Kaimana'),
-    'DRS': ('Дрезден', 'Dresden'),
-    'SKK': ('Шактулик', 'Shaktoolik'),
-    'RRT': ('Уоррод', 'Warroad'),
-    'BTF': ('Баунтифул', 'Bountiful'),
-    'RRV': ('Робинсон Ривер', 'Robinson River'),
-    'OOM': ('Кума', 'Cooma'),
-    'ZHM': ('Шамштернагар', 'Shamshernagar'),
-    'CRQ': ('Каравелас', 'Caravelas'),
-    'ZYS': (None, 'Sandefjord'),
-    'RSD': ('Рок Саунд', 'Rock Sound'),
-    'FBD': ('Файзабад', 'Faizabad'),
-    'XYX': ('Сала', 'Sala'),
-    'ISC': ('Силли', 'Isles of Scilly'),
-    'SXI': ('Сири', 'Sirri Island'),
-    'OTK': (None, 'Tillamook'),
-    'TLJ': ('Таталина', 'Tatalina'),
-    'FMY': ('Форт Майерс', 'Fort Myers'),
-    'FCA': ('Калиспелл', 'Kalispell'),
-    'RTY': ('Мэрти', 'Merty'),
-    'TRN': ('Турин', 'Turin'),
-    'RTE': ('Маргерит Бэй', 'Marguerite Bay'),
-    'VJI': ('Абингдон', 'Abingdon'),
-    'YYD': ('Смитерс', 'Smithers'),
-    'JQA': ('Каарсут', 'Qaarsut'),
-    'BMO': ('Бамо', 'Bhamo'),
-    'RUT': ('Ратленд', 'Rutland'),
-    'FCN': ('Куксхафен', 'Cuxhaven'),
-    'LSY': ('Лисмор', 'Lismore'),
-    'RUU': ('Рути', 'Ruti'),
-    'SBK': ('Тремюсон', 'Tremuson'),
-    'RUV': ('Рубельсанто', 'Rubelsanto'),
-    'BHM': ('Бирмингем', 'Birmingham'),
-    'FDY': ('Финдли', 'Findlay'),
-    'RVR': ('Грин Ривер', 'Green River'),
-    'SAA': ('Саратога', 'Saratoga'),
-    'XOI': (None, 'Ischgl'),
-    'FUJ': ('Фукуэ', 'Fukue'),
-    'VRI': (None, 'Varandey'),
-    'SCG': ('Сприг Крик', 'Spring Creek'),
-    'VAV': ('Вавау', "Vava'u"),
-    'SAL': ('Сан-Сальвадор', 'San Salvador'),
-    'BNT': ('Бунди', 'Bundi'),
-    'RZZ': ('Роанок Рапидс', 'Roanoke Rapids'),
-    'AWA': ('Ауаса', 'Awassa'),
-    'SBD': ('Сан-Бернардино', 'San Bernardino'),
-    'GAK': ('Гакона', 'Gakona'),
-    'CEF': ('Чикопи', 'Chicopee'),
-    'SBE': ('Сааби', 'Suabi'),
-    'HNB': ('Хантингберг', 'Huntingburg'),
-    'FFM': ('Фергус-Фолс', 'Fergus Falls'),
-    'CSL': ('Сан-Луи-Обиспо', 'San Luis Obispo'),
-    'BND': ('Бендер-Аббас', 'Bandar Abbas'),
-    'FFT': ('Франкфурт', 'Frankfort'),
-    'SCC': ('Прадхо-Бей', 'Prudhoe Bay/Deadhorse'),
-    'BHQ': ('Брокен Хилл', 'Broken Hill'),
-    'AIK': ('Айкен', 'Aiken'),
-    'PHX': ('Финикс', 'Phoenix'),
-    'SCP': ('Сен-Крепин', 'St Crepin'),
-    'EPH': ('Эфрата', 'Ephrata'),
-    'SJH': ('Сан Хуан Дель Сесар', 'San Juan Del Cesar'),
-    'SCQ': ('Сантьяго-де-Компостела', 'Santiago De Compostela'),
-    'FIL': ('Фильмор', 'Fillmore'),
-    'IPI': ('Ипьялес', 'Ipiales'),
-    'GHT': ('Гат', 'Ghat'),
-    'GDP': ('Гуадалупи', 'Guadalupe'),
-    'SDY': ('Сидни', 'Sidney'),
-    'FMC': ('Файв Майл', 'Five Mile'),
-    'SAN': ('Сан-Диего', 'San Diego'),
-    'SEP': ('Стивенвилл', 'Stephenville'),
-    'XWN': (None, 'Warrington'),
-    'ANM': ('Анталахи', 'Antalaha'),
-    'SES': ('Сельма', 'Selma'),
-    'BNP': ('Банну', 'Bannu'),
-    'RWF': ('Редвуд-Фолс', 'Redwood Falls'),
-    'SFE': ('Сан Фернандо', 'San Fernando'),
-    'TCO': ('Тумако', 'Tumaco'),
-    'SGH': ('Спрингфилд', 'Springfield'),
-    'FRC': ('Франко', 'Franca'),
-    'MTS': ('Манзини', 'Manzini'),
-    'AFS': ('Зарафшан', 'Zarafshan'),
-    'AHH': ('Амери', 'Amery'),
-    'AQY': ('Аляска', 'Alyeska'),
-    'GHM': ('Сентервилл', 'Centerville'),
-    'BNZ': ('Банз', 'Banz'),
-    'ENA': ('Кенай', 'Kenai'),
-    'BJD': ('Баккафьордур', 'Bakkafjordur'),
-    'SIC': ('Синоп', 'Sinop'),
-    'GJA': ('Гуанаха', 'Guanaja'),
-    'SID': ('Сал', 'Sal'),
-    'GHU': ('Гуалегуайчу', 'Gualeguaychu'),
-    'DSD': ('Ла Дезирад', 'La Desirade'),
-    'BRA': ('Баррейрас', 'Barreiras'),
-    'SIW': ('Сибиса', 'Sibisa'),
-    'ULX': ('Улусаба', 'Ulusaba'),
-    'SJF': ('Сент-Джон', 'St John Island'),
-    'SMC': ('Санта Мария', 'Santa Maria'),
-    'BOZ': ('Бозуме', 'Bozoum'),
-    'FSK': ('Форт Скотт', 'Fort Scott'),
-    'SHA': ('Шанхай', 'Shanghai'),
-    'BTH': ('Батам', 'Batam'),
-    'SJG': ('Сан Педро Хагуа', 'San Pedro Jagua'),
-    'AAG': ('Арапоти', 'Arapoti'),
-    'SJJ': ('Сараево', 'Sarajevo'),
-    'CNA': ('Кананеа', 'Cananea'),
-    'AAJ': ('Аварадам', 'Awaradam'),
-    'MDH': ('Карбондейл', 'Carbondale'),
-    'SLJ': ('Чандлер', 'Chandler'),
-    'AAU': ('Асау', 'Asau'),
-    'BPH': ('Бислиг', 'Bislig'),
-    'SKL': ('Айл Оф Скай', 'Isle Of Skye'),
-    'FSN': ('Форт-Шеридан', 'Fort Sheridan'),
-    'SKM': ('Скелдон', 'Skeldon'),
-    'EAT': ('Уэнатчи', 'Wenatchee'),
-    'ABX': ('Олбери', 'Albury'),
-    'ACA': ('Акапулько', 'Acapulco'),
-    'EDI': ('Эдинбург', 'Edinburgh'),
-    'FRM': ('Фэрмонт', 'Fairmont'),
-    'AIL': ('Аилиганди', 'Ailigandi'),
-    'SMO': ('Санта Моника', 'Santa Monica'),
-    'ACJ': ('Анурадхапура', 'Anuradhapura'),
-    'GAA': ('Гуамаль', 'Guamal'),
-    'SMV': ('Санкт-Мориц', 'St Moritz'),
-    'ACX': ('Синъи', 'Xingyi'),
-    'SMX': ('Санта-Мария', 'Santa Maria'),
-    'ADK': ('Адак', 'Adak Island'),
-    'AXR': ('Арутуа', 'Arutua'),
-    'ADR': ('Эндрюс', 'Andrews'),
-    'SPD': ('Саидпур', 'Saidpur'),
-    'SQR': ('Сороако', 'Soroako'),
-    'GAX': ('Гамба', 'Gamba'),
-    'GBC': ('Гасуке', 'Gasuke'),
-    'SQN': ('о. Санана', 'Sanana'),
-    'AEH': ('Абеше', 'Abéché'),
-    'GBG': ('Гейлсберг', 'Galesburg'),
-    'SRF': ('Сан Рафаел', 'San Rafael'),
-    'AGD': ('Ангги', 'Anggi'),
-    'VVC': ('Вильявисенсио', 'Villavicencio'),
-    'SRJ': ('Сан Борха', 'San Borja'),
-    'ONJ': ('Одате', 'Odate Noshiro'),
-    'SRO': ('Сантана Рамос', 'Santana Ramos'),
-    'AHF': ('Арапахо', 'Arapahoe'),
-    'STW': ('Ставрополь', 'Stavropol'),
-    'SUG': ('Суригао', 'Surigao'),
-    'ZHD': (None, 'Fluelen'),
-    'SAT': ('Сан-Антонио', 'San Antonio'),
-    'ELE': ('Эль-Рил', 'El Real'),
-    'AHI': ('Амахаи', 'Amahai'),
-    'SPS': ('Вичита Фоллс Шеппард АФБ', 'Wichita Falls'),
-    'BRZ': ('Боротоу', 'Borotou'),
-    'AHT': ('Амчитка', 'Amchitka'),
-    'AKN': ('Кинг Салмон', 'King Salmon'),
-    'SUH': ('Сур', 'Sur'),
-    'AIA': ('Альянс', 'Alliance'),
-    'STV': ('Сурат', 'Surat Gujarat'),
-    'AIC': ('Аирок', 'Airok'),
-    'MSJ': ('Мисава', 'Misawa'),
-    'SUZ': ('Суриа', 'Suria'),
-    'GKD': (None, 'Gokceada'),
-    'AIF': ('Ассис', 'Assis'),
-    'FFA': ('Килл-Девил-Хиллз', 'Kill Devil Hills'),
-    'URO': ('Руан', 'Rouen'),
-    'SWE': ('Сивея', 'Siwea'),
-    'ACT': ('Уэйко', 'Waco'),
-    'SXA': ('Сиалум', 'Sialum'),
-    'SYL': (None, 'San Miguel'),
-    'FOG': ('Фоджа', 'Foggia'),
-    'EDM': ('Ля-Рош', 'La Roche'),
-    'AKD': ('Акола', 'Akola'),
-    'BTB': ('Бету', 'Betou'),
-    'GDV': ('Глендайв', 'Glendive'),
-    'AKE': ('Акиени', 'Akieni'),
-    'COH': ('Куч-Бехар', 'Cooch Behar'),
-    'JIC': ('Цзиньчан', 'Jinchang'),
-    'SYQ': ('Сан-Хосе', 'San Jose'),
-    'ALE': ('Алпайн', 'Alpine'),
-    'GOT': ('Гётеборг', 'Gothenburg'),
-    'SYT': ('Шароле', 'Saint Yan'),
-    'AKG': ('Ангуганак', 'Anguganak'),
-    'SZE': ('Семера', 'Semera'),
-    'AKH': ('Эль-Харж', 'Al Kharj'),
-    'GEG': ('Спокан', 'Spokane'),
-    'AKO': ('Акрон', 'Akron'),
-    'TTT': ('Тайдун', 'Taitung City'),
-    'TAG': ('Тагбиларан', 'Tagbilaran'),
-    'SZG': ('Зальцбург', 'Salzburg'),
-    'ALD': ('Алерта', 'Alerta'),
-    'ALG': ('Алжир', 'Algiers'),
-    'BRR': ('Барра', 'Barra'),
-    'TEQ': ('Текирдаг', 'Tekirdag'),
-    'ALH': ('Олбани', 'Albany'),
-    'TCJ': ('Торемби', 'Torembi'),
-    'MQJ': ('Хонуу', 'Khonu'),
-    'BRX': ('Барахона', 'Barahona'),
-    'ARE': ('Аресибо', 'Arecibo'),
-    'TCL': ('Тускалуза', 'Tuscaloosa'),
-    'ANB': ('Аннистон', 'Anniston'),
-    'KNH': ('Цзиньмэнь', 'Kinmen'),
-    'GNS': ('Гунунгситоли', 'Gunungsitoli'),
-    'TEG': ('Тенкодого', 'Tenkodogo'),
-    'QPW': ('Кангаатсиак', 'Kangaatsiaq'),
-    'ANT': ('Санкт-Антон', 'St Anton'),
-    'YRR': ('Остров Стьюарт', 'Stuart Island'),
-    'TEM': ('Темора', 'Temora'),
-    'ANX': ('Анденес', 'Andenes'),
-    'BFX': ('Бафуссама', 'Bafoussam'),
-    'TEX': ('Теллерайд', 'Telluride'),
-    'GKN': ('Галкана', 'Gulkana'),
-    'AOI': ('Анкона', 'Ancona'),
-    'GUJ': ('Гуаратингета', 'Guaratingueta'),
-    'AOJ': ('Аомори', 'Aomori'),
-    'TFI': ('Туфи', 'Tufi'),
-    'DEI': ('Денис Айленд', 'Denis Island'),
-    'APE': ('Сан-Хуан-Апосенто', 'San Juan Aposento'),
-    'FCY': ('Форрест-Сити', 'Forrest City'),
-    'FRY': ('Фрайерберг', 'Fryeburg'),
-    'API': ('Апиай', 'Apiay'),
-    'TIB': ('Тибу', 'Tibu'),
-    'TJK': ('Токат', 'Tokat'),
-    'GTW': ('Злин', 'Zlin'),
-    'TIM': ('Тембагапура', 'Tembagapura'),
-    'ARL': ('Арли', 'Arly'),
-    'APQ': ('Арапирака', 'Arapiraca'),
-    'GOK': ('Гатри', 'Guthrie'),
-    'ALN': ('Альтон', 'Alton'),
-    'JOR': (None, 'Orange'),
-    'LAM': ('Лос Аламос', 'Los Alamos'),
-    'TKW': ('Текин', 'Tekin'),
-    'LNJ': ('Линьцан', 'Lincang'),
-    'TLL': ('Таллин', 'Tallinn'),
-    'BOY': ('Бобо-Диуласо', 'Bobo Dioulasso'),
-    'TMJ': ('Термез', 'Termez'),
-    'GYM': ('Гуаймас', 'Guaymas'),
-    'BJT': ('Бентота-Ривер', 'Bentota River'),
-    'TMK': ('Тамки', 'Tamky'),
-    'GOO': ('Гундивинди', 'Goondiwindi'),
-    'ALU': ('Алула', 'Alula'),
-    'TMY': ('Тиом', 'Tiom'),
-    'TOE': ('Тозер', 'Tozeur'),
-    'TNH': ('Тунхуа', 'Sanyuanpu'),
-    'GRH': ('Гаруахи', 'Garuahi'),
-    'TOA': ('Торранс', 'Torrance'),
-    'AME': ('Альто-Молокуэ', 'Alto Molocue'),
-    'ARM': ('Армидейл', 'Armidale'),
-    'TNX': ('Стунг-Тренг', 'Stung Treng'),
-    'ZHN': (None, 'Herzogenbuchsee'),
-    'ASN': ('Талладега', 'Talladega'),
-    'TSE': ('Нур-Султан (Астана)', 'Astana (Nursultan)'),
-    'GTF': ('Грейт-Фолс', 'Great Falls'),
-    'TPQ': ('Тепик', 'Tepic'),
-    'ASV': ('Амбосели', 'Amboseli'),
-    'DMD': ('Думаджи', 'Doomadgee'),
-    'FTW': ('Форт-Уэрт', 'Fort Worth'),
-    'GSS': ('Саби Саби', 'Sabi Sabi'),
-    'AWR': ('Авар', 'Awar'),
-    'TRU': ('Трухильо', 'Trujillo'),
-    'ATK': ('Аткасук', 'Atqasuk'),
-    'TPE': ('Тайбэй', 'Taipei'),
-    'SXK': ('Саумлаки', 'Saumlaki'),
-    'TSR': ('Тимишоара', 'Timisoara'),
-    'TTH': ('Тумраит', 'Thumrait'),
-    'GUF': ('Гулф Шорс', 'Gulf Shores'),
-    'BFF': ('Скотсблафф', 'Scottsbluff'),
-    'IDN': ('Индаген', 'Indagen'),
-    'QTH': (None, 'Thredbo'),
-    'TSV': ('Таунсвилл', 'Townsville'),
-    'AUK': ('Алаканук', 'Alakanuk'),
-    'GUE': ('Гурасо', 'Guriaso'),
-    'TMX': ('Тимимун', 'Timimoun'),
-    'HBG': (None, 'Hattiesburg'),
-    'TTO': ('Бриттон', 'Britton'),
-    'ARJ': ('Арсо', 'Arso'),
-    'TWN': ('Тевантин', 'Tewantin'),
-    'GDI': ('Гордил', 'Gordil'),
-    'TUD': ('Тамбакунда', 'Tambacounda'),
-    'AYG': ('Ягуара', 'Yaguara'),
-    'ADA': ('Адана', 'Adana'),
-    'AYI': ('Яри', 'Yari'),
-    'UAH': ('Уа Хука', 'Ua Huka'),
-    'TWD': ('Порт Таунсенд', 'Port Townsend'),
-    'UDE': ('Уден', 'Uden'),
-    'BVZ': ('Беверли Спрингс', 'Beverley Springs'),
-    'GRS': ('Гроссето', 'Grosseto'),
-    'SUO': ('Санривер', 'Sun River'),
-    'AZB': ('Амазон-Бэй', 'Amazon Bay'),
-    'ANV': ('Анвик', 'Anvik'),
-    'SZS': ('Стюарт Айленд', 'Stewart Island'),
-    'IIL': ('Илам', 'Ilaam'),
-    'TXM': ('Теминабуан', 'Teminabuan'),
-    'BTY': ('Битти', 'Beatty'),
-    'TRR': ('Тринкомали', 'Trincomalee'),
-    'AMY': ('Амбатомаинти', 'Ambatomainty'),
-    'YZV': ('Сет-Иль', 'Sept-Iles'),
-    'TYS': ('Ноксвилл', 'Knoxville'),
-    'AZR': ('Адрар', 'Adrar'),
-    'BUX': ('Буниа', 'Bunia'),
-    'UAL': ('Луау', 'Luau'),
-    'CUI': ('Куррилло', 'Currillo'),
-    'IHC': ('Инхака', 'Inhaca'),
-    'ZMK': (None, 'Bintulu'),
-    'GUG': ('Гуари', 'Guari'),
-    'BVB': ('Боа-Виста', 'Boa Vista'),
-    'BBX': ('Блу Белл', 'Blue Bell'),
-    'ZAH': ('Захедан', 'Zahedan'),
-    'BCC': ('Биэр-Крик', 'Bear Creek'),
-    'QKB': (None, 'Breckenridge'),
-    'HIP': ('Хедингли', 'Headingly'),
-    'APK': ('Апатаки', 'Apataki'),
-    'ZEF': ('Нанхаи', 'Nanhai'),
-    'ANK': ('Анкара', 'Ankara'),
-    'ANR': ('Антверпен', 'Antwerp'),
-    'BUQ': ('Булавайо', 'Bulawayo'),
-    'URT': ('Сураттхани', 'Surat Thani'),
-    'CNP': ('Иллоккортоормиут', 'Neerlerit Inaat'),
-    'BJO': ('Бермеио', 'Bermejo'),
-    'URZ': ('Урузган', 'Uruzgan'),
-    'BCD': ('Баколод', 'Bacolod'),
-    'ZBK': ('Жабляк', 'Zabljak'),
-    'BWI': ('Балтимор', 'Baltimore'),
-    'UTD': ('Натвуд Даунс', 'Nutwood Downs'),
-    'OLV': ('Олив Бранч', 'Olive Branch'),
-    'CWT': ('Коура', 'Cowra'),
-    'BCG': ('Бемичи', 'Bemichi'),
-    'CAJ': ('Канаима', 'Canaima'),
-    'BCI': ('Баркалдин', 'Barcaldine'),
-    'BCK': ('Болварра', 'Bolwarra'),
-    'VAO': ('Суаванао', 'Suavanao'),
-    'WGO': ('Уинчестер', 'Winchester'),
-    'ZFB': ('Олд Форт Бэй', 'Old Fort Bay'),
-    'ZBJ': (None, 'Fredericia'),
-    'BYT': ('Бантри', 'Bantry'),
-    'ZFU': ('Аружа', 'Aruja'),
-    'BCU': ('Баучи', 'Bauchi'),
-    'OLU': ('Колумбус', 'Columbus'),
-    'ZJT': ('Танджунг Пелепас', 'Tanjung Pelepas'),
-    'BMD': ('Белон и Тзирибиина', 'Belo'),
-    'ZGM': ('Нгома', 'Ngoma'),
-    'BDB': ('Бандаберг', 'Bundaberg'),
-    'CKE': ('оз. Клир', 'Clear Lake'),
-    'BVW': ('Батавиа-Даунс', 'Batavia Downs'),
-    'VDE': ('Вальверде', 'Valverde'),
-    'OGD': ('Огден', 'Ogden'),
-    'ZHP': ('Хай Прейри', 'High Prairie'),
-    'ISW': ('Висконсин Рапидс', 'Wisconsin Rapids'),
-    'CXI': ('Остров Рождества', 'Christmas Island'),
-    'TEP': ('Тептеп', 'Teptep'),
-    'ZGS': ('Гетсемани', 'Gethsemani'),
-    'BDE': ('Бодетт', 'Baudette'),
-    'EMM': ('Кеммерер', 'Kemerer'),
-    'ZGU': ('Гауа', 'Gaua'),
-    'BVX': ('Бейтсвилл', 'Batesville'),
-    'CXP': ('Килакап', 'Cilacap'),
-    'VIL': ('Дахла', 'Dakhla'),
-    'BWB': ('Остров Барроу', 'Barrow Island'),
-    'RMC': (None, 'Rockford'),
-    'LPE': ('Ла Примавера', 'La Primavera'),
-    'HOG': ('Ольгин', 'Holguin'),
-    'ZJS': ('Йена', 'Jena'),
-    'CYA': ('Ле Кей', 'Les Cayes'),
-    'BDT': ('Гбадолите', 'Gbadolite'),
-    'ALP': ('Халеб', 'Aleppo'),
-    'BYA': ('Баундари', 'Boundary'),
-    'BDW': ('Бедфорд Даунс', 'Bedford Downs'),
-    'WGC': ('Варангал', 'Warangal'),
-    'MKE': ('Милуоки', 'Milwaukee'),
-    'BDX': ('Бродус', 'Broadus'),
-    'ZPH': ('Зефирхилс', 'Zephyrhills'),
-    'FAJ': ('Фахардо', 'Fajardo'),
-    'ZQS': ('острова Королевы Шарлотты', 'Queen Charlotte Island'),
-    'CBH': ('Бешар', 'Béchar'),
-    'FBG': (None, 'Fort Bragg'),
-    'ZYK': ('Шэкоу', 'Shekou'),
-    'ZLD': (None, 'Weinfelden'),
-    'VRE': ('Вредендал', 'Vredendal'),
-    'HII': ('Лейк-Хавасу-Сити', 'Lake Havasu City'),
-    'CYS': ('Шайенн', 'Cheyenne'),
-    'BXO': ('Буочс', 'Buochs'),
-    'VRU': ('Фрейбурга', 'Vryburg'),
-    'BXT': ('Бонтанг', 'Bontang'),
-    'HOR': ('Орта', 'Horta (Azores)'),
-    'ZRH': ('Цюрих', 'Zurich'),
-    'HOT': ('Хот-Спрингс', 'Hot Springs'),
-    'BEB': ('Бенбекьюла', 'Benbecula'),
-    'GRL': ('Гараса', 'Garasa'),
-    'UKI': ('Юкайа', 'Ukiah'),
-    'HRN': ('Херон-Айленд', 'Heron Island'),
-    'BEH': ('Бентон Харбор', 'Benton Harbor'),
-    'WET': ('Вагесе', 'Wagethe'),
-    'XGD': (None, 'Arendal'),
-    'HFD': ('Хартфорд', 'Hartford'),
-    'BES': ('Брест', 'Brest'),
-    'WHF': ('Вади-Хальфа', 'Wadi Halfa'),
-    'ZSJ': ('Санди-Лейк', 'Sandy Lake'),
-    'BHA': ('Баия де Каракес', 'Bahia De Caraquez'),
-    'BEW': ('Бейра', 'Beira'),
-    'DAJ': ('Дауан Айленд', 'Dauan Island'),
-    'ZTM': ('Шаматтава', 'Shamattawa'),
-    'ZEU': (None, 'Goettingen'),
-    'HRA': ('Мансехра', 'Mansehra'),
-    'POV': ('Прешов', 'Presov'),
-    'AOB': ('Аннанберг', 'Annanberg'),
-    'ZUD': ('Анкуд', 'Ancud'),
-    'USJ': ('Ушарал', 'Usharal'),
-    'BZL': ('Барисал', 'Barisal'),
-    'ULH': ('Аль-Ула', 'Al Ula'),
-    'HRT': ('Харрогейт', 'Harrogate'),
-    'BHI': ('Баия-Бланка', 'Bahia Blanca'),
-    'SZT': ('С. Кристобаиль дель Касас', 'S.Cristobal deL Casas'),
-    'AAR': ('Орхус', 'Aarhus'),
-    'BHO': ('Бхопал', 'Bhopal'),
-    'AUH': ('Абу-Даби', 'Abu Dhabi'),
-    'AOS': ('Амук', 'Amook'),
-    'CSA': ('Айл Оф Колонсей', 'Isle Of Colonsay'),
-    'ZJR': (None, 'Penang'),
-    'ALB': ('Олбани', 'Albany'),
-    'LTT': ('Сен-Тропе', 'Saint Tropez'),
-    'APC': ('Напа', 'Napa'),
-    'LTV': ('Лотусвейл', 'Lotusvale'),
-    'IDB': ('Идре', 'Idre'),
-    'BHU': ('Бхавнагар', 'Bhavnagar'),
-    'WAS': ('Вашингтон', 'Washington'),
-    'HLZ': ('Гамильтон', 'Hamilton'),
-    'XJA': (None, 'Alvdal'),
-    'APF': ('Нейплс', 'Naples'),
-    'CTB': ('Кат Банк', 'Cut Bank'),
-    'NVN': (None, 'Beckwourth'),
-    'BIM': ('Бимини', 'Bimini'),
-    'XBJ': ('Бирдженд', 'Birjand'),
-    'APU': ('Апукара', 'Apucarana'),
-    'HTW': ('Хантингтон', 'Huntington'),
-    'JJD': ('Жерикоакоара', 'Jericoacoara'),
-    'XYY': (None, 'Arvika'),
-    'ANA': ('Анахайм', 'Anaheim'),
-    'AQG': ('Аньцин', 'Anqing'),
-    'ZCB': (None, 'Aschaffenburg'),
-    'MBB': ('Марбл-Бар', 'Marble Bar'),
-    'DMT': ('Диамантину', 'Diamantino'),
-    'QDH': ('Эшфорд', 'Ashford'),
-    'BJK': ('Бенджина', 'Benjina'),
-    'BJL': ('Банжул', 'Banjul'),
-    'QQX': ('Бат', 'Bath'),
-    'SUF': ('Ламеция-Терме', 'Lamezia-Terme'),
-    'ARD': ('Алор', 'Alor Island'),
-    'HSV': ('Хантсвилл', 'Huntsville'),
-    'BCN': ('Барселона', 'Barcelona'),
-    'BJM': ('Бужумбура', 'Bujumbura'),
-    'BGO': ('Берген', 'Bergen'),
-    'MDK': ('Мбандака', 'Mbandaka'),
-    'HAR': ('Гаррисберг', 'Middletown'),
-    'ZJA': (None, 'Le Locle'),
-    'BJR': ('Бахр-Дар', 'Bahar Dar'),
-    'BLE': ('Бурлэнге', 'Borlange/Falun'),
-    'EMN': ('Нема', 'Nema'),
-    'ARX': ('Нептьюн', 'Neptune'),
-    'BER': ('Берлин', 'Berlin'),
-    'BJV': ('Бодрум', 'Bodrum'),
-    'BKD': ('Брекенридж', 'Breckenridge'),
-    'ZDO': (None, 'Buchs SG'),
-    'BNY': ('Беллона', 'Bellona'),
-    'ATD': ('Атоифи', 'Atoifi'),
-    'ZMZ': (None, 'Bjerka'),
-    'AFO': ('Афтон', 'Afton'),
-    'QBO': (None, 'Bochum'),
-    'VDZ': ('Валдиз', 'Valdez'),
-    'POI': ('Потоси', 'Potosi'),
-    'IBO': ('Ибо', 'Ibo'),
-    'XOB': (None, 'Bryne'),
-    'CAX': ('Карлайл', 'Carlisle'),
-    'MGK': ('Монг Тон', 'Mong Ton'),
-    'BKR': ('Бокоро', 'Bokoro'),
-    'GYA': ('Гуаярамерин', 'Guayaramerin'),
-    'HYA': ('Гианнис', 'Hyannis'),
-    'BUD': ('Будапешт', 'Budapest'),
-    'ATR': ('Атар', 'Atar'),
-    'HFS': ('Хагфорс', 'Hagfors'),
-    'BLO': ('Блондуос', 'Blonduos'),
-    'RGS': ('Бургос', 'Burgos'),
-    'OAZ': (None, 'Camp Bastion'),
-    'BMB': ('Бумба', 'Bumba'),
-    'FYV': ('Фейетвил', 'Fayetteville'),
-    'KJI': ('Бурчун', 'Buerjin'),
-    'XAW': (None, 'Capreol'),
-    'MLL': ('Маршалл', 'Marshall'),
-    'ZFI': (None, 'Chesterfield'),
-    'DTT': ('Детройт', 'Detroit'),
-    'BMF': ('Бакума', 'Bakouma'),
-    'CGO': ('Чжэнчжоу', 'Zhengzhou'),
-    'AUD': ('Аугустус-Даунс', 'Augustus Downs'),
-    'IKP': ('Инкерман', 'Inkerman'),
-    'AUE': ('Абу-Рудеис', 'Abu Rudeis'),
-    'CHI': ('Чикаго', 'Chicago'),
-    'AUF': ('Осер', 'Auxerre'),
-    'ZDT': (None, 'Chur'),
-    'COE': (None, "Coeur D'Alene"),
-    'DMM': ('Даммам', 'Dammam'),
-    'BML': ('Берлин', 'Berlin'),
-    'TYR': ('Тайлер', 'Tyler'),
-    'CAP': ('Кап-Аитьен', 'Cap Haitien'),
-    'AUM': ('Остин', 'Austin'),
-    'BMU': ('Кота-Бима', 'Bima'),
-    'INS': ('Индиан Спрингс', 'Indian Springs'),
-    'AUT': ('Атауро', 'Atauro'),
-    'XGK': (None, 'Coteau'),
-    'CMB': ('Коломбо', 'Colombo'),
-    'BMX': ('Биг Маунтэн', 'Big Mountain'),
-    'CZH': ('Корозал', 'Corozal'),
-    'IGM': ('Кингмен', 'Kingman'),
-    'AUY': ('Анейтьюм', 'Aneityum'),
-    'AVA': ('Аньшунь', 'An Shun'),
-    'ZDX': (None, 'Dietikon'),
-    'XDM': (None, 'Drummondville'),
-    'IPN': ('Ипатинга', 'Ipatinga'),
-    'AVG': ('Овернь', 'Auvergne'),
-    'GDG': ('Магдагачи', 'Magdagachi'),
-    'EBH': ('Эль-Баяд', 'El Bayadh'),
-    'AVO': ('Эйвон Парк', 'Avon Park'),
-    'EPS': ('Самана', 'Samana'),
-    'BNA': ('Нашвилл', 'Nashville'),
-    'ERL': ('Эрэн-Хото', 'Eren Hot'),
-    'BNG': ('Баннинг', 'Banning'),
-    'XUC': (None, 'Elverum'),
-    'ERF': ('Эрфурт', 'Erfurt'),
-    'UYL': ('Ньяла', 'Nyala'),
-    'HZP': (None, 'Fort MacKay'),
-    'FLL': ('Форт-Лодердейл', 'Fort Lauderdale'),
-    'GBU': ('Хашм Эль Гирба', 'Khashm El Girba'),
-    'CGZ': ('Каса Гранде', 'Casa Grande'),
-    'ISI': ('Айзисфорд', 'Isisford'),
-    'AXN': ('Александрия', 'Alexandria'),
-    'TUS': ('Тусон', 'Tucson'),
-    'XIP': (None, 'Woodstock'),
-    'BBG': ('Бутаритари', 'Butaritari'),
-    'AXU': ('Аксум', 'Axum'),
-    'XRA': (None, 'Graasten'),
-    'IST': ('Стамбул', 'Istanbul'),
-    'GCK': ('Гарден Сити', 'Garden City'),
-    'AXV': ('Вапаконета', 'Wapakoneta'),
-    'ITE': ('Итубера', 'Itubera'),
-    'AYK': ('Аркалык', 'Arkalyk'),
-    'JIM': ('Джимма', 'Jimma'),
-    'QFH': (None, 'Frederikshavn'),
-    'FUO': ('Фошань', 'Fuoshan'),
-    'GVX': ('Йевле', 'Gavle'),
-    'ITH': ('Итака', 'Ithaca'),
-    'AYO': ('Айолас', 'Ayolas'),
-    'ITK': ('Итокама', 'Itokama'),
-    'ZYG': (None, 'Gjovik'),
-    'AAW': ('Абботтабад', 'Abbottabad'),
-    'ONK': ('Оленёк', 'Olenyok'),
-    'DNI': ('Вад Мелани', 'Wad Medani'),
-    'XZC': (None, 'Glencoe'),
-    'XGM': (None, 'Grantham'),
-    'HLM': ('Голландия', 'Holland'),
-    'GDJ': ('Гандажика', 'Gandajika'),
-    'PQT': ('Кекертак', 'Qeqertaq'),
-    'XGY': (None, 'Grimsby'),
-    'ITP': ('Итаперу', 'Itaperuna'),
-    'DOL': ('Довиль', 'Deauville'),
-    'ZHJ': (None, 'Grindelwald'),
-    'BAJ': ('Бали', 'Bali'),
-    'HDG': ('Ханьдань', 'Handan'),
-    'AYY': (None, 'Pothuvil'),
-    'ZEY': (None, 'Hagen'),
-    'ZHL': (None, 'Heerbrugg'),
-    'BOU': ('Бурж', 'Bourges'),
-    'HAM': ('Гамбург', 'Hamburg'),
-    'IXL': ('Лех', 'Leh'),
-    'WKL': ('Уэйколоа', 'Waikoloa'),
-    'MUO': (None, 'Mountain Home'),
-    'QQH': (None, 'Harwich'),
-    'BCF': ('Боука', 'Bouca'),
-    'GNF': (None, 'Quincy'),
-    'ABG': ('Абингдон', 'Abingdon'),
-    'BBI': ('Бхубанешвар', 'Bhubaneswar'),
-    'DRB': ('Дерби', 'Derby'),
-    'CBF': ('Каунсил-Блафс', 'Council Bluffs'),
-    'AKL': ('Окленд', 'Auckland'),
-    'DRR': ('Дери', 'Durrie'),
-    'YVH': (None, 'Hjerkinn'),
-    'BIR': ('Биратнагар', 'Biratnagar'),
-    'AMA': ('Амарилло', 'Amarillo'),
-    'IXW': ('Джамшедпур', 'Jamshedpur'),
-    'ZLG': ('Эль Гоуьера', 'El Gouera'),
-    'BNR': ('Банфору', 'Banfora'),
-    'HOH': ('Хоэнемс', 'Hohenems'),
-    'GEX': (None, 'Geelong'),
-    'HHE': ('Хатинохе', 'Hachinohe'),
-    'UZM': (None, 'Hope Bay'),
-    'NAA': ('Наррабри', 'Narrabri'),
-    'MWJ': ('Мэттьюс Ридж', 'Matthews Ridge'),
-    'ICI': ('Кикиа', 'Cicia'),
-    'BOC': ('Бокас-дель-Торо', 'Bocas Del Toro'),
-    'BCB': ('Блэксбург', 'Blacksburg'),
-    'BOG': ('Богота', 'Bogota'),
-    'DYW': ('Дейли Уотерс', 'Daly Waters'),
-    'ASA': ('Асэб', 'Assab'),
-    'JAR': ('Джаром', 'Jahrom'),
-    'BOH': ('Борнмут', 'Bournemouth'),
-    'EKD': ('Элкедра', 'Elkedra'),
-    'YJA': ('Джаспер', 'Jasper'),
-    'JAX': ('Джэксонвилл', 'Jacksonville'),
-    'ATO': ('Атина', 'Athens'),
-    'JXA': ('Цзиси', 'Jixi'),
-    'BOJ': ('Бургас', 'Bourgas'),
-    'DRW': ('Дарвин', 'Darwin'),
-    'CEM': ('Сентрал', 'Central'),
-    'SHI': ('Симожисима', 'Shimojishima'),
-    'KDX': (None, 'Kadugli'),
-    'YZR': ('Сарния', 'Sarnia'),
-    'PDU': ('Пайсанду', 'Paysandu'),
-    'BOK': ('Брукингс', 'Brookings'),
-    'JKL': ('Калимнос', 'Kalymnos'),
-    'PGC': ('Петербург', 'Petersburg'),
-    'BOP': ('Буаре', 'Bouar'),
-    'BCS': ('Бель Часс', 'Belle Chasse'),
-    'ICL': ('Кларинда', 'Clarinda'),
-    'JMO': ('Джомсом', 'Jomsom'),
-    'GNN': ('Гхиннир', 'Ghinnir'),
-    'ZJD': (None, 'Lenzerheide/Lai'),
-    'DWR': (None, 'Dwyer'),
-    'YGE': ('Джорджи Харбор', 'Gorge Harbor'),
-    'IYK': ('Иньокерн', 'Inyokern'),
-    'BOS': ('Бостон', 'Boston'),
-    'BWH': ('Баттерворс', 'Butterworth'),
-    'VNG': ('Виенгксай', 'Viengxay'),
-    'JCK': ('Джулия Крик', 'Julia Creek'),
-    'QJW': (None, 'Kjellerup'),
-    'MPI': ('Мамитупо', 'Mamitupo'),
-    'DJU': ('Дьюпивогюр', 'Djupivogur'),
-    'KKQ': (None, 'Krasnoselkup'),
-    'IMN': ('Имане', 'Imane'),
-    'KUL': ('Куала-Лумпур', 'Kuala Lumpur'),
-    'PIW': ('Пиквитоней', 'Pikwitonei'),
-    'BOV': ('Боанг', 'Boang'),
-    'BOW': ('Бартау', 'Bartow'),
-    'JYV': ('Ювяскюля', 'Jyvaskyla'),
-    'GNG': ('Гудинг', 'Gooding'),
-    'GRR': ('Гранд-Рапидс', 'Grand Rapids'),
-    'BDS': ('Бриндизи', 'Brindisi'),
-    'XEY': (None, 'Miramichi'),
-    'XEE': (None, 'Lac Edouard'),
-    'BPA': ('Бефпейдж', 'Bethpage'),
-    'LCQ': (None, 'Lake City'),
-    'CDO': ('Крадок', 'Cradock'),
-    'EBS': ('Уэбстер Сити', 'Webster City'),
-    'IPG': ('Ипиранга', 'Ipiranga'),
-    'BPC': ('Баменды', 'Bamenda'),
-    'EDA': ('Эдна Бэй', 'Edna Bay'),
-    'EDW': ('Эдвардс', 'Edwards'),
-    'NKS': ('Нконгсамба', 'Nkongsamba'),
-    'BPK': ('Биангабип', 'Biangabip'),
-    'BEV': ('Беэр-Шева', 'Beer Sheba'),
-    'DNG': ('Дунган', 'Doongan'),
-    'JER': ('Бейливик оф Джерси', 'Jersey'),
-    'LAX': ('Лос-Анджелес', 'Los Angeles'),
-    'BPN': ('Баликпапан', 'Balikpapan'),
-    'YSM': ('Форт-Смит', 'Fort Smith'),
-    'NNU': ('Нануки', 'Nanuque'),
-    'BPU': ('Бэппу', 'Beppu'),
-    'BIC': ('Биг Крик', 'Big Creek'),
-    'IMI': ('Айн Айленд', 'Ine Island'),
-    'BPX': ('Чамдо', 'Bangda'),
-    'XKI': (None, 'Lillestrom'),
-    'JDH': ('Джодхпур', 'Jodhpur'),
-    'BPY': ('Бесалампи', 'Besalampy'),
-    'BIX': ('Билокси', 'Biloxi'),
-    'LLT': (None, 'Lobito'),
-    'JIK': ('Икария', 'Ikaria Island'),
-    'BFW': ('Сиди-бель-Аббес', 'Sidi Belabbes'),
-    'ZJI': (None, 'Locarno'),
-    'LON': ('Лондон', 'London'),
-    'CGG': ('Касигуран', 'Casiguran'),
-    'ZMA': (None, 'Mansfield'),
-    'BRG': ('Уайтсберг', 'Whitesburg'),
-    'BQE': ('Бубаку', 'Bubaque'),
-    'BHT': ('Брайтон-Даунс', 'Brighton Downs'),
-    'JMU': ('Цзямусы', 'Jiamusi'),
-    'SXL': ('Слайгоу', 'Sligo'),
-    'EMP': ('Эмпория', 'Emporia'),
-    'XQI': (None, 'Loughborough'),
-    'BQI': ('Багани', 'Bagani'),
-    'FAH': ('Фарах', 'Farah'),
-    'LGJ': (None, 'Lugoj'),
-    'MMA': ('Мальмё', 'Malmo'),
-    'CRK': ('Лусон', 'Luzon Island'),
-    'GSB': ('Голдсборо', 'Goldsboro'),
-    'BRB': ('Баррейриньяс', 'Barreirinhas'),
-    'BSX': ('Бассейн', 'Bassein'),
-    'CFF': ('Кафунфо', 'Cafunfo'),
-    'BRD': ('Брейнерд', 'Brainerd'),
-    'YMU': ('Мансонс-Ландинг', 'Mansons Landing'),
-    'XQM': (None, 'Market Harborough'),
-    'KLH': ('Колхапур', 'Kolhapur'),
-    'GSC': ('Гаскойн Джанкшен', 'Gascoyne Junction'),
-    'BRN': ('Берн', 'Berne'),
-    'BHV': ('Бахавалпур', 'Bahawalpur'),
-    'CFH': ('Клифтон Хиллс', 'Clifton Hills'),
-    'BRO': ('Браунсвилл', 'Brownsville'),
-    'NTU': ('Океания', 'Oceana'),
-    'SSY': ('Мбанза-Конго', "M'banza Congo"),
-    'BRQ': ('Брно', 'Brno'),
-    'GUS': (None, 'Peru'),
-    'KSD': ('Карлстад', 'Karlstad'),
-    'JJM': ('Меру', 'Meru'),
-    'ETB': ('Запад Бенд', 'West Bend'),
-    'CKN': ('Крукстон', 'Crookston'),
-    'BSB': ('Бразилиа', 'Brasilia'),
-    'MIA': ('Майами', 'Miami'),
-    'UBS': ('Колумбус', 'Columbus'),
-    'EUC': ('Евкла', 'Eucla'),
-    'BSD': ('Баошань', 'Baoshan'),
-    'ZSN': (None, 'Stendal'),
-    'GYL': ('Аргайл', 'Argyle'),
-    'BSE': ('Семантан', 'Sematan'),
-    'MIL': ('Милан', 'Milan'),
-    'BSJ': ('Бэрнсдейл', 'Bairnsdale'),
-    'LRJ': ('Ле Марс', 'Lemars'),
-    'ZMO': (None, 'Modena'),
-    'BSN': ('Босангоа', 'Bossangoa'),
-    'FLI': ('Флатейри', 'Flateyri'),
-    'BJJ': ('Вустер', 'Wooster'),
-    'JGN': ('Цзяюйгуань', 'Jiayuguan'),
-    'VCA': ('Кантхо', 'Can Tho'),
-    'CME': ('Сьюдад-дель-Кармен', 'Ciudad Del Carmen'),
-    'QMO': (None, 'Mons'),
-    'VAG': ('Варжинья', 'Varginha'),
-    'KPT': ('Джэкпот', 'Jackpot'),
-    'OHB': (None, 'Moramanga'),
-    'RRK': ('Роукела', 'Rourkela'),
-    'MUC': ('Мюнхен', 'Munich'),
-    'BLA': ('Барселона', 'Barcelona'),
-    'BSO': ('Баско', 'Basco'),
-    'XOL': (None, 'Myrdal'),
-    'JHS': ('Сисимиут', 'Sisimiut'),
-    'BKB': ('Биканер', 'Bikaner'),
-    'YMK': ('Мыс Каменный', 'Mys-Kamenny'),
-    'OBK': (None, 'Northbrook'),
-    'BKP': ('Баркли-Даунс', 'Barkly Downs'),
-    'XIF': (None, 'Napanee'),
-    'GLT': ('Гладстон', 'Gladstone'),
-    'DWD': ('Давадми', 'Dawadmi'),
-    'QNC': (None, 'Neuchatel'),
-    'BSW': ('Босвелл Бэй', 'Boswell Bay'),
-    'ATS': ('Артижа', 'Artesia'),
-    'NUA': ('Нувоа Элия', 'Nuwara Eliya'),
-    'GWT': ('Вестерланд', 'Westerland'),
-    'NYC': ('Нью-Йорк', 'New York'),
-    'BTA': ('Яунде', 'Yaoundé'),
-    'BLQ': ('Болонья', 'Bologna'),
-    'OCE': ('Ошен Сити', 'Ocean City'),
-    'JMK': ('Миконос', 'Mikonos'),
-    'BTC': ('Баттикалоа', 'Batticaloa'),
-    'CJM': ('Чумпхон', 'Chumphon'),
-    'JGA': ('Джамнагар', 'Jamnagar'),
-    'AWK': ('Уэйк-Айленд', 'Wake Island'),
-    'NIU': ('Ниау', 'Niau'),
-    'UJN': (None, 'Uljin'),
-    'OKB': ('Оркид Бид', 'Orchid Beach'),
-    'NQT': ('Ноттингем', 'Leicestershire'),
-    'BTV': ('Берлингтон', 'Burlington'),
-    'BTG': ('Батангафо', 'Batangafo'),
-    'YVA': ('Морони', 'Moroni'),
-    'BTI': ('Остров Бартер', 'Barter Island'),
-    'ZIB': (None, 'Nyborg'),
-    'ODC': (None, 'Oakdale'),
-    'JLD': ('Ландскрона', 'Landskrona'),
-    'ZRN': (None, 'Nyon'),
-    'BMN': ('Бамерни', 'Bamerny'),
-    'HRI': ('Хамбантота', 'Hambantota'),
-    'GJT': ('Гранд-Джанкшен', 'Grand Junction'),
-    'ZKX': (None, 'Uzwil'),
-    'CXT': ('Чартерс-Тауэрс', 'Charters Towers'),
-    'BTJ': ('Банда-Ачех', 'Banda Aceh'),
-    'SGE': ('Зиген', 'Siegen'),
-    'XVS': (None, 'Valenciennes'),
-    'AGV': ('Акаригуа', 'Acarigua'),
-    'HEH': ('Хехо', 'Heho'),
-    'ZJU': (None, 'Olten'),
-    'HLU': ('Уаилу', 'Houailou'),
-    'SVG': ('Ставангер', 'Stavanger'),
-    'JLR': ('Джабалпур', 'Jabalpur'),
-    'BNB': ('Боанд', 'Boende'),
-    'OST': ('Брюгге', 'Bruges'),
-    'BNF': ('остров Баранова', 'Baranof'),
-    'JMH': ('Шаумбург', 'Schaumburg'),
-    'BVO': ('Бартлсвилл', 'Bartlesville'),
-    'ZAX': ('Пан Ю', 'Pan Yu'),
-    'BTO': ('Боттопасси', 'Botopasie'),
-    'ZYV': (None, 'Vegarshei'),
-    'OSL': ('Осло', 'Oslo'),
-    'GFR': ('Гранвиль', 'Granville'),
-    'QOW': ('Оверри', 'Imo'),
-    'SKO': ('Сокото', 'Sokoto'),
-    'MHA': ('Махдла', 'Mahdia'),
-    'SKQ': ('Секакес', 'Sekakes'),
-    'BTU': ('Бинтулу', 'Bintulu'),
-    'XKE': (None, 'Rena'),
-    'XPB': (None, 'Parksville'),
-    'FLO': ('Флоренс', 'Florence'),
-    'BTW': ('Бату Лицин', 'Batu Licin'),
-    'PAN': ('Паттани', 'Pattani'),
-    'XKP': (None, 'Porsgrunn'),
-    'CIS': ('Кантон', 'Canton Island'),
-    'HGD': ('Хьюэнден', 'Hughenden'),
-    'GRW': ('Остров Грасиоза', 'Graciosa Island (Azores)'),
-    'DUI': (None, 'Duisburg'),
-    'SMM': ('Селангор', 'Semporna'),
-    'YZT': ('Порт Харди', 'Port Hardy'),
-    'BTX': ('Бетута', 'Betoota'),
-    'PAT': ('Патна', 'Patna'),
-    'ZJW': (None, 'Rapperswil'),
-    'ANN': ('Остров Аннет', 'Annette Island'),
-    'BQL': ('Боулия', 'Boulia'),
-    'XKW': (None, 'Tonsberg'),
-    'ZXX': (None, 'Rade'),
-    'BUI': ('Бркондини', 'Bokondini'),
-    'SSM': ('Солт Сейнт Мери', 'Sault Ste. Marie'),
-    'BUL': ('Булоло', 'Bulolo'),
-    'BUP': ('Бхатинда', 'Bhatinda'),
-    'KWX': ('Остров Кивай', 'Kiwai Island'),
-    'BUS': ('Батуми', 'Batumi'),
-    'XUQ': (None, 'Ringebu'),
-    'XKV': (None, 'Sackville'),
-    'HIM': (None, 'Hingurakgoda'),
-    'MVI': ('Манетаи', 'Manetai'),
-    'LHW': ('Ланьчжоу', 'Lanzhou'),
-    'QSR': ('Салерно', 'Salerno'),
-    'ZYW': (None, 'Sandvika'),
-    'KHM': ('Хамти', 'Khamti'),
-    'BVD': ('Залив Бивер', 'Beaver Inlet'),
-    'BSG': ('Бата', 'Bata'),
-    'OAH': (None, 'Shindand'),
-    'BVH': ('Вильена', 'Vilhena'),
-    'ZSD': (None, 'Schwanheide'),
-    'XFK': (None, 'Senneterre'),
-    'BVI': ('Бердсвилл', 'Birdsville'),
-    'KNR': ('Канган', 'Kangan'),
-    'SRT': ('Сороти', 'Soroti'),
-    'THD': ('Тханьхоа', 'Thanh Hoa'),
-    'BVP': ('Боловип', 'Bolovip'),
-    'HOE': ('Хауэисей', 'Houeisay'),
-    'GVT': ('Гринвилл', 'Greenville'),
-    'BTS': ('Братислава', 'Bratislava'),
-    'STF': ('Остров Стивенс', 'Stephen Island'),
-    'KAX': ('Кальбари', 'Kalbarri'),
-    'BWD': ('Браунвуд', 'Brownwood'),
-    'XFM': (None, 'Shawnigan'),
-    'BUK': ('Олбук', 'Albuq'),
-    'HOB': ('Хоббс', 'Hobbs'),
-    'ZAS': ('Шунде', 'Shunde'),
-    'GTI': ('Гюттин', 'Guettin'),
-    'XAH': (None, 'Silkeborg'),
-    'KFA': ('Киффа', 'Kiffa'),
-    'BVM': ('Бельмонте', 'Belmonte'),
-    'CKX': ('Чикен', 'Chicken'),
-    'ZIO': (None, 'Solingen'),
-    'HRS': ('Харрисмит', 'Harrismith'),
-    'BWQ': ('Брюаррина', 'Brewarrina'),
-    'KTF': ('Такака', 'Takaka'),
-    'XQS': (None, 'Sotkamo'),
-    'BXA': ('Богальюза', 'Bogalusa'),
-    'ATX': ('Атбасар', 'Atbasar'),
-    'SOM': ('Сан Томе', 'San Tome'),
-    'WFI': ('Фианаранцуа', 'Fianarantsoa'),
-    'ZKF': (None, 'St Margrethen'),
-    'BXC': ('Боксборо', 'Boxborough'),
-    'FRP': ('Фреш Уотер Бэй', 'Fresh Water Bay'),
-    'BUA': ('о. Бука', 'Buka'),
-    'RUA': ('Аруа', 'Arua'),
-    'GUI': ('Гуириа', 'Guiria'),
-    'AMM': ('Амман', 'Amman'),
-    'BXE': ('Бакел', 'Bakel'),
-    'BWP': ('Бевенаи', 'Bewani'),
-    'CLU': ('Колумбус', 'Columbus'),
-    'XVB': (None, 'Stafford'),
-    'BXB': ('Бабо', 'Babo'),
-    'XUU': (None, 'Stjordal'),
-    'KHT': ('Хост', 'Khost'),
-    'XVA': (None, 'Stockport'),
-    'BXR': ('Бам', 'Bam'),
-    'BXI': ('Бундиали', 'Boundiali'),
-    'BXS': ('Боррего Спрингс', 'Borrego Springs'),
-    'BXV': (None, 'Breiddalsvik'),
-    'GOL': ('Голд Бич', 'Gold Beach'),
-    'HAP': ('Лонг Айленд', 'Long Island'),
-    'BAI': ('Буэнос Айрес', 'Buenos Aires'),
-    'QWQ': (None, 'Struer'),
-    'ZTV': (None, 'Sturtevant'),
-    'HSB': ('Гаррисберг', 'Harrisburg'),
-    'BZT': ('Бразориа', 'Brazoria'),
-    'BYI': ('Руперт', 'Rupert'),
-    'GPT': ('Галфпорт', 'Gulfport'),
-    'KIV': ('Кишинёв', 'Chisinau'),
-    'BYL': ('Белла Йелла', 'Bella Yella'),
-    'KKC': ('Кхонкэн', 'Khon Kaen'),
-    'SZW': ('Шверин', 'Schwerin'),
-    'KKG': ('Конаварук', 'Konawaruk'),
-    'CXO': ('Конро', 'Conroe'),
-    'BYR': ('Лесё', 'Laeso Island'),
-    'BYU': ('Байройт', 'Bayreuth'),
-    'CAT': ('Кашкайш', 'Tires'),
-    'BYW': ('Остров Блэкли', 'Blakely Island'),
-    'BAO': ('Бан-Мак-Хен', 'Ban Mak Khaen'),
-    'KKL': ('оз. Карлек', 'Karluk Lake'),
-    'ZCA': ('Таи Шан', 'Tai Shan'),
-    'KNN': ('Канкан', 'Kankan'),
-    'KUR': ('Куран-о-Мунйан', 'Kuran-O-Munjan'),
-    'XFO': (None, 'Taschereau'),
-    'TNW': ('Тена', 'Tena'),
-    'BZC': ('Армасан-дус-Бузиус', 'Buzios'),
-    'CEX': ('Чина-Хот-Спрингс', 'Chena Hot Springs'),
-    'GRY': ('Гримси', 'Grimsey'),
-    'BZM': ('Берген-оп-Зом', 'Bergen Op Zoom'),
-    'KLT': ('Кайзерслаутерн', 'Kaiserslautern'),
-    'KBI': ('Криби', 'Kribi'),
-    'ZKV': (None, 'Thalwil'),
-    'SLR': ('Салфер Спрингс', 'Sulphur Springs'),
-    'KMS': ('Кумаси', 'Kumasi'),
-    'WLK': ('Селавик', 'Selawik'),
-    'LYT': ('Леди Эллиот Айленд', 'Lady Elliot Island'),
-    'GAE': ('Габес', 'Gabes'),
-    'CSZ': ('Коронель Суарез', 'Coronel Suarez'),
-    'TGJ': ('Тига', 'Tiga'),
-    'HAG': ('Гаага', 'The Hague'),
-    'KNQ': ('Коне', 'Kone'),
-    'GBM': ('Гарбахарей', 'Garbaharey'),
-    'KUV': ('Кунсан', 'Gunsan'),
-    'XTK': (None, 'Thirsk'),
-    'GLZ': ('Бреда', 'Breda'),
-    'CAB': ('Кабинда', 'Cabinda'),
-    'YTO': ('Торонто', 'Toronto'),
-    'ZWD': (None, 'Warnemuende'),
-    'LAE': ('Лаэ', 'Lae'),
-    'LPA': ('Лас-Пальмас', 'Las Palmas'),
-    'CDJ': ('Консейсан-ду-Арагуая', 'Conceicao Do Araguaia'),
-    'PLQ': ('Клайпеда', 'Palanga'),
-    'TTK': (None, 'Tottenham'),
-    'LAF': ('Лафайет', 'Lafayette'),
-    'TUF': ('Тур', 'Tours'),
-    'KYL': ('Ки Ларго', 'Key Largo'),
-    'TDP': (None, 'Trompeteros'),
-    'CBL': ('Сьюдад Боливар', 'Ciudad Bolivar'),
-    'THX': ('Туруханск', 'Turukhansk'),
-    'DBN': ('Дублин', 'Dublin'),
-    'KZH': ('Кизуйак', 'Kizhuyak'),
-    'UTS': ('Усть-Цильма', 'Ust-Tsilma'),
-    'BZN': ('Бозмен', 'Belgrade'),
-    'GNR': ('Хенераль', 'General Roca'),
-    'CXC': ('Читина', 'Chitina'),
-    'LAA': ('Ламар', 'Lamar'),
-    'CAL': ('Кэмпбелтаун', 'Campbeltown'),
-    'LAV': ('Лоломалава', 'Lalomalava'),
-    'VLL': ('Вальядолид', 'Valladolid'),
-    'TXG': ('Тайчжун', 'Taichung'),
-    'CDN': ('Камден', 'Camden'),
-    'HUG': ('Уэуэтенанго', 'Huehuetenango'),
-    'RCU': ('Рио Куарто', 'Rio Cuarto'),
-    'LAN': ('Лансинг', 'Lansing'),
-    'HAJ': ('Ганновер', 'Hanover'),
-    'CAN': ('Гуанчжоу', 'Guangzhou'),
-    'FNE': ('Фане', 'Fane'),
-    'GPS': ('Бальтра', 'Galapagos Islands'),
-    'ENQ': ('Коронел Э Сото Кано АБ', 'Coronel E Soto Cano AB'),
-    'VNT': (None, 'Ventspils'),
-    'HPB': ('Хупер-Бей', 'Hooper Bay'),
-    'CAU': ('Каруару', 'Caruaru'),
-    'ZKY': (None, 'Verbier'),
-    'CNV': ('Кавиейрас', 'Canavieiras'),
-    'CAV': ('Казомбо', 'Cazombo'),
-    'CAY': ('Кайенна', 'Cayenne'),
-    'LCH': ('Лейк-Чарльз', 'Lake Charles'),
-    'GUB': ('Герреро-Негро', 'Guerrero Negro'),
-    'DEC': ('Декейтер', 'Decatur'),
-    'ZVC': (None, 'Villarrica'),
-    'LCS': ('Каньяс', 'Las Canas'),
-    'LDI': ('Линда', 'Lindi'),
-    'ZLC': (None, 'Waedenswil'),
-    'WXJ': (None, 'Wanning'),
-    'LDJ': ('Линден', 'Linden'),
-    'XWA': (None, 'Watford'),
-    'LDZ': ('Лондолози', 'Londolozi'),
-    'WEC': (None, 'Wenchang'),
-    'LUL': ('Лорел', 'Laurel'),
-    'TFF': ('Тефе', 'Tefe'),
-    'CBS': ('Кабимас', 'Cabimas'),
-    'LEX': ('Лексингтон', 'Lexington'),
-    'ESP': ('Восток Страудсберг', 'East Stroudsburg'),
-    'BOL': ('Балликелли', 'Ballykelly'),
-    'ZLF': (None, 'Wettingen'),
-    'LIP': ('Линс', 'Lins'),
-    'HUL': ('Хоултон', 'Houlton'),
-    'GHC': ('Грейт Харбор', 'Great Harbour'),
-    'AXK': ('Атак', 'Ataq'),
-    'DBM': ('Дэбрэ-Маркос', 'Debra Marcos'),
-    'IXP': ('Патанкот', 'Pathankot'),
-    'ZQV': (None, 'Worms'),
-    'CBU': ('Котбус', 'Cottbus'),
-    'CAA': ('Катакамас', 'Catacamas'),
-    'QUY': (None, 'Wyton'),
-    'LKP': ('Лейк-Плэсид', 'Lake Placid'),
-    'CBZ': ('Кабин Крик', 'Cabin Creek'),
-    'LIQ': ('Лисале', 'Lisala'),
-    'GUC': ('Ганнисон', 'Gunnison'),
-    'COY': (None, 'Coolawanyah'),
-    'CCF': ('Каркасон', 'Carcassonne'),
-    'ZIT': (None, 'Zittau'),
-    'CCH': ('Чиле-Чико', 'Chile Chico'),
-    'TPG': ('Тайпин', 'Taiping'),
-    'LIS': ('Лиссабон', 'Lisbon'),
-    'TRC': ('Торреон', 'Torreon'),
-    'CCI': ('Конкордия', 'Concordia'),
-    'LLF': ('Юнчжоу', 'Yongzhou'),
-    'GWL': ('Гвалиор', 'Gwalior'),
-    'CCJ': ('Кожикоде', 'Kozhikode'),
-    'LLM': ('Лонг Лама', 'Long Lama'),
-    'QOR': ('Гиресун', 'Gulyali'),
-    'BGN': ('Белая Гора', 'Belaya Gora'),
-    'BDM': ('Бандырма', 'Bandirma'),
-    'ESO': ('Эспаньола', 'Espanola'),
-    'LME': ('Ле-Ман', 'Le Mans'),
-    'CPH': ('Копенгаген', 'Copenhagen'),
-    'CCL': ('Чинчилла', 'Chinchilla'),
-    'DJB': ('Джамби', 'Jambi'),
-    'HWI': ('Залив Хок', 'Hawk Inlet'),
-    'RDO': ('Радом', 'Radom'),
-    'GWS': ('Гленвуд Спрингс', 'Glenwood Springs'),
-    'UMS': ('Усть-Мая', 'Ust-Maya'),
-    'CCR': ('Конкорд', 'Concord'),
-    'CCT': ('Колония-Катриэль', 'Colonia Catriel'),
-    'KPW': ('Кепервеем', 'Keperveyem'),
-    'HDE': ('Холдредж', 'Holdrege'),
-    'CCW': ('Коуэлл', 'Cowell'),
-    'LMT': ('Кламат Фолс', 'Klamath Falls'),
-    'MQV': ('Мостаганем', 'Mostaganem'),
-    'BTT': ('Бетлс', 'Bettles'),
-    'XKQ': (None, 'Sarpsborg'),
-    'HFN': ('Хорнафьордур', 'Hornafjordur'),
-    'CDC': ('Сидар-Сити', 'Cedar City'),
-    'LMZ': ('Пальма', 'Palma'),
-    'LNO': ('Леонора', 'Leonora'),
-    'HAZ': ('Хатзфейдсавен', 'Hatzfeldthaven'),
-    'CDH': ('Камден', 'Camden'),
-    'LOH': ('Лоха', 'Loja'),
-    'DVL': ('Девилс Лейк', 'Devils Lake'),
-    'LOT': ('Локпорт', 'Lockport'),
-    'HDH': ('Оаху', 'Oahu'),
-    'XHU': (None, 'Huntingdon'),
-    'GEY': ('Грейбулл', 'Greybull'),
-    'CDR': ('Чадрон', 'Chadron'),
-    'LOV': ('Монклова', 'Monclova'),
-    'LOW': ('Луиза', 'Louisa'),
-    'CSX': ('Чанша', 'Changsha'),
-    'CIC': ('Чико', 'Chico'),
-    'AKT': ('Акротири', 'Akrotiri'),
-    'ORZ': ('Ориндж-Уолк', 'Orange Walk'),
-    'LPG': ('Ла-Плата', 'La Plata'),
-    'CEC': ('Кресент-Сити', 'Crescent City'),
-    'HJR': ('Кхаджурахо', 'Khajuraho'),
-    'CGE': ('Кембридж', 'Cambridge'),
-    'HKV': ('Хасково', 'Haskovo'),
-    'CED': ('Сидуна', 'Ceduna'),
-    'HLL': ('Хиллсайд', 'Hillside'),
-    'CEE': ('Череповец', 'Cherepovets'),
-    'LSW': ('Лхоксёмаве', 'Lhoksumawe'),
-    'CTF': ('Коатепеке', 'Coatepeque'),
-    'TNO': ('Тамариндо', 'Tamarindo'),
-    'CEL': ('Капе-Елеутера', 'Cape Eleuthera'),
-    'DLU': ('Дали', 'Dali City'),
-    'LTI': ('Алтай', 'Altai'),
-    'CEQ': ('Канны', 'Cannes'),
-    'LTM': ('Летем', 'Lethem'),
-    'CJB': ('Коямпуттур', 'Coimbatore'),
-    'CES': ('Сеснок', 'Cessnock'),
-    'HMG': ('Херманнсберг', 'Hermannsburg'),
-    'ALZ': ('Алитак', 'Alitak'),
-    'LWH': ('Лон Хилл', 'Lawn Hill'),
-    'ZJP': (None, 'Montreux'),
-    'NTJ': ('Манти', 'Manti'),
-    'DCM': ('Кастр', 'Castres'),
-    'LYH': ('Линчбург', 'Lynchburg'),
-    'CEV': ('Коннерсвилл', 'Connersville'),
-    'HON': ('Гурон', 'Huron'),
-    'LZU': ('Лоренсевилл', 'Lawrenceville'),
-    'CEZ': ('Кортес', 'Cortez'),
-    'CFB': ('Кабу-Фриу', 'Cabo Frio'),
-    'ZEL': ('Белла Белла', 'Bella Bella'),
-    'BQU': ('Бекия', 'Bequia'),
-    'MAT': ('Матади', 'Matadi'),
-    'CWI': ('Клинтон', 'Clinton'),
-    'MAZ': ('Маягуэс', 'Mayaguez'),
-    'CFO': ('Конфреза  -', 'Confreza'),
-    'CZF': ('Капе-Романзоф', 'Cape Romanzof'),
-    'CGN': ('Кёльн', 'Cologne'),
-    'CFQ': ('Крестон', 'Creston'),
-    'MBZ': ('Мауэс', 'Maues'),
-    'CUZ': ('Куско', 'Cuzco'),
-    'MCB': ('Мак-Комб', 'Mccomb'),
-    'QMZ': (None, 'Mainz'),
-    'GZA': ('Рафах', 'Rafah'),
-    'MCM': ('Монте-Карло', 'Monte Carlo'),
-    'RIZ': ('Рио Альзукар', 'Rio Alzucar'),
-    'CGD': ('Чандэ', 'Changde'),
-    'HUN': ('Хуалянь', 'Hualien'),
-    'CKB': ('Кларксберг', 'Clarksburg'),
-    'CGI': ('Кейп Джирардо', 'Cape Girardeau'),
-    'CUO': ('Каруру', 'Caruru'),
-    'CIL': ('Каунсил', 'Council'),
-    'DRC': ('Дирико', 'Dirico'),
-    'CGJ': ('Чингола', 'Chingola'),
-    'ZGE': ('Гоерлитц', 'Goerlitz'),
-    'GMT': ('Гранит Маунтайн', 'Granite Mountain'),
-    'HYS': ('Хейс', 'Hays'),
-    'IAR': ('Ярославль', 'Yaroslavl'),
-    'MDZ': ('Мендоса', 'Mendoza'),
-    'CGQ': ('Чанчунь', 'Changchun'),
-    'CGS': ('Колледж Парк', 'College Park'),
-    'KEH': ('Кенмор Эйр Харбор', 'Kenmore Air Harbor'),
-    'ARW': ('Арад', 'Arad'),
-    'CLL': ('Колледж-Стейшен', 'College Station'),
-    'GWY': ('Голуэй', 'Galway'),
-    'PUM': ('Помала', 'Pomala'),
-    'CWC': ('Черновцы', 'Chernivtsi'),
-    'CHA': ('Чаттануга', 'Chattanooga'),
-    'IBP': ('Иберия', 'Iberia'),
-    'IJK': ('Ижевск', 'Izhevsk'),
-    'CHF': ('Чинхэ', 'Jinhae'),
-    'MGB': ('Маунт-Гамбиер', 'Mount Gambier'),
-    'DSA': ('Донкастер', 'Doncaster'),
-    'CHH': ('Чачапояс', 'Chachapoyas'),
-    'CVQ': ('Карнарвон', 'Carnarvon'),
-    'CHZ': ('Чилокин', 'Chiloquin'),
-    'CHN': ('Чонджу', 'Jeonju'),
-    'MHV': ('Мохаве', 'Mojave'),
-    'IIN': ('Нисиноомоте', 'Nishinoomote'),
-    'NQU': ('Нуки', 'Nuqui'),
-    'MHW': ('Монтеагудо', 'Monteagudo'),
-    'ORA': ('Оран', 'Oran'),
-    'JGB': ('Джагдалпур', 'Jagdalpur'),
-    'YZP': ('Сандспит', 'Sandspit'),
-    'XLU': ('Лев', 'Leo'),
-    'GAR': ('Гараина', 'Garaina'),
-    'MMC': ('Манте', 'Mante'),
-    'ALY': ('Александрия', 'Alexandria'),
-    'ERN': ('Эйрунепе', 'Eirunepe'),
-    'CHW': ('Цзюцюань', 'Jiuquan'),
-    'ZOO': (None, 'Muelheim an der Ruhr'),
-    'IKK': ('Канкаки', 'Kankakee'),
-    'ILX': ('Илег', 'Ileg'),
-    'CID': ('Сидар-Рапидс', 'Cedar Rapids'),
-    'CIF': ('Чифэн', 'Chifeng'),
-    'MIV': ('Милвилл', 'Millville'),
-    'GID': ('Гитеге', 'Gitega'),
-    'CER': ('Шербур-Октевиль', 'Cherbourg'),
-    'ESL': ('Элиста', 'Elista'),
-    'IKS': ('Тикси', 'Tiksi'),
-    'KEQ': ('Кебар', 'Kebar'),
-    'CIJ': ('Кобиха', 'Cobija'),
-    'MSO': ('Мизула', 'Missoula'),
-    'CIM': ('Симитарра', 'Cimitarra'),
-    'INN': ('Инсбрук', 'Innsbruck'),
-    'CIN': ('Карролл', 'Carroll'),
-    'ANG': ('Ангулем', 'Angouleme'),
-    'MVA': ('Миватн', 'Myvatn'),
-    'CIO': ('Консепсьон', 'Concepcion'),
-    'WNA': ('Напакиак', 'Napakiak'),
-    'GRE': ('Гринвилл', 'Greenville'),
-    'MWB': ('Морава', 'Morawa'),
-    'CIP': ('Чипата', 'Chipata'),
-    'MWK': ('Матак', 'Matak'),
-    'CIQ': ('Чикимула', 'Chiquimula'),
-    'IXD': ('Аллахабад', 'Allahabad'),
-    'CIT': ('Шымкент', 'Shymkent'),
-    'ILY': ('Айлей', 'Islay'),
-    'KAY': ('Уэйкайя', 'Wakaya Island'),
-    'NMP': ('Нью-Мун', 'New Moon'),
-    'CIV': ('Чомли', 'Chomley'),
-    'MJT': ('Митилини', 'Mytilene'),
-    'CIX': ('Чиклайо', 'Chiclayo'),
-    'KYK': ('Карлек', 'Karluk'),
-    'CMW': ('Камагуэй', 'Camaguey'),
-    'CIZ': ('Коари', 'Coari'),
-    'NEV': ('Невис', 'Nevis'),
-    'CJD': ('Кандилейас', 'Candilejas'),
-    'IXZ': ('Порт-Блэр', 'Port Blair'),
-    'OYA': ('Гойя', 'Goya'),
-    'DBT': ('Дебра Табор', 'Debra Tabor'),
-    'ACP': ('Саханд', 'Sahand'),
-    'CJL': ('Читрал', 'Chitral'),
-    'OXD': ('Оксфорд', 'Oxford'),
-    'CJT': ('Комитан', 'Comitan'),
-    'PPV': ('Порт Протекшен', 'Port Protection'),
-    'NOK': ('Нова Ксавантина', 'Nova Xavantina'),
-    'JDF': ('Жуис-ди-Фора', 'Juiz de Fora'),
-    'CKG': ('Чунцин', 'Chongqing'),
-    'DEM': ('Дембидолло', 'Dembidollo'),
-    'DLE': ('Доль', 'Dole'),
-    'CKK': ('Чероки', 'Cherokee'),
-    'NQN': ('Неукен', 'Neuquen'),
-    'DFP': ('Драмдафф', 'Drumduff'),
-    'ISH': ('Искьи', 'Ischia'),
-    'CKL': ('Чкаловский', 'Chkalovsky'),
-    'CKO': ('Корнелиу-Прокопиу', 'Cornelio Procopio'),
-    'DGO': ('Дуранго', 'Durango'),
-    'GEC': ('Гекиткале', 'Gecitkale'),
-    'ISP': ('Айлип', 'Ronkonkoma'),
-    'CLM': ('Порт Анджелес', 'Port Angeles'),
-    'CKZ': ('Чанаккале', 'Canakkale'),
-    'JOL': ('Джоли', 'Jolo'),
-    'NUH': ('Нунчия', 'Nunchia'),
-    'MMB': ('Меманбетсу', 'Memanbetsu'),
-    'KDW': ('Канди', 'Kandy'),
-    'ASQ': ('Остин', 'Austin'),
-    'CLS': ('Чехалис', 'Chehalis'),
-    'ACZ': ('Заболь', 'Zabol'),
-    'NYM': ('Надым', 'Nadym'),
-    'CLX': ('Клоринда', 'Clorinda'),
-    'CNC': ('Коконат Айленд', 'Coconut Island'),
-    'CNJ': ('Клонкарри', 'Cloncurry'),
-    'OCF': ('Окала', 'Ocala'),
-    'CMD': ('Кутамундра', 'Cootamundra'),
-    'CMH': ('Колумбус', 'Columbus'),
-    'SOY': ('Стронсей', 'Stronsay'),
-    'CNB': ('Кунамбл', 'Coonamble'),
-    'CML': ('Камоауил', 'Camooweal'),
-    'DLH': ('Дулут', 'Duluth'),
-    'MNC': ('Накала', 'Nacala'),
-    'CSE': ('Крестед Бьютт', 'Crested Butte'),
-    'CMO': ('Оббиа', 'Obbia'),
-    'COM': ('Колмен', 'Coleman'),
-    'NWA': ('Моели', 'Moheli'),
-    'CMR': ('Кольмар', 'Colmar'),
-    'DLN': ('Диллон', 'Dillon'),
-    'GZM': ('Гозо', 'Gozo'),
-    'CMS': ('Скусцибан', 'Scusciuban'),
-    'MOP': ('Маунт-Плезант', 'Mount Pleasant'),
-    'CMX': ('Ханкок', 'Hancock'),
-    'ESR': ('Эль-Сальвадор', 'El Salvador'),
-    'CNE': ('Кэнон-Сити', 'Canon City'),
-    'IXT': ('Пасингхат', 'Pasighat'),
-    'XSC': ('Юг Каикос', 'South Caicos'),
-    'CNG': ('Коньяк', 'Cognac'),
-    'ORS': ('Орфеус Айленд Ресорт', 'Orpheus Island Resort'),
-    'DND': ('Данди', 'Dundee'),
-    'CNI': ('Чанхай', 'Changhai'),
-    'ORV': ('Нурвик', 'Noorvik'),
-    'KIG': ('Коингхаас', 'Koinghaas'),
-    'ALF': ('Алта', 'Alta'),
-    'XJD': ('Аль Удейд', 'Al Udeid'),
-    'OTC': ('Бол', 'Bol'),
-    'TTW': (None, 'Tissa Tank'),
-    'FLV': ('Форт Ливенворс', 'Fort Leavenworth'),
-    'LBP': ('Лонг Банга', 'Long Banga'),
-    'DOC': ('Дорнох', 'Dornoch'),
-    'MPL': ('Монпелье', 'Montpellier'),
-    'CNM': ('Карлсбад', 'Carlsbad'),
-    'XYC': ('Херрилйунга', 'Herrljunga'),
-    'JIJ': ('Джиджига', 'Jijiga'),
-    'OHA': ('Оейкея', 'Ohakea'),
-    'CRF': ('Карно', 'Carnot'),
-    'OXO': ('Ориентос', 'Orientos'),
-    'CNX': ('Чиангмай', 'Chiang Mai'),
-    'OZR': ('Озарк', 'Ozark'),
-    'JEQ': ('Жекие', 'Jequie'),
-    'CNZ': ('Кангамба', 'Cangamba'),
-    'DOM': ('Доминика', 'Dominica'),
-    'COV': ('Ковильян', 'Covilha'),
-    'COG': ('Кондото', 'Condoto'),
-    'ONT': ('Онтарио', 'Ontario'),
-    'COO': ('Котону', 'Cotonou'),
-    'TDL': ('Тандиль', 'Tandil'),
-    'PLA': ('Планадас', 'Planadas'),
-    'MPW': ('Мариуполь', 'Mariupol'),
-    'STC': ('Сент-Клауд', 'Saint Cloud'),
-    'JVI': ('Манвилл', 'Manville'),
-    'COQ': ('Чойбалсан', 'Choibalsan'),
-    'COT': ('Котулла', 'Cotulla'),
-    'DPS': ('Денпасар Бали', 'Denpasar'),
-    'KSC': ('Кошице', 'Kosice'),
-    'BDV': ('Моба', 'Moba'),
-    'DRA': ('Меркури', 'Mercury'),
-    'PNN': ('Принстон', 'Princeton'),
-    'MKM': ('Муках', 'Mukah'),
-    'CPG': ('Кармен-де-Патагонес', 'Carmen De Patagones'),
-    'CIW': ('Кануан', 'Canouan Island'),
-    'IMG': ('Инхаминга', 'Inhaminga'),
-    'POR': ('Пори', 'Pori'),
-    'XEN': ('Синчэн', 'Xingcheng'),
-    'BGW': ('Багдад', 'Baghdad'),
-    'KSY': ('Карс', 'Kars'),
-    'CEU': ('Клемсон', 'Clemson'),
-    'KRU': ('Карау', 'Kerau'),
-    'CPO': ('Копьяпо', 'Copiapo'),
-    'DUE': ('Дундо', 'Dundo'),
-    'KOQ': ('Кётен', 'Koethen'),
-    'MRH': ('Мэй Ривер', 'May River'),
-    'CPR': ('Каспер', 'Casper'),
-    'PRC': ('Прескотт', 'Prescott'),
-    'CPV': ('Кампина-Гранди', 'Campina Grande'),
-    'KAF': ('Карато', 'Karato'),
-    'TQN': ('Тальюквен', 'Taluqan'),
-    'CQM': ('Сьюдад Реаль', 'Ciudad Real'),
-    'KBU': ('Котабару', 'Kotabaru'),
-    'KEL': ('Киль', 'Kiel'),
-    'KDB': ('Камбалда', 'Kambalda'),
-    'KUM': ('Якусима', 'Yakushima'),
-    'CRA': ('Крайова', 'Craiova'),
-    'CRH': ('Чрерриба', 'Cherribah'),
-    'RKU': ('Остров Юл', 'Yule Island'),
-    'PSP': ('Палм-Спрингс', 'Palm Springs'),
-    'DYR': ('Анадырь', 'Anadyr'),
-    'CSQ': ('Крестон', 'Creston'),
-    'CRI': ('Крукед-Айленд', 'Crooked Island'),
-    'YIH': ('Ичан', 'Yichang'),
-    'CRJ': ('Кураби', 'Coorabie'),
-    'ELZ': ('Уэллсвилл', 'Wellsville'),
-    'MVF': ('Моссоро', 'Mossoro'),
-    'EMK': ('Эммонак', 'Emmonak'),
-    'CRM': ('Катерман', 'Catarman'),
-    'ZOY': (None, 'Oberhausen'),
-    'YJF': ('Форт Лиард', 'Fort Liard'),
-    'ZPY': (None, 'Siegburg'),
-    'CFA': ('Кофи-Пойнт', 'Coffee Point'),
-    'PRZ': ('Приневилль', 'Prineville'),
-    'SXQ': ('Солдотна', 'Soldotna'),
-    'OBY': ('Иллоккортоормиут', 'Ittoqqortoormiit'),
-    'JSM': ('Хосе де Сан Мартин', 'Jose De San Martin'),
-    'MOA': ('Моа', 'Moa'),
-    'CRU': ('Карриакоу Айленд', 'Carriacou Island'),
-    'PVA': ('Провиденция', 'Providencia'),
-    'CEO': ('Вако Кунго', 'Waco Kungo'),
-    'CHR': ('Шатору', 'Chateauroux'),
-    'CRX': ('Коринф', 'Corinth'),
-    'PVS': ('Провидения', 'Provideniya'),
-    'CSJ': ('Вунгтау', 'Cape St Jacques'),
-    'DDM': ('Додоима', 'Dodoima'),
-    'GRN': ('Гордон', 'Gordon'),
-    'KKM': ('Лопбури', 'Lop Buri'),
-    'RAJ': ('Раджкот', 'Rajkot'),
-    'CSN': ('Карсон Сити', 'Carson City'),
-    'LBU': ('Лабуан', 'Labuan'),
-    'CSR': ('Казуарито', 'Casuarito'),
-    'LCF': (None, 'Rio Dulce'),
-    'ZRO': (None, "Reggio nell'Emilia"),
-    'CTE': ('Карти', 'Carti'),
-    'EGS': ('Эгильсстадир', 'Egilsstadir'),
-    'AIW': ('Аи-Айс', 'Ai-ais'),
-    'LCL': ('Ла Колома', 'La Coloma'),
-    'RIE': ('Райс Лейк', 'Rice Lake'),
-    'CTG': ('Картахена', 'Cartagena'),
-    'SAQ': ('Сан Андрос', 'San Andros'),
-    'ELB': ('Эль Банка', 'El Banco'),
-    'KMN': ('Камины', 'Kamina'),
-    'CTN': ('Куктаун', 'Cooktown'),
-    'CTP': ('Карутапера', 'Carutapera'),
-    'KEX': ('Канеби', 'Kanabea'),
-    'LEW': ('Льюистон', 'Lewiston'),
-    'REI': ('Реджайна', 'Regina'),
-    'EME': ('Емден', 'Emden'),
-    'ZEE': (None, 'Fulda'),
-    'CUJ': ('Кален', 'Culion'),
-    'SBM': ('Шебойган', 'Sheboygan'),
-    'CTT': ('Ле Кастелле', 'Le Castellet'),
-    'EVM': ('Эвлет', 'Eveleth'),
-    'CTU': ('Чэнду', 'Chengdu'),
-    'AAB': ('Аррабури', 'Arrabury'),
-    'RVC': ('Риверцесс', 'Rivercess'),
-    'CTW': ('Коттонвуд', 'Cottonwood'),
-    'CHU': ('Чуатбалук', 'Chuathbaluk'),
-    'RYO': ('Рио Турбио', 'Rio Turbio'),
-    'DJN': ('Делта-Джанкшен', 'Delta Junction'),
-    'CTY': ('Кросс Сити', 'Cross City'),
-    'HCQ': ('Холс Крик', 'Halls Creek'),
-    'KGP': ('Когалым', 'Kogalym'),
-    'JIN': ('Йиня', 'Jinja'),
-    'BAE': ('Барселонет', 'Barcelonnette'),
-    'CTZ': ('Клинтон', 'Clinton'),
-    'BZB': ('Илха до Базаруто', 'Bazaruto Island'),
-    'KLZ': ('Клейнзи', 'Kleinzee'),
-    'ERE': ('Эраве', 'Erave'),
-    'COR': ('Кордова', 'Cordoba'),
-    'SFT': ('Шеллефтео', 'Skelleftea'),
-    'ATP': ('Айтапе', 'Aitape'),
-    'MBQ': ('Мбарара', 'Mbarara'),
-    'CUA': ('Сьюдад-Конститусьон', 'Ciudad Constitucion'),
-    'CUE': ('Куэнка', 'Cuenca'),
-    'TCD': ('Тарапака', 'Tarapaca'),
-    'CUF': ('Кунео', 'Cuneo'),
-    'SQW': ('Скиве', 'Skive'),
-    'APN': ('Алпена', 'Alpena'),
-    'LNF': ('Мунбил', 'Munbil'),
-    'EUA': ('Эуа', 'Eua'),
-    'MWT': ('Мулаватана', 'Moolawatana'),
-    'EUG': ('Юджин', 'Eugene'),
-    'CUH': ('Кушинг', 'Cushing'),
-    'XXL': (None, 'Lillehammer'),
-    'CUK': ('Остров Кей Колкер', 'Caye Caulker'),
-    'PSD': ('Порт Саид', 'Port Said'),
-    'DBY': ('Далби', 'Dalby'),
-    'OEM': ('Палоемеу', 'Paloemeu'),
-    'EVE': ('Нарвик', 'Harstad-Narvik'),
-    'YSA': ('Сэйбл Айленд', 'Sable Island'),
-    'CUP': ('Карупано', 'Carupano'),
-    'DAG': ('Даггетт', 'Daggett'),
-    'EVN': ('Ереван', 'Yerevan'),
-    'CUW': ('Куба-Ков', 'Cube Cove'),
-    'BBF': ('Берлингтон', 'Burlington'),
-    'EVX': ('Евре', 'Evreux'),
-    'LKK': ('Кулик Лейк', 'Kulik Lake'),
-    'KLO': ('Калибо', 'Kalibo'),
-    'CVC': ('Клив', 'Cleve'),
-    'ZTA': ('Турейра', 'Tureira'),
-    'PMS': ('Пальмира', 'Palmyra'),
-    'TWA': ('Твин Хилс', 'Twin Hills'),
-    'YQS': ('Сейнт Томас', 'St Thomas'),
-    'CVJ': ('Куэрнавака', 'Cuernavaca'),
-    'AMR': ('Альмерия', 'Almeria'),
-    'RAF': (None, 'Rafaela'),
-    'BCH': ('Какунг', 'Baucau'),
-    'PSH': ('Сант Петер', 'St Peter'),
-    'BQB': ('Басселтон', 'Bussellton'),
-    'DAX': ('Дачжоу', 'Dazhou'),
-    'CWB': ('Куритиба', 'Curitiba'),
-    'FAC': ('Фааите', 'Faaite'),
-    'ILO': ('Илоило', 'Iloilo'),
-    'CXA': ('Кайкара дель Ориноко', 'Caicara Del Orinoco'),
-    'KSQ': ('Карши', 'Karshi'),
-    'AOD': ('Абу-Дейя', 'Abou Deia'),
-    'ICR': ('Никаро', 'Nicaro'),
-    'YUD': ('Умиужак', 'Umiujaq'),
-    'GVR': ('Говернадор-Валадарис', 'Governador Valadares'),
-    'ZUM': ('Черчилл Фолс', 'Churchill Falls'),
-    'XOW': (None, 'Seefeld'),
-    'NAE': ('Натитингу', 'Natitingou'),
-    'FBL': ('Фэрибо', 'Faribault'),
-    'AVU': ('Аву-Аву', 'Avu Avu'),
-    'ZGO': ('Готха', 'Gotha'),
-    'LRO': ('Латроп', 'Lathrop'),
-    'CHK': ('Чикаша', 'Chickasha'),
-    'CXJ': ('Кашиас-ду-Сул', 'Caxias do Sul'),
-    'NSN': ('Нельсон', 'Nelson'),
-    'GWE': ('Гверу', 'Gweru'),
-    'FAR': ('Фарго', 'Fargo'),
-    'YXR': ('Иэрлтон', 'Earlton'),
-    'CXL': ('Калексико', 'Calexico'),
-    'HKN': ('Хоскинс', 'Hoskins'),
-    'CXN': ('Кандала', 'Candala'),
-    'NHA': ('Нячанг', 'Nha Trang'),
-    'CYM': ('Чатем', 'Chatham'),
-    'FBR': ('Форт-Бриджер', 'Fort Bridger'),
-    'FOT': ('Форстер', 'Forster'),
-    'HGR': ('Хейгерстаун', 'Hagerstown'),
-    'NIC': ('Никосия', 'Nicosia'),
-    'CYP': ('Калбейог Сити', 'Calbayog'),
-    'NIM': ('Ниамей', 'Niamey'),
-    'ERA': ('Эригаво', 'Erigavo'),
-    'CYR': ('Колония', 'Colonia'),
-    'HMI': ('Хами', 'Hami'),
-    'CYU': ('Куйо', 'Cuyo'),
-    'KMR': ('Каримуи', 'Karimui'),
-    'LKV': ('Лейквью', 'Lakeview'),
-    'CYZ': ('Кауаян Сити', 'Cauayan'),
-    'NPL': ('Нью-Плимут', 'New Plymouth'),
-    'HIB': ('Хиббинг', 'Hibbing'),
-    'CZC': ('Коппер Сентер', 'Copper Centre'),
-    'CZL': ('Константина', 'Constantine'),
-    'KRM': ('Каранамбо', 'Karanambo'),
-    'YFO': ('Флин-Флон', 'Flin Flon'),
-    'XKD': (None, 'Halden'),
-    'BXG': ('Бендиго', 'Bendigo'),
-    'FCB': ('Фиксбург', 'Ficksburg'),
-    'HUV': ('Худиксвалль', 'Hudiksvall'),
-    'DGK': ('Дугонг', 'Dugong'),
-    'FDF': ('Фор-де-Франс', 'Fort De France'),
-    'UOL': ('Буол', 'Buol'),
-    'LST': ('Лонсестон', 'Launceston'),
-    'DHB': ('Дир Харбор', 'Deer Harbor'),
-    'CZS': ('Крузейру-ду-Сул', 'Cruzeiro Do Sul'),
-    'DAO': ('Дабо', 'Dabo'),
-    'CZW': ('Ченстохова', 'Czestochowa'),
-    'CZX': ('Чанчжоу', 'Changzhou'),
-    'DBP': ('Дебепаре', 'Debepare'),
-    'GMC': ('Гуерима', 'Guerima'),
-    'DAC': ('Дакка', 'Dhaka'),
-    'PUA': ('Пуас', 'Puas'),
-    'KSA': ('Кусаие', 'Kosrae, Caroline Islands'),
-    'ISS': ('Вискассет', 'Wiscasset'),
-    'DAD': ('Дананг', 'Da Nang'),
-    'FEK': ('Феркеседугу', 'Ferkessedougou'),
-    'FKQ': ('Факфак', 'Fak Fak'),
-    'FEZ': ('Фес', 'Fez'),
-    'BFL': ('Бейкерсфилд', 'Bakersfield'),
-    'DAM': ('Дамаск', 'Damascus'),
-    'GQQ': ('Галион', 'Galion'),
-    'DAY': ('Дейтон', 'Dayton'),
-    'LXR': ('Луксор', 'Luxor'),
-    'WRH': ('Ренч-Крик', 'Wrench Creek'),
-    'KNS': ('Кинг', 'King Island'),
-    'NSH': ('Ноушехр', 'Now Shahr'),
-    'DAZ': ('Дарвас', 'Darwaz'),
-    'DGW': ('Дуглас', 'Douglas'),
-    'FIG': ('Фриа', 'Fria'),
-    'MAS': ('Остров Манус', 'Manus Island'),
-    'QGQ': ('Атту', 'Attu'),
-    'XCM': ('Чатем', 'Chatham'),
-    'MBM': ('Мкамбати', 'Mkambati'),
-    'WTP': ('Воитапе', 'Woitape'),
-    'TND': ('Тринидад', 'Trinidad'),
-    'ZNG': ('Неггинан', 'Negginan'),
-    'VDR': ('Вилья Долорес', 'Villa Dolores'),
-    'HHQ': ('Хуахин', 'Hua Hin'),
-    'DDN': ('Дельта-Даунс', 'Delta Downs'),
-    'ZJB': (None, 'Kuantan'),
-    'DDP': ('Дорадо', 'Dorado'),
-    'HYG': ('Хайдаберг', 'Hydaburg'),
-    'KUU': ('Куллу', 'Kulu'),
-    'WBU': ('Боулдер', 'Boulder'),
-    'DDU': ('Даду', 'Dadu'),
-    'GYR': ('Гудиер', 'Goodyear'),
-    'NTO': ('Санту-Антан', 'Santo Antao'),
-    'DEB': ('Дебрецен', 'Debrecen'),
-    'FOK': ('Уэстгемптон', 'Westhampton'),
-    'NVS': ('Невер', 'Nevers'),
-    'DEF': ('Дизфуль', 'Dezful'),
-    'DES': ('Дерош', 'Desroches'),
-    'AWN': ('Алтон-Даунс', 'Alton Downs'),
-    'FLW': ('Флориш', 'Flores Island (Azores)'),
-    'HAS': ('Хаиль', 'Hail'),
-    'IXN': ('Ховай', 'Khowai'),
-    'MDB': ('Мелинда', 'Melinda'),
-    'QYV': (None, 'Deventer'),
-    'PCE': ('Пейнтер Крик', 'Painter Creek'),
-    'DIN': ('Дьенбьенфу', 'Dien Bien Phu'),
-    'OGR': ('Бонгор', 'Bongor'),
-    'DGB': ('Дангер Бэй', 'Danger Bay'),
-    'KLM': ('Калалех', 'Kalaleh'),
-    'JAL': ('Халапа', 'Jalapa'),
-    'DGM': ('Донггуан', 'Dongguan'),
-    'IQA': (None, 'Al Asad'),
-    'PTS': ('Питсбург', 'Pittsburg'),
-    'TKC': ('Тико', 'Tiko'),
-    'DHI': ('Дхангрархи', 'Dhangarhi'),
-    'ABW': ('Абау', 'Abau'),
-    'FNC': ('Фуншал', 'Funchal'),
-    'DIR': ('Дыре-Дауа', 'Dire Dawa'),
-    'DHM': ('Дармсала', 'Dharamsala'),
-    'FTI': ('Фитиута', 'Fitiuta'),
-    'OGS': ('Огденсберг', 'Ogdensburg'),
-    'DHT': ('Далхарт', 'Dalhart'),
-    'HZL': ('Хазлтон', 'Hazleton'),
-    'PEW': ('Пешавар', 'Peshawar'),
-    'DIM': ('Димбокро', 'Dimbokro'),
-    'KNX': ('Кунунарра', 'Kununurra'),
-    'DIO': ('Остров Крузенштерна', 'Diomede Island'),
-    'WTD': ('Вест Энд', 'West End'),
-    'GOR': ('Гор', 'Gore'),
-    'KTS': ('Бревиг-Мишн', 'Teller Mission'),
-    'DIP': ('Диапага', 'Diapaga'),
-    'MCX': ('Махачкала', 'Makhachkala'),
-    'RYN': ('Руайян', 'Royan'),
-    'OHT': ('Кохат', 'Kohat'),
-    'GAS': ('Гариса', 'Garissa'),
-    'CPQ': ('Кампинас', 'Campinas'),
-    'GHE': ('Гарачине', 'Garachine'),
-    'MEX': ('Мехико', 'Mexico City'),
-    'ZFN': ('Тьюлита', 'Tulita'),
-    'OIR': ('Окусири', 'Okushiri'),
-    'FUB': ('Фуллеборн', 'Fulleborn'),
-    'FLF': ('Фленсбург', 'Flensburg'),
-    'DJA': ('Джугу', 'Djougou'),
-    'DLB': ('Далбертис', 'Dalbertis'),
-    'DJE': ('Джерба', 'Djerba'),
-    'OIT': ('Оита', 'Oita'),
-    'OKA': ('Окинава', 'Okinawa'),
-    'YMM': ('Форт Мак-Муррей', 'Fort McMurray'),
-    'XJS': ('Кицбюэль', 'Kitzbuehl'),
-    'BFU': ('Бэнбу', 'Bengbu'),
-    'KPH': ('Паулофф Харбор', 'Pauloff Harbor'),
-    'DKI': ('Остров Данк', 'Dunk Island'),
-    'GRQ': ('Гронинген', 'Groningen'),
-    'KYD': ('Оркид Айленд', 'Orchid Island'),
-    'CLZ': ('Калабозо', 'Calabozo'),
-    'OMI': ('Омидийе', 'Omidieh'),
-    'KZF': ('Каинтиба', 'Kaintiba'),
-    'DKK': ('Дюнкерк', 'Dunkirk'),
-    'DNX': ('Диндер', 'Dinder'),
-    'OKU': ('Мокути Лодж', 'Mokuti Lodge'),
-    'FNT': ('Флинт', 'Flint'),
-    'BFD': ('Брэдфорд', 'Bradford'),
-    'LBM': ('Луабо', 'Luabo'),
-    'DLC': ('Далянь', 'Dalian'),
-    'KDV': ('Кандаву', 'Kandavu'),
-    'YBW': ('Бедвелл-Харбор', 'Bedwell Harbor'),
-    'DSI': ('Дестин', 'Destin'),
-    'LED': ('Санкт-Петербург', 'Saint Petersburg'),
-    'OLE': ('Олеан', 'Olean'),
-    'LBY': ('Ла-Боль', 'La Baule-Escoublac'),
-    'OGV': ('Онгава Гейм Резерв', 'Ongava Game Reserve'),
-    'BCY': ('Балчи', 'Bulchi'),
-    'KHD': ('Хуррамобод', 'Khorramabad'),
-    'DSK': ('Дера-Исмаил-Хан', 'Dera Ismail Khan'),
-    'DSM': ('Де-Мойн', 'Des Moines'),
-    'TNS': ('Тунгстен', 'Tungsten'),
-    'HGI': ('Хиглиег', 'Higlieg'),
-    'DLG': ('Диллингхем', 'Dillingham'),
-    'LGN': ('Линга Линга', 'Linga Linga'),
-    'LKN': ('Лекнес', 'Leknes'),
-    'SNJ': ('Сан Хулиан', 'San Julian'),
-    'AIP': ('Аилинглапалап', 'Ailinglapalap Island'),
-    'FOC': ('Фучжоу', 'Fuzhou'),
-    'LML': ('Лае Айленд', 'Lae Island'),
-    'MQH': ('Мису', 'Minacu'),
-    'DLS': ('Даллес', 'The Dalles'),
-    'LKZ': ('Брэндон', 'Brandon'),
-    'YLB': ('Лак Бише', 'Lac Biche'),
-    'LMN': ('Лимбанг', 'Limbang'),
-    'DUB': ('Дублин', 'Dublin'),
-    'GVL': ('Гейнсвилл', 'Gainesville'),
-    'JUZ': ('Цюйчжоу', 'Quzhou, Zhejiang Province'),
-    'DLV': ('Делиссавилл', 'Delissaville'),
-    'MCV': ('Мак-Артур-Ривер', 'Mcarthur River'),
-    'DIV': ('Диво', 'Divo'),
-    'KCT': ('Коггала', 'Koggala'),
-    'MRR': ('Макара', 'Macara'),
-    'YSK': ('Саникилуак', 'Sanikiluaq'),
-    'HHI': ('Вахиава', 'Wahiawa'),
-    'HLS': ('Сант Хеленс', 'St Helens'),
-    'LVK': ('Ливърмор', 'Livermore'),
-    'DUK': ('Дьюкудек', 'Dukuduk'),
-    'LAS': ('Лас-Вегас', 'Las Vegas'),
-    'FOD': ('Форт Додж', 'Fort Dodge'),
-    'FPO': ('Фрипорт', 'Freeport'),
-    'PCV': ('Пунта Чивато', 'Punta Chivato'),
-    'DMN': ('Деминг', 'Deming'),
-    'LPN': ('Лерон Плаинс', 'Leron Plains'),
-    'HOQ': ('Хоф', 'Hof'),
-    'QII': (None, 'Lindau'),
-    'DXD': ('Дикси', 'Dixie'),
-    'KHA': ('Канех', 'Khaneh'),
-    'FIZ': ('Фицрой Кроссинг', 'Fitzroy Crossing'),
-    'CYB': ('Кайман-Брак', 'Cayman Brac Island'),
-    'LTP': ('Линдхёрст', 'Lyndhurst'),
-    'NOD': ('Норден', 'Norden'),
-    'ALJ': ('Александер-Бей', 'Alexander Bay'),
-    'MDV': ('Медоунеу', 'Medouneu'),
-    'LZY': ('Ньингчи', 'Nyingchi'),
-    'LUM': ('Манши', 'Mangshi'),
-    'LXG': ('Луангнамтха', 'Luang Namtha'),
-    'DQA': ('Дацин', 'Daqing'),
-    'DMO': ('Седалия', 'Sedalia'),
-    'PYY': ('Пай', 'Pai'),
-    'BEF': ('Блуфилдсе', 'Bluefields'),
-    'BUC': ('Берктаун', 'Burketown'),
-    'LYS': ('Лион', 'Lyon'),
-    'MAQ': ('Мае Сот', 'Mae Sot'),
-    'HSK': ('Уэска', 'Huesca'),
-    'MGW': ('Моргантаун', 'Morgantown'),
-    'ZNB': (None, 'Hamm'),
-    'MDE': ('Медельин', 'Medellin'),
-    'AXD': ('Александруполис', 'Alexandroupolis'),
-    'NGA': ('Янг', 'Young'),
-    'MOR': ('Морристаун', 'Morristown'),
-    'HFA': ('Хайфа', 'Haifa'),
-    'XAZ': (None, 'Campbellton'),
-    'DMU': ('Димапур', 'Dimapur'),
-    'KSG': ('Кисенган', 'Kisengan'),
-    'GGD': ('Грегори-Даунс', 'Gregory Downs'),
-    'DOA': ('Доани', 'Doany'),
-    'BEP': ('Беллари', 'Bellary'),
-    'KSI': ('Кисидугу', 'Kissidougou'),
-    'MFE': ('Мак-Аллен', 'McAllen'),
-    'PTB': ('Петербург', 'Petersburg'),
-    'FRE': ('Остров Фера', 'Fera Island'),
-    'CFI': ('Камфилд', 'Camfield'),
-    'MLB': ('Мелборн', 'Melbourne'),
-    'DNM': ('Денем', 'Denham'),
-    'CVB': ('Чингрибу', 'Chungribu'),
-    'ORQ': ('Норволк', 'Norwalk'),
-    'UST': ('Сент-Огастин', 'Saint Augustine'),
-    'OSB': ('Осейдж Бич', 'Osage Beach'),
-    'YHS': ('Сешелт', 'Sechelt'),
-    'MSE': ('Манстон', 'Manston'),
-    'SBL': ('Санта Ана', 'Santa Ana'),
-    'JKV': ('Джексонвилл', 'Jacksonville'),
-    'DOB': ('Добо', 'Dobo'),
-    'LBW': ('Лонг Баван', 'Long Bawan'),
-    'DOD': ('Додома', 'Dodoma'),
-    'TOZ': ('Туба', 'Touba'),
-    'HUS': ('Хьюс', 'Hughes'),
-    'DOF': ('Дора Бэй', 'Dora Bay'),
-    'DOH': ('Доха', 'Doha'),
-    'DVP': ('Дэвенпорт-Даунс', 'Davenport Downs'),
-    'XMI': ('Масаси', 'Masasi'),
-    'DOK': ('Донецк', 'Donetsk'),
-    'DOV': ('Давер-Чесволд', 'Dover-Cheswold'),
-    'TNQ': ('Тераина', 'Teraina'),
-    'DPK': ('Дир-Парк', 'Deer Park'),
-    'KKR': ('Каукура', 'Kaukura Atoll'),
-    'OFI': ('Оуанго Фитини', 'Ouango Fitini'),
-    'DPO': ('Девонпорт', 'Devonport'),
-    'ANS': ('Андауайлас', 'Andahuaylas'),
-    'GMM': ('Гамбома', 'Gamboma'),
-    'AZG': ('Апацинган', 'Apatzingan'),
-    'DRI': ('ДеРиддер', 'De Ridder'),
-    'DUC': ('Дункан', 'Duncan'),
-    'FRT': ('Фрутильяр', 'Frutillar'),
-    'MMM': ('Мидлмаунт', 'Middlemount'),
-    'SHG': ('Шангнак', 'Shungnak'),
-    'DRN': ('Дирранбанди', 'Dirranbandi'),
-    'DUF': ('Королла', 'Corolla'),
-    'EDG': ('Эджвуд', 'Edgewood'),
-    'FRU': ('Бишкек', 'Bishkek'),
-    'ADN': ('Андес', 'Andes'),
-    'OSX': ('Косциаско', 'Kosciusko'),
-    'DRT': ('Дель-Рио', 'Del Rio'),
-    'OSZ': ('Кошалин', 'Koszalin'),
-    'AFI': ('Амальфи', 'Amalfi'),
-    'FRZ': ('Фритзлар', 'Fritzlar'),
-    'OTY': ('Ориа', 'Oria'),
-    'FSC': ('Фигари', 'Figari'),
-    'ACM': ('Арика', 'Arica'),
-    'CTA': ('Катания', 'Catania'),
-    'FST': ('Форт Стоктон', 'Fort Stockton'),
-    'MNI': ('Монтсеррат', 'Montserrat'),
-    'YDP': ('Нейн', 'Nain'),
-    'DSE': ('Дэссе', 'Dessie'),
-    'FTU': ('Толанаро', 'Fort Dauphin'),
-    'DUR': ('Дурбан', 'Durban'),
-    'DTL': ('Детройт-Лейкс', 'Detroit Lakes'),
-    'DTM': ('Дортмунд', 'Dortmund'),
-    'XTL': ('Тадоул Лейк', 'Tadoule Lake'),
-    'MIN': ('Миннипа', 'Minnipa'),
-    'VYI': ('Вилюйск', 'Vilyuisk'),
-    'PPS': ('Пуэрто-Принсеса', 'Puerto Princesa'),
-    'FUK': ('Фукуока', 'Fukuoka'),
-    'CHP': ('Серкл Хот Спрингс', 'Circle Hot Springs'),
-    'VPS': ('Дестин', 'Fort Walton Beach'),
-    'OUD': ('Уджда', 'Oujda'),
-    'FXM': ('Остров Флаксман', 'Flaxman Island'),
-    'DTR': ('Дакатур Айленд', 'Decatur Island'),
-    'GJR': ('Гьоргур', 'Gjogur'),
-    'QEQ': (None, 'Embrach/Rorbas'),
-    'BWJ': ('Баван', 'Bawan'),
-    'DXR': ('Данбери', 'Danbury'),
-    'IKO': ('Никольски', 'Nikolski'),
-    'PAL': ('Паланкеро', 'Palanquero'),
-    'EAE': ('Эмаэ', 'Emae'),
-    'MPO': ('Маунт Поконо', 'Mount Pocono'),
-    'DYA': ('Дайсарт', 'Dysart'),
-    'XYF': (None, 'Falkoping'),
-    'DYG': ('Чжанцзяцзе', 'Dayong'),
-    'EKO': ('Элко', 'Elko'),
-    'KED': ('Каэди', 'Kaedi'),
-    'DYL': ('Дойлстаун', 'Doylestown'),
-    'XKF': (None, 'Fredrikstad'),
-    'CAW': ('Кампус-дус-Гойтаказис', 'Campos'),
-    'GLL': ('Гол', 'Gol'),
-    'FUM': ('Фума', 'Fuma'),
-    'WHO': ('Франц Иосиф', 'Franz Josef'),
-    'SVZ': ('Сан Антонио', 'San Antonio'),
-    'DYU': ('Душанбе', 'Dushanbe'),
-    'GRZ': ('Грац', 'Graz'),
-    'ECA': ('Восток Тавас', 'East Tawas'),
-    'FVL': ('Флора Валли', 'Flora Valley'),
-    'HTI': ('Гамильтон', 'Hamilton Island'),
-    'MLD': ('Малед Сити', 'Malad City'),
-    'PBJ': ('Паама', 'Paama'),
-    'XDO': (None, 'Grande-Riviere'),
-    'DUS': ('Дюссельдорф', 'Dusseldorf'),
-    'PBN': ('Порто Амбоим', 'Porto Amboim'),
-    'DZU': ('Дазу', 'Dazu'),
-    'PDS': ('Пьедрас Неграс', 'Piedras Negras'),
-    'XHF': (None, 'Honefoss'),
-    'EAA': ('Игл', 'Eagle'),
-    'GTC': ('Грин Тортл', 'Green Turtle'),
-    'NTB': ('Нутодден', 'Notodden'),
-    'EAB': ('Аббсе', 'Abbse'),
-    'YGL': ('Ла-Гранд', 'La Grande'),
-    'EAN': ('Уитленд', 'Wheatland'),
-    'ISO': ('Кинстон', 'Kinston'),
-    'ECS': ('Ньюкасл', 'Newcastle'),
-    'KWH': (None, 'Khwahan'),
-    'EBG': ('Эль Багре', 'El Bagre'),
-    'FWA': ('Форт-Уэйн', 'Fort Wayne'),
-    'PGF': ('Перпиньян', 'Perpignan'),
-    'BMR': ('Бальтрум', 'Baltrum Island'),
-    'MVK': ('Мулька', 'Mulka'),
-    'YYB': ('Норт-Бей', 'North Bay'),
-    'EBJ': ('Эсбьерг', 'Esbjerg'),
-    'EBL': ('Эрбиль', 'Erbil'),
-    'HUF': ('Терре-Хот', 'Terre Haute'),
-    'PGP': ('Порту-Алегри', 'Porto Alegre'),
-    'XUE': (None, 'Heimdal'),
-    'EBU': ('Сент-Этьен', 'Saint Etienne'),
-    'OYO': ('Трес Арройос', 'Tres Arroyos'),
-    'IMD': ('Имонда', 'Imonda'),
-    'EBW': ('Эболова', 'Ebolowa'),
-    'PHB': ('Парнаиба', 'Parnaiba'),
-    'PRB': ('Пасо Роблс', 'Paso Robles'),
-    'ECG': ('Элизабет Сити', 'Elizabeth City'),
-    'KFG': ('Калкерунг', 'Kalkurung'),
-    'GFL': ('Гленс Фолс', 'Glens Falls'),
-    'ECN': ('Никосия', 'Ercan'),
-    'DTH': ('Смерти Валли', 'Death Valley'),
-    'CZY': ('Клюни', 'Cluny'),
-    'BGL': ('Баглунг', 'Baglung'),
-    'WKK': ('Алекнеджик', 'Aleknagik'),
-    'OAA': (None, 'Shank'),
-    'AKM': ('Закума', 'Zakouma'),
-    'GUO': ('Гуалако', 'Gualaco'),
-    'PIT': ('Питтсбург', 'Pittsburgh'),
-    'ECO': ('Эль-Энканто', 'El Encanto'),
-    'GAF': ('Гафса', 'Gafsa'),
-    'CRR': ('Серес', 'Ceres'),
-    'XGI': (None, 'Andalsnes'),
-    'HTY': ('Хатай', 'Antakya'),
-    'KWD': ('Каваджила', 'Kawadjia'),
-    'EDO': ('Эдремит', 'Edremit'),
-    'BOQ': ('Боку', 'Boku'),
-    'HNA': ('Ханамаки', 'Hanamaki'),
-    'GAP': ('Гусап', 'Gusap'),
-    'GAU': ('Гувахати', 'Guwahati'),
-    'EED': ('Нидлс', 'Needles'),
-    'EJA': ('Барранкабермеха', 'Barrancabermeja'),
-    'RDB': ('Ред-Дог', 'Red Dog'),
-    'KWR': ('Квай Харбор', 'Kwai Harbour'),
-    'FAL': ('Рома', 'Roma'),
-    'GSA': ('Лонг Пасиа', 'Long Pasia'),
-    'SDB': ('Салданха Бэй', 'Saldanha Bay'),
-    'EFG': ('Эфоги', 'Efogi'),
-    'EFO': ('Ист Форк', 'East Fork'),
-    'PKE': ('Паркс', 'Parkes'),
-    'KNA': ('Винья Дель Мар', 'Vina del Mar'),
-    'SZU': ('Сеги', 'Segou'),
-    'PLJ': ('Плаценсия', 'Placencia'),
-    'EGC': ('Бержерак', 'Bergerac'),
-    'ENO': ('Энкарнасьон', 'Encarnacion'),
-    'EMO': ('Эмо', 'Emo'),
-    'IRI': ('Иринга', 'Iringa'),
-    'HAI': ('Три Риверс', 'Three Rivers'),
-    'TPX': ('Тупаи', 'Tupai'),
-    'TPI': ('Тапини', 'Tapini'),
-    'PUK': ('Пукаруа', 'Pukarua'),
-    'GBF': ('Негарбо', 'Negarbo'),
-    'AMS': ('Амстердам', 'Amsterdam'),
-    'ELM': ('Элмайра', 'Elmira'),
-    'GBH': ('оз. Галбрайт', 'Galbraith Lake'),
-    'EIB': ('Эйзенах', 'Eisenach'),
-    'EIS': ('Тортола', 'Beef Island'),
-    'IWK': ('Ивакуни', 'Iwakuni'),
-    'BKQ': ('Блэколл', 'Blackall'),
-    'KPK': ('Паркс', 'Parks'),
-    'WWD': ('Вайлдвуд', 'Wildwood'),
-    'KPN': ('Кипнук', 'Kipnuk'),
-    'EIY': ('Эйн-Яхав', 'Ein Yahav'),
-    'GBS': ('Грейт-Барриер', 'Port Fitzroy'),
-    'CJJ': ('Чхонджу', 'Cheongju'),
-    'SPF': ('Спирфиш', 'Spearfish'),
-    'AYN': ('Аньянг', 'Anyang'),
-    'EKI': ('Элкхарт', 'Elkhart'),
-    'ADC': ('Андакомбе', 'Andakombe'),
-    'MQL': ('Милдьюра', 'Mildura'),
-    'ELL': ('Эллисрас', 'Ellisras'),
-    'EKN': ('Элкинс', 'Elkins'),
-    'EKT': ('Эскильстуна', 'Eskilstuna'),
-    'LAH': ('Лабуха', 'Labuha'),
-    'SJB': ('Сан Джоакин', 'San Joaquin'),
-    'CYX': ('Черский', 'Cherskiy'),
-    'TJI': ('Трухильо', 'Trujillo'),
-    'GCA': ('Гуакамайа', 'Guacamaya'),
-    'BCR': ('Бока-ду-Акри', 'Boca Do Acre'),
-    'MQX': ('Макале', 'Makale'),
-    'IXK': ('Кешод', 'Keshod'),
-    'GCC': ('Джиллетт', 'Gillette'),
-    'CSF': ('Крей', 'Creil'),
-    'XKB': (None, 'Kongsberg'),
-    'XXI': (None, 'Koping'),
-    'ESM': ('Эсмеральдас', 'Esmeraldas'),
-    'ELC': ('Элко', 'Elcho Island'),
-    'WVI': ('Уотсонвилл', 'Watsonville'),
-    'KMG': ('Куньмин', 'Kunming'),
-    'PMY': ('Пуэрто Мадрин', 'Puerto Madryn'),
-    'ELF': ('Эль-Фашир', 'El Fasher'),
-    'MRS': ('Марсель', 'Marseille'),
-    'ELI': ('Элим', 'Elim'),
-    'GCI': ('Гернси', 'Guernsey'),
-    'ELJ': ('Эль-Рекрео', 'El Recreo'),
-    'ETH': ('Эйлат', 'Elat'),
-    'ELN': ('Элленсберг', 'Ellensburg'),
-    'EOK': ('Кеокек', 'Keokuk'),
-    'EZS': ('Элязыг', 'Elazig'),
-    'ELP': ('Эль-Пасо', 'El Paso'),
-    'XHM': (None, 'Georgetown'),
-    'KNV': ('Кнайтс Инлет', 'Knights Inlet'),
-    'ELQ': ('Бурайда', 'Gassim'),
-    'POE': ('Форт Полк', 'Fort Polk'),
-    'ETZ': ('Нанси', 'Metz/Nancy'),
-    'GDE': ('Годе', 'Gode/Iddidole'),
-    'AEX': ('Александрия', 'Alexandria'),
-    'MQS': ('Мюстик', 'Mustique Island'),
-    'MRY': ('Монтерей', 'Monterey'),
-    'ELS': ('Ист-Лондон', 'East London'),
-    'LGO': ('Лангеог', 'Langeoog'),
-    'BYD': ('Бейда', 'Beidah'),
-    'ELW': ('Элламар', 'Ellamar'),
-    'EMD': ('Эмералд', 'Emerald'),
-    'TVC': ('Траверс-Сити', 'Traverse City'),
-    'KRG': ('Карасабаи', 'Karasabai'),
-    'QXB': ('Экс-ан-Прованс', 'Aix-en-Provence'),
-    'KRP': ('Каруп', 'Karup'),
-    'AVX': ('Авалон', 'Avalon'),
-    'CDP': ('Кадапа', 'Cuddapah'),
-    'EMI': ('Эмирау', 'Emirau'),
-    'POT': ('Порт Антонио', 'Port Antonio'),
-    'FAF': ('Форт Эустис', 'Fort Eustis'),
-    'HHR': ('Хоторн', 'Hawthorne'),
-    'ENJ': ('Эль-Наранджо', 'El Naranjo'),
-    'EML': ('Люцерн', 'Luzern'),
-    'EMT': ('Эль Монте', 'El Monte'),
-    'PPJ': ('Палау Панджанг', 'Pulau Panjang'),
-    'HJT': ('Худжирт', 'Khujirt'),
-    'PPZ': ('Пуэрто Паэс', 'Puerto Paez'),
-    'WLA': ('Уоллал', 'Wallal'),
-    'GDH': ('Голден Хорн Лодж', 'Golden Horn Lodge'),
-    'CPI': ('Капе-Орфорд', 'Cape Orford'),
-    'ZJM': (None, 'Martigny'),
-    'EMX': ('Эль Майтен', 'El Maiten'),
-    'FAB': ('Фарнборо', 'Farnborough'),
-    'GDM': ('Гарднер', 'Gardner'),
-    'EMY': ('Эль-Минья', 'El Minya'),
-    'GDN': ('Гданьск', 'Gdansk'),
-    'ENB': ('Энибба', 'Eneabba West'),
-    'ENW': ('Кеноша', 'Kenosha'),
-    'ENH': ('Эньши', 'Enshi'),
-    'DEZ': ('Дэйр-эз-Зор', 'Deirezzor'),
-    'ENI': ('Эль-Нидо', 'El Nido'),
-    'GLK': ('Галкайо', 'Galcaio'),
-    'SKI': ('Скикда', 'Skikda'),
-    'PSL': ('Перт', 'Perth'),
-    'ENL': ('Сентралия', 'Centralia'),
-    'KXE': ('Клерксдорп', 'Klerksdorp'),
-    'GES': ('Генерал-Сантос', 'General Santos City'),
-    'ALM': ('Аламогордо', 'Alamogordo'),
-    'YPW': ('Пауэлл Ривер', 'Powell River'),
-    'FBE': ('Белтран Франциско', 'Francisco Beltrao'),
-    'HNI': ('Хейвени', 'Heiweni'),
-    'UJE': ('Уджаэ', 'Ujae Island'),
-    'JCU': ('Кеута', 'Ceuta'),
-    'EOI': ('Идей', 'Eday'),
-    'EOS': ('Неошо', 'Neosho'),
-    'JDN': ('Джордан', 'Jordan'),
-    'RXE': (None, 'Rexburg'),
-    'FBM': ('Лубумбаши', 'Lubumbashi'),
-    'GET': ('Джералдтон', 'Geraldton'),
-    'EPN': ('Эпена', 'Epena'),
-    'GLS': ('Галвестон', 'Galveston'),
-    'EPR': ('Эсперанс', 'Esperance'),
-    'PUV': ('Пум', 'Poum'),
-    'FHU': ('Сьерра-Виста', 'Sierra Vista'),
-    'PZO': ('Пуэрто-Ордас', 'Puerto Ordaz'),
-    'JJU': ('Какорток', 'Qaqortoq'),
-    'EPT': ('Элиптамин', 'Eliptamin'),
-    'XOK': (None, 'Oakville'),
-    'ERD': ('Бердянск', 'Berdyansk'),
-    'MWL': ('Минерал Уеллс', 'Mineral Wells'),
-    'JOP': ('Джосефстаал', 'Josephstaal'),
-    'FRA': ('Франкфурт-на-Майне', 'Frankfurt'),
-    'ILG': ('Уилмингтон', 'Wilmington'),
-    'ERI': ('Эри', 'Erie'),
-    'LOG': ('Лонгвью', 'Longview'),
-    'BCL': ('Барра дель Колорадо', 'Barra Colorado'),
-    'GMI': ('Гасмата-Айленд', 'Gasmata Island'),
-    'VDA': ('Эйлат', 'Ovda'),
-    'KWY': ('Кивайу', 'Kiwayu'),
-    'LPU': ('Лонг Апунг', 'Long Apung'),
-    'ERT': ('Шинэ Идэр', 'Erdenet'),
-    'GFE': ('Гренфелл', 'Grenfell'),
-    'VNE': ('Ванн', 'Vannes'),
-    'HST': ('Хоумстэд', 'Homestead'),
-    'BAH': ('Манама', 'Bahrain'),
-    'GFF': ('Гриффит', 'Griffith'),
-    'ESI': ('Эспиноза', 'Espinosa'),
-    'KUH': ('Кусиро', 'Kushiro'),
-    'ETD': ('Этадунна', 'Etadunna'),
-    'LNH': ('Лейк Наш', 'Lake Nash'),
-    'GFN': ('Графтон', 'Grafton'),
-    'ETS': ('Энтерпрайз', 'Enterprise'),
-    'BYM': ('Баямо', 'Bayamo'),
-    'EVA': ('Эвадейл', 'Evadale'),
-    'INY': ('Иняти', 'Inyati'),
-    'YDN': ('Дофин', 'Dauphin'),
-    'ELH': ('Норт-Элеутера', 'North Eleuthera'),
-    'OBN': ('Обан', 'Oban'),
-    'FEG': ('Фергана', 'Fergana'),
-    'GHA': ('Гардая', 'Ghardaia'),
-    'EVV': ('Эвансвилл', 'Evansville'),
-    'EVW': ('Эванстон', 'Evanston'),
-    'CRS': ('Корсикана', 'Corsicana'),
-    'FLP': ('Флиппин', 'Flippin'),
-    'GHN': ('Гуангхан', 'Guanghan'),
-    'EWI': ('Энаротали', 'Enarotali'),
-    'KAJ': ('Каяани', 'Kajaani'),
-    'ION': ('Импфондо', 'Impfondo'),
-    'CBT': ('Катумбела', 'Catumbela'),
-    'EWK': ('Ньютон', 'Newton'),
-    'EWN': ('Нью-Берн', 'New Bern'),
-    'FDK': ('Фредерик', 'Frederick'),
-    'XPY': (None, 'Pyha'),
-    'NDB': ('Нуадибу', 'Nouadhibou'),
-    'EYL': ('Йелимане', 'Yelimane'),
-    'YOH': ('Оксфорд Хаус', 'Oxford House'),
-    'LAJ': ('Лажис', 'Lages'),
-    'GNI': ('Грин Айленд', 'Green Island'),
-    'VHV': ('Верхневилюйск', 'Verhnevilyuisk'),
-    'PUF': ('По', 'Pau'),
-    'SEQ': ('Сунгаи Пакнинг', 'Sungai Pakning'),
-    'GIB': ('Гибралтар', 'Gibraltar'),
-    'LBI': ('Альби', 'Albi'),
-    'BJF': ('Ботсфьорд', 'Batsfjord'),
-    'KGA': ('Кананга', 'Kananga'),
-    'HUQ': ('Хун', 'Houn'),
-    'FOO': ('Намфур', 'Numfoor'),
-    'VGS': ('Хенераль Вильегас', 'General Villegas'),
-    'EWB': ('Нью-Бедфорд', 'New Bedford'),
-    'PPM': ('Помпано Бич', 'Pompano Beach'),
-    'QQR': (None, 'Ramsgate'),
-    'FAT': ('Фресно', 'Fresno'),
-    'PVD': ('Провиденс', 'Providence'),
-    'LCO': ('Лаг', 'Lague'),
-    'FBS': ('Фрайдей Харбор', 'Friday Harbor'),
-    'ICA': ('Икабару', 'Icabaru'),
-    'FDH': ('Фридрихсхафен', 'Friedrichshafen'),
-    'QMK': ('Ниякорнаарсук', 'Niaqornaarsuk'),
-    'AGI': ('Вагенинген', 'Wageningen'),
-    'FDR': ('Фредерик', 'Frederick'),
-    'FRI': ('Форт Рилей', 'Fort Riley'),
-    'FEP': ('Фрипорт', 'Freeport'),
-    'LPM': ('Ламап', 'Lamap'),
-    'FET': ('Фримонт', 'Fremont'),
-    'LDA': ('Мальда', 'Malda'),
-    'PEH': ('Пеуахо', 'Pehuajo'),
-    'FFL': ('Феърфилд', 'Fairfield'),
-    'RTS': ('Роттнест', 'Rottnest Island'),
-    'DRH': ('Дабра', 'Dabra'),
-    'RAM': ('Рамингининг', 'Ramingining'),
-    'COL': ('Колл', 'Isle Of Coll'),
-    'PET': ('Пелотас', 'Pelotas'),
-    'FEL': ('Фюрстенфельдбрук', 'Fuerstenfeldbruck'),
-    'KPD': ('Кинг оф Проссия', 'King Of Prussia'),
-    'DSG': ('Диласаг', 'Dilasag'),
-    'FFU': ('Футалеуфу', 'Futaleufu'),
-    'NKC': ('Нуакшот', 'Nouakchott'),
-    'RMT': ('Риматара', 'Rimatara'),
-    'FID': ('Фишерс Айленд', 'Fishers Island'),
-    'IFL': ('Иннисфейл', 'Innisfail'),
-    'MZR': ('Мазари-Шариф', 'Mazar-I-Sharif'),
-    'LDX': ('Сен-Лоран-дю-Марони', 'St Laurent du Maroni'),
-    'FES': ('Сан-Фернандо', 'San Fernando'),
-    'RBC': ('Робинвейл', 'Robinvale'),
-    'FNR': ('Фантер Бэй', 'Funter Bay'),
-    'FIK': ('Финк', 'Finke'),
-    'FLD': ('Фонд дю Лак', 'Fond Du Lac'),
-    'IFN': ('Исфахан', 'Isfahan'),
-    'BLC': ('Бали', 'Bali'),
-    'GKA': ('Горока', 'Goroka'),
-    'KWF': ('Уотерфолл', 'Waterfall'),
-    'GLD': ('Гудленд', 'Goodland'),
-    'IHR': ('Иран Шахр', 'Iran Shahr'),
-    'ARY': ('Арарат', 'Ararat'),
-    'BHF': ('Бахья-Купика', 'Bahia Cupica'),
-    'LEJ': ('Лейпциг', 'Leipzig/Halle'),
-    'GLG': ('Гленгиль', 'Glengyle'),
-    'NLL': ('Наллагин', 'Nullagine'),
-    'FMA': ('Формоса', 'Formosa'),
-    'CDU': ('Камден', 'Camden'),
-    'BNN': ('Брённёйсунн', 'Bronnoysund'),
-    'LEY': ('Лелистад', 'Lelystad'),
-    'RCL': ('Редклиффе', 'Redcliffe'),
-    'FME': ('Форт Миде', 'Fort Meade'),
-    'GUQ': ('Гуанаре', 'Guanare'),
-    'ILB': ('Илья-Солтейра', 'Ilha Solteira'),
-    'PIL': ('Пилар', 'Pilar'),
-    'FRO': ('Флурё', 'Floro'),
-    'FMS': ('Форт Мэдисон', 'Fort Madison'),
-    'NLV': ('Николаев', 'Nikolaev'),
-    'GOZ': ('Горна-Оряховица', 'Gorna Oriahovitsa'),
-    'MMZ': ('Меймене', 'Maimana'),
-    'NPP': ('Напперби', 'Napperby'),
-    'NEA': ('Глинко', 'Glynco'),
-    'QPL': (None, 'Ploiesti'),
-    'ITB': ('Итайтуба', 'Itaituba'),
-    'INA': ('Инта', 'Inta'),
-    'FLS': ('Флиндерс', 'Flinders Island'),
-    'FNI': ('Ним', 'Nimes'),
-    'OAS': ('Шарана', 'Sharana'),
-    'BYJ': (None, 'Beja'),
-    'DAK': ('Дахла', 'Dakhla Oasis'),
-    'FRD': ('Фрайдей-Харбор', 'Friday Harbor'),
-    'KWJ': ('Кванджу', 'Gwangju'),
-    'FON': ('Ла Фортуна', 'Fortuna'),
-    'GOY': ('Гал Ойа', 'Gal Oya'),
-    'FOR': ('Форталеза', 'Fortaleza'),
-    'JMB': ('Джамба', 'Jamba'),
-    'LIZ': ('Лаймстоун', 'Limestone'),
-    'FRG': ('Фармингдейл', 'Farmingdale'),
-    'XNO': (None, 'Northallerton'),
-    'GNA': ('Гродно', 'Grodno'),
-    'IPL': ('Эль-Сентро', 'Imperial'),
-    'FRK': ('Фрегат', 'Fregate Island'),
-    'UTO': ('Утопиа Крик', 'Utopia Creek'),
-    'QOB': (None, 'Ansbach'),
-    'ICY': ('Айси Бэй', 'Icy Bay'),
-    'QXK': (None, 'St-Genis'),
-    'PBE': ('Пуэрто Беррио', 'Puerto Berrio'),
-    'JNN': ('Нонорталик', 'Nanortalik'),
-    'KKB': ('Китои Бэй', 'Kitoi Bay'),
-    'FRS': ('Флорес', 'Flores'),
-    'AYE': ('Форт Девенс', 'Fort Devens'),
-    'FRW': ('Франсистаун', 'Francistown'),
-    'URD': ('Бург-Ферштейн', 'Burg Feuerstein'),
-    'GAY': ('Гая', 'Gaya'),
-    'FSD': ('Су-Фолс', 'Sioux Falls'),
-    'LCE': ('Ла-Сейба', 'La Ceiba'),
-    'GUY': ('Гаймон', 'Guymon'),
-    'FSP': ('Сен-Пьер', 'Saint Pierre'),
-    'LCJ': ('Лодзь', 'Lodz'),
-    'FSU': ('Форт Самнер', 'Fort Sumner'),
-    'ISE': ('Ыспарта', 'Isparta'),
-    'GDL': ('Гвадалахара', 'Guadalajara'),
-    'JUM': ('Джумла', 'Jumla'),
-    'FTK': ('Форт Кнокс', 'Fort Knox'),
-    'LPP': ('Лаппеэнранта', 'Lappeenranta'),
-    'FTL': ('Фортуна Ледж', 'Fortuna Ledge'),
-    'BUY': ('Банбери', 'Bunbury'),
-    'FUE': ('Фуэртевентура', 'Puerto del Rosario'),
-    'CAM': ('Камири', 'Camiri'),
-    'REW': ('Рева', 'Rewa'),
-    'FWL': ('Фаруэлл', 'Farewell'),
-    'LLA': ('Лулео', 'Lulea'),
-    'LLS': ('Лас Ломитас', 'Las Lomitas'),
-    'MSK': ('Мастик Поинт', 'Mastic Point'),
-    'MXM': ('Моромб', 'Morombe'),
-    'XWH': (None, 'Stoke-on-Trent'),
-    'NPE': ('Нейпир', 'Napier'),
-    'FXO': ('Куамба', 'Cuamba'),
-    'AUL': ('Аур', 'Aur Island'),
-    'JUV': ('Упернавик', 'Upernavik'),
-    'LSK': ('Ласк', 'Lusk'),
-    'FXY': ('Форест Сити', 'Forest City'),
-    'FYU': ('Форт-Юкон', 'Fort Yukon'),
-    'NTI': ('Бинтуни', 'Bintuni'),
-    'LUN': ('Лусака', 'Lusaka'),
-    'KAU': ('Каухава', 'Kauhava'),
-    'WWI': ('Вуди Вуди', 'Woodie Woodie'),
-    'BAP': ('Байбара', 'Baibara'),
-    'BCW': ('Бенгуера-Айленд', 'Benguera Island'),
-    'NSX': ('Норд Саунд', 'Nord Sound'),
-    'OXF': ('Оксфорд', 'Oxford'),
-    'KDM': ('Каадедду', 'Kaadedhdhoo'),
-    'GAM': ('Гамбелл', 'Gambell'),
-    'GAO': ('Гуантанамо', 'Guantanamo'),
-    'LVA': ('Лаваль', 'Laval'),
-    'JNP': ('Ньюпорт Бич', 'Newport Beach'),
-    'KDU': ('Скарду', 'Skardu'),
-    'XVX': (None, 'Vejle'),
-    'JAA': ('Джелалабад', 'Jalalabad'),
-    'NTM': ('Миракема До Норте', 'Miracema Do Norte'),
-    'LWB': ('Льюисберг', 'Lewisburg'),
-    'GAQ': ('Гао', 'Gao'),
-    'JNS': ('Нарсдак', 'Narsaq'),
-    'JIR': ('Джири', 'Jiri'),
-    'LZO': ('Лучжоу', 'Luzhou'),
-    'FNA': ('Фритаун', 'Freetown'),
-    'GBB': ('Габала', 'Gabala'),
-    'JJN': ('Цюаньчжоу', 'Jinjiang'),
-    'GOA': ('Генуя', 'Genoa'),
-    'MAM': ('Матаморос', 'Matamoros'),
-    'BKS': ('Бенкулу', 'Bengkulu'),
-    'CHG': ('Чаоян', 'Chaoyang'),
-    'ORR': ('Йорктаун', 'Yorketown'),
-    'GOB': ('Гоба', 'Goba'),
-    'IWA': ('Иваново', 'Ivanovo'),
-    'GBD': ('Грэйт Бенд', 'Great Bend'),
-    'GOC': ('Гора', 'Gora'),
-    'BHS': ('Батерст', 'Bathurst'),
-    'MCL': ('Маунт Маккинли', 'Mount Mckinley'),
-    'GIL': ('Гилгит', 'Gilgit'),
-    'GBJ': ('Мари Галант', 'Marie Galante'),
-    'HWK': ('Хаукер', 'Hawker'),
-    'GJL': ('Джиджель', 'Jijel'),
-    'GON': ('Нью Лондон', 'New London'),
-    'GBV': ('Гибб Ривер', 'Gibb River'),
-    'AUN': ('Оберн', 'Auburn'),
-    'QUB': ('Убари', 'Ubari'),
-    'GCH': ('Гачсаран', 'Gachsaran'),
-    'AYS': ('Уэйкросс', 'Waycross'),
-    'GPB': ('Гуарапуава', 'Guarapuava'),
-    'PCL': ('Пукальпа', 'Pucallpa'),
-    'MDY': ('Острова Мидуэй', 'Midway Island'),
-    'GDA': ('Гаунда', 'Gounda'),
-    'GKL': ('Остров Грэйт Кеппел', 'Great Keppel Island'),
-    'MDX': ('Мерседес', 'Mercedes'),
-    'HSS': ('Хиссар', 'Hissar'),
-    'GRG': ('Гардез', 'Gardez'),
-    'AUR': ('Орийак', 'Aurillac'),
-    'PCN': ('Пиктон', 'Picton'),
-    'JVL': ('Джейнсвилл', 'Janesville'),
-    'GEF': ('Гева', 'Geva'),
-    'GER': ('Нуэва-Херона', 'Nueva Gerona'),
-    'GTB': ('Гентинг', 'Genting'),
-    'RFK': ('Ангилла', 'Anguilla'),
-    'GLR': ('Гейлорд', 'Gaylord'),
-    'RGN': ('Янгон', 'Yangon'),
-    'GEV': ('Елливаре', 'Gallivare'),
-    'CHB': ('Чилас', 'Chilas'),
-    'GLM': ('Гленормистон', 'Glenormiston'),
-    'JAQ': ('Джакуинот Бэй', 'Jacquinot Bay'),
-    'CUV': ('Касигуа', 'Casigua'),
-    'OGX': ('Уаргла', 'Ouargla'),
-    'GRT': ('Гуджарат', 'Gujrat'),
-    'WDR': ('Уиндер', 'Winder'),
-    'MAE': ('Мадера', 'Madera'),
-    'GSI': ('Гуадалканал', 'Guadalcanal'),
-    'PFN': ('Панама', 'Panama City'),
-    'HCW': ('Черо', 'Cheraw'),
-    'RHN': ('Рош Пина', 'Rosh Pina'),
-    'GFD': ('Гринфилд', 'Greenfield'),
-    'GGT': ('Джордж Таун', 'George Town'),
-    'OLF': ('Вулф Пойнт', 'Wolf Point'),
-    'TEU': ('Те-Анау', 'Te Anau'),
-    'PGH': ('Пантнагар', 'Pantnagar'),
-    'MFS': ('Мирафлорес', 'Miraflores'),
-    'FGL': ('Фокс Глейшер', 'Fox Glacier'),
-    'GSM': ('Кешм', 'Qeshm Island'),
-    'MGQ': ('Могадишо', 'Mogadishu'),
-    'CEP': ('Консепсьон', 'Concepcion'),
-    'DNS': ('Денисон', 'Denison'),
-    'MGU': ('Манаунг', 'Manaung'),
-    'CHJ': ('Чипинге', 'Chipinge'),
-    'GOI': ('Гоа', 'Goa'),
-    'GIU': ('Сигерия', 'Sigiriya'),
-    'GRI': ('Гранд-Айленд', 'Grand Island'),
-    'GIZ': ('Джизан', 'Jazan'),
-    'JEE': ('Жереми', 'Jeremie'),
-    'CMK': ('Клаб Макокола', 'Club Makokola'),
-    'XWY': (None, 'Wyoming'),
-    'CBN': ('Киребон', 'Cirebon'),
-    'DBO': ('Даббо', 'Dubbo'),
-    'GSN': ('Маунт Гансон', 'Mount Gunson'),
-    'KGH': ('Йонгаи', 'Yongai'),
-    'KIY': ('Килва-Кисивани', 'Kilwa Masoko'),
-    'MTO': ('Мэттун', 'Mattoon'),
-    'GKH': ('Горкха', 'Gorkha'),
-    'GLE': ('Гейнсвилл', 'Gainesville'),
-    'BEE': ('Бигл-Бэй', 'Beagle Bay'),
-    'POQ': ('Полк Инлет', 'Polk Inlet'),
-    'RHO': ('Родос', 'Rhodes'),
-    'GLF': ('Гольфито', 'Golfito'),
-    'ZBY': ('Сайнябули', 'Sayaboury'),
-    'OKV': ('Окао', 'Okao'),
-    'GLP': ('Галгабип', 'Gulgubip'),
-    'KGI': ('Калгурли', 'Kalgoorlie'),
-    'MHM': ('Минчумина', 'Minchumina'),
-    'GOJ': ('Нижний Новгород', 'Nizhniy Novgorod'),
-    'GLV': ('Головин', 'Golovin'),
-    'BLG': ('Белага', 'Belaga'),
-    'MAX': ('Матам', 'Matam'),
-    'GLX': ('Галела', 'Galela'),
-    'SUI': ('Сухум', 'Sukhumi'),
-    'SLK': ('Саранак Лейк', 'Saranac Lake'),
-    'GLY': ('Голдсворти', 'Goldsworthy'),
-    'GSR': ('Гардо', 'Gardo'),
-    'GMA': ('Гемене', 'Gemena'),
-    'KIA': ('Каиапит', 'Kaiapit'),
-    'GME': ('Гомель', 'Gomel'),
-    'GUU': ('Грундарфьордур', 'Grundarfjordur'),
-    'GUV': ('Моугулу', 'Mougulu'),
-    'ROA': ('Роанок', 'Roanoke'),
-    'DIK': ('Дикинсон', 'Dickinson'),
-    'GVA': ('Женева', 'Geneva'),
-    'GMR': ('Гамбиер-Айленд', 'Gambier Island'),
-    'XYM': ('Фаленберг', 'Falkenberg'),
-    'BGR': ('Бангор', 'Bangor'),
-    'GNM': ('Гуамби', 'Guanambi'),
-    'MFW': ('Магарукуе', 'Magaruque'),
-    'GNT': ('Грантс', 'Grants'),
-    'GYI': ('Гисеньи', 'Gisenyi'),
-    'GPN': ('Гарден Пойнт', 'Garden Point'),
-    'ROS': ('Росарио', 'Rosario'),
-    'UUU': ('Мануму', 'Manumu'),
-    'KEC': ('Касенга', 'Kasenga'),
-    'OTO': ('Отто', 'Otto'),
-    'GOP': ('Горакхпур', 'Gorakhpur'),
-    'HAU': ('Хеугесунн', 'Haugesund'),
-    'GOU': ('Гаруа', 'Garoua'),
-    'OTR': ('Кото 47', 'Coto 47'),
-    'JNU': ('Джуно', 'Juneau'),
-    'BNW': ('Бун', 'Boone'),
-    'GRB': ('Грин-Бей', 'Green Bay'),
-    'AOU': ('Аттопеу', 'Attopeu'),
-    'GYS': ('Гуанъюань', 'Guang Yuan'),
-    'GRC': ('Гранд Кесс', 'Grand Cess'),
-    'DOR': ('Дори', 'Dori'),
-    'BOI': ('Бойсе', 'Boise'),
-    'SPG': ('Сент-Питерсберг', 'St Petersburg'),
-    'KYZ': ('Кызыл', 'Kyzyl'),
-    'GSQ': ('Шарк Эловайнэт', 'Shark Elowainat'),
-    'EFW': ('Джефферсон', 'Jefferson'),
-    'GRJ': ('Джордж', 'George'),
-    'OWK': ('Норриджвок', 'Norridgewock'),
-    'GRO': ('Жирона', 'Girona'),
-    'LTG': ('Лангтанг', 'Langtang'),
-    'PAS': ('Парос', 'Paros'),
-    'DHA': ('Дахран', 'Dhahran'),
-    'GSO': ('Гринсборо', 'Greensboro/High Point'),
-    'AUB': ('Итауба', 'Itauba'),
-    'FUG': ('Фуян', 'Fuyang'),
-    'KDR': ('Кандриан', 'Kandrian'),
-    'OVB': ('Новосибирск', 'Novosibirsk'),
-    'GST': ('Гаставус', 'Gustavus'),
-    'SRH': ('Сарх', 'Sarh'),
-    'CNO': ('Чино', 'Chino'),
-    'LHA': ('Лар', 'Lahr'),
-    'RPM': ('Нгкерр', 'Ngukurr'),
-    'ALK': ('Асэлла', 'Asela'),
-    'ZAU': ('Ауэ', 'Aue'),
-    'GTO': ('Горонтало', 'Gorontalo'),
-    'AMB': ('Амбилоб', 'Ambilobe'),
-    'GTS': ('Гранитес', 'Granites'),
-    'PBL': ('Пуерто Кабелло', 'Puerto Cabello'),
-    'KOH': ('Кулата', 'Koolatah'),
-    'PBO': ('Параберду', 'Paraburdoo'),
-    'GTT': ('Джорджтаун', 'Georgetown'),
-    'PCC': ('Пуэрто Рико', 'Puerto Rico'),
-    'FLM': ('Филадельфия', 'Filadelfia'),
-    'GUA': ('Гватемала', 'Guatemala City'),
-    'ATJ': ('Анцирабе', 'Antsirabe'),
-    'DVK': ('Диавик', 'Diavik'),
-    'PCP': ('Принсипе', 'Principe'),
-    'KIT': ('Китира', 'Kithira'),
-    'BVF': ('Буа', 'Bua'),
-    'HBA': ('Хобарт', 'Hobart'),
-    'PCT': ('Принстон', 'Princeton'),
-    'LDE': ('Лурд', 'Lourdes'),
-    'GUM': ('Хагатна', 'Guam'),
-    'PDP': ('Пунта-дель-Эсте', 'Punta Del Este'),
-    'GUR': ('Алотау', 'Alotau'),
-    'GYY': ('Гэри', 'Gary'),
-    'GUW': ('Атырау', 'Atyrau'),
-    'DAF': ('Дауп', 'Daup'),
-    'PEV': ('Печ', 'Pecs'),
-    'GUX': ('Гуна', 'Guna'),
-    'FMG': ('Фламинго', 'Flamingo'),
-    'ZBD': ('Цзюцзян', 'Jiang Men'),
-    'ASY': ('Ашли', 'Ashley'),
-    'GVE': ('Гордонсвилл', 'Gordonsville'),
-    'MXG': ('Марлборо', 'Marlborough'),
-    'PEX': ('Печора', 'Pechora'),
-    'ESE': ('Энсенада', 'Ensenada'),
-    'GWA': ('Гва', 'Gwa'),
-    'HYL': ('Холлис', 'Hollis'),
-    'HRY': ('Хенбари', 'Henbury'),
-    'GWD': ('Гвадар', 'Gwadar'),
-    'PGB': ('Пангоа', 'Pangoa'),
-    'PGI': ('Читато', 'Chitato'),
-    'GXF': ('Сейюн', 'Seiyun'),
-    'HDS': ('Хоэдспруит', 'Hoedspruit'),
-    'PES': ('Петрозаводск', 'Petrozavodsk'),
-    'CGA': ('Крейг', 'Craig'),
-    'HEV': ('Уэльва', 'Huelva'),
-    'SXH': ('Сухели', 'Sehulea'),
-    'HIO': ('Хиллсборо', 'Hillsboro'),
-    'AJJ': ('Акжужт', 'Akjoujt'),
-    'BNE': ('Брисбен', 'Brisbane'),
-    'SEH': ('Сенггех', 'Senggeh'),
-    'ORU': ('Оруро', 'Oruro'),
-    'PHS': ('Пхитсанулок', 'Phitsanulok'),
-    'LJU': ('Любляна', 'Ljubljana'),
-    'GYN': ('Гояния', 'Goiania'),
-    'MDI': ('Макурди', 'Makurdi'),
-    'CBA': ('Залив Корнер', 'Corner Bay'),
-    'GZI': ('Газни', 'Ghazni'),
-    'HAA': ('Хасвик', 'Hasvik'),
-    'HLH': ('Улан-Хото', 'Ulanhot'),
-    'LMD': ('Лос Менукос', 'Los Menucos'),
-    'PLH': ('Плимут', 'Plymouth'),
-    'HAB': ('Гамильтон', 'Hamilton'),
-    'PMW': ('Палмас', 'Palmas'),
-    'RTD': ('Ротунда', 'Rotunda'),
-    'GUD': ('Гундам', 'Goundam'),
-    'HAC': ('Хатидзёдзима', 'Hachijo Jima'),
-    'LOD': ('Лонгана', 'Longana'),
-    'MHO': ('Маунт Хауз', 'Mount House'),
-    'ZPD': (None, 'Oldenburg'),
-    'PPC': ('Проспект Крик', 'Prospect Creek'),
-    'KHJ': ('Каухайоки', 'Kauhajoki'),
-    'HOA': ('Хола', 'Hola'),
-    'TFC': ('Таормина', 'Taormina'),
-    'HAT': ('Хелсайленд', 'Heathlands'),
-    'DBD': ('Дханбад', 'Dhanbad'),
-    'BHG': ('Брус Лагуна', 'Brus Laguna'),
-    'INB': ('Индепенденс', 'Independence'),
-    'PUJ': ('Пунта-Кана', 'Punta Cana'),
-    'HIT': ('Хиваро', 'Hivaro'),
-    'MOW': ('Москва', 'Moscow'),
-    'RVT': ('Равенсторп', 'Ravensthorpe'),
-    'HBN': ('Пху-Бон', 'Phu-bon'),
-    'SMH': ('Сапманга', 'Sapmanga'),
-    'HCA': ('Биг Спринг', 'Big Spring'),
-    'CQA': ('Канарана', 'Canarana'),
-    'CKR': ('Крэйн-Айленд', 'Crane Island'),
-    'HCC': ('Гудзон', 'Hudson'),
-    'HOF': ('Эль-Хуфуф', 'Hofuf'),
-    'HDB': ('Хайдельберг', 'Heidelberg'),
-    'NEN': ('Уайтхаус', 'Whitehouse'),
-    'HEI': ('Хейде-Буесум', 'Heide-Buesum'),
-    'DRK': ('Дрейк-Бэй', 'Drake Bay'),
-    'HOV': ('Волда', 'Orsta-Volda'),
-    'HES': ('Хермистон', 'Hermiston'),
-    'HBH': ('Хобарт Бэй', 'Hobart Bay'),
-    'HNE': ('Тахнета Пасс Лодж', 'Tahneta Pass Lodge'),
-    'PYO': ('Путумайо', 'Putumayo'),
-    'GWO': ('Гринвуд', 'Greenwood'),
-    'HFE': ('Хэфэй', 'Hefei'),
-    'HNM': ('Хана', 'Hana'),
-    'ERC': ('Эрзинджан', 'Erzincan'),
-    'RAL': ('Риверсайд', 'Riverside'),
-    'HNN': (None, 'Honinabi'),
-    'RJL': ('Логроньо', 'Logrono'),
-    'HVN': ('Нью-Хейвен', 'New Haven'),
-    'HGA': ('Харгейса', 'Hargeisa'),
-    'HGO': ('Корого', 'Korhogo'),
-    'JGX': (None, 'Glendale'),
-    'CZJ': ('Коразьон-де-Йесус', 'Corazon De Jesus'),
-    'HGU': ('Маунт-Хаген', 'Mount Hagen'),
-    'CBV': ('Кобан', 'Coban'),
-    'BTQ': ('Бутаре', 'Butare'),
-    'HRJ': ('Чаурджхари', 'Chaurjhari'),
-    'BNM': ('Бодинуму', 'Bodinumu'),
-    'RGH': ('Балургхат', 'Balurghat'),
-    'HRL': ('Харлинген', 'Harlingen'),
-    'HRO': ('Гаррисон', 'Harrison'),
-    'HIS': ('Хейман Айленд', 'Hayman Island'),
-    'HKD': ('Хакодате', 'Hakodate'),
-    'BYB': ('Дибаа', 'Dibaa'),
-    'RKT': ('Рас-эль-Хайма', 'Ras al-Khaimah'),
-    'SBF': ('Сардех Банд', 'Sardeh Band'),
-    'HMJ': ('Хмельницкий', 'Khmelnitskiy'),
-    'HMO': ('Эрмосильо', 'Hermosillo'),
-    'CIR': ('Кайро', 'Cairo'),
-    'RMB': ('Бураими', 'Buraimi'),
-    'SDP': ('Санд-Пойнт', 'Sand Point'),
-    'HMT': ('Хемет', 'Hemet'),
-    'HPH': ('Хайфон', 'Haiphong'),
-    'JAN': ('Джексон', 'Jackson'),
-    'BTE': ('Бонте', 'Bonthe'),
-    'RNP': ('Ронгелап', 'Rongelap Island'),
-    'HPT': ('Хэмптон', 'Hampton'),
-    'HNC': ('Хаттерас', 'Hatteras'),
-    'XPH': (None, 'Port Hope'),
-    'HRB': ('Харбин', 'Harbin'),
-    'HNH': ('Хуна', 'Hoonah'),
-    'TOM': ('Тимбукту', 'Tombouctou'),
-    'HWN': ('Хванге Нэшнл Парк', 'Hwange Nat Park'),
-    'PCB': (None, 'Pondok Cabe'),
-    'HOD': ('Ходейда', 'Hodeidah'),
-    'GBL': ('Гоулбёрн Айленд', 'Goulburn Island'),
-    'HYF': ('Хейфилдс', 'Hayfields'),
-    'KSW': ('Кирьят-Шмона', 'Kiryat Shmona'),
-    'KIU': ('Киунга', 'Kiunga'),
-    'HOX': ('Хомалин', 'Homalin'),
-    'BVR': ('Брава', 'Brava'),
-    'RRL': ('Меррилл', 'Merrill'),
-    'HSC': ('Шаогуань', 'Shaoguan'),
-    'ASM': ('Асмэра', 'Asmara'),
-    'HPE': ('Хоп Вейл', 'Hope Vale'),
-    'HTA': ('Чита', 'Chita'),
-    'YJP': ('Джаспер-Хинтон', 'Jasper-hinton'),
-    'MSX': ('Моссенджо', 'Mossendjo'),
-    'RSB': ('Роузберс', 'Roseberth'),
-    'HRZ': ('Оризонти', 'Horizontina'),
-    'HSN': ('Чжоушань', 'Zhoushan'),
-    'INI': ('Ниш', 'Nis'),
-    'HTO': ('Восток Хамптон', 'East Hampton'),
-    'HTL': ('Хоунтон', 'Houghton'),
-    'MUQ': ('Маккан', 'Muccan'),
-    'PDB': ('Педро Бэй', 'Pedro Bay'),
-    'RSU': ('Йосу', 'Yeosu'),
-    'HTM': ('Хатгаи', 'Khatgal'),
-    'GDX': ('Магадан', 'Magadan'),
-    'CSI': ('Казино', 'Casino'),
-    'REC': ('Ресифи', 'Recife'),
-    'MUS': ('о. Маркус', 'Marcus Island'),
-    'HTR': ('Хатэрума', 'Hateruma'),
-    'HTU': ('Хоптаун', 'Hopetoun'),
-    'HUE': ('Хумера', 'Humera'),
-    'BXP': (None, 'Biala Podlaska'),
-    'EVG': ('Свег', 'Sveg'),
-    'VAH': ('Валье Гранде', 'Vallegrande'),
-    'RUH': ('Эр-Рияд', 'Riyadh'),
-    'SSP': ('Сильвер Плейнс', 'Silver Plains'),
-    'HUC': ('Хумакао', 'Humacao'),
-    'RUP': ('Рапзи', 'Rupsi'),
-    'NXX': ('Уиллоу Гроув', 'Willow Grove'),
-    'HUH': ('Хуахине', 'Huahine'),
-    'HUK': ('Хукунтси', 'Hukuntsi'),
-    'RVN': ('Рованиеми', 'Rovaniemi'),
-    'MVG': ('Меванг', 'Mevang'),
-    'RVO': ('Реивило', 'Reivilo'),
-    'HQM': ('Хокиам', 'Hoquiam'),
-    'MVR': ('Маруа', 'Maroua'),
-    'HUM': ('Хаума', 'Houma'),
-    'GEI': ('Ниссан', 'Green Islands'),
-    'HVD': ('Ховд', 'Khovd'),
-    'IGN': ('Илиган', 'Iligan'),
-    'HVA': ('Аналалова', 'Analalava'),
-    'BRC': ('Сан-Карлос-де-Барилоче', 'San Carlos de Bariloche'),
-    'HVB': ('Харви-Бей', 'Hervey Bay'),
-    'KUG': ('Кубин Айленд', 'Kubin Island'),
-    'BPG': ('Барра-ду-Гарсас', 'Barra Do Garcas'),
-    'RYK': ('Рахимъярхан', 'Rahim Yar Khan'),
-    'HVS': ('Хартсвилл', 'Hartsville'),
-    'IGS': ('Ингольштадт-Маншинг', 'Ingolstadt-manching'),
-    'HVK': ('Холмавик', 'Holmavik'),
-    'KCZ': ('Коти', 'Kochi'),
-    'HVR': ('Хавр', 'Havre'),
-    'HWD': ('Хейвард', 'Hayward'),
-    'MJC': ('Ман', 'Man'),
-    'XOO': (None, 'Soelden'),
-    'BAZ': ('Барбелос', 'Barbelos'),
-    'BWF': ('Барроу-ин-Фернесс', 'Barrow-In-Furness'),
-    'ISG': ('Исигаки', 'Ishigaki'),
-    'HWO': ('Голливуд', 'Hollywood'),
-    'HYD': ('Хайдарабад', 'Hyderabad'),
-    'LYI': ('Линьи', 'Linyi'),
-    'HZK': ('Хусавик', 'Husavik'),
-    'HZH': ('Липинг', 'Liping'),
-    'EBM': ('Эль-Борма', 'El Borma'),
-    'IBA': ('Ибадан', 'Ibadan'),
-    'SPJ': (None, 'Sparta'),
-    'GHB': ('Говернерс Харбор', "Governor's Harbour"),
-    'ICO': ('Остров Сикогон', 'Sicogon Island'),
-    'ICT': ('Уичито', 'Wichita'),
-    'IOU': ('Иле Оуен', 'Ile Ouen'),
-    'IAS': ('Яссы', 'Iasi'),
-    'IPH': ('Ипох', 'Ipoh'),
-    'MXJ': ('Минна', 'Minna'),
-    'BPD': ('Бапи', 'Bapi'),
-    'RHG': ('Рухенгери', 'Ruhengeri'),
-    'CMV': ('Коромандел', 'Coromandel'),
-    'SVM': (None, 'St Pauls'),
-    'BMY': ('Острова Белеп', 'Belep Island'),
-    'XPK': ('Пукатаваган', 'Pukatawagan'),
-    'SRL': ('Санта-Росалия', 'Santa Rosalia'),
-    'SEA': ('Сиэтл', 'Seattle'),
-    'SBX': ('Шелби', 'Shelby'),
-    'EMS': ('Эмбесса', 'Embessa'),
-    'SGW': ('Залив Сагино', 'Saginaw Bay'),
-    'HLV': ('Хеленвейл', 'Helenvale'),
-    'MXX': ('Мура', 'Mora'),
-    'LHG': ('Лайтнинг Ридж', 'Lightning Ridge'),
-    'IRA': ('Киракира', 'Kirakira'),
-    'MAL': ('Манголе', 'Mangole'),
-    'LLN': ('Келила', 'Kelila'),
-    'IGG': ('Игьюджиг', 'Igiugig'),
-    'SCN': ('Саарбрюккен', 'Saarbruecken'),
-    'IDG': ('Айда Гров', 'Ida Grove'),
-    'MYL': ('Мак-Колл', 'Mccall'),
-    'RJA': ('Раджамандри', 'Rajahmundry'),
-    'IJX': ('Джексонвилл', 'Jacksonville'),
-    'BAG': ('Багуиоь', 'Baguio'),
-    'IRE': ('Иресе', 'Irece'),
-    'KYN': ('Милтон Кейнс', 'Milton Keynes'),
-    'IES': ('Риза', 'Riesa'),
-    'ALR': ('Александра', 'Alexandra'),
-    'ISB': ('Исламабад', 'Islamabad'),
-    'SKW': ('Скуэнтна', 'Skwentna'),
-    'BSV': ('Бесакоа', 'Besakoa'),
-    'BEG': ('Белград', 'Belgrade'),
-    'OME': ('Ном', 'Nome'),
-    'SDG': ('Сенендедж', 'Sanandaj'),
-    'IFP': ('Буллхед Сити', 'Bullhead City'),
-    'ISN': ('Уиллистон', 'Williston'),
-    'BHJ': ('Бхудж', 'Bhuj'),
-    'CLA': ('Комилле', 'Comilla'),
-    'NAD': ('Маканал', 'Macanal'),
-    'SDH': ('Санта Роза Копан', 'Santa Rosa Copan'),
-    'IGR': ('Пуэрто-Игуасу', 'Iguazu'),
-    'IKI': ('Ики', 'Iki'),
-    'SEB': ('Себха', 'Sebha'),
-    'IHO': ('Иоси', 'Ihosy'),
-    'JOT': ('Джолит', 'Joliet'),
-    'TAU': ('Таурамена', 'Tauramena'),
-    'IIA': ('Галловей', 'Galloway'),
-    'ISQ': ('Манистик', 'Manistique'),
-    'IVG': ('Беране', 'Berane'),
-    'ILP': ('Пен', 'Ile Des Pins'),
-    'IMM': ('Иммокали', 'Immokalee'),
-    'IKL': ('Икела', 'Ikela'),
-    'SXU': ('Содду', 'Soddu'),
-    'ONO': ('Онтарио', 'Ontario'),
-    'SFC': ('Сан Франсуа', 'St Francois'),
-    'IKT': ('Иркутск', 'Irkutsk'),
-    'LPI': ('Линчёпинг', 'Linkoping'),
-    'ILF': ('Илфорд', 'Ilford'),
-    'NCU': ('Нукус', 'Nukus'),
-    'ILM': ('Уилмингтон', 'Wilmington'),
-    'ASZ': ('Асирим', 'Asirim'),
-    'SFJ': ('Кангерлуссуак', 'Kangerlussuaq'),
-    'GRD': ('Гринвуд', 'Greenwood'),
-    'SFU': ('Сафиа', 'Safia'),
-    'ILQ': ('Ило', 'Ilo'),
-    'SGA': ('Шенгхнан', 'Sheghnan'),
-    'ITN': ('Итабуна', 'Itabuna'),
-    'ILU': ('Килагуни', 'Kilaguni'),
-    'IMF': ('Импхал', 'Imphal'),
-    'TES': ('Тэсэнэй', 'Tessenei'),
-    'LBE': ('Латроб', 'Latrobe'),
-    'HLT': ('Хамильтон', 'Hamilton'),
-    'JAM': ('Ямбол', 'Jambol'),
-    'TGG': ('Куала-Тренгану', 'Kuala Terengganu'),
-    'IVC': ('Инверкаргилл', 'Invercargill'),
-    'INE': ('Чинде', 'Chinde'),
-    'IMP': ('Императрис', 'Imperatriz'),
-    'ARF': ('Акарируара', 'Acaricuara'),
-    'SGK': ('Сангапи', 'Sangapi'),
-    'WAI': ('Антсоии', 'Antsohihy'),
-    'SGM': ('Сан Игнасио', 'San Ignacio'),
-    'CHV': ('Шавиш', 'Chaves'),
-    'TGI': ('Тинго Мария', 'Tingo Maria'),
-    'LUP': ('Калопапа', 'Kalaupapa'),
-    'INL': ('Интернашенал-Фолс', 'International Falls'),
-    'OKC': ('Оклахома-Сити', 'Oklahoma City'),
-    'SGN': ('Хошимин', 'Ho Chi Minh City'),
-    'INU': ('Науру Айленд', 'Nauru Island'),
-    'KSP': ('Косипе', 'Kosipe'),
-    'INW': ('Уинслоу', 'Winslow'),
-    'IOP': ('Иома', 'Ioma'),
-    'INZ': ('Ин-Салах', 'In Salah'),
-    'AQS': ('Сакани', 'Saqani'),
-    'IOA': ('Янина', 'Ioannina'),
-    'IRC': ('Серкл', 'Circle'),
-    'JAB': ('Джаберу', 'Jabiru'),
-    'XFH': (None, 'Strangnas'),
-    'IOK': ('Иокеа', 'Iokea'),
-    'ATV': ('Ати', 'Ati'),
-    'CJN': ('Эль Каджон', 'El Cajon'),
-    'IOM': ('Остров Мэн', 'Isle Of Man'),
-    'SHP': ('Циньхуандао', 'Qinhuangdao'),
-    'MDP': ('Миндиптана', 'Mindiptana'),
-    'IOW': ('Айова Сити', 'Iowa City'),
-    'OSY': ('Намсус', 'Namsos'),
-    'NDL': ('Нделе', 'Ndele'),
-    'SHY': ('Шиньянга', 'Shinyanga'),
-    'IPT': ('Уильямспорт', 'Williamsport'),
-    'OUE': ('Уессо', 'Ouesso'),
-    'TID': ('Тиарет', 'Tiaret'),
-    'IQN': ('Цинъян', 'Qingyang'),
-    'IQT': ('Икитос', 'Iquitos'),
-    'HEA': ('Герат', 'Herat'),
-    'BVG': ('Берлевог', 'Berlevag'),
-    'FKJ': ('Фукуи', 'Fukui'),
-    'ISU': ('Сулеймания', 'Sulaimaniyah'),
-    'IXB': ('Багдогра', 'Bagdogra'),
-    'LEH': ('Гавр', 'Le Havre'),
-    'MBU': ('Мбамбанакира', 'Mbambanakira'),
-    'SLM': ('Саламанка', 'Salamanca'),
-    'JSU': ('Мантиисок', 'Maniitsoq'),
-    'ITI': ('Итамбакури', 'Itambacuri'),
-    'SLU': ('Кастри', 'Saint Lucia'),
-    'OUN': ('Норман', 'Norman'),
-    'IUE': ('Ниуэ', 'Niue Island'),
-    'SIY': ('Монтагю', 'Montague'),
-    'ISK': ('Нашик', 'Nasik'),
-    'IVO': ('Чиволо', 'Chivolo'),
-    'PBW': ('Палибело', 'Palibelo'),
-    'IUS': ('Инус', 'Inus'),
-    'TJM': ('Тюмень', 'Tyumen'),
-    'NGD': ('Анегада', 'Anegada'),
-    'IVR': ('Инверелл', 'Inverell'),
-    'SJC': ('Сан-Хосе', 'San Jose'),
-    'MID': ('Мерида', 'Merida'),
-    'SKB': ('Сент-Китс', 'Saint Kitts'),
-    'IWD': ('Айронвуд', 'Ironwood'),
-    'IWO': ('Ива Джима Вол', 'Iwo Jima Vol'),
-    'NOT': ('Новато', 'Novato'),
-    'MBJ': ('Монтего-Бей', 'Montego Bay'),
-    'RAB': ('Рабаул', 'Rabaul'),
-    'IXA': ('Агартала', 'Agartala'),
-    'LKD': ('Лейкланд-Даунс', 'Lakeland Downs'),
-    'IXE': ('Мангалур', 'Mangalore'),
-    'LQK': ('Пиккенс', 'Pickens'),
-    'SKC': ('Суки', 'Suki'),
-    'IXI': ('Лакхимпур', 'Lilabari'),
-    'QYM': (None, 'Amersfoort'),
-    'KDS': ('Камаран Даунс', 'Kamaran Downs'),
-    'LIM': ('Лима', 'Lima'),
-    'JAF': ('Джафна', 'Jaffna'),
-    'KAG': ('Каннын', 'Gangneung'),
-    'SOZ': ('Сари-Солензара', 'Solenzara'),
-    'JAK': ('Жакмеле', 'Jacmel'),
-    'SLD': ('Слиач', 'Sliac'),
-    'MQI': ('Куинси', 'Quincy'),
-    'CMC': ('Камосин', 'Camocim'),
-    'JBK': ('Беркли', 'Berkeley'),
-    'THM': ('Томпсон Филд', 'Thompsonfield'),
-    'JED': ('Джидда', 'Jeddah'),
-    'KWK': ('Квигиллингок', 'Kwigillingok'),
-    'MMG': ('Маунт Магнет', 'Mount Magnet'),
-    'LKH': ('Лонг Аках', 'Long Akah'),
-    'OUG': ('Оуахигоуйа', 'Ouahigouya'),
-    'JCY': ('Джонсон', 'Johnson'),
-    'SMN': ('Салмон', 'Salmon'),
-    'MCT': ('Маскат', 'Muscat'),
-    'JEF': ('Джефферсон Сити', 'Jefferson City'),
-    'CSC': ('Канаш', 'Canas'),
-    'JUJ': ('Жужуй', 'Jujuy'),
-    'SMR': ('Санта-Марта', 'Santa Marta'),
-    'JEG': ('Аасиаат', 'Aasiaat'),
-    'JFR': ('Паамиут', 'Paamiut'),
-    'JFN': ('Джефферсон', 'Jefferson'),
-    'JVA': ('Анкавандра', 'Ankavandra'),
-    'JGO': ('Кекертарсуак', 'Qeqertarsuaq'),
-    'MSL': ('Маскл Шолс', 'Muscle Shoals'),
-    'MYM': ('Манки Маунтин', 'Monkey Mountain'),
-    'SNO': ('Саконнакхон', 'Sakon Nakhon'),
-    'JHM': ('Капалуа', 'Kapalua'),
-    'MLT': ('Миллинокет', 'Millinocket'),
-    'JHW': ('Джеймстаун', 'Jamestown'),
-    'KAB': ('Кариба', 'Kariba'),
-    'KAK': ('Кар', 'Kar'),
-    'MEV': ('Минден', 'Minden'),
-    'JIL': ('Цзилинь', 'Jilin'),
-    'JIU': ('Цзюцзян', 'Jiujiang'),
-    'JIW': ('Дживани', 'Jiwani'),
-    'KAM': ('Камаран', 'Kamaran Island'),
-    'KBC': ('Берч Крик', 'Birch Creek'),
-    'IOR': ('Инишмор', 'Inishmore'),
-    'OCV': ('Оканья', 'Ocana'),
-    'MJM': ('Мбужи-Майи', 'Mbuji-Mayi'),
-    'SQV': ('Секим', 'Sequim'),
-    'JLH': ('Арлингтон Хейтс', 'Arlington Heights'),
-    'MMP': ('Момпос', 'Mompos'),
-    'VOZ': ('Воронеж', 'Voronezh'),
-    'KBG': ('Кабалега Фолс', 'Kabalega Falls'),
-    'STS': ('Санта-Роза', 'Santa Rosa'),
-    'KBT': ('Кабен', 'Kaben'),
-    'CCN': ('Чакчаран', 'Chakcharan'),
-    'UAS': ('Самбуру', 'Samburu'),
-    'PPE': ('Пуэрто-Пеньяско', 'Puerto Penasco'),
-    'SVL': ('Савонлинна', 'Savonlinna'),
-    'JMC': ('Саусалито', 'Sausalito'),
-    'KAT': ('Каитаиа', 'Kaitaia'),
-    'JNA': ('Жануария', 'Januaria'),
-    'HLD': ('Хайлар', 'Hailar'),
-    'KPS': ('Кемпси', 'Kempsey'),
-    'JTO': ('Тоусанд Оукс', 'Thousand Oaks'),
-    'JNG': ('Цзинин', 'Jining'),
-    'KAQ': ('Камулаи', 'Kamulai'),
-    'MWY': ('Миранда-Даунс', 'Miranda Downs'),
-    'JNI': ('Хунин', 'Junin'),
-    'MPV': ('Монтпилиер', 'Montpelier'),
-    'SNA': ('Санта-Ана', 'Santa Ana'),
-    'JOI': ('Жоинвили', 'Joinville'),
-    'UMY': ('Сумы', 'Sumy'),
-    'MHF': ('Маричал', 'Morichal'),
-    'JOE': ('Йоэнсуу', 'Joensuu'),
-    'NAJ': ('Нахичевань', 'Nakhichevan'),
-    'JOG': ('Джокьякарта', 'Yogyakarta'),
-    'JSH': ('Ситиа', 'Sitia'),
-    'UOX': ('Оксфорд', 'Oxford'),
-    'JST': ('Джонстаун', 'Johnstown'),
-    'KBB': ('Киркимби', 'Kirkimbie'),
-    'JSY': ('Остров Сирос', 'Syros Island'),
-    'UPN': ('Уруапан', 'Uruapan'),
-    'JTI': ('Джатай', 'Jatai'),
-    'WMV': ('Мадировало', 'Madirovalo'),
-    'DZO': ('Дурасно', 'Durazno'),
-    'SQA': ('Санта Йнез', 'Santa Ynez'),
-    'JSD': ('Стрэдфорд', 'Stratford'),
-    'JON': ('Джонстон Айленд', 'Johnston Island'),
-    'NRG': ('Наррогин', 'Narrogin'),
-    'KAV': ('Каванайен', 'Kavanayen'),
-    'JRK': ('Арсук', 'Arsuk'),
-    'SNM': ('Сан Игнасио Де М', 'San Ignacio De M'),
-    'ROV': ('Ростов-на-Дону', 'Rostov'),
-    'KKI': ('Акиачак', 'Akiachak'),
-    'KAL': ('Калтаг', 'Kaltag'),
-    'OBO': ('Обихиро', 'Obihiro'),
-    'KBE': ('Белл Айленд', 'Bell Island'),
-    'VIN': ('Винница', 'Vinnytsia'),
-    'MXV': ('Морон', 'Moron'),
-    'KBK': ('Залив Клаг', 'Klag Bay'),
-    'WLW': ('Уиллоус', 'Willows'),
-    'DCR': ('Декейтер', 'Decatur'),
-    'KBL': ('Кабул', 'Kabul'),
-    'MJB': ('Меджит', 'Mejit Island'),
-    'VOT': ('Вотупоранга', 'Votuporanga'),
-    'KCE': ('Коллинсвиль', 'Collinsville'),
-    'AUP': ('Агаун', 'Agaun'),
-    'KNJ': ('Киндамба', 'Kindamba'),
-    'JRN': ('Джурена', 'Juruena'),
-    'MKN': ('Малеколон', 'Malekolon'),
-    'NRM': ('Нара', 'Nara'),
-    'XIN': ('Хайлиньнинг', 'Xingning'),
-    'KCK': ('Киренск', 'Kirensk'),
-    'GAD': ('Гадсден', 'Gadsden'),
-    'PRV': ('Преров', 'Prerov'),
-    'WAA': ('Уэльс', 'Wales'),
-    'KCN': ('Чернофски', 'Chernofski'),
-    'KEZ': ('Келания', 'Kelaniya'),
-    'TNZ': ('Тосонцэнгэл', 'Tosontsengel'),
-    'KCS': ('Кингс Крик Стейшн', 'Kings Creek Station'),
-    'KDA': ('Колда', 'Kolda'),
-    'KEK': ('Эквок', 'Ekwok'),
-    'JUB': ('Джуба', 'Juba'),
-    'NMU': ('Наму', 'Namu'),
-    'MTD': ('Маунт Сэндфорд', 'Mount Sandford'),
-    'KEP': ('Непалгандж', 'Nepalganj'),
-    'JYR': ('Джирофт', 'Jiroft'),
-    'KAN': ('Кано', 'Kano'),
-    'GUH': ('Ганнеда', 'Gunnedah'),
-    'KBV': ('Краби', 'Krabi'),
-    'KGO': ('Кировоград', 'Kirovograd'),
-    'ILE': ('Киллин', 'Killeen'),
-    'MZB': ('Мокимбоа Праиа', 'Mocimboa Praia'),
-    'KCA': ('Куча', 'Kuqa'),
-    'ARC': ('Арктик Виллидж', 'Arctic Village'),
-    'OOA': ('Оскалуза', 'Oskaloosa'),
-    'EFB': ('Эйт Фатом Байт', 'Eight Fathom Bight'),
-    'KDQ': ('Камбераторо', 'Kamberatoro'),
-    'KDC': ('Канди', 'Kandi'),
-    'KDT': ('Кампхангсаен', 'Kamphangsaen'),
-    'KDH': ('Кандагар', 'Kandahar'),
-    'ABD': ('Абадан', 'Abadan'),
-    'WGP': ('Вайнгапу', 'Waingapu'),
-    'KEG': ('Кеглшугл', 'Keglsugl'),
-    'ZCL': ('Сакатекас', 'Zacatecas'),
-    'KDY': ('Махавели', 'Mahaweli'),
-    'KIK': ('Киркук', 'Kirkuk'),
-    'BLM': ('Монмут Экзекьютив', 'Belmar - Farmingdale'),
-    'UMI': ('Куинсемил', 'Quincemil'),
-    'KEM': ('Кеми', 'Kemi/Tornio'),
-    'EJT': ('Мили', 'Mili Atoll'),
-    'KGN': ('Касонго-Люнда', 'Kasongo Lunda'),
-    'KDZ': ('Канди', 'Kandy'),
-    'KIH': ('Киш Айленд', 'Kish Island'),
-    'LMS': ('Луисвил', 'Louisville'),
-    'MOZ': ('Муреа', 'Moorea'),
-    'BJI': ('Бемиджи', 'Bemidji'),
-    'HRR': ('Херрера', 'Herrera'),
-    'KEY': ('Керичо', 'Kericho'),
-    'KEJ': ('Кемерово', 'Kemerovo'),
-    'EHL': ('Эль Больсон', 'El Bolson'),
-    'MRD': ('Мерида', 'Merida'),
-    'WSM': ('Уизман', 'Wiseman'),
-    'KHI': ('Карачи', 'Karachi'),
-    'JOH': ('Порт Сант Джонс', 'Port Saint Johns'),
-    'NVA': ('Нейва', 'Neiva'),
-    'KHV': ('Хабаровск', 'Khabarovsk'),
-    'CRC': ('Картаго', 'Cartago'),
-    'BMV': ('Буонметхуот', 'Banmethuot'),
-    'PZY': ('Пьештяны', 'Piestany'),
-    'KHZ': ('Кауэхи', 'Kauehi'),
-    'NGN': ('Наргана', 'Nargana'),
-    'GSY': ('Гримсби', 'Grimsby'),
-    'PBP': ('Пунта Ислита', 'Punta Islita'),
-    'KLN': ('Ларсен Бэй', 'Larsen Bay'),
-    'MSS': ('Массена', 'Massena'),
-    'KER': ('Керман', 'Kerman'),
-    'SXO': ('Сан-Фелис-ду-Арагуая', 'Sao Felix Do Araguaia'),
-    'KSK': ('Карлскуга', 'Karlskoga'),
-    'KGJ': ('Каронга', 'Karonga'),
-    'UVA': ('Ювалд', 'Uvalde'),
-    'AMP': ('Ампанихи', 'Ampanihy'),
-    'KGS': ('Кос', 'Kos'),
-    'LLE': ('Малелане', 'Malelane'),
-    'GBI': ('Большая Багама', 'Grand Bahama'),
-    'XIC': ('Сичан', 'Xichang'),
-    'KGZ': ('Глейшер Крик', 'Glacier Creek'),
-    'XYO': ('Карлсшамн', 'Karlshamn'),
-    'KGW': ('Каджи', 'Kagi'),
-    'YEO': ('Йеавилтон', 'Yeovilton'),
-    'YYL': ('Линн Лейк', 'Lynn Lake'),
-    'YAC': ('оз. Кэт', 'Cat Lake'),
-    'NYE': ('Ниери', 'Nyeri'),
-    'HER': ('Ираклион (Крит)', 'Heraklion'),
-    'KHU': ('Кременчуг', 'Kremenchug'),
-    'KHR': ('Хархорин', 'Kharkhorin'),
-    'OLK': ('Фуэрте Олимпо', 'Fuerte Olimpo'),
-    'SOI': ('Остров Юг Молл', 'South Molle Island'),
-    'KIB': ('Айваноф Бэй', 'Ivanof Bay'),
-    'YCO': ('Куглуктук', 'Kugluktuk/Coppermine'),
-    'RDD': ('Реддинг', 'Redding'),
-    'KIJ': ('Ниигата', 'Niigata'),
-    'YEY': ('Амос', 'Amos'),
-    'BJZ': ('Бадахос', 'Badajoz'),
-    'CLQ': ('Колима', 'Colima'),
-    'KIL': ('Килва', 'Kilwa'),
-    'MPY': ('Марипаула', 'Maripasoula'),
-    'KDD': ('Хуздар', 'Khuzdar'),
-    'HIH': ('Остров Хук', 'Hook Island'),
-    'KIQ': ('Кира', 'Kira'),
-    'OTM': ('Оттамуа', 'Ottumwa'),
-    'MXO': ('Монтиселло', 'Monticello'),
-    'KIR': ('Керри', 'Kerry County'),
-    'KJA': ('Красноярск', 'Krasnojarsk'),
-    'BEZ': ('Беру', 'Beru'),
-    'AWE': ('Алове', 'Alowe'),
-    'YFG': ('Фонтанджес', 'Fontanges'),
-    'MXZ': ('Мэйчжоу', 'Mei Xian'),
-    'KKD': ('Кокода', 'Kokoda'),
-    'KKJ': ('Китакюсю', 'Kitakyushu'),
-    'KLL': ('Левелок', 'Levelock'),
-    'YGK': ('Кингстон', 'Kingston'),
-    'KKK': ('Калакакет', 'Kalakaket'),
-    'MYI': ('Мюррей Айленд', 'Murray Island'),
-    'CKV': ('Кларксвилл', 'Clarksville'),
-    'KKT': ('Кентленд', 'Kentland'),
-    'JAG': ('Джейкобабад', 'Jacobabad'),
-    'MUK': ('Мауке', 'Mauke Island'),
-    'CNK': ('Конкордия', 'Concordia'),
-    'CSU': ('Санта-Крус-ду-Сул', 'Santa Cruz Do Sul'),
-    'KKY': ('Килкенни', 'Kilkenny'),
-    'MZL': ('Манисалес', 'Manizales'),
-    'WUV': ('Вувулу', 'Wuvulu Island'),
-    'KOF': ('Коматипоорт', 'Komatipoort'),
-    'BWS': ('Блейн', 'Blaine'),
-    'SPN': ('Сайпан', 'Saipan'),
-    'MCR': ('Мелкор-Де-Менко', 'Melchor De Menco'),
-    'KLS': ('Келсо', 'Kelso'),
-    'KKZ': ('Као Конг', 'Koh Kong'),
-    'YKI': ('Кенносао Лейк', 'Kennosao Lake'),
-    'NAF': ('Банейна', 'Banaina'),
-    'KLC': ('Каолак', 'Kaolack'),
-    'ACL': ('Агуаклара', 'Aguaclara'),
-    'KLD': ('Тверь', 'Tver'),
-    'YKL': ('Шеффервилл', 'Schefferville'),
-    'KLF': ('Калуга', 'Kaluga'),
-    'AMO': ('Мао', 'Mao'),
-    'KLW': ('Клавок', 'Klawock'),
-    'FMM': ('Мемминген', 'Memmingen'),
-    'KMY': ('Залив Мозер', 'Moser Bay'),
-    'YLA': ('Лангара', 'Langara'),
-    'KLV': ('Карловы Вары', 'Karlovy Vary'),
-    'SKU': ('Скирос', 'Skiros'),
-    'CQD': ('Шехре-Корд', 'Shahre-kord'),
-    'UMD': ('Уумманнак', 'Uummannaq'),
-    'HEE': ('Хелена', 'Helena'),
-    'KMI': ('Миядзаки', 'Miyazaki'),
-    'VEL': ('Вернал', 'Vernal'),
-    'DSV': ('Дансвилл', 'Dansville'),
-    'KML': ('Камилерои', 'Kamileroi'),
-    'AWB': ('Аваба', 'Awaba'),
-    'CMJ': ('Чи Мей', 'Chi Mei'),
-    'YLC': ('Киммирут', 'Kimmirut'),
-    'PTI': ('Порт Дуглас', 'Port Douglas'),
-    'KMP': ('Китмансхуп', 'Keetmanshoop'),
-    'AGU': ('Агуаскальентес', 'Aguascalientes'),
-    'KMQ': ('Комацу', 'Komatsu'),
-    'YLY': ('Лэнгли', 'Langley'),
-    'AER': ('Сочи (Адлер)', 'Adler/Sochi'),
-    'JAU': ('Хауха', 'Jauja'),
-    'KMV': ('Калемьо', 'Kalemyo'),
-    'AHY': ('Амбатолахи', 'Ambatolahy'),
-    'KMZ': ('Каома', 'Kaoma'),
-    'GZW': ('Казвин', 'Ghazvin'),
-    'KNB': ('Канаб', 'Kanab'),
-    'KPB': ('Пойнт Бейкер', 'Point Baker'),
-    'KNE': ('Канейнж', 'Kanainj'),
-    'LAD': ('Луанда', 'Luanda'),
-    'HOO': ('Кваньдук', 'Quanduc'),
-    'NDC': ('Нандед', 'Nanded'),
-    'YMW': ('Маниваки', 'Maniwaki'),
-    'KNF': ('Кингс Линн', 'Kings Lynn'),
-    'RBM': ('Страубинг', 'Straubing'),
-    'YNJ': ('Яньцзи', 'Yanji'),
-    'KNI': ('Катаннинг', 'Katanning'),
-    'CBE': ('Камберленд', 'Cumberland'),
-    'KNK': ('Кахонак', 'Kokhanok'),
-    'KNL': ('Келаноа', 'Kelanoa'),
-    'KNZ': ('Кениеба', 'Kenieba'),
-    'LMB': ('Салима', 'Salima'),
-    'KRB': ('Карамба', 'Karumba'),
-    'WSP': ('Васпан', 'Waspam'),
-    'KNY': ('Киноосао', 'Kinoosao'),
-    'MFC': ('Мафетенг', 'Mafeteng'),
-    'LEB': ('Лебанон', 'Lebanon'),
-    'YPZ': ('Бёрнс Лейк', 'Burns Lake'),
-    'KOI': ('Керкуолл', 'Kirkwall'),
-    'RNN': ('Борнхольм', 'Bornholm'),
-    'KOJ': ('Кагосима', 'Kagoshima'),
-    'YSU': ('Саммерсайд', 'Summerside'),
-    'YQW': ('Север Батлфорд', 'North Battleford'),
-    'LET': ('Летисия', 'Leticia'),
-    'NYK': ('Нанюки', 'Nanyuki'),
-    'LPY': ('Ле-Пюи-ан-Веле', 'Le Puy'),
-    'KON': ('Контум', 'Kontum'),
-    'LRV': ('Лос-Рокес', 'Los Roques'),
-    'CPM': ('Комптон', 'Compton'),
-    'KOP': ('Накхонпханом', 'Nakhon Phanom'),
-    'BUN': ('Буенавентура', 'Buenaventura'),
-    'MAR': ('Маракаибо', 'Maracaibo'),
-    'KOX': ('Коконао', 'Kokonao'),
-    'MAU': ('Маупити', 'Maupiti'),
-    'KOY': ('Ольга Бэй', 'Olga Bay'),
-    'KPA': ('Копиаго', 'Kopiago'),
-    'NCI': ('Некокли', 'Necocli'),
-    'OMR': ('Орадя', 'Oradea'),
-    'KPE': ('Яапсиеи', 'Yapsiei'),
-    'SJW': ('Шицзячжуан', 'Shijiazhuang'),
-    'KPG': ('Курупунг', 'Kurupung'),
-    'SQC': ('Саутерн Кросс', 'Southern Cross'),
-    'BKF': ('Катмай', 'Katmai National Park'),
-    'LAU': ('Лама', 'Lamu'),
-    'MIS': ('Мисима', 'Misima Island'),
-    'MRO': ('Мастертон', 'Masterton'),
-    'ZNU': ('Наму', 'Namu'),
-    'AOC': ('Альтенбург', 'Altenburg'),
-    'KPI': ('Капит', 'Kapit'),
-    'FMU': (None, 'Florence'),
-    'KPM': ('Копиам', 'Kompiam'),
-    'LAI': ('Ланьон', 'Lannion'),
-    'IDY': (None, "Ile d'Yeu"),
-    'KPO': ('Пхохан', 'Pohang'),
-    'MKH': ('Мохотлонг', 'Mokhotlong'),
-    'MJE': ('Маджкин', 'Majkin'),
-    'HCB': ('Шоал Коув', 'Shoal Cove'),
-    'GIY': ('Гияни', 'Giyani'),
-    'KRK': ('Краков', 'Krakow'),
-    'KTQ': ('Китеэ', 'Kitee'),
-    'KRN': ('Кируна', 'Kiruna'),
-    'KUI': ('Кавау', 'Kawau Island'),
-    'TEL': ('Телупид', 'Telupid'),
-    'FIE': ('Фэйр-Айл', 'Fair Isle'),
-    'KRO': ('Курган', 'Kurgan'),
-    'AKW': ('Агаджари', 'Aghajari'),
-    'BJC': ('Брумфилд', 'Broomfield'),
-    'KRT': ('Хартум', 'Khartoum'),
-    'MLC': ('Мак-Алестер', 'Mc Alester'),
-    'KRV': ('Керио Уолли', 'Kerio Valley'),
-    'ZLT': ('Ла Табальере', 'La Tabatiere'),
-    'SQH': ('Сон-Ла', 'Son-La'),
-    'MNY': ('Остров Моно', 'Mono'),
-    'AMG': ('Каравари', 'Amboin'),
-    'CCC': ('Кайо-Коко', 'Cayo Coco'),
-    'KRY': ('Карамай', 'Karamay'),
-    'PBK': ('Пак Крик', 'Pack Creek'),
-    'CAZ': ('Кобар', 'Cobar'),
-    'PBY': ('Пепперс Палм Бэй', 'Peppers Palm Bay'),
-    'YZS': ('Корал-Харбор', 'Coral Harbour'),
-    'KTA': ('Каррата', 'Karratha'),
-    'KSE': ('Касесе', 'Kasese'),
-    'KTD': ('Китадайто', 'Kitadaito'),
-    'KSR': ('Сэнди Ривер', 'Sandy River'),
-    'YYF': ('Пентиктон', 'Penticton'),
-    'PCK': ('Порсупин Крик', 'Porcupine Creek'),
-    'KTH': ('Тикчик', 'Tikchik'),
-    'NKL': ('Нколо', 'Nkolo'),
-    'MTJ': ('Монтроз', 'Montrose'),
-    'KTL': ('Китале', 'Kitale'),
-    'KTN': ('Кетчикан', 'Ketchikan'),
-    'CLJ': ('Клуж', 'Cluj'),
-    'VHZ': ('Вахитахи', 'Vahitahi'),
-    'MVY': ('Мартас-Винъярд', "Martha's Vineyard"),
-    'KTV': ('Камарата', 'Kamarata'),
-    'THO': ('Торсхофн', 'Thorshofn'),
-    'TIG': ('Тингвон', 'Tingwon'),
-    'KUZ': ('Гансан АБ', 'Gunsan AB'),
-    'TKZ': ('Токороа', 'Tokoroa'),
-    'SWQ': ('Сумбава-Бесар', 'Sumbawa Besar'),
-    'AEB': ('Байс', 'Baise'),
-    'KUC': ('Куриа', 'Kuria'),
-    'MPH': ('Катиклан', 'Caticlan'),
-    'ZJG': ('Дженпег', 'Jenpeg'),
-    'MZV': ('Мулу', 'Mulu'),
-    'ZLW': ('Пасир Гуаданг', 'Pasir Gudang'),
-    'KUF': ('Самара', 'Samara'),
-    'BMW': ('Бордж Баджи Мохтар', 'Bordj Badji Mokhtar'),
-    'SXB': ('Страсбург', 'Strasbourg'),
-    'TCF': ('Токоа', 'Tocoa'),
-    'LGQ': ('Лаго-Агрио', 'Lago Agrio'),
-    'HAD': ('Хальмстад', 'Halmstad'),
-    'NEJ': ('Нежхо', 'Nejjo'),
-    'BBK': ('Касане', 'Kasane'),
-    'EAM': ('Неджран', 'Nejran'),
-    'KUS': ('Кулусук', 'Kulusuk'),
-    'KBS': ('Бо', 'Bo'),
-    'KUT': ('Кутаиси', 'Kutaisi'),
-    'LDV': ('Ландивизио', 'Landivisiau'),
-    'ZIE': (None, 'Vulcano'),
-    'SYB': ('Сил Бэй', 'Seal Bay'),
-    'ANO': ('Ангоче', 'Angoche'),
-    'LIE': ('Либенж', 'Libenge'),
-    'SYC': ('Ширингайок', 'Shiringayoc'),
-    'KVG': ('Кавиенг', 'Kavieng'),
-    'KZG': ('Китцинген', 'Kitzingen'),
-    'KYP': ('Кьяукпью', 'Kyaukpyu'),
-    'KVU': ('Королеву', 'Korolevu'),
-    'XOA': (None, 'Aalbaek'),
-    'KWA': ('Кваджалейн', 'Kwajalein'),
-    'SYP': ('Сантьяго', 'Santiago'),
-    'SYR': ('Сиракьюс', 'Syracuse'),
-    'KWB': ('Каримуджава', 'Karimunjawa'),
-    'LKB': ('Лакемба', 'Lakeba'),
-    'ONE': ('Онепусу', 'Onepusu'),
-    'FRB': ('Форбс', 'Forbes'),
-    'KWI': ('Кувейт', 'Kuwait'),
-    'NTN': ('Нормантон', 'Normanton'),
-    'KWN': ('Квинхагак', 'Quinhagak'),
-    'KXK': ('Комсомольск-на-Амуре', 'Komsomolsk Na Amure'),
-    'EEK': ('Ик', 'Eek'),
-    'NTY': ('Сан-Сити', 'Sun City'),
-    'SFX': ('Сан Феликс', 'San Felix'),
-    'KTG': ('Кетапанг', 'Ketapang'),
-    'NUI': ('Нуиксут', 'Nuiqsut'),
-    'KTI': ('Кратьэх', 'Kratie'),
-    'KYE': ('Триполи', 'Tripoli'),
-    'LNP': ('Уайз', 'Wise'),
-    'KZC': ('Компонг-Чхна', 'Kompong-Chhna'),
-    'LBJ': ('Лабуан Баджо', 'Labuan Bajo'),
-    'KYI': ('Яалата Мишн', 'Yalata Mission'),
-    'OGG': ('Кахулуи', 'Kahului'),
-    'KYU': ('Коюкук', 'Koyukuk'),
-    'KTM': ('Катманду', 'Kathmandu'),
-    'NVD': ('Невада', 'Nevada'),
-    'MWG': ('Маравака', 'Marawaka'),
-    'KZD': ('Кракор', 'Krakor'),
-    'LGD': ('Ла Гранде', 'La Grande'),
-    'SHQ': ('Саутпорт', 'Southport'),
-    'BJN': ('Бахоне', 'Bajone'),
-    'KST': ('Кости', 'Kosti'),
-    'GUP': ('Гэллап', 'Gallup'),
-    'LAP': ('Ла-Пас', 'La Paz'),
-    'LNI': ('Лонли', 'Lonely'),
-    'OLA': ('Орленд', 'Orland'),
-    'LAR': ('Ларами', 'Laramie'),
-    'CTQ': ('Санта-Витория', 'Santa Vitoria'),
-    'KTR': ('Кэтрин', 'Katherine'),
-    'AGR': ('Агра', 'Agra'),
-    'AQA': ('Араракуара', 'Araraquara'),
-    'ERQ': ('Элроуз Майн', 'Elrose Mine'),
-    'AON': ('Арон', 'Arona'),
-    'SZR': ('Стара-Загора', 'Stara Zagora'),
-    'TIC': ('Тинак Айленд', 'Tinak Island'),
-    'LBQ': ('Ламбарене', 'Lambarene'),
-    'KUA': ('Куантан', 'Kuantan'),
-    'LOL': ('Лавлок', 'Lovelock'),
-    'LBT': ('Ламбертон', 'Lumberton'),
-    'VCT': ('Виктория', 'Victoria'),
-    'KUJ': ('Кусимото', 'Kushimoto'),
-    'LUB': ('Лумид Пау', 'Lumid Pau'),
-    'SOB': ('Сармеллек', 'Sármellék'),
-    'LOY': ('Лойангалани', 'Loyangalani'),
-    'LCB': ('Понтес-э-Лакерда', 'Pontes e Lacerda'),
-    'LCV': ('Лукка', 'Lucca'),
-    'LCD': ('Луис Тричард', 'Louis Trichardt'),
-    'RFS': ('Росита', 'Rosita'),
-    'LVM': ('Ливингстон', 'Livingston'),
-    'TUK': ('Турбат', 'Turbat'),
-    'TBD': ('Тимбики', 'Timbiqui'),
-    'LDU': ('Лахад-Дату', 'Lahad Datu'),
-    'LCG': ('Ла-Корунья', 'La Coruna'),
-    'EHT': ('Восток Хартфорд', 'East Hartford'),
-    'LCN': ('Балкануна', 'Balcanoona'),
-    'ODD': ('Однадатта', 'Oodnadatta'),
-    'MYH': ('Марбл Каньон', 'Marble Canyon'),
-    'LCR': ('Ла Чоррера', 'La Chorrera'),
-    'KUE': ('Кукунду', 'Kukundu'),
-    'LZR': ('Остров Лайзард', 'Lizard Island'),
-    'LDN': ('Ламиданда', 'Lamidanda'),
-    'LER': ('Леинстер', 'Leinster'),
-    'SSD': ('Сан Филипе', 'San Felipe'),
-    'LDY': ('Дерри', 'Derry'),
-    'MWS': ('Маунт Уилсон', 'Mount Wilson'),
-    'GLI': ('Глен Иннес', 'Glen Innes'),
-    'LEC': ('Ленсойс', 'Lencois'),
-    'OGE': ('Огерананг', 'Ogeranang'),
-    'BNL': ('Барнуэлл', 'Barnwell'),
-    'PSA': ('Пиза', 'Pisa'),
-    'MBH': ('Мэриборо', 'Maryborough'),
-    'MIK': ('Миккели', 'Mikkeli'),
-    'LEG': ('Алег', 'Aleg'),
-    'GAC': ('Грасиас', 'Gracias'),
-    'OHR': ('Вик-ауф-Фёр', 'Wyk Auf Foehr'),
-    'LEI': ('Альмерия', 'Almeria'),
-    'SFV': ('Санта-Фе-ду-Сул', 'Santa Fe Do Sul'),
-    'LEP': ('Леополди', 'Leopoldina'),
-    'DIW': ('Диквелла', 'Dikwella'),
-    'MZF': ('Мзабиа', 'Mzamba(Wild Coast Sun)'),
-    'QFQ': ('Молёй', 'Maloy'),
-    'LEV': ('Бурета', 'Bureta'),
-    'LEZ': ('Ла Эсперанса', 'La Esperanza'),
-    'KHO': ('Кхока Мойа', 'Khoka Moya'),
-    'LFN': ('Луисбург', 'Louisburg'),
-    'XGS': (None, 'Gjerstad'),
-    'PQQ': ('Порт-Маккуори', 'Port Macquarie'),
-    'LFR': ('Ла Фрия', 'La Fria'),
-    'AII': ('Али Сабье', 'Alisabieh'),
-    'SBI': ('Кундара', 'Koundara'),
-    'GVI': ('Грин Ривер', 'Green River'),
-    'RIN': ('Ринги Коув', 'Ringi Cove'),
-    'LGC': ('Лаграндж', 'La Grange'),
-    'QLS': ('Лозанна', 'Lausanne'),
-    'LGR': ('Кочране', 'Cochrane'),
-    'ADH': ('Алдан', 'Aldan'),
-    'LGU': ('Логан', 'Logan'),
-    'KOT': ('Котлик', 'Kotlik'),
-    'LUT': ('Лора Стейшен', 'Laura Station'),
-    'LGY': ('Лагуниллас', 'Lagunillas'),
-    'RNS': ('Ренн', 'Rennes'),
-    'LHB': ('Гавань Лост', 'Lost Harbor'),
-    'GFO': ('Бартика', 'Bartica'),
-    'OPB': ('Залив Опен', 'Open Bay'),
-    'SSS': ('Сиасси', 'Siassi'),
-    'LHV': ('Лок Хейвен', 'Lock Haven'),
-    'LMY': ('Марри', 'Lake Murray'),
-    'SIO': ('Смиттон', 'Smithton'),
-    'LLP': ('Линда-Даунс', 'Linda Downs'),
-    'MEN': ('Манд', 'Mende'),
-    'LIA': ('Лиангпинг', 'Liangping'),
-    'TBS': ('Тбилиси', 'Tbilisi'),
-    'WTS': ('Тзироаномандиди', 'Tsiroanomandidy'),
-    'LIF': ('Лифу', 'Lifou'),
-    'GIF': ('Уинтер Хейвен', 'Winter Haven'),
-    'LIH': ('Кауаи', 'Kauai Island'),
-    'MHI': ('Остров Муша', 'Musha'),
-    'KWT': ('Куитлук', 'Kwethluk'),
-    'UKR': ('Мюкерас', 'Mukeiras'),
-    'LIJ': ('Лонг Айленд', 'Long Island'),
-    'TCI': ('Тенерифе', 'Tenerife'),
-    'RGT': ('Ренгат', 'Rengat'),
-    'LIK': ('Ликиеп', 'Likiep Island'),
-    'AKA': ('Анкан', 'Ankang'),
-    'LPB': ('Ла-Пас', 'La Paz'),
-    'LIT': ('Литл-Рок', 'Little Rock'),
-    'STZ': ('Санта-Терезинья', 'Santa Terezinha'),
-    'ZHU': (None, 'Kreuzlingen'),
-    'NAV': ('Невшехир', 'Nevsehir'),
-    'MRJ': ('Маркала', 'Marcala'),
-    'LKR': ('Лас Хорех', 'Las Khoreh'),
-    'BCZ': ('Бикертон', 'Bickerton Island'),
-    'NBB': ('Барранкоминас', 'Barrancominas'),
-    'LKO': ('Лакхнау', 'Lucknow'),
-    'INJ': ('Инхун', 'Injune'),
-    'DLZ': ('Даланзадгад', 'Dalanzadgad'),
-    'KOU': ('Куламуту', 'Koulamoutou'),
-    'ROX': ('Розо', 'Roseau'),
-    'GXX': ('Йагуа', 'Yagoua'),
-    'MGT': ('Милингимби', 'Milingimbi'),
-    'GSU': ('Гедареф', 'Gedaref'),
-    'RSP': ('Расберри Стрейт', 'Raspberry Strait'),
-    'LMM': ('Лос-Мочис', 'Los Mochis'),
-    'UKY': ('Киото', 'Kyoto'),
-    'LMR': ('Лайм Эйкерс', 'Lime Acres'),
-    'DOX': ('Донгара', 'Dongara'),
-    'LMX': ('Лопез Де Микей', 'Lopez De Micay'),
-    'MBO': ('Мамбурао', 'Mamburao'),
-    'RUN': ('Сен-Дени', 'Saint Denis de la Reunion'),
-    'MIM': ('Меримбула', 'Merimbula'),
-    'UIQ': ('Куини Хилл', 'Quine Hill'),
-    'KMJ': ('Кумамото', 'Kumamoto'),
-    'RWB': ('Залив Рован', 'Rowan Bay'),
-    'LTA': ('Тзанеен', 'Tzaneen'),
-    'LND': ('Ландер', 'Lander'),
-    'INK': ('Уинк', 'Wink'),
-    'OSW': ('Орск', 'Orsk'),
-    'LNG': ('Лесе', 'Lese'),
-    'NFL': (None, 'Fallon'),
-    'TCY': ('Террас Бэй', 'Terrace Bay'),
-    'LNR': ('Лон Рок', 'Lone Rock'),
-    'LNY': ('Ланаи', 'Lanai'),
-    'SVK': ('Силвер Крик', 'Silver Creek'),
-    'KVC': ('Кинг Ков', 'King Cove'),
-    'MJU': ('Мамуджу', 'Mamuju'),
-    'COC': ('Конкордия', 'Concordia'),
-    'TDA': ('Тринидад', 'Trinidad'),
-    'BKJ': ('Боке', 'Boke'),
-    'DZN': ('Жезказган', 'Zhezkazgan'),
-    'BQW': ('Балго Хиллс', 'Balgo Hills'),
-    'CCO': ('Каримагуа', 'Carimagua'),
-    'KWM': ('Кованьяма', 'Kowanyama'),
-    'OZA': ('Озона', 'Ozona'),
-    'LPK': ('Липецк', 'Lipetsk'),
-    'LRM': ('Ла-Романа', 'La Romana'),
-    'LSC': ('Ла-Серена', 'La Serena'),
-    'LPW': ('Литл Порт Уолтер', 'Little Port Walter'),
-    'OYG': ('Мойо', 'Moyo'),
-    'LPX': ('Лиепая', 'Liepaya'),
-    'NDG': ('Цицикар', 'Qiqihar'),
-    'LDG': ('Лешуконское', 'Leshukonskoye'),
-    'BAC': ('Барранка де Упиа', 'Barranca De Upia'),
-    'DNR': ('Динар', 'Dinard'),
-    'LBL': ('Либерал', 'Liberal'),
-    'PHD': ('Нью Филадельфия', 'New Philadelphia'),
-    'LRD': ('Ларедо', 'Laredo'),
-    'LFW': ('Ломе', 'Lome'),
-    'KZS': ('Мейисти', 'Kastellorizo'),
-    'MFT': ('Мачу-Пикчу', 'Machu Picchu'),
-    'LBF': ('Норт-Платт', 'North Platte'),
-    'SML': ('Стелла Марис', 'Stella Maris'),
-    'LAB': ('Лаблэб', 'Lablab'),
-    'YNH': (None, "Hudson's  Hope"),
-    'MGD': ('Магдалена', 'Magdalena'),
-    'LRE': ('Лонгрич', 'Longreach'),
-    'LAC': ('Пуалу Лайаг-Лайанг Айленл', 'Pulau Layang-Layang Island'),
-    'LRG': ('Рануэй', 'Lora Lai'),
-    'THR': ('Тегеран', 'Tehran'),
-    'DCP': (None, 'Cabin Plant'),
-    'LDH': ('Лорд-Хау', 'Lord Howe Island'),
-    'BNC': ('Бени', 'Beni'),
-    'JLS': ('Джалес', 'Jales'),
-    'CTM': ('Четумаль', 'Chetumal'),
-    'RCP': ('Река Синдер', 'Cinder River'),
-    'LEM': ('Леммон', 'Lemmon'),
-    'RBF': ('Биг Бэар', 'Big Bear'),
-    'TAA': ('Тарапаина', 'Tarapaina'),
-    'LRS': ('Лерос', 'Leros'),
-    'TDG': ('Тадаг', 'Tandag'),
-    'MAV': ('Малоэлап', 'Maloelap Island'),
-    'LRT': ('Лорьян', 'Lorient'),
-    'HTZ': ('Ато Коросаль', 'Hato Corozal'),
-    'LSB': ('Лордсберг', 'Lordsburg'),
-    'SOD': ('Сорокаба', 'Sorocaba'),
-    'LUC': ('Лаукала Айленд', 'Laucala Island'),
-    'MHH': ('Марш-Харбор', 'Marsh Harbour'),
-    'LFO': ('Келафо', 'Kelafo'),
-    'LTX': ('Латакунга', 'Latacunga'),
-    'LHN': ('Лишан', 'Lishan'),
-    'LEA': ('Эксмут', 'Learmonth'),
-    'UEE': ('Квинстаун', 'Queenstown'),
-    'SHW': ('Шарура', 'Sharurah'),
-    'LUE': ('Лученец', 'Lucenec'),
-    'ORF': ('Норфолк', 'Norfolk'),
-    'LVD': ('Лайм Виллидж', 'Lime Village'),
-    'LUO': ('Луэна', 'Luena'),
-    'LUR': ('Капе Лисбурн', 'Cape Lisburne'),
-    'HZV': ('Хейзивью', 'Hazyview'),
-    'LGI': ('Дедменс Кей', 'Deadmans Cay'),
-    'LVL': ('Лоренсевилл', 'Lawrenceville'),
-    'MQY': ('Смирна', 'Smyrna'),
-    'BAM': ('Батл Маунтин', 'Battle Mountain'),
-    'LWA': ('Лвбак', 'Lwbak'),
-    'IBL': ('Индиго Бэй Лодж', 'Indigo Bay Lodge'),
-    'LGG': ('Льеж', 'Liege'),
-    'SXR': ('Сринагар', 'Srinagar'),
-    'PCS': ('Пикус', 'Picos'),
-    'SJA': ('Сан Хуан', 'San Juan'),
-    'DER': ('Дерим', 'Derim'),
-    'LCA': ('Ларнака', 'Larnaca'),
-    'LWN': ('Гюмри', 'Gyoumri'),
-    'LWT': ('Льюистаун', 'Lewistown'),
-    'AOA': ('Ароа', 'Aroa'),
-    'BIP': ('Булимба', 'Bulimba'),
-    'TFM': ('Телефомин', 'Telefomin'),
-    'EST': ('Эстервилл', 'Estherville'),
-    'MJG': ('Майаджингуа', 'Mayajigua'),
-    'MKY': ('Маккай', 'Mackay'),
-    'LGH': ('Ли Крик', 'Leigh Creek'),
-    'LXN': ('Лексингтон', 'Lexington'),
-    'TGE': ('Таскджи', 'Tuskegee'),
-    'LXU': ('Лукулу', 'Lukulu'),
-    'OZP': (None, 'Moron'),
-    'GOG': ('Гобабис', 'Gobabis'),
-    'CAF': ('Карауари', 'Carauari'),
-    'OBC': ('Обок', 'Obock'),
-    'PEQ': ('Пекос', 'Pecos City'),
-    'LGM': ('Лаиагам', 'Laiagam'),
-    'MLO': ('Милос', 'Milos'),
-    'MAB': ('Мараба', 'Maraba'),
-    'TGM': ('Тыргу-Муреш', 'Tirgu Mures'),
-    'MME': ('Тиссайд', 'Durham Tees Valley'),
-    'OBI': ('Обидуш', 'Obidos'),
-    'MAP': ('Мамаи', 'Mamai'),
-    'LGS': ('Маларгуэ', 'Malargue'),
-    'XIQ': ('Илиманак', 'Ilimanaq'),
-    'WMA': ('Мандритзара', 'Mandritsara'),
-    'LHI': ('Лерех', 'Lereh'),
-    'MMU': ('Морристаун', 'Morristown'),
-    'MBF': ('Маунт Буффало', 'Mount Buffalo'),
-    'XKM': (None, 'Moss'),
-    'MBS': ('Сагино', 'Saginaw'),
-    'SKN': ('Стокмаркнес', 'Stokmarknes'),
-    'LHP': ('Леху', 'Lehu'),
-    'ING': ('Архентино', 'Lago Argentino'),
-    'MBY': ('Моберли', 'Moberly'),
-    'THE': ('Терезина', 'Teresina'),
-    'DIQ': ('Дивинополис', 'Divinopolis'),
-    'LIG': ('Лимож', 'Limoges'),
-    'SWC': ('Стауэлл', 'Stawell'),
-    'MON': ('Маунт Кук', 'Mount Cook'),
-    'MCD': ('Макино-Сити', 'Mackinac Island'),
-    'MEO': ('Мантео', 'Manteo'),
-    'IVA': ('Амбанжа', 'Ambanja'),
-    'CEH': ('Челинда', 'Chelinda'),
-    'MCJ': ('Майкао', 'Maicao'),
-    'MCK': ('Мак-Кук', 'McCook'),
-    'ENV': ('Уэндовер', 'Wendover'),
-    'MWH': ('Мозес Лейк', 'Moses Lake'),
-    'OUK': ('Аут Скеррис', 'Outer Skerries'),
-    'MCN': ('Макон', 'Macon'),
-    'MDC': ('Манадо', 'Manado'),
-    'MCY': ('Саншайн Кост', 'Sunshine Coast'),
-    'ASG': ('Ашбертон', 'Ashburton'),
-    'GUL': ('Гулберн', 'Goulburn'),
-    'MCZ': ('Масейо', 'Maceio'),
-    'FSI': ('Форт Силл', 'Fort Sill'),
-    'OKG': ('Окуайо', 'Okoyo'),
-    'LIV': ('Ливенгуд', 'Livengood'),
-    'KMB': ('Койнамб', 'Koinambe'),
-    'MQC': ('Микелон', 'Miquelon'),
-    'CFD': ('Брайан', 'Bryan'),
-    'LJG': ('Лицзян', 'Lijiang'),
-    'MQF': ('Магнитогорск', 'Magnitogorsk'),
-    'PJC': ('Педро Хуан Кабальерро', 'Pedro Juan Caballero'),
-    'HUY': ('Хамберсайд', 'Humberside'),
-    'MCG': ('Макграт', 'McGrath'),
-    'MDU': ('Менди', 'Mendi'),
-    'LKA': ('Ларантука', 'Larantuka'),
-    'MED': ('Медина', 'Madinah'),
-    'MSM': ('Мази-Манимба', 'Masi Manimba'),
-    'EUQ': (None, 'Antique'),
-    'CDK': ('Сидар Ки', 'Cedar Key'),
-    'LKC': ('Лекана', 'Lekana'),
-    'MRE': ('Масаи-Мара', 'Mara Lodges'),
-    'PMK': ('Палм Айленд', 'Palm Island'),
-    'MEF': ('Мельфи', 'Melfi'),
-    'MOV': ('Моранба', 'Moranbah'),
-    'MEH': ('Мехамн', 'Mehamn'),
-    'LKL': ('Лаксэльв', 'Lakselv'),
-    'MEI': ('Меридиан', 'Meridian'),
-    'LKU': ('оз. Туркана', 'Lake Rudolf'),
-    'BDN': ('Бадин', 'Badin'),
-    'PRP': ('Проприано', 'Propriano'),
-    'MEK': ('Мекнес', 'Meknes'),
-    'LSL': ('Лос Чилес', 'Los Chiles'),
-    'MSD': ('Маунт Плезант', 'Mount Pleasant'),
-    'BKO': ('Бамако', 'Bamako'),
-    'MEW': ('Мвека', 'Mweka'),
-    'FKI': ('Кисангани', 'Kisangani'),
-    'YHA': ('Порт Хоп Симпсон', 'Port Hope Simpson'),
-    'LLG': ('Чиллаго', 'Chillagoe'),
-    'MSH': ('Масирах', 'Masirah'),
-    'HSL': ('Хуслия', 'Huslia'),
-    'MSW': ('Массауа', 'Massawa'),
-    'MFI': ('Маршфилд', 'Marshfield'),
-    'BFJ': ('Бицзе', 'Bijie'),
-    'LWS': ('Льюистон', 'Lewiston'),
-    'XWX': (None, 'Nassjo'),
-    'THL': ('Тачилек', 'Tachilek'),
-    'MFM': ('Макао', 'Macau'),
-    'CDL': ('Кэндл', 'Candle'),
-    'HYV': ('Хювинкяя', 'Hyvinkaa'),
-    'PZU': ('Порт-Судан', 'Port Sudan'),
-    'MGI': ('Мастагорда Айленд', 'Matagorda Island'),
-    'XHL': (None, 'Nelaug'),
-    'CFV': ('Коффивилл', 'Coffeyville'),
-    'GVP': ('Гринвейл', 'Greenvale'),
-    'RBA': ('Рабат', 'Rabat'),
-    'IHN': ('Кьюшн', 'Qishn'),
-    'SPA': ('Спартанберг', 'Spartanburg'),
-    'NEK': ('Некемт', 'Nekemt'),
-    'MHN': ('Муллен', 'Mullen'),
-    'CMQ': ('Клермонт', 'Clermont'),
-    'NAN': ('Нанди', 'Nadi'),
-    'LSH': ('Лаша', 'Lashio'),
-    'CJH': ('оз. Чилко', 'Chilko Lake'),
-    'NOZ': ('Новокузнецк', 'Novokuznetsk'),
-    'MJD': ('Мохонджондаро', 'Mohenjodaro'),
-    'RDS': ('Ринкон де Лос Саусес', 'Rincon de los Sauces'),
-    'MIJ': ('Мили', 'Mili Island'),
-    'BQO': ('Буна', 'Bouna'),
-    'RJB': ('Раджбирадж', 'Rajbiraj'),
-    'REP': ('Сиемреап', 'Siem Reap'),
-    'KGG': ('Кедугу', 'Kedougou'),
-    'GGN': ('Ганьоа', 'Gagnoa'),
-    'SXN': ('Сова', 'Suapan'),
-    'LNQ': ('Лоани', 'Loani'),
-    'MVU': ('Масгрейв', 'Musgrave'),
-    'MIR': ('Монастир', 'Monastir'),
-    'TIA': ('Тирана', 'Tirana'),
-    'ERV': ('Керрвилл', 'Kerrville'),
-    'RHI': ('Райнлендер', 'Rhinelander'),
-    'MJX': ('Томс Ривер', 'Toms River'),
-    'LOA': ('Лоррани', 'Lorraine'),
-    'MVZ': ('Машвинго', 'Masvingo'),
-    'NNY': ('Наньян', 'Nanyang'),
-    'MKK': ('Каунакакаи', 'Hoolehua'),
-    'LOB': ('Лос Анд', 'Los Andes'),
-    'MWE': ('Мерове', 'Merowe'),
-    'LOZ': ('Лондон', 'London'),
-    'VCV': ('Викторвилль', 'Victorville'),
-    'MWF': ('Маэво', 'Maewo'),
-    'LPQ': ('Луангпхабанг', 'Luang Prabang'),
-    'AWZ': ('Ахваз', 'Ahwaz'),
-    'SUD': ('Страуд', 'Stroud'),
-    'MLF': ('Милфорд', 'Milford'),
-    'MXT': ('Мэнтирано', 'Maintirano'),
-    'CVU': ('Остров Корву', 'Corvo Island (Azores)'),
-    'MLP': ('Малабанг', 'Malabang'),
-    'FUT': ('Футуна', 'Futuna Island'),
-    'LPT': ('Лампанг', 'Lampang'),
-    'DCT': ('Дункан Таун', 'Duncan Town'),
-    'JAS': ('Джаспер', 'Jasper'),
-    'MLU': ('Монро', 'Monroe'),
-    'DLY': ('Диллонс Бэй', 'Dillons Bay'),
-    'MXA': ('Манила', 'Manila'),
-    'IBI': ('Ибоки', 'Iboki'),
-    'MNG': ('Манингрида', 'Maningrida'),
-    'MNH': ('Хингеракгода', 'Minneriya'),
-    'XMA': ('Марамаг', 'Maramag'),
-    'PFR': ('Илебо', 'Ilebo'),
-    'MXH': ('Моро', 'Moro'),
-    'NLG': ('Нельсон Лагун', 'Nelson Lagoon'),
-    'OZG': ('Загора', 'Zagora'),
-    'OBT': ('Окленд', 'Oakland'),
-    'LQM': ('Пуэрто Легисамо', 'Puerto Leguizamo'),
-    'MJY': ('Манганжайя', 'Mangunjaya'),
-    'BON': ('Бонэйр', 'Bonaire'),
-    'FGR': ('Фуэнхирола', 'Fuengirola'),
-    'MXL': ('Мехикали', 'Mexicali'),
-    'LQN': ('Куала Нау', 'Qala Nau'),
-    'SYW': ('Сехвен Шариф', 'Sehwen Sharif'),
-    'MNK': ('Маиана', 'Maiana'),
-    'BRU': ('Брюссель', 'Brussels'),
-    'TLK': ('Талакан', 'Talakan'),
-    'MWX': ('Муан', 'Gwangju'),
-    'LLY': ('Маунт Холли', 'Mount Holly'),
-    'MXN': ('Морле', 'Morlaix'),
-    'SSJ': ('Саннесшёэн', 'Sandnessjoen'),
-    'MNL': ('Манила', 'Manila'),
-    'AJL': ('Аиджал', 'Aizawl'),
-    'BLW': ('Уэйманало', 'Waimanalo'),
-    'SAK': ('Сёйдауркроукюр', 'Saudarkrokur'),
-    'QYT': (None, 'Paterswolde'),
-    'MNU': ('Моламьяйн', 'Maulmyine'),
-    'NNG': ('Наньнин', 'Nanning'),
-    'MYP': ('Мару', 'Mary'),
-    'KOZ': ('Оузинки', 'Ouzinkie'),
-    'STE': ('Стивенс Пойнт', 'Stevens Point'),
-    'FNH': ('Финча', 'Fincha'),
-    'MOB': ('Мобил', 'Mobile'),
-    'MZG': ('Магун', 'Makung'),
-    'ITO': ('Хило', 'Hilo'),
-    'BHH': ('Биша', 'Bisha'),
-    'OLN': ('Сармьенто', 'Colonia Sarmiento'),
-    'MOQ': ('Мурундава', 'Morondava'),
-    'MZH': ('Амасья', 'Merzifon'),
-    'MYU': ('Мекорьюк', 'Mekoryuk'),
-    'LTC': ('Лаи', 'Lai'),
-    'SZQ': ('Саенз Пена', 'Saenz Pena'),
-    'DIY': ('Диярбакыр', 'Diyarbakir'),
-    'MPN': ('Маунт Плезант', 'Mount Pleasant'),
-    'LTK': ('Латакия', 'Latakia'),
-    'MZT': ('Масатлан', 'Mazatlan'),
-    'MPU': ('Мапуа', 'Mapua'),
-    'XPF': (None, 'Penrith'),
-    'FRQ': ('Ферамин', 'Feramin'),
-    'TAK': ('Такамацу', 'Takamatsu'),
-    'GAW': ('Ганав', 'Gangaw'),
-    'MXY': ('Маккарти', 'Mccarthy'),
-    'MRA': ('Мисрата', 'Misurata'),
-    'OML': ('Омкалай', 'Omkalai'),
-    'NAP': ('Неаполь', 'Naples'),
-    'MRK': ('Марко Айленд', 'Marco Island'),
-    'PHF': ('Ньюпорт-Ньюс', 'Newport News'),
-    'PGG': (None, 'Progresso'),
-    'LUA': ('Лукла', 'Lukla'),
-    'SDE': ('Сантьяго-дель-Эстеро', 'Santiago Del Estero'),
-    'MRN': ('Моргантон', 'Morganton'),
-    'GII': ('Сигири', 'Siguiri'),
-    'LUU': ('Лаура', 'Laura'),
-    'HIL': ('Шилаво', 'Shillavo'),
-    'ZPM': (None, 'Regensburg'),
-    'MPA': ('Мпача', 'Mpacha'),
-    'PVR': ('Пуэрто-Вальярта', 'Puerto Vallarta'),
-    'XRH': (None, 'Richmond'),
-    'MSF': ('Маунт Сван', 'Mount Swan'),
-    'TJV': ('Тханджавур', 'Thanjavur'),
-    'LVB': ('Ливраменто', 'Livramento'),
-    'NBV': ('Гана Брава', 'Cana Brava'),
-    'ZSI': (None, 'Sassnitz'),
-    'LBV': ('Либревиль', 'Libreville'),
-    'MTB': ('Монте Либано', 'Monte Libano'),
-    'LIX': ('Остров Ликома', 'Likoma Island'),
-    'NDD': ('Сумбе', 'Sumbe'),
-    'APS': ('Аполис', 'Anapolis'),
-    'MTF': ('Мизан Тефери', 'Mizan Teferi'),
-    'NFG': ('Нефтеюганск', 'Nefteyugansk'),
-    'MTW': ('Манитовок', 'Manitowoc'),
-    'TKA': ('Талкитна', 'Talkeetna'),
-    'GJM': ('Гуажара-Мирин', 'Guajara-Mirim'),
-    'LXS': ('Лемнос', 'Limnos'),
-    'ORM': ('Норсамптон', 'Northampton'),
-    'NEG': ('Негрил', 'Negril'),
-    'MUB': ('Маун', 'Maun'),
-    'OAG': ('Ориндж', 'Orange'),
-    'TKE': ('Танаки Спрингс', 'Tenakee Springs'),
-    'GOE': ('Гоналия', 'Gonalia'),
-    'WNR': ('Уиндора', 'Windorah'),
-    'CUD': ('Калундра', 'Caloundra'),
-    'LZN': ('Нанган', 'Nangan'),
-    'LYR': ('Лонгйир', 'Longyearbyen'),
-    'NHF': ('Нью Халифа', 'New Halfa'),
-    'PIV': ('Пирапора', 'Pirapora'),
-    'NIG': ('Никунау', 'Nikunau'),
-    'LZI': ('Люозь', 'Luozi'),
-    'VAF': ('Валанс', 'Valence'),
-    'DLI': ('Далат', 'Dalat'),
-    'MUX': ('Мултан', 'Multan'),
-    'MAA': ('Ченнай', 'Chennai'),
-    'MUZ': ('Мусома', 'Musoma'),
-    'MFD': ('Мэнсфилд', 'Mansfield'),
-    'OVS': ('Советский', 'Sovetsky'),
-    'NKG': ('Нанкин', 'Nanjing'),
-    'MVM': ('Кайента', 'Kayenta'),
-    'BGQ': ('Биг Лейк', 'Big Lake'),
-    'OXC': ('Оксфорд', 'Oxford'),
-    'GNZ': ('Ганзи', 'Ghanzi'),
-    'MAY': ('Мангрове Кей', 'Mangrove Cay'),
-    'TKX': ('Такароа', 'Takaroa'),
-    'MVX': ('Минвоул', 'Minvoul'),
-    'NGE': ('Нгаундере', 'Ngaoundéré'),
-    'TLA': ('Теллер', 'Teller'),
-    'KMK': ('Макабана', 'Makabana'),
-    'NMS': ('Нансанг', 'Namsang'),
-    'THB': ('Таба-Цека', 'Thaba-Tseka'),
-    'JNX': ('Наксос', 'Naxos, Cyclades Islands'),
-    'MWA': ('Марион', 'Marion'),
-    'MBL': ('Манисти', 'Manistee'),
-    'GRP': ('Гурупи', 'Gurupi'),
-    'MWO': ('Мидлтаун', 'Middletown'),
-    'OIA': ('Ориландия', 'Ourilandia'),
-    'OCI': ('Ошеник', 'Oceanic'),
-    'MWQ': ('Магуэ', 'Magwe'),
-    'PCH': ('Палакиос', 'Palacios'),
-    'MWU': ('Остров Массау', 'Mussau'),
-    'TDN': ('Теда', 'Theda'),
-    'DDI': ('Дейдрим Айленд', 'Daydream Island'),
-    'SWP': ('Свакопмунд', 'Swakopmund'),
-    'TLN': ('Тулон', 'Toulon'),
-    'NVR': ('Новгород', 'Novgorod'),
-    'NOI': ('Новороссийск', 'Novorossijsk'),
-    'MCA': ('Масента', 'Macenta'),
-    'MYG': ('Маягуана', 'Mayaguana'),
-    'NOO': ('Наоро', 'Naoro'),
-    'XIO': (None, 'St Marys'),
-    'IMT': ('Айрон-Маунтин', 'Iron Mountain'),
-    'MCQ': ('Мишкольц', 'Miskolc'),
-    'MYR': ('Миртл-Бич', 'Myrtle Beach'),
-    'FTX': ('Овандо', 'Owando'),
-    'HAF': ('Халф Мун Бэй', 'Half Moon'),
-    'SNG': ('Сан Игнасио Де Веласко', 'San Ignacio De Velasco'),
-    'TET': ('Тете', 'Tete'),
-    'TER': ('Терсейра', 'Terceira'),
-    'MFR': ('Медфорд', 'Medford'),
-    'NQL': ('Никеландия', 'Niquelandia'),
-    'DPG': ('Дагвей', 'Dugway'),
-    'MYT': ('Мьичина', 'Myitkyina'),
-    'PAW': ('Памбва', 'Pambwa'),
-    'ODR': ('Орд Ривер', 'Ord River'),
-    'MZZ': ('Мэрион', 'Marion'),
-    'HHZ': ('Хикуэру', 'Hikueru'),
-    'MDO': ('Мидлтон Айленд', 'Middleton Island'),
-    'LAG': ('Ла Гуаира', 'La Guaira'),
-    'PBG': ('Платтсбург', 'Plattsburgh'),
-    'XWB': (None, 'Stirling'),
-    'NAG': ('Нагпур', 'Nagpur'),
-    'GZP': ('Алания', 'Gazipasa'),
-    'HWA': ('Хавабанго', 'Hawabango'),
-    'TLV': ('Тель-Авив', 'Tel Aviv-Yafo'),
-    'NAX': ('Каполей', 'Kapolei'),
-    'NAI': ('Аннаи', 'Annai'),
-    'NBO': ('Найроби', 'Nairobi'),
-    'FTA': ('Футуна', 'Futuna Island'),
-    'NDI': ('Намуди', 'Namudi'),
-    'NCL': ('Ньюкасл', 'Newcastle'),
-    'SXX': ('Сан-Фелис-ду-Шингу', 'Sao Felix Do Xingu'),
-    'SHR': ('Шеридан', 'Sheridan'),
-    'ICK': ('Ньив-Никкери', 'Nieuw Nickerie'),
-    'KPL': ('Капал', 'Kapal'),
-    'SHT': ('Шеппартон', 'Shepparton'),
-    'NVI': ('Навои', 'Navoi'),
-    'MDQ': ('Мар-дель-Плата', 'Mar Del Plata'),
-    'TGS': ('Чокве', 'Chokwe'),
-    'JIP': ('Хипихапа', 'Jipijapa'),
-    'DEP': ('Депаризо', 'Deparizo'),
-    'BDH': ('Бандар-Ленге', 'Bandar Lengeh'),
-    'JCH': ('Касигианнгуит', 'Qasigiannguit'),
-    'MDR': ('Медфра', 'Medfra'),
-    'VRS': ('Версаль', 'Versailles'),
-    'LYX': ('Лидд', 'Lydd'),
-    'GXY': ('Грили', 'Greeley'),
-    'NER': ('Нерюнгри', 'Neryungri'),
-    'NOC': ('Нок', 'Knock'),
-    'THQ': ('Цзяншуй', 'Tianshui'),
-    'AMZ': ('Ардмор', 'Ardmore'),
-    'OBL': ('Зоерсел', 'Zoersel'),
-    'QUL': (None, 'Ulm'),
-    'JWA': ('Дваненг', 'Jwaneng'),
-    'MVD': ('Монтевидео', 'Montevideo'),
-    'SZY': ('Шимани', 'Szymany'),
-    'HOY': ('Хой-Айленд', 'Hoy Island'),
-    'AQB': ('Киче', 'Quiche'),
-    'KCB': ('Касикасима', 'Kasikasima'),
-    'KCC': ('Кофман Ков', 'Coffman Cove'),
-    'OBD': ('Обано', 'Obano'),
-    'MEA': ('Макаэ', 'Macae'),
-    'ZWN': (None, 'Wittenberge'),
-    'TME': ('Таме', 'Tame'),
-    'UCC': ('Юкка Флет', 'Yucca Flat'),
-    'MRP': ('Марла', 'Marla'),
-    'MET': ('Моретон', 'Moreton'),
-    'EUO': ('Паратебуэно', 'Paratebueno'),
-    'UEN': (None, 'Urengoy'),
-    'MEG': ('Маланже', 'Melanje'),
-    'UUD': ('Улан-Удэ', 'Ulan-Ude'),
-    'MEY': ('Мегхаули', 'Meghauli'),
-    'OBM': ('Моробе', 'Morobe'),
-    'MEZ': ('Мусина', 'Messina'),
-    'USM': ('Самуи', 'Koh Samui'),
-    'OBX': ('Обо', 'Obo'),
-    'OCA': ('Ошен Риф Клаб', 'Ocean Reef'),
-    'SQB': ('Санта Ана', 'Santa Ana'),
-    'MFH': ('Мескит', 'Mesquite'),
-    'NOV': ('Уамбо', 'Huambo'),
-    'POO': ('Посус-ди-Калдас', 'Pocos De Caldas'),
-    'NIE': ('Ниблэк', 'Niblack'),
-    'SWT': ('Стрежевой', 'Strezhevoy'),
-    'MFL': ('Маунс Фулл Стоп', 'Mount Full Stop'),
-    'OCW': ('Вашингтон', 'Washington'),
-    'HDY': ('Хатъяй', 'Hat Yai'),
-    'IGE': ('Игуэла', 'Iguela'),
-    'IEJ': ('Иеджима', 'Iejima'),
-    'SWR': ('Силер', 'Silur'),
-    'NIR': ('Бивилль', 'Beeville'),
-    'NDR': ('Надор', 'Nador'),
-    'RPB': ('Ропер Бар', 'Roper Bar'),
-    'KNP': ('Капанда', 'Capanda'),
-    'EDR': ('Эдуард Ривер', 'Edward River'),
-    'GRA': ('Гамарра', 'Gamarra'),
-    'GTG': ('Грантсберг', 'Grantsburg'),
-    'KPV': ('Перривилл', 'Perryville'),
-    'NWH': ('Ньюпорт', 'Newport'),
-    'ONQ': ('Зонгулдак', 'Zonguldak'),
-    'NLC': ('Лемур', 'Lemoore'),
-    'KRF': ('Крамфорс', 'Kramfors'),
-    'OGA': ('Огаллала', 'Ogallala'),
-    'XWV': (None, 'Varberg'),
-    'NMA': ('Наманган', 'Namangan'),
-    'MOJ': ('Моенго', 'Moengo'),
-    'MBI': ('Мбея', 'Mbeya'),
-    'EKA': ('Эврика', 'Eureka'),
-    'LAK': ('Аклавик', 'Aklavik'),
-    'MGA': ('Манагуа', 'Managua'),
-    'HNG': ('Ианген', 'Hienghene'),
-    'MGE': ('Мариетта', 'Marietta'),
-    'NOB': ('Носара Бич', 'Nosara Beach'),
-    'OKR': ('Острова Йорк', 'Yorke Island'),
-    'LGP': ('Легаспи', 'Legaspi'),
-    'VDY': (None, 'Vidyanagar'),
-    'OLD': ('Олд Таун', 'Old Town'),
-    'MGF': ('Маринга', 'Maringa'),
-    'WKR': (None, "Walker's Cay"),
-    'TIN': ('Тиндуф', 'Tindouf'),
-    'OLM': ('Олимпия', 'Olympia'),
-    'MGG': ('Маргарима', 'Margarima'),
-    'MGH': ('Маргит', 'Margate'),
-    'AST': ('Астория', 'Astoria'),
-    'TIP': ('Триполи', 'Tripoli'),
-    'ISM': ('Киссимми', 'Kissimmee'),
-    'NOJ': ('Ноябрьск', 'Nojabrxsk'),
-    'MGP': ('Манга', 'Manga'),
-    'BGJ': ('Боргарфьордур-Эйстри', 'Borgarfjordur Eystri'),
-    'TIY': ('Тиджикжа', 'Tidjikja'),
-    'KTW': ('Катовице', 'Katowice'),
-    'NIT': ('Ньор', 'Niort'),
-    'LHK': ('Гуангхуа', 'Guanghua'),
-    'BCP': ('Бамбу', 'Bambu'),
-    'MFZ': ('Месалиа', 'Mesalia'),
-    'BMQ': ('Бамбури', 'Bamburi'),
-    'KOC': ('Кумак', 'Koumac'),
-    'LAY': ('Ледисмит', 'Ladysmith'),
-    'OMB': ('Омбуэ', 'Omboue'),
-    'TJG': ('Танджунг Варукин', 'Tanjung Warukin'),
-    'PKG': ('Пангкор', 'Pangkor'),
-    'ZIX': ('Жиганск', 'Zhigansk'),
-    'MTV': ('Мота-Лава', 'Mota Lava'),
-    'NQY': ('Ньюквей', 'Newquay'),
-    'NRD': ('Нордерней', 'Norderney'),
-    'TNU': ('Ньютон', 'Newton'),
-    'MPX': ('Миянмин', 'Miyanmin'),
-    'MGV': ('Маргарет Ривер Стейшн', 'Margaret River Station'),
-    'OMS': ('Омск', 'Omsk'),
-    'UYU': ('Уюни', 'Uyuni'),
-    'NRI': ('Шангри-Ла', 'Shangri-la'),
-    'TNV': ('Табуаэран', 'Tabuaeran'),
-    'NSV': ('Нузавилл', 'Noosaville'),
-    'ONL': ("О'нейлл", 'Oneill'),
-    'NRL': ('Норт-Рональдсей', 'North Ronaldsay'),
-    'TOV': ('Тортола', 'Tortola'),
-    'BXF': ('Бельбурн', 'Belburn'),
-    'ONR': ('Монкира', 'Monkira'),
-    'MIT': ('Шафтер', 'Shafter'),
-    'BHZ': ('Белу-Оризонти', 'Belo Horizonte'),
-    'OOT': ('Онотоа', 'Onotoa'),
-    'MHQ': ('Мариехамн', 'Mariehamn'),
-    'ZHY': ('Чжунвэй', 'Zhongwei'),
-    'NWI': ('Норидж', 'Norwich'),
-    'NRR': ('Русвейт Роудз', 'Roosevelt Roads'),
-    'MRV': ('Минеральные Воды', 'Mineralnye Vody'),
-    'RGE': ('Поргера', 'Porgera'),
-    'MPC': ('Муко-Муко', 'Muko-Muko'),
-    'NDN': ('Надунуму', 'Nadunumu'),
-    'SGG': ('Симангганг', 'Simanggang'),
-    'JUO': ('Джурадо', 'Jurado'),
-    'OPU': ('Балимо', 'Balimo'),
-    'MJJ': ('Моки', 'Moki'),
-    'NSK': ('Норильск', "Noril'sk"),
-    'LRK': ('Линкольн Рок', 'Lincoln Rock'),
-    'MJL': ('Муиа', 'Mouila'),
-    'THY': ('Тхохояндоу', 'Thohoyandou'),
-    'RON': ('Рондон', 'Rondon'),
-    'TOQ': ('Токопилья', 'Tocopilla'),
-    'FMO': ('Мюнстер', 'Muenster'),
-    'NUG': ('Нукуриа', 'Nuguria'),
-    'FIH': ('Киншаса', 'Kinshasa'),
-    'TKV': ('Татакото', 'Tatakoto'),
-    'MKG': ('Маскегон', 'Muskegon'),
-    'BBW': ('Брокен Боу', 'Broken Bow'),
-    'NUJ': ('Ноджех', 'Nojeh'),
-    'RBB': ('Борба', 'Borba'),
-    'NUL': ('Нулато', 'Nulato'),
-    'XGA': ('Гава', 'Gaoua'),
-    'SUY': ('Сунтар', 'Suntar'),
-    'NUS': ('Норсуп', 'Norsup'),
-    'SZK': ('Скукуза', 'Skukuza'),
-    'OLJ': ('Олпои', 'Olpoi'),
-    'MKT': ('Манкейто', 'Mankato'),
-    'OTA': ('Мота', 'Mota'),
-    'YLG': ('Ялгу', 'Yalgoo'),
-    'ORB': ('Эребру', 'Orebro'),
-    'NCH': ('Начингвеа', 'Nachingwea'),
-    'AVK': ('Арвайхэр', 'Arvaikheer'),
-    'NUX': ('Новый Уренгой', 'Novyj Urengoj'),
-    'DRG': ('Диринг', 'Deering'),
-    'DEL': ('Дели', 'Delhi'),
-    'OAX': ('Оахака', 'Oaxaca'),
-    'TLP': ('Тамолбил', 'Tumolbil'),
-    'MKV': ('Маунт Кавенаг', 'Mount Cavenagh'),
-    'PHL': ('Филадельфия', 'Philadelphia'),
-    'QLU': ('Люблин', 'Lublin'),
-    'ODS': ('Одесса', 'Odessa'),
-    'CIE': ('Колли', 'Collie'),
-    'TPR': ('Том Прайс', 'Tom Price'),
-    'ODY': ('Сай', 'Oudomxay'),
-    'YXT': ('Террас', 'Terrace'),
-    'OEL': ('Орел', 'Orel'),
-    'MMI': ('Атина', 'Athens'),
-    'MMJ': ('Мацумото', 'Matsumoto'),
-    'TRL': ('Террелл', 'Terrell'),
-    'WIE': ('Вайсбаден', 'Wiesbaden'),
-    'RCY': ('Рам-Ки', 'Rum Cay'),
-    'BMZ': ('Баму', 'Bamu'),
-    'MML': ('Маршалл', 'Marshall'),
-    'MMN': ('Стоу', 'Stow'),
-    'ENN': ('Ненана', 'Nenana'),
-    'CKI': ('Крокер', 'Croker Island'),
-    'ROY': ('Рио Майо', 'Rio Mayo'),
-    'COZ': ('Констанция', 'Constanza'),
-    'MJQ': ('Джексон', 'Jackson'),
-    'OMC': ('Ормок', 'Ormoc'),
-    'CDY': ('Кагаян-де-Сулу', 'Cagayan De Sulu'),
-    'OHC': ('Норсист Кейп', 'Northeast Cape'),
-    'KOL': ('Коумала', 'Koumala'),
-    'BOO': ('Будё', 'Bodo'),
-    'MJS': ('Манганйа Да Коста', 'Maganja Da Costa'),
-    'TPL': ('Темпл', 'Temple'),
-    'ABA': ('Абакан', 'Abakan'),
-    'MMS': ('Маркс', 'Marks'),
-    'OGZ': ('Владикавказ', 'Vladikavkaz'),
-    'UTH': ('Удонтхани', 'Udon Thani'),
-    'HIN': ('Чинджу', 'Jinju'),
-    'OHD': ('Охрид', 'Ohrid'),
-    'HSM': ('Хоршам', 'Horsham'),
-    'PUX': ('Пуэрто-Варас', 'Puerto Varas'),
-    'MLZ': ('Мел', 'Melo'),
-    'ZGN': ('Жонгшан', 'Zhongshan'),
-    'MNM': ('Меномини', 'Menominee'),
-    'NLS': ('Николсон', 'Nicholson'),
-    'HBO': ('Гумбольдт', 'Humboldt'),
-    'RMA': ('Рома', 'Roma'),
-    'OLH': ('Олд Харбор', 'Old Harbor'),
-    'TSG': ('Танакросс', 'Tanacross'),
-    'MNV': ('Маунтен Валлей', 'Mountain Valley'),
-    'SNN': ('Шаннон', 'Shannon'),
-    'MNZ': ('Манассас', 'Manassas'),
-    'LRQ': ('Лори Ривер', 'Laurie River'),
-    'LLH': ('Лас Лимас', 'Las Limas'),
-    'YCC': ('Корнуолл', 'Cornwall'),
-    'DBB': ('Дабаа Сити', 'Dabaa City'),
-    'UCA': ('Ютика', 'Utica'),
-    'MNW': ('Макдональд-Даунс', 'Macdonald Downs'),
-    'VBY': ('Висбю', 'Visby'),
-    'MOC': ('Монтис-Кларус', 'Montes Claros'),
-    'PPI': ('Порт Пири', 'Port Pirie'),
-    'WRI': ('Врайтстоун', 'Wrightstown'),
-    'OUM': ('Оум Хаджер', 'Oum Hadjer'),
-    'HAE': ('Хавасупай', 'Havasupai'),
-    'NTQ': ('Вадзима', 'Wajima'),
-    'XMY': ('Ям Айленд', 'Yam Island'),
-    'OLO': ('Оломоуц', 'Olomouc'),
-    'MOF': ('Маумере', 'Maumere'),
-    'MOG': ('Монг Хсат', 'Mong Hsat'),
-    'PKD': ('Парк-Рапидс', 'Park Rapids'),
-    'CHQ': ('Ханья', 'Chania'),
-    'OMH': ('Урмия', 'Nazluy-ye Jonubi'),
-    'PXO': ('Порту-Санту', 'Porto Santo (Madeira)'),
-    'KET': ('Чёнгтун', 'Keng Tung'),
-    'BNI': ('Бенин-Сити', 'Benin City'),
-    'ONI': ('Моанамани', 'Moanamani'),
-    'HEB': ('Хензада', 'Henzada'),
-    'OPI': ('Оенпелли', 'Oenpelli'),
-    'YBA': ('Банф', 'Banff'),
-    'OPS': ('Синоп', 'Sinop'),
-    'MSG': ('Матсаиле', 'Matsaile'),
-    'MTK': ('Макин Айленд', 'Makin Island'),
-    'MPP': ('Мулатупо', 'Mulatupo'),
-    'PDL': ('Понта-Делгада', 'Ponta Delgada (Azores)'),
-    'OPW': ('Опуво', 'Opuwa'),
-    'ZOG': (None, 'Lueneburg'),
-    'MPD': ('Мирпур-Хас', 'Mirpur Khas'),
-    'TSM': ('Таос', 'Taos'),
-    'NAW': ('Наратхиват', 'Narathiwat'),
-    'TMN': ('Тамана', 'Tamana Island'),
-    'TYB': ('Тибооберра', 'Tibooburra'),
-    'WBM': ('Вапенаманда', 'Wapenamanda'),
-    'MPE': ('Мадисон', 'Madison'),
-    'NND': ('Нангаде', 'Nangade'),
-    'PBV': ('Порто Дес Гаучос', 'Porto Dos Gauchos'),
-    'PUT': ('Путтапарти', 'Puttaparthi'),
-    'MRW': ('Марибо', 'Maribo'),
-    'NSM': ('Норсман', 'Norseman'),
-    'PUZ': ('Пуэрто Кабесас', 'Puerto Cabezas'),
-    'XMC': ('Маллакоота', 'Mallacoota'),
-    'HHH': ('Хилтон-Хед-Айленд', 'Hilton Head'),
-    'QVY': ('Коувола', 'Kouvola'),
-    'CMA': ('Каннамулла', 'Cunnamulla'),
-    'PAJ': ('Парачинар', 'Para Chinar'),
-    'LPD': ('Ла Педрера', 'La Pedrera'),
-    'NDK': ('Наморик', 'Namdrik Island'),
-    'ORW': ('Ормара', 'Ormara'),
-    'RBL': ('Ред Блафф', 'Red Bluff'),
-    'HBD': ('Хаби', 'Habi'),
-    'ORX': ('Оришими', 'Oriximina'),
-    'MQM': ('Мардин', 'Mardin'),
-    'AED': ('Аленива', 'Aleneva'),
-    'NAL': ('Нальчик', 'Nalchik'),
-    'WJU': ('Вонджу', 'Wonju'),
-    'OSE': ('Омора', 'Omora'),
-    'MRG': ('Мариба', 'Mareeba'),
-    'OUI': ('Бан Хоусеи', 'Ban Houei'),
-    'OSR': ('Острава', 'Ostrava'),
-    'BRH': ('Брахман', 'Brahman'),
-    'OTS': ('Анакортс', 'Anacortes'),
-    'GLQ': ('Гленналлен', 'Glennallen'),
-    'CCZ': ('Чаб Кей', 'Chub Cay'),
-    'BFE': ('Билефельд', 'Bielefeld'),
-    'MDS': ('Мидл Каикос', 'Middle Caicos'),
-    'GOM': ('Гома', 'Goma'),
-    'TUC': ('Тукуман', 'Tucuman'),
-    'BZI': ('Балыкесир', 'Balikesir'),
-    'DGE': ('Маджи', 'Mudgee'),
-    'IML': ('Империал', 'Imperial'),
-    'LMC': ('Ламакарена', 'Lamacarena'),
-    'URR': ('Уррао', 'Urrao'),
-    'LOI': ('Лонтрас', 'Lontras'),
-    'WLB': ('Лэбаучер Бэй', 'Labouchere Bay'),
-    'MQZ': ('Маргарет Ривер', 'Margaret River'),
-    'ZMM': ('Заора', 'Zamora'),
-    'MSZ': ('Намибе', 'Namibe'),
-    'WUN': ('Уилуна', 'Wiluna'),
-    'CTH': ('Котсвилл', 'Coatesville'),
-    'OUA': ('Уагадугу', 'Ouagadougou'),
-    'MRZ': ('Мори', 'Moree'),
-    'GIC': ('Боигу Айленд', 'Boigu Island'),
-    'TDB': ('Татабеди', 'Tetabedi'),
-    'MSR': ('Муш', 'Mus'),
-    'HOC': ('Комако', 'Komako'),
-    'TAI': ('Таиз', 'Taiz'),
-    'MST': ('Маастрихт', 'Maastricht'),
-    'EGE': ('Вейл', 'Vail'),
-    'WYB': ('Йес Бэй', 'Yes Bay'),
-    'MSV': ('Монтиселло', 'Monticello'),
-    'YNS': ('Немаска', 'Nemiscau'),
-    'MTH': ('Умтата', 'Marathon'),
-    'OUZ': ('Зоуерате', 'Zouerate'),
-    'LOS': ('Лагос', 'Lagos'),
-    'MTI': ('Мостеирос', 'Mosteiros'),
-    'TSW': ('Тсеви', 'Tsewi'),
-    'GWN': ('Гнарауэин', 'Gnarowein'),
-    'GAN': ('Ган', 'Gan Island'),
-    'OVD': ('Астурия', 'Asturias'),
-    'MKL': ('Джексон', 'Jackson'),
-    'QMV': ('Монтвейл', 'Montvale'),
-    'PDE': ('Панди Панди', 'Pandie Pandie'),
-    'DJO': ('Далоа', 'Daloa'),
-    'MTQ': ('Митчелл', 'Mitchell'),
-    'MNS': ('Манса', 'Mansa'),
-    'AAI': ('Арраяс', 'Arraias'),
-    'KTT': ('Киттиля', 'Kittila'),
-    'PBT': ('Пуэрто Леда', 'Puerto Leda'),
-    'MND': ('Медина', 'Medina'),
-    'XMN': ('Сямынь', 'Xiamen'),
-    'DHL': ('Дхала', 'Dhala'),
-    'MTZ': ('Масада', 'Masada'),
-    'XGR': ('Кангиксуалуджуак', 'Kangiqsualujjuaq'),
-    'SVQ': ('Севилья', 'Sevilla'),
-    'ESC': ('Эсканаба', 'Escanaba'),
-    'OVE': ('Оровилл', 'Oroville'),
-    'JUT': ('Хутикальпа', 'Juticalpa'),
-    'LOC': ('Лок', 'Lock'),
-    'ESH': ('Шорхэм-бай-Си', 'Shoreham By Sea'),
-    'PAG': ('Пагадиан', 'Pagadian'),
-    'WAL': ('Чинкотигуэ', 'Chincoteague'),
-    'PHR': ('Пацифик Харбор', 'Pacific Harbor'),
-    'KAS': ('Карасбург', 'Karasburg'),
-    'MGO': ('Манега', 'Manega'),
-    'CSP': ('Капе-Снесер', 'Cape Spencer'),
-    'MUE': ('Уэймея', 'Kamuela'),
-    'OHI': ('Ошакати', 'Oshakati'),
-    'XMP': ('Макмиллан Пасс', 'Macmillan Pass'),
-    'MQU': ('Марикита', 'Mariquita'),
-    'ZGL': ('Саус Галвей', 'South Galway'),
-    'PDN': ('Парндана', 'Parndana'),
-    'KOS': ('Сиануквиль', 'Sihanoukville'),
-    'CUR': ('Кюрасао', 'Curacao'),
-    'CHX': ('Чангуинола', 'Changuinola'),
-    'PHI': ('Пиньейру', 'Pinheiro'),
-    'IQM': ('Черчен', 'Qiemo'),
-    'MUR': ('Маруди', 'Marudi'),
-    'GCW': ('Гранд Каньон Уэст', 'Grand Canyon West'),
-    'MUU': ('Маунт Юнион', 'Mount Union'),
-    'XNT': ('Синтай', 'Xingtai'),
-    'MUY': ('Муйондзи', 'Mouyondzi'),
-    'XRY': ('Херес-де-ла-Фронтера', 'Jerez De La Frontera'),
-    'AKF': ('Куфра', 'Kufrah'),
-    'MVJ': ('Мандевиль', 'Mandeville'),
-    'YXS': ('Принс-Джордж', 'Prince George'),
-    'XZA': ('Забре', 'Zabre'),
-    'MZI': ('Мопти', 'Mopti'),
-    'DGA': ('Дангрига', 'Dangriga'),
-    'GMV': ('Монумент Вэлли', 'Monument Valley Gldngs'),
-    'TBR': ('Стейтсборо', 'Statesboro'),
-    'TLZ': ('Каталан', 'Catalao'),
-    'INF': ('Ин Геззам', 'In Guezzam'),
-    'PAQ': ('Палмер', 'Palmer'),
-    'TBJ': ('Табарка', 'Tabarka'),
-    'MVP': ('Миту', 'Mitu'),
-    'DIU': ('Диу', 'Diu'),
-    'PBF': ('Пайн Блафф', 'Pine Bluff'),
-    'BUO': ('Бурао', 'Burao'),
-    'MVS': ('Мукури', 'Mucuri'),
-    'PBX': ('Порто Алгере До Норте', 'Porto Alegre Do Norte'),
-    'NKA': ('Нкан', 'Nkan'),
-    'MVV': ('Межев', 'Megeve'),
-    'YQL': ('Летбридж', 'Lethbridge'),
-    'TUX': ('Тамблер Ридж', 'Tumbler Ridge'),
-    'PCM': ('Плая-дель-Кармен', 'Playa Del Carmen'),
-    'VHC': ('Сауримо', 'Saurimo'),
-    'YTN': ('Ривьер Ау Тоннерри', 'Riviere Au Tonnerre'),
-    'PHP': ('Филип', 'Philip'),
-    'PCQ': ('Пхонгсали', 'Phongsaly'),
-    'MWN': ('Мвадуи', 'Mwadui'),
-    'OAM': ('Оамару', 'Oamaru'),
-    'SHM': ('Сирахама', 'Shirahama'),
-    'RBK': ('Ранчо', 'Rancho'),
-    'MWV': ('Мундулкири', 'Mundulkiri'),
-    'BMM': ('Битам', 'Bitam'),
-    'LES': ('Лесобенг', 'Lesobeng'),
-    'CXF': ('Колдфут', 'Coldfoot'),
-    'MXC': ('Монтикелло', 'Monticello'),
-    'PCU': ('Пикаюн', 'Picayune'),
-    'RBN': ('Форт Джефферсон', 'Fort Jefferson'),
-    'PFC': ('Пацифик Сити', 'Pacific City'),
-    'PDV': ('Пловдив', 'Plovdiv'),
-    'TWT': ('Остров Тави Тави', 'Tawitawi'),
-    'PEI': ('Перейра', 'Pereira'),
-    'MYK': ('Мэй-Крик', 'May Creek'),
-    'LOK': ('Лодвар', 'Lodwar'),
-    'YKN': ('Янктон', 'Yankton'),
-    'PHO': ('Пойнт-Хоуп', 'Point Hope'),
-    'PEJ': ('Пешией', 'Peschiei'),
-    'COD': ('Коди', 'Cody'),
-    'CBO': ('Котабато', 'Cotabato'),
-    'BST': ('Бост', 'Bost'),
-    'MYO': ('Майруда', 'Myroodah'),
-    'BUJ': ('Боуссаада', 'Boussaada'),
-    'PEP': ('Пеппименарти', 'Peppimenarti'),
-    'CLH': ('Кула', 'Coolah'),
-    'FMI': ('Калемие', 'Kalemie'),
-    'PFA': ('Паф Уаррен', 'Paf Warren'),
-    'OKT': ('Октябрьский', 'Oktiabrskij'),
-    'XAY': ('Ксайабери', 'Xayabury'),
-    'TOR': ('Торрингтон', 'Torrington'),
-    'GIR': ('Жирардо', 'Girardot'),
-    'NDV': ('Анакостиа', 'Anacostia'),
-    'LIC': ('Лимон', 'Limon'),
-    'WAX': ('Звара', 'Zwara'),
-    'PGN': ('Пангиа', 'Pangia'),
-    'ESN': ('Истон', 'Easton'),
-    'PHU': ('Пху Винх', 'Phu Vinh'),
-    'CFE': ('Клермон-Ферран', 'Clermont-Ferrand'),
-    'PHW': ('Пхалаборва', 'Phalaborwa'),
-    'ASJ': ('Амами', 'Amami O Shima'),
-    'SBT': ('Сабетта', 'Sabetta'),
-    'NAM': ('Намлеа', 'Namlea'),
-    'RCE': ('Рош Харбор', 'Roche Harbor'),
-    'YQC': ('Кактак', 'Quaqtaq'),
-    'KAO': ('Куусамо', 'Kuusamo'),
-    'MYQ': ('Майсур', 'Mysore'),
-    'GYU': ('Гуюань', 'Guyuan'),
-    'COJ': ('Кунабарабран', 'Coonabarabran'),
-    'PIG': ('Питинга', 'Pitinga'),
-    'PIN': ('Паринтинса', 'Parintins'),
-    'NDF': ('Ндалатандос', 'Ndalatandos'),
-    'CGU': ('Сьюдад Гуаяна', 'Ciudad Guayana'),
-    'LCI': ('Лакония', 'Laconia'),
-    'PKH': ('Порто Кхели', 'Porto Kheli'),
-    'LAO': ('Лаоаг', 'Laoag'),
-    'KDL': ('Кярдла', 'Kardla'),
-    'MYX': ('Менйамйа', 'Menyamya'),
-    'SCL': ('Сантьяго', 'Santiago'),
-    'TPC': ('Тарапоа', 'Tarapoa'),
-    'ELO': ('Эль Дорадо', 'Eldorado'),
-    'IPU': ('Ипиау', 'Ipiau'),
-    'MYZ': ('Манки Бэй', 'Monkey Bay'),
-    'MNA': ('Меланггуане', 'Melangguane'),
-    'BJP': ('Браганса Паулиста', 'Braganca Paulista'),
-    'PIO': ('Писко', 'Pisco'),
-    'MZJ': ('Марана', 'Marana'),
-    'PIS': ('Пуатье', 'Poitiers'),
-    'GBT': ('Горган', 'Gorgon'),
-    'PJB': ('Пейсон', 'Payson'),
-    'CPB': ('Капургана', 'Capurgana'),
-    'MZQ': ('Мкуз', 'Mkuze'),
-    'YQU': ('Гранд-Прери', 'Grande Prairie'),
-    'NAH': ('Наза', 'Naha'),
-    'MBE': ('Момбецу', 'Monbetsu'),
-    'AJN': ('Анжуан', 'Anjouan'),
-    'RDN': ('Реданг', 'Redang'),
-    'WCA': ('Кастро', 'Castro'),
-    'IPE': ('Ипил', 'Ipil'),
-    'NAK': ('Накхонратчасима', 'Nakhon Ratchasima'),
-    'PKA': ('Напаскиак', 'Napaskiak'),
-    'NAR': ('Наре', 'Nare'),
-    'RHD': ('Рио Ондо', 'Rio Hondo'),
-    'TTJ': ('Тоттори', 'Tottori'),
-    'PKL': ('Пакатоа Айленд', 'Pakatoa Island'),
-    'XVH': (None, 'Peterborough'),
-    'NAZ': ('Гавань Стар', 'Star Habour'),
-    'TPN': ('Типутини', 'Tiputini'),
-    'OSM': ('Мосул', 'Mosul'),
-    'KMM': ('Кимам', 'Kimam'),
-    'PKT': ('Порт Китс', 'Port Keats'),
-    'NCA': ('Север Каикос', 'North Caicos'),
-    'NCE': ('Ницца', 'Nice'),
-    'RIA': ('Санта-Мария', 'Santa Maria'),
-    'YSZ': ('Сквирел Ков', 'Squirrel Cove'),
-    'RNJ': ('Йорон', 'Yoronjima'),
-    'NCG': ('Палома Гранде', 'Paloma Grande'),
-    'BYN': ('Баянхонгор', 'Bayankhongor'),
-    'PNF': (None, "Peterson's Point"),
-    'PGX': ('Периге', 'Perigueux'),
-    'HCN': ('Хенгчун', 'Hengchun'),
-    'PML': ('Порт Моллер', 'Port Moller'),
-    'GIT': ('Гейта', 'Geita'),
-    'MJO': ('Маунт Этджо Лодж', 'Mount Etjo Lodge'),
-    'OKF': ('Окаукуеджо', 'Okaukuejo'),
-    'WGY': ('Вагни', 'Wagny'),
-    'BFP': ('Бивер Фолс', 'Beaver Falls'),
-    'PKZ': ('Паксе', 'Pakse'),
-    'EXI': ('Экскуршен-Инлет', 'Excursion Inlet'),
-    'CSB': ('Карансебеше', 'Caransebes'),
-    'CLI': ('Клинтонвилл', 'Clintonville'),
-    'PLD': ('Плайя Самара', 'Playa Samara'),
-    'PLE': ('Пейела', 'Paiela'),
-    'PLN': ('Пелстон', 'Pellston'),
-    'LDC': ('Остров Линдман', 'Lindeman Island'),
-    'KEB': ('Нануолек', 'Nanwalek'),
-    'KIW': ('Китве', 'Kitwe'),
-    'PLM': ('Палембанг', 'Palembang'),
-    'XHT': (None, 'Arna'),
-    'XUR': (None, 'Skoppum'),
-    'NDJ': ('Нджамена', 'Ndjamena'),
-    'RMG': ('Ром', 'Rome'),
-    'PLP': ('Ла-Пальма', 'La Palma'),
-    'ABH': ('Альфа', 'Alpha'),
-    'GED': ('Джорджтаун', 'Georgetown'),
-    'NDY': ('Сандэй', 'Sanday'),
-    'TRX': ('Трентон', 'Trenton'),
-    'NEC': ('Некочеа', 'Necochea'),
-    'TXU': ('Табу', 'Tabou'),
-    'PLW': ('Палу', 'Palu'),
-    'BAR': ('Бэйкер-Айленд', 'Baker Island'),
-    'BIZ': ('Бимин', 'Bimin'),
-    'NEF': ('Нефтекамск', 'Neftekamsk'),
-    'RNL': ('о. Реннелл', 'Rennell'),
-    'PLX': ('Семей', 'Semey'),
-    'JUA': ('Жуара', 'Juara'),
-    'DCI': ('Дечимоманну', 'Decimomannu'),
-    'NEL': ('Лейкхерст', 'Lakehurst'),
-    'PMD': ('Палмдейл', 'Palmdale'),
-    'ROK': ('Рокгемптон', 'Rockhampton'),
-    'CVE': ('Ковеньяс', 'Covenas'),
-    'CKD': ('Крукед Крик', 'Crooked Creek'),
-    'TTA': ('Тан-Тан', 'Tan Tan'),
-    'WLL': ('Уоллогоранг', 'Wollogorang'),
-    'NET': ('Нью Байт', 'New Bight'),
-    'TYO': ('Токио', 'Tokyo'),
-    'CFN': ('Донегол', 'Donegal'),
-    'LGZ': ('Легисамо', 'Leguizamo'),
-    'MPF': ('Мапода', 'Mapoda'),
-    'GDT': ('Гранд Терк', 'Grand Turk Island'),
-    'DTD': ('Датадави', 'Datadawai'),
-    'ADP': ('Анурадхапура', 'Ampara'),
-    'TUJ': ('Тум', 'Tum'),
-    'NGI': ('Нгау', 'Ngau Island'),
-    'BVS': ('Бревис', 'Breves'),
-    'DNZ': ('Денизли', 'Denizli'),
-    'PMH': ('Портсмут', 'Portsmouth'),
-    'TUV': ('Тукупита', 'Tucupita'),
-    'MWD': ('Мианвали', 'Mianwali'),
-    'SHZ': ('Сешутес', 'Seshutes'),
-    'KEU': ('Келли Бар', 'Kelly Bar'),
-    'PMP': ('Пимага', 'Pimaga'),
-    'PMQ': ('Перито Морено', 'Perito Moreno'),
-    'KIF': ('оз. Кингфишер', 'Kingfisher Lake'),
-    'GAB': ('Габс', 'Gabbs'),
-    'CUN': ('Канкун', 'Cancun'),
-    'AYD': ('Элрой-Даунс', 'Alroy Downs'),
-    'PNA': ('Памплона', 'Pamplona'),
-    'PNH': ('Пномпень', 'Phnom Penh'),
-    'ABY': ('Олбани', 'Albany'),
-    'PNI': ('Понпеи', 'Pohnpei, Caroline Islands'),
-    'NGL': ('Нгала', 'Ngala'),
-    'CRZ': ('Туркменабат', 'Turkmenabad'),
-    'NHX': ('Фоли', 'Foley'),
-    'CZO': ('Чисточайна', 'Chistochina'),
-    'GOQ': ('Голмуд', 'Golmud'),
-    'NUD': ('Эн Нахуд', 'En Nahud'),
-    'DAB': ('Дейтона-Бич', 'Daytona Beach'),
-    'ZGW': ('Грейфсвальд', 'Greifswald'),
-    'NHT': ('Норхолт', 'Northolt'),
-    'PTA': ('Порт Алсворт', 'Port Alsworth'),
-    'PNY': ('Пондишери', 'Pondicherry'),
-    'UAI': ('Суаи', 'Suai'),
-    'CSV': ('Кроссвилл', 'Crossville'),
-    'DCU': ('Декейтер', 'Decatur'),
-    'CEI': ('Чианграй', 'Chiang Rai'),
-    'PNU': ('Пангитч', 'Panguitch'),
-    'PMU': ('Паймиут', 'Paimiut'),
-    'ANE': ('Анже', 'Angers'),
-    'EYS': ('Элийе Спрингс', 'Eliye Springs'),
-    'XUX': (None, 'Ustaoset'),
-    'POU': ('Пукипси', 'Poughkeepsie'),
-    'LNS': ('Ланкастер', 'Lancaster'),
-    'TGD': ('Подгорица', 'Podgorica'),
-    'MOY': ('Монтеррей', 'Monterrey'),
-    'AGL': ('Ванигела', 'Wanigela'),
-    'UBU': ('Каламбуру', 'Kalumburu'),
-    'OCH': ('Накодочес', 'Nacogdoches'),
-    'VTL': ('Витель', 'Vittel'),
-    'YCV': ('Картьервиль', 'Cartierville'),
-    'NIS': ('Симберти Айленд', 'Simberi Island'),
-    'FLT': ('Флэт', 'Flat'),
-    'CKY': ('Конакри', 'Conakry'),
-    'PNZ': ('Петролина', 'Petrolina'),
-    'PPN': ('Попаян', 'Popayan'),
-    'POF': ('Поплар Блафф', 'Poplar Bluff'),
-    'POS': ('Порт-оф-Спейн', 'Port Of Spain'),
-    'FAY': ('Фейетвилл', 'Fayetteville'),
-    'GCM': ('Большой Кайман', 'Grand Cayman Island'),
-    'KYS': ('Кайес', 'Kayes'),
-    'CPC': ('Сан-Мартин-де-лос-Андес', 'San Martin De Los Andes'),
-    'IDC': ('Ила Да Чилонзуэнэ', 'Ila Da Chilonzuene'),
-    'PPX': ('Парам', 'Param'),
-    'TEE': ('Тебесса', 'Tebessa'),
-    'MTM': ('Метлейкатла', 'Metlakatla'),
-    'POZ': ('Познань', 'Poznan'),
-    'MVQ': ('Могилев', 'Mogilev'),
-    'AWP': ('Австрал-Даунс', 'Austral Downs'),
-    'PPQ': ('Парапарауму', 'Paraparaumu'),
-    'NLA': ('Ндола', 'Ndola'),
-    'FOM': ('Фумбан', 'Foumban'),
-    'NLK': ('Остров Норфолк', 'Norfolk Island'),
-    'BYQ': ('Бунью', 'Bunyu'),
-    'PCO': ('Пунта Колорада', 'Punta Colorada'),
-    'IRS': ('Стерджис', 'Sturgis'),
-    'PWR': ('Порт Уолтер', 'Port Walter'),
-    'SVP': ('Куито', 'Kuito'),
-    'MES': ('Медан', 'Kuala Namu'),
-    'PRR': ('Паруима', 'Paruima'),
-    'YCN': (None, 'Cochrane'),
-    'ZMD': ('Се-Мадурейра', 'Sena Madureira'),
-    'MQQ': ('Мунду', 'Moundou'),
-    'UIN': ('Куинси', 'Quincy'),
-    'SPY': ('Сан-Педро', 'San Pedro'),
-    'NMR': ('Наппа-Мэри', 'Nappa Merry'),
-    'WSU': ('Васу', 'Wasu'),
-    'PRT': ('Поинт Ретрит', 'Point Retreat'),
-    'DNO': ('Дианополис', 'Dianopolis'),
-    'SAR': ('Спарта', 'Sparta'),
-    'FBY': ('Фэрбери', 'Fairbury'),
-    'KSJ': ('Касос', 'Kasos Island'),
-    'CLV': ('Калдас-Новас', 'Caldas Novas'),
-    'COA': ('Колумбия', 'Columbia'),
-    'PXS': ('Пуэрто Де Санта Мария', 'Puerto De Santa Maria'),
-    'PPU': ('Папун', 'Papun'),
-    'NNT': ('Нан', 'Nan'),
-    'EWD': ('оз. Уайлдман', 'Wildman Lake'),
-    'TDD': ('Тринидад', 'Trinidad'),
-    'BKZ': ('Букоба', 'Bukoba'),
-    'FAZ': ('Фаса', 'Fasa'),
-    'DAT': ('Датун', 'Datong'),
-    'GTY': ('Геттисберг', 'Gettysburg'),
-    'PRE': ('Поре', 'Pore'),
-    'CFT': ('Клифтон', 'Clifton'),
-    'OKH': ('Оакам', 'Oakham'),
-    'BGA': ('Букараманга', 'Bucaramanga'),
-    'VVB': ('Мааноро', 'Mahanoro'),
-    'PRH': ('Пхрэ', 'Phrae'),
-    'UDO': ('Удомксей', 'Udomxay'),
-    'BLB': ('Бальбоа', 'Balboa'),
-    'SAE': ('Сангир', 'Sangir'),
-    'ZQN': ('Куинстаун', 'Queenstown'),
-    'VII': ('Винь', 'Vinh City'),
-    'NOL': ('Наколик Ривер', 'Nakolik River'),
-    'HNS': ('Хейнс', 'Haines'),
-    'KAP': ('Капанга', 'Kapanga'),
-    'NOM': ('Номад Ривер', 'Nomad River'),
-    'ZSS': ('Сассандра', 'Sassandra'),
-    'QYP': (None, 'Apeldoorn'),
-    'PRN': ('Приштина', 'Pristina'),
-    'GGG': ('Лонгвью', 'Longview'),
-    'URS': ('Курск', 'Kursk'),
-    'PRF': ('Порт Джонсон', 'Port Johnson'),
-    'BIT': ('Байтади', 'Baitadi'),
-    'EBA': ('Эльба', 'Elba Island'),
-    'PRQ': ('Прес. Роки Саенз Пена', 'Pres. Roque Saenz Pena'),
-    'PRU': ('Проме', 'Prome'),
-    'IFA': ('Айова Фолс', 'Iowa Falls'),
-    'PRY': ('Претория', 'Pretoria'),
-    'BGM': ('Бингемтон', 'Binghamton'),
-    'PSB': ('Беллефонт', 'Bellefonte'),
-    'GGR': ('Гарове', 'Garoe'),
-    'PSG': ('Питерсберг', 'Petersburg'),
-    'VDC': ('Витория-да-Конкиста', 'Vitoria Da Conquista'),
-    'KTO': ('Като', 'Kato'),
-    'INO': ('Инонго', 'Inongo'),
-    'BZA': ('Бонанса', 'Bonanza'),
-    'PSK': ('Дублин', 'Dublin'),
-    'YAN': ('Йагамби', 'Yangambi'),
-    'PTM': ('Пальмарито', 'Palmarito'),
-    'BII': ('Бикини Атолл', 'Bikini Atoll'),
-    'ZYI': ('Цзуньи', 'Zunyi'),
-    'ATF': ('Амбато', 'Ambato'),
-    'NAU': ('Напука Айленд', 'Napuka Island'),
-    'STI': ('Сантьяго', 'Santiago'),
-    'JEM': ('Эмеривилль', 'Emeryville'),
-    'TQD': (None, 'Al Fallujah'),
-    'PTU': ('Платинум', 'Platinum'),
-    'BRJ': ('Брайт', 'Bright'),
-    'KEA': ('Кейсах', 'Keisah'),
-    'PUD': ('Пуэрто Десеадо', 'Puerto Deseado'),
-    'SCB': ('Скрибнер', 'Scribner'),
-    'PVK': ('Превеза', 'Preveza'),
-    'XAQ': (None, 'Bronderslev'),
-    'NAO': ('Наньчун', 'Nanchong'),
-    'WTA': ('Тамборано', 'Tambohorano'),
-    'BUB': ('Беруэлл', 'Burwell'),
-    'RBG': ('Розберг', 'Roseburg'),
-    'PUH': ('Почутла', 'Pochutla'),
-    'NRA': ('Наррандера', 'Narrandera'),
-    'JGD': ('Джагдачи', 'Jiagedaqi District'),
-    'ULD': ('Улунди', 'Ulundi'),
-    'YLW': ('Келоуна', 'Kelowna'),
-    'UGC': ('Ургенч', 'Urgench'),
-    'NRE': ('Намроле', 'Namrole'),
-    'NMC': (None, "Norman's Cay"),
-    'DAS': ('Грейт Биэр Лейк', 'Great Bear Lake'),
-    'PUW': ('Пульман', 'Pullman'),
-    'NRK': ('Норрчёпинг', 'Norrkoping'),
-    'GPA': ('Патры', 'Patras'),
-    'UNG': ('Киунга', 'Kiunga'),
-    'NSY': ('Сигонелла', 'Sigonella'),
-    'PVO': ('Портовьехо', 'Portoviejo'),
-    'STA': ('Скйерн', 'Skjern'),
-    'NTC': ('Санта-Каролина', 'Santa Carolina'),
-    'DRD': ('Доруна Стэйшн', 'Dorunda Station'),
-    'PWQ': ('Павлодар', 'Pavlodar'),
-    'CEN': ('Сьюдад-Обрегон', 'Ciudad Obregon'),
-    'BXL': ('Блю Лагун', 'Blue Lagoon'),
-    'UPA': ('Пунта Алегре', 'Punta Alegre'),
-    'KUQ': ('Кури', 'Kuri'),
-    'MZW': ('Мешрьа', 'Mechria'),
-    'SQE': ('Сан Луис Де Пале', 'San Luis De Pale'),
-    'BGH': (None, 'Boghe'),
-    'MOE': ('Момеик', 'Momeik'),
-    'YWN': ('Уиниск', 'Winisk'),
-    'CYF': ('Чефорнак', 'Chefornak'),
-    'PXR': ('Сурин', 'Surin'),
-    'GSL': ('Талсейлей Нарроус', 'Taltheilei Narrows'),
-    'UND': ('Кундуз', 'Kunduz'),
-    'LJN': ('Лейк Джэксон', 'Lake Jackson'),
-    'PXU': ('Плейку', 'Pleiku'),
-    'PYA': ('Пуэрто Бояка', 'Puerto Boyaca'),
-    'CCS': ('Каракас', 'Caracas'),
-    'RBP': ('Рабараба', 'Rabaraba'),
-    'DLO': ('Доломи', 'Dolomi'),
-    'NUB': ('Намбулвар', 'Numbulwar'),
-    'RDE': ('Мерди', 'Merdey'),
-    'PYJ': ('Полярный', 'Polyarnyj'),
-    'UPR': ('Упиара', 'Upiara'),
-    'JZH': ('Цзючжайгоу', 'Song Pan'),
-    'LNC': ('Ленгбати', 'Lengbati'),
-    'PZH': ('Жоб', 'Zhob'),
-    'CTX': ('Кортленд', 'Cortland'),
-    'PYM': ('Плимут', 'Plymouth'),
-    'PYN': ('Паньян', 'Payan'),
-    'MKU': ('Макоку', 'Makokou'),
-    'HDR': ('Хавадарья', 'Havadarya'),
-    'QDL': (None, 'Guarapari'),
-    'ASR': ('Кайсери', 'Kayseri'),
-    'LEF': ('Лебакенг', 'Lebakeng'),
-    'SFL': ('Сао Филипе', 'São Filipe'),
-    'NGB': ('Нинбо', 'Ningbo'),
-    'PZL': ('Пхинда', 'Phinda'),
-    'SFK': ('Сори', 'Soure'),
-    'XXD': (None, 'Degerfors'),
-    'PYR': ('Пиргос', 'Pyrgos'),
-    'SHV': ('Шривпорт', 'Shreveport'),
-    'NDO': ('Ла-Пальма-дель-Кондадо', 'La Palma Del Condado'),
-    'QFI': ('Игинниарфик', 'Iginniarfik'),
-    'PZI': ('Паньчжихуа', 'Pan Zhi Hua'),
-    'SHH': ('Шишмарёв', 'Shishmaref'),
-    'XND': (None, 'Drammen'),
-    'NWP': ('Аргентия', 'Argentia'),
-    'LRR': ('Лар', 'Lar'),
-    'NWT': ('Новата', 'Nowata'),
-    'PSO': ('Пасто', 'Pasto'),
-    'LWL': ('Уэлс', 'Wells'),
-    'ESS': ('Эссен', 'Essen'),
-    'QBC': ('Белла Кула', 'Bella Coola'),
-    'QJV': ('Скаген З7', 'Skagen Z7'),
-    'KAC': ('Эль-Камышлы', 'Kameshli'),
-    'MGX': ('Моаби', 'Moabi'),
-    'NYU': ('Паган', 'Nyaung-u'),
-    'SYF': ('Остров Габриола', 'Silva Bay'),
-    'URY': ('Гураят', 'Gurayat'),
-    'ABI': ('Абилин', 'Abilene'),
-    'HNX': ('Ханна', 'Hanna'),
-    'EPU': ('Пярну', 'Parnu'),
-    'QRY': ('Икерасаарсук', 'Ikerasaarsuk'),
-    'QZD': ('Сегед', 'Szeged'),
-    'EUE': ('Эврика', 'Eureka'),
-    'GMZ': ('Сан-Себастьян-Де-Ла-Гомера', 'San Sebastian de la Gomera'),
-    'MZP': ('Мотуика', 'Motueka'),
-    'HAN': ('Ханой', 'Hanoi'),
-    'RAC': ('Расин', 'Racine'),
-    'VDP': ('Валье Де Ла Паскуа', 'Valle De Pascua'),
-    'RAG': ('Раглан', 'Raglan'),
-    'GRX': ('Гранада', 'Granada'),
-    'RAO': ('Рибейран-Прету', 'Ribeirao Preto'),
-    'ABS': ('Абу Симбел', 'Abu Simbel'),
-    'MZU': ('Музаффарпур', 'Muzaffarpur'),
-    'CXY': ('Кэт Кейс', 'Cat Cays'),
-    'REK': ('Рейкьявик', 'Reykjavik'),
-    'HUU': ('Уануко', 'Huanuco'),
-    'RAR': ('Раротонга', 'Rarotonga'),
-    'RNH': ('Нью Ричмонд', 'New Richmond'),
-    'SGT': ('Статгарт', 'Stuttgart'),
-    'OBA': ('Обан', 'Oban'),
-    'RAZ': ('Равала Кот', 'Rawala Kot'),
-    'RDV': ('Ред Девил', 'Red Devil'),
-    'NON': ('Ротима', 'Rotima'),
-    'QLZ': (None, 'Ikast'),
-    'ZGY': (None, 'Kuching'),
-    'SJN': ('Сейнт Джонс', 'St Johns'),
-    'OBU': ('Кобук', 'Kobuk'),
-    'EGV': ('Игл Ривер', 'Eagle River'),
-    'WOT': ('Вонан', 'Wonan'),
-    'PGV': ('Гринвилл', 'Greenville'),
-    'AXX': ('Анджел Файер', 'Angel Fire'),
-    'RBH': ('Бкукс Лодж', 'Brooks Lodge'),
-    'HTH': ('Хоуторн', 'Hawthorne'),
-    'FEA': ('Фетлар', 'Fetlar'),
-    'LDM': ('Лудингтон', 'Ludington'),
-    'ODA': ('Уадда', 'Ouadda'),
-    'BMH': ('Бомаи', 'Bomai'),
-    'BDR': ('Бриджпорт', 'Bridgeport'),
-    'EGN': ('Эль-Генейна', 'Geneina'),
-    'RBO': ('Роборе', 'Robore'),
-    'FDE': ('Фёрде', 'Forde'),
-    'ALS': ('Аламоса', 'Alamosa'),
-    'ODH': ('Одинхам', 'Odiham'),
-    'UTK': ('Утирик', 'Utirik Island'),
-    'TAQ': ('Таркоола', 'Tarcoola'),
-    'MQE': ('Марква', 'Marqua'),
-    'AET': ('Аллакакет', 'Allakaket'),
-    'LBD': ('Худжанд', 'Khujand'),
-    'RBR': ('Риу-Бранку', 'Rio Branco'),
-    'KZB': ('Захар Бэй', 'Zachar Bay'),
-    'RIM': ('Родригес Де Мендоза', 'Rodriguez De Mendoza'),
-    'MQO': ('Малам', 'Malam'),
-    'IRK': ('Кирксвилл', 'Kirksville'),
-    'MEE': ('Маре', 'Mare'),
-    'RFN': ('Рауфархофн', 'Raufarhofn'),
-    'KKO': ('Кайко', 'Kaikohe'),
-    'CRV': ('Кротоне', 'Crotone'),
-    'CZM': ('Косумель', 'Cozumel'),
-    'RBV': ('Рамата', 'Ramata'),
-    'UTR': ('Уттарадит', 'Uttaradit'),
-    'ODW': ('Ок Харбор', 'Oak Harbor'),
-    'MQW': ('Мак-Рай', 'Mc Rae'),
-    'IDO': ('Санта Изабел Де Морро', 'Santa Isabel Do Morro'),
-    'RBY': ('Руби', 'Ruby'),
-    'HLI': ('Холлистер', 'Hollister'),
-    'PHC': ('Порт-Харкорт', 'Port Harcourt'),
-    'ADU': ('Ардабил', 'Ardabil'),
-    'RKP': ('Рокпорт', 'Rockport'),
-    'NVT': ('Навегантис', 'Navegantes'),
-    'RKY': ('Роукби', 'Rokeby'),
-    'YYA': ('Биг Бей Яхт Клаб', 'Big Bay Yacht Club'),
-    'LFM': ('Ламерд', 'Lamerd'),
-    'CTD': ('Читре', 'Chitre'),
-    'MUT': ('Маскатин', 'Muscatine'),
-    'UGU': ('Зугапа', 'Zugapa'),
-    'RCK': ('Рокдейл', 'Rockdale'),
-    'ATQ': ('Амритсар', 'Amritsar'),
-    'EBN': ('Эбадон', 'Ebadon'),
-    'RCO': ('Рошфор', 'Rochefort'),
-    'RGR': ('Рейнджер', 'Ranger'),
-    'ROD': ('Робертсон', 'Robertson'),
-    'NJC': ('Нижневартовск', 'Nizhnevartovsk'),
-    'MUF': ('Мутинг', 'Muting'),
-    'OFJ': ('Оулафсфьордюр', 'Olafsfjordur'),
-    'ROH': ('Робинхуд', 'Robinhood'),
-    'TBN': ('Форт Леонадр Вуд', 'Fort Leonard Wood'),
-    'OFU': ('Ваота', 'Vaoto'),
-    'SJO': ('Сан-Хосе', 'San Jose'),
-    'ROO': ('Рондонополис', 'Rondonopolis'),
-    'RDA': ('Рокхамтон-Даунс', 'Rockhampton Downs'),
-    'REB': ('Рехлин', 'Rechlin'),
-    'UZC': ('Ужице', 'Uzice'),
-    'RHA': ('Рейхолар', 'Reykholar'),
-    'RAV': ('Краво Норте', 'Cravo Norte'),
-    'RDR': ('Ред Ривер', 'Red River'),
-    'RIO': ('Рио-де-Жанейро', 'Rio De Janeiro'),
-    'RDT': ('Ришар Толь', 'Richard Toll'),
-    'KGB': ('Кондж', 'Konge'),
-    'REO': ('Ром', 'Rome'),
-    'INM': ('Иннаминкка', 'Innamincka'),
-    'EKX': ('Элизабеттаун', 'Elizabethtown'),
-    'ISD': ('Искуанде', 'Iscuande'),
-    'RET': ('Рост', 'Rost'),
-    'SUT': ('Сумбаванга', 'Sumbawanga'),
-    'OGL': ('Джорджтаун', 'Georgetown'),
-    'RSX': ('Русес Пойнт', 'Rouses Point'),
-    'RFP': ('Раиатеа', 'Raiatea'),
-    'RKW': ('Роквуд', 'Rockwood'),
-    'SUX': ('Су-сити', 'Sioux City'),
-    'DVR': ('Дейли Ривер', 'Daly River'),
-    'RTI': ('Роти', 'Roti'),
-    'OGO': ('Абенгуру', 'Abengourou'),
-    'RTL': ('Спирит Лейк', 'Spirit Lake'),
-    'MRF': ('Марфа', 'Marfa'),
-    'NZW': ('Саус Веймаус', 'South Weymouth'),
-    'IIS': ('Ниссан', 'Nissan Island'),
-    'OIM': ('Ошима', 'Oshima'),
-    'RTM': ('Роттердам', 'Rotterdam'),
-    'RLU': ('Борнит', 'Bornite'),
-    'RHE': ('Реймс', 'Reims'),
-    'BCT': ('Бока-Ратон', 'Boca Raton'),
-    'KVA': ('Кавала', 'Kavala'),
-    'RHL': ('Рой Хилл', 'Roy Hill'),
-    'RIJ': ('Риоджа', 'Rioja'),
-    'RNR': ('Робинсон Ривер', 'Robinson River'),
-    'RUG': ('Ругао', 'Rugao'),
-    'BDK': ('Бондуку', 'Bondoukou'),
-    'RIK': ('Каррилло', 'Carrillo'),
-    'WMO': ('Уайт-Маунтин', 'White Mountain'),
-    'VCH': ('Вичадеро', 'Vichadero'),
-    'RIT': ('Рио Тигре', 'Rio Tigre'),
-    'NKU': ('Нкаус', 'Nkaus'),
-    'RJH': ('Раджшахи', 'Rajshahi'),
-    'XUI': (None, 'Lysaker'),
-    'VDI': ('Видалия', 'Vidalia'),
-    'RVA': ('Фарафангана', 'Farafangana'),
-    'OKP': ('Оксапмин', 'Oksapmin'),
-    'TYT': ('Трейнта-и-Трес', 'Treinta-y-Tres'),
-    'RVV': ('Раируа', 'Rairua'),
-    'TCW': ('Токумвал', 'Tocumwal'),
-    'OKQ': ('Окаба', 'Okaba'),
-    'NLN': (None, 'Kneeland'),
-    'VEY': ('Вестманнаэйяр', 'Vestmannaeyjar'),
-    'ROR': ('Корор', 'Koror'),
-    'MTR': ('Монтерия', 'Monteria'),
-    'ONS': ('Онслоу', 'Onslow'),
-    'OLP': ('Олимпик Дэм', 'Olympic Dam'),
-    'HLF': ('Хултсфред', 'Hultsfred'),
-    'RXS': ('Рохас', 'Roxas City'),
-    'RNA': ('Арон', 'Arona'),
-    'OMJ': ('Омура', 'Omura'),
-    'HTV': (None, 'Huntsville'),
-    'OMM': ('Мармул', 'Marmul'),
-    'PRD': ('Парду', 'Pardoo'),
-    'OMY': ('Оддор Меанче', 'Oddor Meanche'),
-    'RRE': ('Марри', 'Marree'),
-    'RZE': ('Жешув', 'Rzeszow'),
-    'VIA': ('Видейра', 'Videira'),
-    'ONB': ('Ононге', 'Ononge'),
-    'RRM': ('Марромеу', 'Marromeu'),
-    'SAB': ('Саба', 'Saba'),
-    'OOK': ('Токсук-Бей', 'Toksook Bay'),
-    'TED': ('Тистед', 'Thisted'),
-    'RSG': ('Серра Пелада', 'Serra Pelada'),
-    'OND': ('Ондангва', 'Ondangwa'),
-    'VIB': ('Вилья Конститусьон', 'Villa Constitucion'),
-    'RVD': ('Риу-Верди', 'Rio Verde'),
-    'ORJ': ('Ориндуик', 'Orinduik'),
-    'ASB': ('Ашхабад', 'Ashgabat'),
-    'ORK': ('Корк', 'Cork'),
-    'ENU': ('Энугу', 'Enugu'),
-    'ANY': ('Энтони', 'Anthony'),
-    'SCH': ('Скенектади', 'Schenectady'),
-    'ORO': ('Йоро', 'Yoro'),
-    'ORT': ('Нортуэй', 'Northway'),
-    'RNC': ('Макминнвилл', 'Mcminnville'),
-    'NUP': ('Нанапитчек', 'Nunapitchuk'),
-    'ILI': ('Иламна', 'Iliamna'),
-    'NUT': ('Натув', 'Nutuve'),
-    'OTU': ('Оту', 'Otu'),
-    'RZR': ('Рамсар', 'Ramsar'),
-    'DOS': ('Диос', 'Dios'),
-    'OSS': ('Ош', 'Osh'),
-    'IRG': ('Локхарт Ривер', 'Lockhart River'),
-    'GEL': ('Санту Анджело', 'Santo Angelo'),
-    'KWU': ('Мэншен Хаус', 'Mansion House'),
-    'OTG': ('Уэртингтон', 'Worthington'),
-    'SDC': ('Сандкрик', 'Sandcreek'),
-    'OTH': ('Норт-Бенд', 'North Bend'),
-    'PKJ': ('Плайя Гранде', 'Playa Grande'),
-    'SDK': ('Сандакан', 'Sandakan'),
-    'SVJ': ('Свольвер', 'Svolvaer'),
-    'OZI': ('Бобадилья', 'Bobadilla'),
-    'OUL': ('Оулу', 'Oulu'),
-    'HZG': ('Ханьчжун', 'Hanzhong'),
-    'RNG': ('Рейнджели', 'Rangely'),
-    'MJP': ('Манджимап', 'Manjimup'),
-    'XIA': (None, 'Guelph'),
-    'SAH': ('Сана', "Sana'a"),
-    'ROP': ('Рота', 'Rota'),
-    'SAY': ('Сиена', 'Siena'),
-    'OVR': ('Олаваррия', 'Olavarria'),
-    'SBA': ('Санта-Барбара', 'Santa Barbara'),
-    'OWE': ('Овендо', 'Owendo'),
-    'OXB': ('Бисау', 'Bissau'),
-    'SEG': ('Селинсгров', 'Selinsgrove'),
-    'SBH': ('Сен-Бартелеми', 'Saint Barthelemy'),
-    'ROL': ('Рузвельт', 'Roosevelt'),
-    'RPR': ('Райпур', 'Raipur'),
-    'PAA': ('Пхаан', 'Pa-an'),
-    'IKU': ('Иссык-Куль', 'Tamchy'),
-    'VLV': ('Валера', 'Valera'),
-    'SCE': ('Стейт Колледж', 'State College'),
-    'ACU': ('Ачутупо', 'Achutupo'),
-    'PKC': ('Петропавловск-Камчатский', 'Petropavlovsk-Kamchatsky'),
-    'OYN': ('Ойен', 'Ouyen'),
-    'SCO': ('Актау', 'Aktau'),
-    'RRO': ('Неаполь', 'Naples'),
-    'SCU': ('Сантьяго', 'Santiago'),
-    'OLI': ('Олафсвик', 'Olafsvik'),
-    'RRN': ('Серра Норте', 'Serra Norte'),
-    'VPN': ('Вопнафьордур', 'Vopnafjordur'),
-    'SLG': ('Сайлом-Спрингс', 'Siloam Springs'),
-    'PEU': ('Пуэрто Лемпира', 'Puerto Lempira'),
-    'XWO': (None, 'Woking'),
-    'VSE': ('Визеу', 'Viseu'),
-    'XUJ': (None, 'Moelv'),
-    'PUC': ('Прайс', 'Price'),
-    'PBR': ('Пуэрто Барриос', 'Puerto Barrios'),
-    'RSI': ('Рио Сидра', 'Rio Sidra'),
-    'PHH': ('Фантьет', 'Phan Thiet'),
-    'SNK': ('Снайдер', 'Snyder'),
-    'RTA': ('Ротума Айленд', 'Rotuma Island'),
-    'NFO': ("Ниуафо'оу", "Niuafo'ou"),
-    'SSO': ('Сан Лоренсу', 'Sao Lourenco'),
-    'SQU': ('Сапосоа', 'Saposoa'),
-    'POP': ('Пуэрто-Плата', 'Puerto Plata'),
-    'SDF': ('Луисвилл', 'Louisville'),
-    'VVZ': ('Иллизи', 'Illizi'),
-    'TGB': ('Тагбита', 'Tagbita'),
-    'PDR': ('Президенти-Дутра', 'Presidente Dutra'),
-    'PLK': ('Пойнт Лукаут', 'Point Lookout'),
-    'BDC': ('Барра-ду-Корда', 'Barra Do Corda'),
-    'RUF': ('Йуруф', 'Yuruf'),
-    'SVH': ('Стейтсвилл', 'Statesville'),
-    'WNE': ('Вора На Йе', 'Wora Na Ye'),
-    'SSR': ('Сара', 'Sara'),
-    'LUG': ('Лугано', 'Lugano'),
-    'RUM': ('Румджатар', 'Rumjatar'),
-    'PEZ': ('Пенза', 'Penza'),
-    'SDX': ('Седона', 'Sedona'),
-    'PWE': ('Певек', 'Pevek'),
-    'DKL': (None, 'Kiwigana Lodge'),
-    'PFO': ('Пафос', 'Paphos'),
-    'RXA': ('Раудха', 'Raudha'),
-    'WAK': ('Анказоабао', 'Ankazoabo'),
-    'MKI': (None, 'Obo'),
-    'PGR': ('Парагулд', 'Paragould'),
-    'HEO': ('Хаелого', 'Haelogo'),
-    'PIM': ('Пайн Маунтин', 'Pine Mountain'),
-    'KIO': ('Кили', 'Kili Island'),
-    'IGO': ('Чигородо', 'Chigorodo'),
-    'UMC': ('Умба', 'Umba'),
-    'PIQ': ('Пипиллипаи', 'Pipillipai'),
-    'KHE': ('Херсон', 'Kherson'),
-    'PJM': ('Пуэрто Джименез', 'Puerto Jimenez'),
-    'RZN': ('Рязань', 'Ryazan'),
-    'YFT': ('Тайпа', 'Taipa'),
-    'GKE': ('Гейленкирхен', 'Geilenkirchen'),
-    'JEJ': ('Джех', 'Jeh'),
-    'IAA': ('Игарка', 'Igarka'),
-    'PDF': ('Праду', 'Prado'),
-    'CBG': ('Кембридж', 'Cambridge'),
-    'SAO': ('Сан-Паулу', 'Sao Paulo'),
-    'TKY': ('Туркей Крик', 'Turkey Creek'),
-    'INT': ('Уинстон-Сейлем', 'Winston-Salem'),
-    'ECR': ('Эль Чарко', 'El Charco'),
-    'NLF': ('Дарнли Айленд', 'Darnley Island'),
-    'DZA': ('Мамуцу', 'Dzaoudzi'),
-    'SAU': ('Саву', 'Sawu'),
-    'WPO': ('Паония', 'Paonia'),
-    'HEZ': ('Натчез', 'Natchez'),
-    'PSW': ('Пассос', 'Passos'),
-    'XWM': (None, 'Hallsberg'),
-    'PLT': ('Плато', 'Plato'),
-    'VOH': ('Вуэмар', 'Vohemar'),
-    'YOI': (None, 'Opinaca'),
-    'XVJ': (None, 'Stevenage'),
-    'MFX': ('Мерибель', 'Meribel'),
-    'SAV': ('Саванна', 'Savannah'),
-    'LNM': ('Лангимар', 'Langimar'),
-    'SAX': ('Самбу', 'Sambu'),
-    'INQ': ('Инишир', 'Inisheer'),
-    'TCC': ('Тукумкари', 'Tucumcari'),
-    'KLR': ('Кальмар', 'Kalmar'),
-    'SDI': ('Саидор', 'Saidor'),
-    'GOS': ('Госфорд', 'Gosford'),
-    'SGC': ('Сургут', 'Surgut'),
-    'RID': ('Ричмонд', 'Richmond'),
-    'VAC': ('Фаррельбуш', 'Varrelbusch'),
-    'KEI': ('Кепи', 'Kepi'),
-    'OKJ': ('Окаяма', 'Okayama'),
-    'IRD': ('Ишурди', 'Ishurdi'),
-    'RSL': ('Расселл', 'Russell'),
-    'DOG': ('Донгола', 'Dongola'),
-    'VPZ': ('Вальпараисо', 'Valparaiso'),
-    'DLM': ('Даламан', 'Dalaman'),
-    'PMB': ('Пембина', 'Pembina'),
-    'VRK': ('Йоройнен', 'Joroinen'),
-    'SER': ('Сеймур', 'Seymour'),
-    'PMM': ('Пханом Саракхам', 'Phanom Sarakham'),
-    'EGL': ('Негхелли', 'Neghelli'),
-    'GBA': ('Залив Биг', 'Big Bay'),
-    'MQA': ('Мандора', 'Mandora'),
-    'XZK': (None, 'Amherst'),
-    'SEU': ('Серонера', 'Seronera'),
-    'WAV': ('Вейв Хилл', 'Wave Hill'),
-    'RLG': ('Росток', 'Rostock-Laage'),
-    'LRU': ('Лас Крусес', 'Las Cruces'),
-    'PMZ': ('Палмар', 'Palmar'),
-    'SCV': ('Сучава', 'Suceava'),
-    'ZAZ': ('Сарагоса', 'Zaragoza'),
-    'IFJ': ('Исафьордюр', 'Isafjordur'),
-    'MYA': ('Моруя', 'Moruya'),
-    'PWM': ('Портленд', 'Portland'),
-    'MOI': ('Митиаро', 'Mitiaro Island'),
-    'SFA': ('Сфакс', 'Sfax'),
-    'FMH': ('Фалмаус', 'Falmouth'),
-    'PNV': ('Паневежис', 'Panevezys'),
-    'PRS': ('Параси', 'Parasi'),
-    'PAO': ('Пало Альто', 'Palo Alto'),
-    'LWM': ('Лоуренс', 'Lawrence'),
-    'HLB': ('Батсвилл', 'Batesville'),
-    'SFP': ('Серферс Парадайс', 'Surfers Paradise'),
-    'POC': ('Ла Верн', 'La Verne'),
-    'MVT': ('Матаива', 'Mataiva'),
-    'AZS': ('Эль Катей', 'El Catey'),
-    'SFO': ('Сан-Франциско', 'San Francisco'),
-    'CVG': ('Цинциннати', 'Cincinnati'),
-    'SGF': ('Спрингфилд', 'Springfield'),
-    'LGX': ('Лаф Генейн', 'Lugh Ganane'),
-    'SGO': ('Сент-Джордж', 'St George'),
-    'EBO': ('Эбон', 'Ebon'),
-    'KIE': ('Киета', 'Kieta'),
-    'WAW': ('Варшава', 'Warsaw'),
-    'SYO': ('Сёнай', 'Shonai'),
-    'YXQ': ('Бивер Крик', 'Beaver Creek'),
-    'TEH': ('Тетлин', 'Tetlin'),
-    'NNR': ('Спидл', 'Spiddal'),
-    'SGQ': ('Санггата', 'Sanggata'),
-    'EXM': ('Эксмут Галф', 'Exmouth Gulf'),
-    'SWJ': ('Залив Юг Запад', 'South West Bay'),
-    'OGB': ('Оринджберг', 'Orangeburg'),
-    'SFN': ('Санта-Фе', 'Santa Fe'),
-    'XJQ': (None, 'Jonquiere'),
-    'NCP': ('Лусон', 'Luzon Island'),
-    'SGV': ('Сьерра Гранде', 'Sierra Grande'),
-    'RTN': ('Ратон', 'Raton'),
-    'SGZ': ('Сонгкхла', 'Songkhla'),
-    'OXY': ('Морни', 'Morney'),
-    'JDY': ('Дауни', 'Downey'),
-    'CLR': ('Калипатрия', 'Calipatria'),
-    'PYL': ('Остров Перри', 'Perry Island'),
-    'GAT': ('Гап', 'Gap'),
-    'RTG': ('Рутенг', 'Ruteng'),
-    'BKI': ('Кота-Кинабалу', 'Kota Kinabalu'),
-    'PRK': ('Приеска', 'Prieska'),
-    'WLG': ('Веллингтон', 'Wellington'),
-    'NDM': ('Менди', 'Mendi'),
-    'SHE': ('Шэньян', 'Shenyang'),
-    'SHS': ('Шаши', 'Shashi'),
-    'MYB': ('Мейюмба', 'Mayoumba'),
-    'FTE': ('Эль Калафате', 'El Calafate'),
-    'PRL': ('Порт Ошеник', 'Port Oceanic'),
-    'SIQ': ('Сингкеп', 'Singkep'),
-    'PRO': (None, 'Perry'),
-    'JOS': ('Джос', 'Jos'),
-    'BLT': ('Блэкуотер', 'Blackwater'),
-    'JAV': ('Илулиссат', 'Ilulissat'),
-    'CYL': ('Койолес', 'Coyoles'),
-    'XGH': (None, 'Flam'),
-    'VTE': ('Вьентьян', 'Vientiane'),
-    'ZSC': (None, 'Schoena'),
-    'PRW': ('Прентис', 'Prentice'),
-    'RLO': ('Мерло', 'Merlo'),
-    'SIU': ('Сиуна', 'Siuna'),
-    'RSK': ('Рансики', 'Ransiki'),
-    'WAP': ('Альто Палена', 'Alto Palena'),
-    'IHA': ('Ниихама', 'Niihama'),
-    'ELX': ('Эль-Тигре', 'El Tigre'),
-    'IGB': ('Инхеньеро Хакобакси', 'Ingeniero Jacobacci'),
-    'KSZ': ('Котлас', 'Kotlas'),
-    'PSF': ('Питтсфилд', 'Pittsfield'),
-    'PSR': ('Пескара', 'Pescara'),
-    'KBA': ('Кабала', 'Kabala'),
-    'DMR': ('Дхамар', 'Dhamar'),
-    'GMS': ('Гимарайнш', 'Guimaraes'),
-    'SIV': ('Салливан', 'Sullivan'),
-    'PWL': ('Пурвокерто', 'Purwokerto'),
-    'NKO': ('Анкокамбо', 'Ankokoambo'),
-    'JSI': ('Скиатос', 'Skiathos'),
-    'PTG': ('Полокване', 'Polokwane'),
-    'PTJ': ('Портленд', 'Portland'),
-    'GHF': ('Гибельштадт', 'Giebelstadt'),
-    'ZOM': (None, 'Minden'),
-    'TBG': ('Табубил', 'Tabubil'),
-    'YWP': ('Уэбеки', 'Webequie'),
-    'HOW': ('Форт Коббе', 'Fort Kobbe'),
-    'PTO': ('Пату Бранку', 'Pato Branco'),
-    'SZV': ('Сучжоу', 'Suzhou'),
-    'NPU': ('Сан Педро Ураба', 'San Pedro Uraba'),
-    'LDW': ('Лансдауни', 'Lansdowne'),
-    'PTR': ('Плезант Харбор', 'Pleasant Harbour'),
-    'XQP': ('Кепос', 'Quepos'),
-    'MCW': ('Мейсон Сити', 'Mason City'),
-    'MAH': ('Менорка', 'Menorca'),
-    'SIX': ('Синглтон', 'Singleton'),
-    'MAO': ('Манаус', 'Manaus'),
-    'PTT': ('Пратт', 'Pratt'),
-    'OWD': ('Норвуд', 'Norwood'),
-    'ERU': ('Эруме', 'Erume'),
-    'CRY': ('Калтон Хилл', 'Carlton Hill'),
-    'SJD': ('Сан-Хосе-дель-Кабо', 'San Jose Cabo'),
-    'BGF': ('Банги', 'Bangui'),
-    'SJM': ('Сан-Хуан', 'San Juan'),
-    'LMQ': ('Марса Брега', 'Marsa Brega'),
-    'NZE': ('Нзерекоре', 'Nzerekore'),
-    'PUN': ('Пюнийя', 'Punia'),
-    'BIW': ('Биллилуна', 'Billiluna'),
-    'YPD': ('Парри Саунд', 'Parry Sound'),
-    'ELR': ('Элелим', 'Elelim'),
-    'SJT': ('Сан-Анджело', 'San Angelo'),
-    'PUR': ('Пуэрто Рико', 'Puerto Rico'),
-    'FOY': ('Фойа', 'Foya'),
-    'PUU': ('Пуэрто Асис', 'Puerto Asis'),
-    'ONG': ('Морнингтон', 'Mornington'),
-    'WLS': ('Уоллис', 'Wallis Island'),
-    'MXD': ('Мэрион-Даунс', 'Marion Downs'),
-    'ZKI': (None, 'Saas-Fee'),
-    'RCH': ('Риоача', 'Riohacha'),
-    'MFV': ('Мелфа', 'Melfa'),
-    'SJV': ('Сан Хавьер', 'San Javier'),
-    'CSD': ('Крессуэлл Даунс', 'Cresswell Downs'),
-    'ANH': ('Ануха-Айленд-Резорт', 'Anuha Island Resort'),
-    'SKD': ('Самарканд', 'Samarkand'),
-    'CLG': ('Колинга', 'Coalinga'),
-    'LUX': ('Люксембург', 'Luxembourg'),
-    'SKZ': ('Суккур', 'Sukkur'),
-    'JUL': ('Хульяка', 'Juliaca'),
-    'PVW': ('Плейнвью', 'Plainview'),
-    'UPV': ('Апавон', 'Upavon'),
-    'VTG': ('Вунг-Тау', 'Vung Tau'),
-    'PVZ': ('Пейнсвилл', 'Painesville'),
-    'TNI': ('Сатна', 'Satna'),
-    'PWN': ('Питтс Таун', 'Pitts Town'),
-    'SLB': ('Сторм Лейк', 'Storm Lake'),
-    'RBI': ('Остров Раби', 'Rabi'),
-    'ZKK': (None, 'Schwyz'),
-    'NBU': ('Гленвью', 'Glenview'),
-    'SMK': ('Сент-Майкл', 'Saint Michael'),
-    'HAO': ('Гамильтон', 'Hamilton'),
-    'PWO': ('Пвето', 'Pweto'),
-    'CLY': ('Кальви', 'Calvi'),
-    'PIU': ('Пьюра', 'Piura'),
-    'FLB': ('Флориан', 'Floriano'),
-    'DGD': ('Далгаранга', 'Dalgaranga'),
-    'RES': ('Ресистенсия', 'Resistencia'),
-    'FPY': ('Перри', 'Perry'),
-    'ZRR': ('Фиумикино', 'Fiumicino'),
-    'SLE': ('Сейлем', 'Salem'),
-    'DHR': ('Ден-Хелдер', 'Den Helder'),
-    'BSY': ('Бардера', 'Bardera'),
-    'POH': ('Покахонтас', 'Pocahontas'),
-    'PYE': ('Пенрин', 'Penrhyn Island'),
-    'HFF': ('Хоффман', 'Hoffman'),
-    'PTN': ('Паттерсон', 'Patterson'),
-    'MNJ': ('Мананжари', 'Mananjary'),
-    'JIA': ('Жуи', 'Juina'),
-    'LNX': ('Смоленск', 'Smolensk'),
-    'KBN': ('Кабенда', 'Kabinda'),
-    'SND': ('Сено', 'Seno'),
-    'BGZ': ('Брага', 'Braga'),
-    'PZK': ('Пукапука', 'Puka Puka'),
-    'XOU': ('Сеговия', 'Segovia'),
-    'GEW': ('Гевоиа', 'Gewoia'),
-    'KUP': ('Купиано', 'Kupiano'),
-    'HKY': ('Хикори', 'Hickory'),
-    'SNU': ('Санта-Клара', 'Santa Clara'),
-    'SDT': ('Сейду Шариф', 'Saidu Sharif'),
-    'PKF': ('Парк Фолс', 'Park Falls'),
-    'WMK': ('Майерс Чак', 'Meyers Chuck'),
-    'SLT': ('Салида', 'Salida'),
-    'PAK': ('Ханапеп', 'Hanapepe'),
-    'KBX': ('Камбуайя', 'Kambuaya'),
-    'HTS': ('Хантингтон', 'Huntington'),
-    'WKB': ('Уоррекнабел', 'Warracknabeal'),
-    'SLW': ('Сальтильо', 'Saltillo'),
-    'SRE': ('Сукре', 'Sucre'),
-    'MSA': ('Маскрэт Дэм', 'Muskrat Dam'),
-    'MUD': ('Муеда', 'Mueda'),
-    'WNS': ('Навабшах', 'Nawabshah'),
-    'WOO': ('Вудчоппер', 'Woodchopper'),
-    'MXR': ('Миргород', 'Mirgorod'),
-    'OUS': ('Ориньюс', 'Ourinhos'),
-    'IDP': ('Индепенденс', 'Independence'),
-    'SLZ': ('Сан-Луис', 'Sao Luiz'),
-    'TOI': ('Троя', 'Troy'),
-    'NUE': ('Нюрнберг', 'Nuremberg'),
-    'TCK': ('Тинболи', 'Tinboli'),
-    'MKQ': ('Мерауке', 'Merauke'),
-    'IAM': ('Ин-Аменас', 'In Amenas'),
-    'QHU': ('Хузум', 'Husum'),
-    'OSC': ('Оскода', 'Oscoda'),
-    'LSN': ('Лос Баньос', 'Los Banos'),
-    'BIN': ('Бамиан', 'Bamiyan'),
-    'RAI': ('Прая', 'Praia'),
-    'SMP': ('Стокем', 'Stockholm'),
-    'RAQ': ('Раха', 'Raha'),
-    'REA': ('Реао', 'Reao'),
-    'JDO': ('Жуазейру-ду-Норти', 'Juazeiro Do Norte'),
-    'RAS': ('Решт', 'Rasht'),
-    'TCR': ('Тутикорин', 'Tuticorin'),
-    'RAW': ('Арава', 'Arawa'),
-    'SRM': ('Сандрингхам', 'Sandringham'),
-    'BPI': ('Биг-Пайни', 'Big Piney'),
-    'SMT': ('Сан Мун Лейк', 'Sun Moon Lake'),
-    'YGO': ('Годс Лейк Нарроус', 'Gods Lake Narrows'),
-    'KEV': ('Куоревеси', 'Kuorevesi'),
-    'SIH': ('Силгарай Доти', 'Silgadi Doti'),
-    'GYE': ('Гуаякиль', 'Guayaquil'),
-    'FOU': ('Фужаму', 'Fougamou'),
-    'PME': ('Портсмут', 'Portsmouth'),
-    'OKL': ('Оксибил', 'Oksibil'),
-    'BXH': ('Балхаш', 'Balhash'),
-    'BPF': ('Батуна', 'Batuna'),
-    'SEF': ('Себринг', 'Sebring'),
-    'PJZ': ('Пуэрто Хуарес', 'Puerto Juarez'),
-    'WOL': ('Вуллонгонг', 'Wollongong'),
-    'PIH': ('Покателло', 'Pocatello'),
-    'YCB': ('Кеймбридж-Бей', 'Cambridge Bay'),
-    'GNY': ('Шанлыурфа', 'Golgen'),
-    'IFO': ('Ивано-Франковск', 'Ivano-Frankovsk'),
-    'RBW': ('Уолтерборо', 'Walterboro'),
-    'HUT': ('Хатчинсон', 'Hutchinson'),
-    'PSN': ('Палестин', 'Palestine'),
-    'TSQ': ('Торрес', 'Torres'),
-    'WST': ('Уэстерли', 'Westerly'),
-    'ZKS': (None, 'Solothurn'),
-    'RCB': ('Ричардс-Бей', 'Richards Bay'),
-    'SQQ': ('Шяуляй', 'Siauliai'),
-    'YML': ('Мюррей Бэй', 'Murray Bay'),
-    'RDU': ('Роли', 'Raleigh/Durham'),
-    'HYR': ('Хейуърд', 'Hayward'),
-    'OAK': ('Окленд', 'Oakland'),
-    'YCI': ('Карибу Айленд', 'Caribou Island'),
-    'KPF': ('Кондубол', 'Kondubol'),
-    'XJO': ('Сория', 'Soria'),
-    'WTO': ('Вото', 'Wotho Island'),
-    'SMW': ('Смара', 'Smara'),
-    'ILK': ('Илака', 'Ilaka'),
-    'JPA': ('Жуан-Песоа', 'Joao Pessoa'),
-    'XXE': (None, 'Vennesla'),
-    'SNC': ('Салинас', 'Salinas'),
-    'JQE': ('Хаке', 'Jaque'),
-    'MMQ': ('Мбала', 'Mbala'),
-    'MNF': ('Остров Мана', 'Mana Island'),
-    'LCM': ('Ла Кумбре', 'La Cumbre'),
-    'VIH': ('Виши', 'Vichy'),
-    'SWF': ('Ньюбург', 'Newburgh'),
-    'SNF': ('Сан-Фелипе', 'San Felipe'),
-    'OES': ('Сан-Антонио Оэсте', 'San Antonio Oeste'),
-    'MNT': ('Минто', 'Minto'),
-    'YVP': ('Кууджуак', 'Kuujjuaq'),
-    'OCJ': ('Очо-Риос', 'Ocho Rios'),
-    'KPC': ('Порт Кларенс', 'Port Clarence'),
-    'STG': ('Сент-Джордж', 'Saint George Island'),
-    'IDA': ('Айдахо-Фоллс', 'Idaho Falls'),
-    'ZGX': (None, 'Viborg'),
-    'SSC': (None, 'Sumter'),
-    'OAJ': ('Джексонвилл', 'Richlands'),
-    'ACI': ('Олдерни', 'Alderney'),
-    'RBU': ('Роборн', 'Roebourne'),
-    'YKX': ('Киркленд Лейк', 'Kirkland Lake'),
-    'CZZ': ('Кампо', 'Campo'),
-    'SRV': ('Стони Ривер', 'Stony River'),
-    'REG': ('Реджо-ди-Калабрия', 'Reggio Calabria'),
-    'MHG': ('Мангейм', 'Mannheim'),
-    'SRP': ('Стур', 'Stord'),
-    'SNS': ('Салинас', 'Salinas'),
-    'YRD': ('Дин Ривер', 'Dean River'),
-    'XCN': ('Пуэрто Прицеса Сити', 'Puerto Princesa City'),
-    'DAH': ('Датина', 'Dathina'),
-    'PCR': ('Пуэрто-Карреньо', 'Puerto Carreno'),
-    'HYN': ('Тайчжоу', 'Taizhou'),
-    'RMP': ('Рампарт', 'Rampart'),
-    'DOE': ('Джоемое', 'Djoemoe'),
-    'STL': ('Сент-Луис', 'Saint Louis'),
-    'KOK': ('Коккола', 'Kokkola/Pietarsaari'),
-    'CMZ': ('Кала', 'Caia'),
-    'SNW': ('Тандве', 'Thandwe'),
-    'BAF': ('Уэстфилд', 'Westfield'),
-    'REL': ('Трелью', 'Trelew'),
-    'JPR': ('Жи-Парана', 'Ji-Parana'),
-    'EDK': ('Эль-Дорадо', 'El Dorado'),
-    'LEK': ('Лаба', 'Labe'),
-    'REN': ('Оренбург', 'Orenburg'),
-    'WGE': ('Уолджетт', 'Walgett'),
-    'YZX': ('Гринвуд', 'Greenwood'),
-    'NBE': ('Энфида', 'Enfidha'),
-    'AIB': ('Залив Анита', 'Anita Bay'),
-    'FIV': ('Файв Фингер Коас Гуард Хелипорт', 'Five Finger Coast Guard Heliport'),
-    'SOC': ('Суракарта', 'Surakarta'),
-    'LSX': ('Лхок Сукон', 'Lhok Sukon'),
-    'OSG': ('Оссима', 'Ossima'),
-    'TOG': ('Тоджиак', 'Togiak Village'),
-    'BCX': ('Белорецк', 'Beloreck'),
-    'XDE': ('Дьебугу', 'Diebougou'),
-    'TOK': ('Торокина', 'Torokina'),
-    'SOV': ('Селдовия', 'Seldovia'),
-    'STY': ('Сальто', 'Salto'),
-    'XFN': ('Сянфань', 'Xiangyang'),
-    'SGB': ('Сингауа', 'Singaua'),
-    'ADD': ('Аддис-Абеба', 'Addis Ababa'),
-    'XFU': (None, 'Tierp'),
-    'WBK': (None, 'West Branch'),
-    'REZ': ('Резенди', 'Resende'),
-    'NMB': ('Даман', 'Daman'),
-    'GEK': ('Гейнс Крик', 'Ganes Creek'),
-    'SPU': ('Сплит', 'Split'),
-    'BDZ': ('Байндунг', 'Baindoung'),
-    'FAQ': ('Фрейда Ривер', 'Freida River'),
-    'RFA': ('Рафай', 'Rafai'),
-    'BEQ': ('Бери-Сент-Эдмендс', 'Bury St Edmunds'),
-    'TGL': ('Тагула', 'Tagula'),
-    'JSA': ('Джайсалмер', 'Jaisalmer'),
-    'LGL': ('Лонг Лелланг', 'Long Lellang'),
-    'SPW': ('Спенсер', 'Spencer'),
-    'RSJ': ('Розарио', 'Rosario'),
-    'FAK': ('Фолс Айленд', 'False Island'),
-    'BEI': ('Бейка', 'Beica'),
-    'WLM': ('Уолтем', 'Waltham'),
-    'RIC': ('Ричмонд', 'Richmond'),
-    'THV': ('Йорк', 'York'),
-    'SQG': ('Синтанг', 'Sorong'),
-    'RIY': ('Рьян Мукалла', 'Riyan Mukalla'),
-    'XFI': (None, 'Port-Daniel'),
-    'SRA': ('Санта Роса', 'Santa Rosa'),
-    'IDF': ('Идьофа', 'Idiofa'),
-    'SRI': ('Самаринда', 'Samarinda'),
-    'XPA': ('Пама', 'Pama'),
-    'TOW': ('Толедо', 'Toledo'),
-    'CMP': ('Санта-ду-Арагуая', 'Santana Do Araguaia'),
-    'MKZ': ('Малакка', 'Malacca'),
-    'BHC': (None, 'Bhurban'),
-    'HLY': ('Холилэд', 'Holyhead'),
-    'PHA': ('Пхан Ранг', 'Phan Rang'),
-    'SBB': ('Санта-Барбара де Баринас', 'Santa Barbara de Barinas'),
-    'BTD': ('Брунетт-Даунс', 'Brunette Downs'),
-    'PPP': ('Просерпайн', 'Proserpine'),
-    'SRR': ('Стредброук Айленд', 'Stradbroke Island'),
-    'RJI': ('Раджори', 'Rajouri'),
-    'BGV': ('Бенту-Гонсалвис', 'Bento Goncalves'),
-    'MIU': ('Маидугури', 'Maiduguri'),
-    'TNL': ('Тернополь', 'Ternopol'),
-    'IBE': ('Ибаге', 'Ibague'),
-    'LVS': ('Лас-Вегас', 'Las Vegas'),
-    'KSM': ('Сент-Мэрис', "Saint Mary's"),
-    'SVW': ('Спэррвохн', 'Sparrevohn'),
-    'RKS': ('Рок-Спрингс', 'Rock Springs'),
-    'HOI': ('Хао Айленд', 'Hao Island'),
-    'RPN': ('Рош Пина', 'Rosh Pina'),
-    'RLA': ('Ролла', 'Rolla'),
-    'KAE': ('Каке', 'Kake'),
-    'VAK': ('Чевак', 'Chevak'),
-    'RLT': ('Арли', 'Arlit'),
-    'YEM': ('Манитованинг', 'Manitowaning'),
-    'RMF': ('Марса-Алам', 'Marsa Alam'),
-    'TKD': ('Такоради', 'Takoradi'),
-    'PRI': ('Праслен', 'Praslin Island'),
-    'TKJ': ('Ток', 'Tok'),
-    'YDE': ('Парадайс Ривер', 'Paradise River'),
-    'RBS': ('Орбост', 'Orbost'),
-    'SWB': ('Река Шо', 'Shaw River'),
-    'TKK': ('Трук', 'Truk, Caroline Islands'),
-    'GAG': ('Гейдж', 'Gage'),
-    'ATI': ('Артигас', 'Artigas'),
-    'XXU': ('Хедемора', 'Hedemora'),
-    'MKJ': ('Макоуа', 'Makoua'),
-    'DAP': ('Гокулешвар', 'Gokuleshwar'),
-    'KAA': ('Касама', 'Kasama'),
-    'SRU': ('Санта Круз', 'Santa Cruz'),
-    'AEK': ('Асеки', 'Aseki'),
-    'GAL': ('Галена', 'Galena'),
-    'SSE': ('Солапур', 'Sholapur'),
-    'POA': ('Порту-Алегри', 'Porto Alegre'),
-    'JUR': ('Джуриен Бэй', 'Jurien Bay'),
-    'MTE': ('Монти-Алегри', 'Monte Alegre'),
-    'ASH': ('Нэшуа', 'Nashua'),
-    'RMK': ('Ренмарк', 'Renmark'),
-    'MMY': ('Миякодзима', 'Miyako'),
-    'AJF': ('Эль-Джауф', 'Jouf'),
-    'OKS': ('Ошкош', 'Oshkosh'),
-    'XYA': ('Яандина', 'Yandina'),
-    'YWR': (None, 'White River'),
-    'CNY': ('Моаб', 'Moab'),
-    'SSW': ('Остров Стьюарт', 'Stuart Island'),
-    'SSZ': ('Сантос', 'Santos'),
-    'DEH': ('Декора', 'Decorah'),
-    'MFQ': ('Маради', 'Maradi'),
-    'MGJ': ('Монтгомери', 'Montgomery'),
-    'STH': ('Стрейтмор', 'Strathmore'),
-    'RNI': ('Биг-Корн-Айленд', 'Corn Island'),
-    'LTW': ('Леонардтаун', 'Leonardtown'),
-    'OYP': ("Сен-Жорж-де-л'Уайапок", 'St Georges de lOyapock'),
-    'SYZ': ('Шираз', 'Shiraz'),
-    'CVI': ('Калета Оливия', 'Caleta Olivia'),
-    'NPO': ('Нангапино', 'Nangapinoh'),
-    'WIU': ('Остров Гаров', 'Witu'),
-    'VRO': ('Матанзас', 'Matanzas'),
-    'TKP': ('Такапото', 'Takapoto'),
-    'MAI': ('Мангочи', 'Mangochi'),
-    'RKZ': ('Ксигазе', 'Xigaze/Rikaze'),
-    'SZH': ('Сенипах', 'Senipah'),
-    'STK': ('Стерлинг', 'Sterling'),
-    'AXM': ('Армения', 'Armenia'),
-    'WLO': ('Ватерлоо', 'Waterloo'),
-    'PDZ': ('Педерналес', 'Pedernales'),
-    'LCC': ('Лечче', 'Lecce'),
-    'ROI': ('Ройет', 'Roi Et'),
-    'CFC': ('Касадор', 'Cacador'),
-    'KII': ('Кибули', 'Kibuli'),
-    'PKR': ('Покхара', 'Pokhara'),
-    'STQ': ('Сейнт Мэрис', 'St Marys'),
-    'BKU': ('Бетиоки', 'Betioky'),
-    'WBO': ('Беророа', 'Beroroha'),
-    'GRM': ('Гранд-Марей', 'Grand Marais'),
-    'STU': ('Санта Крус', 'Santa Cruz'),
-    'RNT': ('Рентон', 'Renton'),
-    'LUH': ('Лудхияна', 'Ludhiana'),
-    'GEB': ('Гебе', 'Gebe'),
-    'PDG': ('Паданг', 'Padang'),
-    'YZW': ('Теслин', 'Teslin'),
-    'KWZ': ('Колвези', 'Kolwezi'),
-    'MGS': ('Мангаиа', 'Mangaia Island'),
-    'SUB': ('Сурабая', 'Surabaya'),
-    'BPE': ('Баган', 'Bagan'),
-    'XKZ': (None, 'Vinstra'),
-    'INC': ('Иньчуань', 'Yinchuan'),
-    'TAX': ('Талиабу', 'Taliabu'),
-    'XES': ('Лейк Дженива', 'Lake Geneva'),
-    'IMO': ('Земио', 'Zemio'),
-    'HAL': ('Халали', 'Halali'),
-    'WRL': ('Уэрленд', 'Worland'),
-    'MYE': ('Мияки Джика', 'Miyake Jima'),
-    'FYT': ('Файа', 'Faya'),
-    'RWI': ('Роки Маунт', 'Rocky Mount'),
-    'SFS': (None, 'Subic Bay'),
-    'OTI': ('Питу', 'Pitu'),
-    'KSV': ('Спрингвейл', 'Springvale'),
-    'BWT': ('Берни', 'Burnie'),
-    'XON': (None, 'Carleton'),
-    'MWP': ('Маунтан', 'Mountain'),
-    'BZK': ('Брянск', 'Bryansk'),
-    'AEL': ('Альберт-Ли', 'Albert Lea'),
-    'TPJ': ('Тапледжунг', 'Taplejung'),
-    'MPR': ('Макферсон', 'Mcpherson'),
-    'NTD': ('Порт Хуэенеме', 'Port Hueneme'),
-    'RNE': ('Роанн', 'Roanne'),
-    'KXR': ('Каруула', 'Karoola'),
-    'ROC': ('Рочестер', 'Rochester'),
-    'TBB': ('Туихоа', 'Tuy Hoa'),
-    'ROG': ('Роджерс', 'Rogers'),
-    'WIO': ('Уилкания', 'Wilcannia'),
-    'UBI': ('Буин', 'Buin'),
-    'FRR': ('Фронт Ройал', 'Front Royal'),
-    'KAZ': ('Кау', 'Kau'),
-    'SUR': ('Саммер Бивер', 'Summer Beaver'),
-    'LLL': ('Лиссаделл', 'Lissadell'),
-    'MHU': ('Маунт Хотам', 'Mount Hotham'),
-    'YAP': ('Яп', 'Yap, Caroline Islands'),
-    'MUW': ('Грис', 'Mascara-Ghriss'),
-    'HGL': ('Хельголанд', 'Helgoland'),
-    'DUM': ('Думай', 'Dumai'),
-    'SVE': ('Сасанвилл', 'Susanville'),
-    'ROT': ('Роторуа', 'Rotorua'),
-    'KBO': ('Кабало', 'Kabalo'),
-    'ONU': ('Оно И Лау', 'Ono I Lau'),
-    'YGN': ('Гринвей Саунд', 'Greenway Sound'),
-    'CBP': ('Коимбра', 'Coimbra'),
-    'ABL': ('Амблер', 'Ambler'),
-    'OWB': ('Оуэнсборо', 'Owensboro'),
-    'KZN': ('Казань', 'Kazan'),
-    'CZT': ('Карризо Спрингс', 'Carrizo Springs'),
-    'TBI': ('Зе Байт', 'The Bight'),
-    'MYY': ('Мири', 'Miri'),
-    'CPE': ('Кампече', 'Campeche'),
-    'SVF': ('Саве', 'Save'),
-    'RPA': ('Ролпа', 'Rolpa'),
-    'OKK': ('Кокомо', 'Kokomo'),
-    'ZYY': (None, 'Marnardal'),
-    'TCQ': ('Такна', 'Tacna'),
-    'CBX': ('Кондоболин', 'Condobolin'),
-    'SWY': ('Ситиаван', 'Sitiawan'),
-    'TCT': ('Такотна', 'Takotna'),
-    'BGC': ('Браганса', 'Braganca'),
-    'YBL': ('Кэмпбелл-Ривер', 'Campbell River'),
-    'SXP': ('Нунам-Икуа', 'Sheldon Point'),
-    'RPV': ('Ропер Уолли', 'Roper Valley'),
-    'ARO': ('Арболетас', 'Arboletas'),
-    'UES': ('Уокешо', 'Waukesha'),
-    'SOT': ('Соданкюля', 'Sodankyla'),
-    'WME': ('Маунт Кейт', 'Mount Keith'),
-    'NRC': ('Кроус Ландинг', 'Crows Landing'),
-    'RRA': ('Ронда', 'Ronda'),
-    'RRS': ('Рёрус', 'Roros'),
-    'DDC': ('Додж-Сити', 'Dodge City'),
-    'PAB': ('Биласпур', 'Bilaspur'),
-    'CBW': ('Кампо Моуаро', 'Campo Mourao'),
-    'MBR': ('Мбоут', 'Mbout'),
-    'TBV': ('Табал', 'Tabal'),
-    'RSH': ('Рашн Мишн', 'Russian Mission'),
-    'BJG': ('Болаанг', 'Bolaang'),
-    'DIG': ('Шангри-Ла', 'Diqing'),
-    'SXZ': ('Сиирт', 'Siirt'),
-    'VTN': ('Валентайн', 'Valentine'),
-    'APO': ('Апартадо', 'Apartado'),
-    'RST': ('Рочестер', 'Rochester'),
-    'SDN': ('Сандане', 'Sandane'),
-    'PHN': ('Порт Гурон', 'Port Huron'),
-    'LAW': ('Лотон', 'Lawton'),
-    'FIC': ('Файр Коув', 'Fire Cove'),
-    'RTC': ('Ратнагири', 'Ratnagiri'),
-    'RVE': ('Саравена', 'Saravena'),
-    'RWL': ('Роулинс', 'Rawlins'),
-    'LBK': ('Либои', 'Liboi'),
-    'WPM': ('Випим', 'Wipim'),
-    'BKY': ('Букаву', 'Bukavu'),
-    'RUI': ('Руидозо', 'Ruidoso'),
-    'LIY': ('Хинесвилль', 'Hinesville'),
-    'TMQ': ('Тамбао', 'Tambao'),
-    'YBP': ('Ибинь', 'Yibin'),
-    'SAM': ('Саламо', 'Salamo'),
-    'YDA': ('Доусон', 'Dawson City'),
-    'RUR': ('Рурту', 'Rurutu'),
-    'TOO': ('Сан Вито', 'San Vito'),
-    'YDB': ('Беруош Ландинг', 'Burwash Landings'),
-    'SHB': ('Накасибецу', 'Nakashibetsu'),
-    'TOP': ('Топика', 'Topeka'),
-    'TOY': ('Тояма', 'Toyama'),
-    'RZP': ('Тайтай Сандовал', 'Taytay Sandoval'),
-    'YDU': ('Касба', 'Kasba Lake'),
-    'RZS': ('Саван', 'Sawan'),
-    'YCH': ('Мирамичи', 'Miramichi'),
-    'SAD': ('Саффорд', 'Safford'),
-    'SYE': ('Садах', 'Sadah'),
-    'YCX': ('Гейджтаун', 'Gagetown'),
-    'TOC': ('Токкоа', 'Toccoa'),
-    'SYK': ('Стиккишолмар', 'Stykkisholmur'),
-    'TAM': ('Тампико', 'Tampico'),
-    'TEI': ('Тезу', 'Tezu'),
-    'SHJ': ('Шарджа', 'Sharjah'),
-    'SYM': ('Сымао', "Pu'er"),
-    'SAP': ('Сан-Педро-Сула', 'San Pedro Sula'),
-    'YEA': ('Эдмонтон', 'Edmonton'),
-    'YME': ('Матан', 'Matane'),
-    'TQS': ('Трес Эскуинас', 'Tres Esquinas'),
-    'ULB': ('Улеи', 'Ulei'),
-    'SBJ': ('Сан Матеус', 'Sao Mateus'),
-    'TRH': ('Трона', 'Trona'),
-    'ULG': ('Улджит', 'Ulgit'),
-    'SBR': ('Саибаи', 'Saibai Island'),
-    'SYS': ('Сунчхон', 'Suncheon'),
-    'SBV': ('Сабах', 'Sabah'),
-    'TRJ': ('Таракбитс', 'Tarakbits'),
-    'SCA': ('Санта Каталина', 'Santa Catalina'),
-    'YTC': ('Струди', 'Sturdee'),
-    'SEO': ('Сегеле', 'Seguela'),
-    'TEN': ('Тунжэнь', 'Tongren'),
-    'SYV': ('Силвестер', 'Sylvester'),
-    'SCM': ('Скаммон Бей', 'Scammon Bay'),
-    'YWS': ('Уистлер', 'Whistler'),
-    'SYY': ('Сторновей', 'Stornoway, Outer Stat Hebrides'),
-    'SMJ': ('Сим', 'Sim'),
-    'FIN': ('Финшхафен', 'Finschhafen'),
-    'SDO': ('о. Рётса Садо', 'Ryotsu Sado Island'),
-    'YYQ': ('Черчилл', 'Churchill'),
-    'TSC': ('Тайса', 'Taisha'),
-    'SZA': ('Сойо', 'Soyo'),
-    'UNI': ('Юнион', 'Union Island'),
-    'MWM': ('Уиндом', 'Windom'),
-    'TSP': ('Техачапи', 'Tehachapi'),
-    'UNR': ('Ундеркаан', 'Underkhaan'),
-    'SEY': ('Селибаби', 'Selibaby'),
-    'ZFA': ('Фару', 'Faro'),
-    'ZSP': ('Сейнт Пол', 'St Paul'),
-    'SEZ': ('Маэ', 'Mahe Island'),
-    'SGJ': ('Сагараи', 'Sagarai'),
-    'TTE': ('Тернате', 'Ternate'),
-    'KAI': ('Каиетеур', 'Kaieteur'),
-    'SZJ': ('Сигуанеа', 'Siguanea'),
-    'TUM': ('Тамут', 'Tumut'),
-    'KTX': ('Кутиала', 'Koutiala'),
-    'SFW': ('Санта Фе', 'Santa Fe'),
-    'TIF': ('Таиф', 'Taif'),
-    'SZM': ('Сесрием', 'Sesriem'),
-    'YEN': ('Эстеван', 'Estevan'),
-    'SGU': ('Сент-Джордж', 'Saint George'),
-    'ZMT': ('Массет', 'Masset'),
-    'TJQ': ('Танджунгпандан', 'Tanjung Pandan'),
-    'SGX': ('Сонгеа', 'Songea'),
-    'CTR': ('Каттл-Крик', 'Cattle Creek'),
-    'CBK': ('Колби', 'Colby'),
-    'USR': ('Усть-Нера', 'Ust-Nera'),
-    'GNU': ('Гудньюс Бэй', 'Goodnews Bay'),
-    'UAP': ('Уа Поу', 'Ua Pou'),
-    'TKB': ('Текаду', 'Tekadu'),
-    'TGV': ('Тарговиште', 'Targovishte'),
-    'SHC': ('Индаселасси', 'Indaselassie'),
-    'OOR': ('Мураберри', 'Mooraberree'),
-    'URJ': ('Урай', 'Uraj'),
-    'TXF': ('Тейшейра-ди-Фрейтас', 'Teixeira de Freitas'),
-    'CTK': ('Кантон', 'Canton'),
-    'TVL': ('Саус Лейк Тахое', 'South Lake Tahoe'),
-    'FVR': ('Река Форрест', 'Forrest River'),
-    'GDO': ('Гуасдуалито', 'Guasdualito'),
-    'TLR': ('Тулар', 'Tulare'),
-    'TXN': ('Хуаншань', 'Tunxi'),
-    'ODB': ('Кордоба', 'Cordoba'),
-    'UTT': ('Умтата', 'Umtata'),
-    'PCG': ('Пасо Кабаллос', 'Paso Caballos'),
-    'TXR': ('Танбар', 'Tanbar'),
-    'CGR': ('Кампу-Гранди', 'Campo Grande'),
-    'TAE': ('Тэгу', 'Daegu'),
-    'DRJ': ('Дретаббетдже', 'Drietabbetje'),
-    'QYL': (None, 'Almelo'),
-    'MXE': ('Макстон', 'Maxton'),
-    'ELT': ('Тур Синай Сити', 'Tour Sinai City'),
-    'TAS': ('Ташкент', 'Tashkent'),
-    'EWE': ('Эвер', 'Ewer'),
-    'MBX': ('Марибор', 'Maribor'),
-    'TAT': ('Попрад', 'Poprad/Tatry'),
-    'TLW': ('Таласи', 'Talasea'),
-    'GCY': ('Гринвилл', 'Greenville'),
-    'TAY': ('Тарту', 'Tartu'),
-    'EGA': ('Энгатли', 'Engati'),
-    'AKS': ('Ауки', 'Auki'),
-    'UVL': ('Харга', 'Kharga'),
-    'SOA': ('Шокчанг', 'Soc Trang'),
-    'QWP': ('Винтер Парк', 'Winter Park'),
-    'LYE': ('Линхам', 'Lyneham'),
-    'RLK': ('Баян-Нур', 'Bayannur'),
-    'DPE': ('Дьеп', 'Dieppe'),
-    'BSH': ('Брайтон', 'Brighton'),
-    'TBC': ('Таба Сити', 'Tuba City'),
-    'SJE': ('Сан Хосе Дел Гуа', 'San Jose Del Gua'),
-    'TBM': ('Тамбанг Самба', 'Tumbang Samba'),
-    'XXC': (None, 'Bo'),
-    'LOM': ('Лагос де Морено', 'Lagos De Moreno'),
-    'TNF': ('Тусю-ле-Нобль', 'Toussus-Le-Noble'),
-    'CRT': ('Кроссетт', 'Crossett'),
-    'WUG': ('Вау', 'Wau'),
-    'MOS': ('Мозес Пойнт', 'Moses Point'),
-    'VCD': ('Виктория Ривер Даунс', 'Victoria River Downs'),
-    'UAR': (None, 'Bouarfa'),
-    'UDJ': ('Ужгород', 'Uzhgorod'),
-    'SKG': ('Салоники', 'Thessaloniki'),
-    'SEK': ('Среднеколымск', 'Srednekolymsk'),
-    'WWK': ('Вевак', 'Wewak'),
-    'CZK': ('Каскейд Локс', 'Cascade Locks'),
-    'XPN': (None, 'Brampton'),
-    'SKR': ('Шакисо', 'Shakiso'),
-    'VCF': ('Вальчета', 'Valcheta'),
-    'SVB': ('Самбава', 'Sambava'),
-    'OOL': ('Голд-Кост', 'Coolangatta (Gold Coast)'),
-    'CSO': ('Кочстед', 'Cochstedt'),
-    'SKX': ('Саранск', 'Saransk'),
-    'TBT': ('Табатинга', 'Tabatinga'),
-    'MUA': ('Мунда', 'Munda'),
-    'LTH': ('Латроп Уэлс Кон', 'Lathrop Wells'),
-    'BUR': ('Бербанк', 'Burbank'),
-    'UEL': ('Келимане', 'Quelimane'),
-    'SKY': ('Сандаски', 'Sandusky'),
-    'TNR': ('Антананариву', 'Antananarivo'),
-    'TBW': ('Тамбов', 'Tambov'),
-    'EPI': ('Эпи', 'Epi'),
-    'UGA': ('Булган', 'Bulgan'),
-    'TCB': ('Треже Кей', 'Treasure Cay'),
-    'SLA': ('Сальта', 'Salta'),
-    'TCE': ('Тулча', 'Tulcea'),
-    'ZXO': (None, 'Fauske'),
-    'LFP': ('Лейкфилд', 'Lakefield'),
-    'OLB': ('Ольбия', 'Olbia'),
-    'MYC': ('Маракай', 'Maracay'),
-    'DCY': ('Дабба', 'Daocheng'),
-    'BED': ('Бедфорд', 'Bedford'),
-    'TCU': ('Тхаба Нчу', 'Thaba Nchu'),
-    'YGM': ('Джимли', 'Gimli'),
-    'ZEQ': (None, 'Dewsbury'),
-    'SIK': ('Сайкстон', 'Sikeston'),
-    'YFL': ('Форт Релианс', 'Fort Reliance'),
-    'KGE': ('Остров Кагау', 'Kagau'),
-    'YGP': ('Гаспе', 'Gaspe'),
-    'UHE': ('Градиште', 'Uherske Hradiste'),
-    'VRL': ('Вила-Реал', 'Vila Real'),
-    'SME': ('Сомерсет', 'Somerset'),
-    'GCD': (None, 'Electric City'),
-    'YGW': ('Кууджуарапик', 'Kuujjuarapik'),
-    'KCF': ('Каданвари', 'Kadanwari'),
-    'FAU': (None, 'Fahud'),
-    'SIB': ('Сибити', 'Sibiti'),
-    'TDJ': ('Таджура', 'Tadjoura'),
-    'RWN': ('Ровно', 'Rovno'),
-    'OBS': ('Убена', 'Aubenas'),
-    'CKT': ('Сарахс', 'Sarakhs'),
-    'TBL': ('Тейбеланд', 'Tableland'),
-    'FYM': ('Фейетвилл', 'Fayetteville'),
-    'KGC': ('Кингскот', 'Kingscote'),
-    'TRB': ('Турбо', 'Turbo'),
-    'TDK': ('Талдыкорган', 'Taldykorgan'),
-    'KRD': ('Курунди', 'Kurundi'),
-    'IXG': ('Белгаум', 'Belgaum'),
-    'KLE': ('Каеле', 'Kaele'),
-    'KHS': ('Эль-Хасаб', 'Khasab'),
-    'SQZ': ('Скрамптон', 'Scampton'),
-    'LOE': ('Лей', 'Loei'),
-    'ULM': ('Нью-Алм', 'New Ulm'),
-    'SNE': ('Сан-Николау', 'Sao Nicolau'),
-    'TEY': ('Тингейри', 'Thingeyri'),
-    'TEZ': ('Тезпур', 'Salonibari'),
-    'YHY': ('Хей Ривер', 'Hay River'),
-    'VAU': ('Ватукоула', 'Vatukoula'),
-    'IXU': ('Аурангабад', 'Aurangabad'),
-    'TFB': ('Тифалмин', 'Tifalmin'),
-    'FGU': ('Фангатау', 'Fangatau'),
-    'YKC': ('Коллинс Бэй', 'Collins Bay'),
-    'CVR': ('Калвер Сити', 'Culver City'),
-    'SOJ': ('Сёркйосен', 'Sorkjosen'),
-    'SMU': ('Шип Маунтин', 'Sheep Mountain'),
-    'XFQ': (None, 'Weymont'),
-    'IBB': (None, 'Isabela Island'),
-    'TMP': ('Тампере', 'Tampere'),
-    'TGU': ('Тегусигальпа', 'Tegucigalpa'),
-    'GXG': ('Негаге', 'Negage'),
-    'KOV': ('Кокшетау', 'Kokshetau'),
-    'TUY': ('Тулум', 'Tulum'),
-    'ZTI': ('Хумэнь', 'Humen'),
-    'SMY': ('Сименти', 'Simenti'),
-    'XBG': ('Боганде', 'Bogande'),
-    'YVK': (None, 'Koppang'),
-    'SNH': ('Стэнтхорп', 'Stanthorpe'),
-    'SWN': ('Сахивале', 'Sahiwal'),
-    'FFD': ('Фэйрфорд', 'Fairford'),
-    'GWV': ('Глендейл', 'Glendale'),
-    'THG': ('Тангул', 'Thangool'),
-    'AFY': ('Афьонкарахисар', 'Afyon'),
-    'XBL': ('Буно Бедел', 'Buno Bedelle'),
-    'RPX': ('Раундап', 'Roundup'),
-    'BVL': ('Баурес', 'Baures'),
-    'NVY': ('Нейевели', 'Neyveli'),
-    'UAE': ('Маунт Ауэ', 'Mount Aue'),
-    'XGC': ('Лунд', 'Lund'),
-    'HOP': ('Хопкинсвилль', 'Hopkinsville'),
-    'UNK': ('Уналаклит', 'Unalakleet'),
-    'SNI': ('Синоэ', 'Sinoe'),
-    'SOO': ('Сёдерхамн', 'Soderhamn'),
-    'GXQ': ('Койяик', 'Coyhaique'),
-    'SPZ': ('Спрингдейл', 'Springdale'),
-    'QXF': (None, 'Vestbjerg'),
-    'EMG': ('Эмпангени', 'Empangeni'),
-    'YOC': ('Олд-Кроу', 'Old Crow'),
-    'TKT': ('Так', 'Tak'),
-    'MMO': ('Маио', 'Maio'),
-    'HDF': ('Херингсдорф', 'Heringsdorf'),
-    'UDN': ('Удине', 'Udine'),
-    'SGS': ('Санга-Санга', 'Sanga Sanga'),
-    'PEF': ('Пенемюнде', 'Peenemuende'),
-    'TLM': ('Тлемсен', 'Tlemcen'),
-    'MMW': ('Мома', 'Moma'),
-    'RSS': ('Росейрес', 'Roseires'),
-    'VLI': ('Порт-Вила', 'Port Vila'),
-    'UGN': ('Уокиган', 'Waukegan'),
-    'KQA': ('Акутан', 'Akutan'),
-    'UGT': ('Емагобитор', 'Umnugobitour'),
-    'FOS': ('Форрест', 'Forrest'),
-    'XCH': ('Остров Рождества', 'Christmas Island'),
-    'SNV': ('Санта Елена', 'Santa Elena'),
-    'IPW': ('Ипсвич', 'Ipswich'),
-    'KKP': ('Кулберра', 'Koolburra'),
-    'SOG': ('Согндал', 'Sogndal'),
-    'UIL': ('Куиллейт', 'Quillayute'),
-    'KIC': ('Кинг Сити', 'King City'),
-    'GGS': ('Гобернадор Грегорес', 'Gobernador Gregores'),
-    'TLO': ('Тол', 'Tol'),
-    'LEN': ('Леон', 'Leon'),
-    'JCO': ('Комино', 'Comino'),
-    'UKU': ('Нуку', 'Nuku'),
-    'TGK': ('Таганрог', 'Taganrog'),
-    'PGO': ('Пагоса Спрингс', 'Pagosa Springs'),
-    'WPK': ('Уротэм Парк', 'Wrotham Park'),
-    'URM': ('Уриман', 'Uriman'),
-    'RRI': ('Барора', 'Barora'),
-    'PNX': ('Шерман-Денисон', 'Sherman-Denison'),
-    'UME': ('Умео', 'Umea'),
-    'LOF': ('Лоэн', 'Loen'),
-    'URC': ('Урумчи', 'Urumqi'),
-    'TLS': ('Тулуза', 'Toulouse'),
-    'SRX': ('Серт', 'Sert'),
-    'SOP': ('Саутерн Пайнс', 'Southern Pines'),
-    'ERG': ('Ербогачён', 'Erbogachen'),
-    'AIH': (None, 'Aiambak'),
-    'TMG': ('Томанггонг', 'Tomanggong'),
-    'QWO': (None, 'Holstebro'),
-    'VVK': ('Вестервик', 'Vastervik'),
-    'YPA': ('Принс Элберт', 'Prince Albert'),
-    'KTK': ('Кануа', 'Kanua'),
-    'TPO': ('Таналиан Пойнт', 'Tanalian Point'),
-    'TMI': ('Тамлингтар', 'Tumling Tar'),
-    'WDB': ('Дип Бэй', 'Deep Bay'),
-    'ZSA': ('Сан-Сальвадор', 'San Salvador'),
-    'KBY': ('Стрики Бэй', 'Streaky Bay'),
-    'SPE': ('Сепулот', 'Sepulot'),
-    'TMO': ('Тумеремо', 'Tumeremo'),
-    'UON': ('Муонг Саи', 'Muong Sai'),
-    'PYV': ('Яавиза', 'Yaviza'),
-    'SEI': ('Сеньор-ду-Бонфин', 'Senhor Do Bonfim'),
-    'KBM': ('Кабвум', 'Kabwum'),
-    'БАТ': ('Баткен', 'Batken'),
-    'TQR': ('о. Сан-Доминго', 'San Domino Island'),
-    'TMR': ('Таманрассет', 'Tamanrasset'),
-    'TOT': ('Тотнесс', 'Totness'),
-    'TMW': ('Тамворт', 'Tamworth'),
-    'VAT': ('Ватомандри', 'Vatomandry'),
-    'TNA': ('Цзинань', 'Jinan'),
-    'SOQ': ('Соронг', 'Sorong'),
-    'YPB': ('Порт Элберни', 'Port Alberni'),
-    'TMS': ('Сан-Томе', 'Sao Tome Island'),
-    'UTG': ('Цгутинг', 'Quthing'),
-    'TNG': ('Танжер', 'Tangier'),
-    'SPH': ('Сопу', 'Sopu'),
-    'TNM': ('Тениенте Р. Мариш Мартин', 'Teniente R. Marsh Martin'),
-    'MYN': ('Мареб', 'Mareb'),
-    'TPP': ('Тарапото', 'Tarapoto'),
-    'CYI': ('Цзяи', 'Chiayi'),
-    'TPT': ('Тапета', 'Tapeta'),
-    'LSR': ('Лост Ривер', 'Lost River'),
-    'MJK': ('Моки Миа', 'Monkey Mia'),
-    'NCS': ('Ньюкасл', 'Newcastle'),
-    'XBE': ('оз. Бирскин', 'Bearskin Lake'),
-    'TLF': ('Телида', 'Telida'),
-    'JIB': ('Джибути', 'Djibouti'),
-    'SQK': ('Сиди Барани', 'Sidi Barani'),
-    'DGF': ('Дуглас Лейк', 'Douglas Lake'),
-    'GDZ': ('Геленджик', 'Gelendzik'),
-    'TRO': ('Тари', 'Taree'),
-    'TRS': ('Триест', 'Trieste'),
-    'GGW': ('Глазго', 'Glasgow'),
-    'WAU': ('Уоучоп', 'Wauchope'),
-    'NYR': ('Нюрба', 'Nyurba'),
-    'SRB': ('Санта Роса', 'Santa Rosa'),
-    'TAL': ('Танана', 'Tanana'),
-    'AAS': ('Апалапзили', 'Apalapsili'),
-    'OBF': ('Оберпфаффенхофен', 'Oberpfaffenhofen'),
-    'GDW': ('Гладуин', 'Gladwin'),
-    'WGA': ('Уогга-Уогга', 'Wagga Wagga'),
-    'KSO': ('Костур', 'Kastoria'),
-    'NTT': ('Ниуатопутапу', 'Niuatoputapu'),
-    'YRG': ('Риголет', 'Rigolet'),
-    'WIN': ('Уинтон', 'Winton'),
-    'TRT': ('Тремонтон', 'Tremonton'),
-    'MVL': ('Стоу', 'Stowe'),
-    'ZDB': (None, 'Adelboden'),
-    'YRQ': ('Труа-Ривьер', 'Trois-Rivieres'),
-    'YWJ': ('Делайн', 'Deline'),
-    'WOW': ('Уиллоу', 'Willow'),
-    'RFG': ('Рефухио', 'Refugio'),
-    'WPU': ('Кабо-де-Орнос', 'Puerto Williams'),
-    'KMO': ('Манокотак', 'Manokotak'),
-    'WPA': ('Пуэрто Айзен', 'Puerto Aisen'),
-    'KWL': ('Гуйлинь', 'Guilin'),
-    'GND': ('Гренада', "St. George's"),
-    'EUF': ('Юфола', 'Eufaula'),
-    'TRY': ('Тороро', 'Tororo'),
-    'XAL': ('Аламос', 'Alamos'),
-    'KIS': ('Кисуму', 'Kisumu'),
-    'TRZ': ('Тируччираппалли', 'Tiruchirappalli'),
-    'KOW': ('Ганьчжоу', 'Ganzhou'),
-    'RDZ': ('Родез', 'Rodez'),
-    'JXN': ('Джексон', 'Jackson'),
-    'SMG': ('Санта Мария', 'Santa Maria'),
-    'KOE': ('Купанг', 'Kupang'),
-    'KOG': ('Кхонг', 'Khong'),
-    'XIG': ('Ксингуара', 'Xinguara'),
-    'SRQ': ('Сарасота', 'Sarasota'),
-    'TJN': ('Такуме', 'Takume'),
-    'KKF': ('Кагвик Крик', 'Kagvik Creek'),
-    'SWM': ('Суиа-Миссу', 'Suia-Missu'),
-    'ESW': ('Истон', 'Easton'),
-    'KFP': ('Фолз Пасс', 'False Pass'),
-    'TSD': ('Тшиписе', 'Tshipise'),
-    'SUW': ('Сьюпириор', 'Superior'),
-    'KSS': ('Сикасо', 'Sikasso'),
-    'TSL': ('Тамуин', 'Tamuin'),
-    'KDJ': (None, 'Ndjole'),
-    'CSS': ('Касиландия', 'Cassilandia'),
-    'ZAC': ('Йорк Ландинг', 'York Landing'),
-    'XKS': ('Касабоника', 'Kasabonika'),
-    'VAA': ('Вааса', 'Vaasa'),
-    'BWE': ('Брауншвейг', 'Braunschweig'),
-    'KSB': ('Касаномбе', 'Kasanombe'),
-    'PRA': ('Парана', 'Parana'),
-    'YWY': ('Ригли', 'Wrigley'),
-    'XTG': ('Таргоминда', 'Thargomindah'),
-    'NIA': ('Нимба', 'Nimba'),
-    'IPA': ('Ипота', 'Ipota'),
-    'XAJ': (None, 'Hirtshals'),
-    'YBV': ('Беренс Ривер', 'Berens River'),
-    'ULL': ('Малл', 'Mull'),
-    'YCK': ('Колвилл', 'Colville Lake'),
-    'ONX': ('Колон', 'Colon'),
-    'BYS': ('Форт Ирвин', 'Fort Irwin'),
-    'JBR': ('Джонсборо', 'Jonesboro'),
-    'TSZ': ('Цэцэрлэг', 'Tsetserleg'),
-    'MPK': ('Мокпхо', 'Mokpo'),
-    'KVD': ('Гянджа', 'Gyandzha'),
-    'YPY': ('Форт Чипуян', 'Fort Chipewyan'),
-    'KYF': ('Йеелирри', 'Yeelirrie'),
-    'TGO': ('Тунляо', 'Tongliao'),
-    'HOK': ('Хукер Крик', 'Hooker Creek'),
-    'YTG': ('Салливан Бэй', 'Sullivan Bay'),
-    'KME': ('Камембе', 'Kamembe'),
-    'VEG': ('Маиквак', 'Maikwak'),
-    'FAE': ('Фарерские острова', 'Faroe Islands'),
-    'DNF': ('Дерна', 'Derna'),
-    'SYU': ('Сью Айленд', 'Sue Island'),
-    'FSZ': ('Сидзуока', 'Shizuoka'),
-    'TOB': ('Тобрук', 'Tobruk'),
-    'KLU': ('Клагенфурт', 'Klagenfurt'),
-    'ETR': ('Санта Роса', 'Santa Rosa'),
-    'MVB': ('Франсвил', 'Franceville'),
-    'SNB': ('Снейк Бэй', 'Snake Bay'),
-    'NMT': ('Намту', 'Namtu'),
-    'YRL': ('Ред Лейк', 'Red Lake'),
-    'KHY': ('Хой', 'Khoy'),
-    'STX': ('Санта-Крус', 'Saint Croix'),
-    'TTD': ('Траутдейл', 'Troutdale'),
-    'TIE': ('Типпи', 'Tippi'),
-    'BJE': (None, 'Baleela'),
-    'ULI': ('Улити', 'Ulithi'),
-    'SNL': ('Шони', 'Shawnee'),
-    'YGZ': ('Грис Файорд', 'Grise Fiord'),
-    'SXM': ('Синт-Мартен', 'Sint Maarten'),
-    'GLO': ('Глостер', 'Gloucester'),
-    'SJR': ('Сан Хуан Д Ур', 'San Juan D Ur'),
-    'XHC': (None, 'Akaslompolo'),
-    'RKI': ('Рокот', 'Rokot'),
-    'NBH': ('Намбакка Хедс', 'Nambucca Heads'),
-    'PST': ('Престон', 'Preston'),
-    'YYC': ('Калгари', 'Calgary'),
-    'BXX': ('Борама', 'Borama'),
-    'ZAR': ('Заря', 'Zaria'),
-    'YTT': ('Тисдейл', 'Tisdale'),
-    'BMJ': ('Барамита', 'Baramita'),
-    'GUT': ('Гютерсло', 'Guetersloh'),
-    'KMX': ('Хамис-Мушаит', 'Khamis Mushait'),
-    'ZEC': ('Секунда', 'Secunda'),
-    'ZUC': ('Игнас', 'Ignace'),
-    'ILA': ('Иллага', 'Illaga'),
-    'ADL': ('Аделаида', 'Adelaide'),
-    'LGB': ('Лонг-Бич', 'Long Beach'),
-    'ZZU': ('Мзузу', 'Mzuzu'),
-    'KNT': ('Кеннетт', 'Kennett'),
-    'KVE': ('Остров Китава', 'Kitava'),
-    'ADM': (None, 'Ardmore'),
-    'SUC': ('Сандэнс', 'Sundance'),
-    'XTY': (None, 'Strathroy'),
-    'HTB': ('Терре-де-Бас', 'Terre-de-Bas'),
-    'WSB': ('Стимбоут Бэй', 'Steamboat Bay'),
-    'JNZ': ('Цзиньчжоу', 'Jinzhou'),
-    'LDR': ('Лодар', 'Lodar'),
-    'ENK': ('Эннискиллен', 'Enniskillen'),
-    'KID': ('Кристианстад', 'Kristianstad'),
-    'VEX': ('Тайога', 'Tioga'),
-    'ASP': ('Алис-Спрингс', 'Alice Springs'),
-    'IRP': ('Исиро', 'Isiro'),
-    'STR': ('Штутгарт', 'Stuttgart'),
-    'SVX': ('Екатеринбург', 'Yekaterinburg'),
-    'SUL': ('Суи', 'Sui'),
-    'VVN': (None, 'Malvinas'),
-    'YMP': ('Порт Макнейлл', 'Port McNeil'),
-    'VNO': ('Вильнюс', 'Vilnius'),
-    'TUG': ('Тугегарао', 'Tuguegarao'),
-    'FOB': ('Форт Брагг', 'Fort Bragg'),
-    'AXT': ('Акита', 'Akita'),
-    'TUI': ('Тураиф', 'Turaif'),
-    'LBZ': ('Лукапа', 'Lukapa'),
-    'KCL': ('Чигник', 'Chignik'),
-    'MFA': ('Мафия', 'Mafia'),
-    'SUP': ('Суменеп', 'Sumenep'),
-    'RED': ('Ридсвилль', 'Reedsville'),
-    'POW': ('Порторож', 'Portoroz'),
-    'VJB': ('Ксаи Ксаи', 'Xai Xai'),
-    'XMG': ('Махенджанагар', 'Mahendranagar'),
-    'SUU': (None, 'Fairfield'),
-    'KND': ('Кинду', 'Kindu'),
-    'KDE': ('Короба', 'Koroba'),
-    'YUY': ('Руэн-Норанда', 'Rouyn'),
-    'PWI': ('Белс', 'Pawi'),
-    'SUV': ('Сува', 'Suva'),
-    'BOE': ('Бунджи', 'Boundji'),
-    'TYM': ('Станиел Кей', 'Staniel Cay'),
-    'JLN': ('Джоплин', 'Joplin'),
-    'SIF': ('Симара', 'Simara'),
-    'DOY': ('Дунъин', 'Dongying'),
-    'TVI': ('Томасвилл', 'Thomasville'),
-    'YWG': ('Виннипег', 'Winnipeg'),
-    'XPQ': ('Порт Кланг', 'Port Klang'),
-    'MHX': ('Манихики', 'Manihiki Island'),
-    'VKS': ('Виксберг', 'Vicksburg'),
-    'FSS': ('Форрес', 'Forres'),
-    'IJU': ('Ижуи', 'Ijui'),
-    'RLP': ('Роселла Плейнс', 'Rosella Plains'),
-    'LWI': ('Ловаи', 'Lowai'),
-    'BHY': ('Бэйхай', 'Beihai'),
-    'DVN': ('Дэвенпорт', 'Davenport'),
-    'MLG': ('Маланг', 'Malang'),
-    'BLN': ('Беналла', 'Benalla'),
-    'SCY': ('Сан-Кристобаль', 'San Cristobal'),
-    'BYO': ('Бониту', 'Bonito'),
-    'PYC': ('Плайон Чико', 'Playon Chico'),
-    'SJP': ('Сан-Жозе-ду-Риу-Прету', 'Sao Jose Do Rio Preto'),
-    'OKI': ('о. Оки', 'Oki Island'),
-    'TWP': ('Торвуд', 'Torwood'),
-    'MJV': ('Мурсия', 'Murcia'),
-    'DWB': ('Соалала', 'Soalala'),
-    'JRO': ('Килиманджаро', 'Kilimanjaro'),
-    'SVY': ('Саво', 'Savo'),
-    'MUG': ('Мулехе', 'Mulege'),
-    'MQT': ('Маркетт', 'Marquette'),
-    'PUI': ('Пурени', 'Pureni'),
-    'TYD': ('Тында', 'Tynda'),
-    'MFG': ('Музафарабад', 'Muzaffarabad'),
-    'ENS': ('Энсхеде', 'Enschede'),
-    'MEC': ('Манта', 'Manta'),
-    'MNX': ('Маникоре', 'Manicore'),
-    'TYF': ('Турсбю', 'Torsby'),
-    'HED': ('Херендин', 'Herendeen'),
-    'SQF': ('Солано', 'Solano'),
-    'LYO': ('Лайонс', 'Lyons'),
-    'MPQ': ('Маан', 'Maan'),
-    'GKO': ('Конгобаумба', 'Kongoboumba'),
-    'BJB': ('Боджнурд', 'Bojnord'),
-    'VLU': ('Великие Луки', 'Velikiye Luki'),
-    'KPP': ('Калповар', 'Kalpowar'),
-    'BRM': ('Баркисимето', 'Barquisimeto'),
-    'SOE': ('Суанке', 'Souanke'),
-    'SWA': ('Шаньтоу', 'Jieyang'),
-    'ZWL': ('Вулластон', 'Wollaston Lake'),
-    'PPA': ('Пампа', 'Pampa'),
-    'ODN': ('Лонг-Серидан', 'Long Seridan'),
-    'CUQ': ('Коен', 'Coen'),
-    'GGL': ('Гилгал', 'Gilgal'),
-    'SWH': ('Суон Хилл', 'Swan Hill'),
-    'AHO': ('Альгеро', 'Alghero'),
-    'ACR': ('Араракуара', 'Araracuara'),
-    'AKU': ('Аксу', 'Aksu'),
-    'SWO': ('Стилуотер', 'Stillwater'),
-    'VPG': (None, 'Vipingo'),
-    'SQT': ('Самараи Айленд', 'Samarai Island'),
-    'IXC': ('Чандигарх', 'Chandigarh'),
-    'SWV': ('Эвенск', 'Evensk'),
-    'DNN': ('Далтон', 'Dalton'),
-    'BTR': ('Батон-Руж', 'Baton Rouge'),
-    'UMU': ('Умуарама', 'Umuarama'),
-    'SWW': ('Суитуотер', 'Sweetwater'),
-    'BNX': ('Баня-Лука', 'Banja Luka'),
-    'DIJ': ('Дижон', 'Dijon'),
-    'XIE': ('Ксиенгиом', 'Xienglom'),
-    'KRJ': ('Каравари', 'Karawari'),
-    'GIM': ('Миеле Мимбале', 'Miele Mimbale'),
-    'PDT': ('Пендлтон', 'Pendleton'),
-    'PVY': ('Поуп Ваной', 'Pope Vanoy'),
-    'VND': ('Вангэндрано', 'Vangaindrano'),
-    'SWX': ('Шакаве', 'Shakawe'),
-    'MBK': ('Матупа', 'Matupa'),
-    'JCR': ('Жакареаканга', 'Jacareacanga'),
-    'ZBT': (None, 'Kolding'),
-    'KHG': ('Кашгар', 'Kashi'),
-    'SXJ': ('Шаншан', 'Shanshan'),
-    'DTA': ('Дельта', 'Delta'),
-    'DBS': ('Дюбуа', 'Dubois'),
-    'MIP': ('Мицпе Рамон', 'Mitspeh Ramon'),
-    'LHS': ('Лас Херас', 'Las Heras'),
-    'YBS': ('Опапамиска Лейк', 'Opapamiska Lake'),
-    'CJC': ('Калама', 'Calama'),
-    'SYH': ('Сьянгбокхе', 'Syangboche'),
-    'TYL': ('Талара', 'Talara'),
-    'SXS': ('Сахабат 16', 'Sahabat 16'),
-    'GCV': ('Граватаи', 'Gravatai'),
-    'PKU': ('Пеканбару', 'Pekanbaru'),
-    'MJW': ('Махенйе', 'Mahenye'),
-    'SXY': ('Сидней', 'Sidney'),
-    'PGS': ('Пич Спрингс', 'Peach Springs'),
-    'RFR': ('Рио Фрио', 'Rio Frio'),
-    'OTD': ('Остров Контадора', 'Contadora'),
-    'IXY': ('Кандла', 'Kandla'),
-    'TYZ': ('Тейлор', 'Taylor'),
-    'TZM': ('Тисимин', 'Tizimin'),
-    'JAC': ('Джексон', 'Jackson'),
-    'HDM': ('Хамадан', 'Hamadan'),
-    'KUK': ('Кейсиглек', 'Kasigluk'),
-    'MMD': ('Минамидайто', 'Minami Daito'),
-    'SZP': ('Санта Паула', 'Santa Paula'),
-    'YAJ': ('Льялл Харбор', 'Lyall Harbour'),
-    'VNR': ('Ванрук', 'Vanrook'),
-    'UAK': ('Нарсарсуак', 'Narsarsuaq'),
-    'URG': ('Уругуаяна', 'Uruguaiana'),
-    'SQS': ('Сан Игнасио', 'San Ignacio'),
-    'KWV': ('Курвина', 'Kurwina'),
-    'KUO': ('Куопио', 'Kuopio'),
-    'MBP': ('Мойобамба', 'Moyobamba'),
-    'UCE': ('Юнис', 'Eunice'),
-    'MKR': ('Микатарра', 'Meekatharra'),
-    'JGE': ('Коджи', 'Geoje'),
-    'UCK': ('Луцк', 'Lutsk'),
-    'OSK': ('Оскарсхамн', 'Oskarshamn'),
-    'IXM': ('Мадурай', 'Madurai'),
-    'RWS': ('Сумаре', 'Sumare'),
-    'PMI': ('Пальма-де-Мальорка', 'Palma Mallorca'),
-    'MLK': ('Мальта', 'Malta'),
-    'KSN': ('Костанай', 'Kostanay'),
-    'SZC': ('Санта Круз', 'Santa Cruz'),
-    'TSX': ('Танджунг Сантан', 'Tanjung Santan'),
-    'DSC': ('Дшан', 'Dschang'),
-    'SYA': ('Шемья', 'Shemya'),
-    'SWS': ('Свонси', 'Swansea'),
-    'SIS': ('Сишен', 'Sishen'),
-    'KCI': ('Кон', 'Kon'),
-    'SMQ': ('Сампит', 'Sampit'),
-    'FNK': ('Фин Крик', 'Fin Creek'),
-    'HRK': ('Харьков', 'Kharkov'),
-    'MLY': ('Манли Хот Спрингс', 'Manley Hot Springs'),
-    'HLW': ('Хлухлуве', 'Hluhluwe'),
-    'VNX': ('Виланкулу', 'Vilanculos'),
-    'RHP': ('Рамечхап', 'Ramechhap'),
-    'PKO': ('Параку', 'Parakou'),
-    'KPR': ('Порт Уилльямс', 'Port Williams'),
-    'UCT': ('Ухта', 'Ukhta'),
-    'KEW': ('Кивейвин', 'Keewaywin'),
-    'KOM': ('Комо-Манда', 'Komo-Manda'),
-    'YDL': ('Дис Лейк', 'Dease Lake'),
-    'TAD': ('Тринидад', 'Trinidad'),
-    'TAN': ('Тангалума', 'Tangalooma'),
-    'YAR': ('Лагранде', 'Lagrande 3'),
-    'EPL': ('Епинал', 'Epinal'),
-    'BLS': ('Боллон', 'Bollon'),
-    'UFA': ('Уфа', 'Ufa'),
-    'TAO': ('Циндао', 'Qingdao'),
-    'ACE': ('Лансароте', 'Lanzarote'),
-    'GGO': ('Гило', 'Guiglo'),
-    'JNJ': (None, 'Duqm'),
-    'NPG': ('Нипа', 'Nipa'),
-    'TII': ('Тиринкот', 'Tirinkot'),
-    'EJH': ('Эль-Ваджх', 'Wedjh'),
-    'XBR': ('Броквилл', 'Brockville'),
-    'VRC': ('Вирак', 'Virac'),
-    'YCL': ('Чарло', 'Charlo'),
-    'LIR': ('Либерия', 'Liberia'),
-    'PNG': ('Паранагуа', 'Paranagua'),
-    'DOU': ('Дорадус', 'Dourados'),
-    'LSO': ("Ле-Сабль-д'Олон", 'Les Sables'),
-    'XWI': (None, 'Wigan'),
-    'CPT': ('Кейптаун', 'Cape Town'),
-    'VMI': ('Валлеми', 'Vallemi'),
-    'LGK': ('Лангкави', 'Langkawi'),
-    'PSZ': ('Пуэрто Суарес', 'Puerto Suarez'),
-    'BBH': ('Барт', 'Barth'),
-    'UGI': ('Аганик', 'Uganik'),
-    'PUO': ('Прудхо Бэй', 'Prudhoe Bay'),
-    'BBN': ('Барио', 'Bario'),
-    'TAZ': ('Дашогуз', 'Dashoguz'),
-    'MJN': ('Махадзанга', 'Majunga'),
-    'YBB': ('Кагарек', 'Kugaaruk'),
-    'NIB': ('Найколай', 'Nikolai'),
-    'TBA': ('Табибуга', 'Tabibuga'),
-    'PNB': ('Порту-Насиул', 'Porto Nacional'),
-    'TBE': (None, 'Timbunke'),
-    'IFF': ('Иффли', 'Iffley'),
-    'LYA': ('Лоян', 'Luoyang'),
-    'URI': ('Урибе', 'Uribe'),
-    'SRY': ('Сари', 'Sary'),
-    'TBK': ('Тимбер Крик', 'Timber Creek'),
-    'ZAD': ('Задар', 'Zadar'),
-    'UIK': ('Усть-Илимск', 'Ust-Ilimsk'),
-    'HVG': ('Хоннингсвог', 'Honningsvag'),
-    'ONA': ('Вайнона', 'Winona'),
-    'FSM': ('Форт-Смит', 'Fort Smith'),
-    'NCR': ('Сан Калос', 'San Carlos'),
-    'OSN': ('Осан', 'Osan'),
-    'TBP': ('Тумбес', 'Tumbes'),
-    'MPT': ('Малиана', 'Maliana'),
-    'MFK': ('Матсу', 'Matsu'),
-    'BGE': ('Байнбридж', 'Bainbridge'),
-    'CIY': ('Комизо', 'Comiso'),
-    'LSP': ('Лас Пьедрас', 'Las Piedras'),
-    'YYH': ('Талойоак', 'Taloyoak'),
-    'VSG': ('Луганск', 'Lugansk'),
-    'WSN': ('Юг Нейкнек', 'South Naknek'),
-    'AGZ': ('Аггенейс', 'Aggeneys'),
-    'TST': ('Транг', 'Trang'),
-    'TCA': ('Теннант Крик', 'Tennant Creek'),
-    'KGM': ('Кунгум', 'Kungum'),
-    'KRQ': ('Краматорск', 'Kramatorsk'),
-    'NML': (None, 'Mildred Lake'),
-    'COI': ('Кокоа', 'Cocoa'),
-    'BHB': ('Бар Харбор', 'Bar Harbor'),
-    'AJY': ('Агадес', 'Agades'),
-    'VTU': ('Лас Тунас', 'Las Tunas'),
-    'LTR': ('Леттеркенни', 'Letterkenny'),
-    'CON': ('Конкорд', 'Concord'),
-    'NZA': ('Нзаги', 'Nzagi'),
-    'PVU': ('Прово', 'Provo'),
-    'NDU': ('Рунду', 'Rundu'),
-    'UKA': ('Юканда', 'Ukunda'),
-    'BVV': ('Итуруп', 'Iturup Island'),
-    'KWP': ('Вест Поинт', 'West Point'),
-    'PVF': ('Пласервилл', 'Placerville'),
-    'TCG': ('Чугучак', 'Tacheng'),
-    'DKR': ('Дакар', 'Dakar'),
-    'ILZ': ('Жилина', 'Zilina'),
-    'TCH': ('Тшибанга', 'Tchibanga'),
-    'MXW': ('Мандалговь', 'Mandalgobi'),
-    'SIM': ('Симбаи', 'Simbai'),
-    'ELY': ('Или', 'Ely'),
-    'BZP': ('Бизант', 'Bizant'),
-    'UMR': ('Вумера', 'Woomera'),
-    'CTI': ('Квито-Кванавале', 'Cuito Cuanavale'),
-    'IAU': ('Иаура', 'Iaura'),
-    'KSF': ('Кассель', 'Kassel'),
-    'MRM': ('Манаре', 'Manare'),
-    'BEN': ('Бенгази', 'Benghazi'),
-    'TIZ': ('Тари', 'Tari'),
-    'BRP': ('Бирау', 'Biaru'),
-    'KAD': ('Кадуна', 'Kaduna'),
-    'YIB': ('Атикокан', 'Atikokan'),
-    'FAM': ('Фармингтон', 'Farmington'),
-    'TCN': ('Теуакан', 'Tehuacan'),
-    'YKA': ('Камлупс', 'Kamloops'),
-    'JUN': ('Джунда', 'Jundah'),
-    'XBW': ('Киллинек', 'Killineq'),
-    'TDO': ('Толедо', 'Toledo'),
-    'LVP': ('Лаван', 'Lavan'),
-    'NKT': ('Ширнак', 'Shirnak'),
-    'TDR': ('Теодор', 'Theodore'),
-    'HOS': ('Чос-Малаль', 'Chos Malal'),
-    'TDX': ('Трат', 'Trat'),
-    'EEN': ('Кин', 'Keene'),
-    'TEA': ('Тела', 'Tela'),
-    'KWO': ('Кавито', 'Kawito'),
-    'TEF': ('Тефе', 'Telfer'),
-    'CHM': ('Чимботе', 'Chimbote'),
-    'YDS': ('Десолейшн Саунд', 'Desolation Sound'),
-    'BRK': ('Бурк', 'Bourke'),
-    'ZCO': ('Темуко', 'Temuco'),
-    'YLH': ('Лансдаун Хаус', 'Lansdowne House'),
-    'LAZ': ('Бон-Жезус-да-Лапа', 'Bom Jesus Da Lapa'),
-    'ZEN': ('Зенаг', 'Zenag'),
-    'MTP': ('Монток', 'Montauk'),
-    'TGN': ('Траралгон', 'Traralgon'),
-    'MEM': ('Мемфис', 'Memphis'),
-    'TGR': ('Туггурт', 'Touggourt'),
-    'KBD': ('Кимберли Даунс', 'Kimberley Downs'),
-    'RCT': ('Рид Сити', 'Reed City'),
-    'LDO': ('Ладоуани', 'Ladouanie'),
-    'BIB': ('Байдоа', 'Baidoa'),
-    'TGZ': ('Тустла-Гутьеррес', 'Tuxtla Gutierrez'),
-    'UNA': ('У', 'Una'),
-    'YLO': ('Шило', 'Shilo'),
-    'THA': ('Таллахома', 'Tullahoma'),
-    'WEA': ('Уэтерфорд', 'Weatherford'),
-    'TTS': ('Тзаратанана', 'Tsaratanana'),
-    'THC': ('Тчиен', 'Tchien'),
-    'KHH': ('Гаосюн', 'Kaohsiung'),
-    'CAR': ('Карибу', 'Caribou'),
-    'ZTU': (None, 'Zaqatala'),
-    'THP': ('Термополис', 'Thermopolis'),
-    'ZGI': ('Годс Ривер', 'Gods River'),
-    'THT': ('Тамчакетт', 'Tamchakett'),
-    'TRP': ('Три Поинт', 'Tree Point'),
-    'THU': ('Питуффик', 'Pituffik'),
-    'PAF': ('Пакуба', 'Pakuba'),
-    'ACK': ('Нантакет', 'Nantucket'),
-    'TIO': ('Тилин', 'Tilin'),
-    'HJJ': ('Хуайхуа', 'Huaihua'),
-    'TIQ': ('Тиниан', 'Tinian'),
-    'TIR': ('Тирупати', 'Tirupati'),
-    'TRG': ('Тауранга', 'Tauranga'),
-    'CRW': ('Чарлстон', 'Charleston'),
-    'IWJ': ('Ивами', 'Masuda'),
-    'IXS': ('Силчар', 'Silchar'),
-    'TIX': ('Титусвилль', 'Titusville'),
-    'TKI': ('Токен', 'Tokeen'),
-    'QFK': ('Селье', 'Selje'),
-    'NKB': ('Нунканба', 'Noonkanbah'),
-    'IXV': ('Алонг', 'Along'),
-    'PQM': ('Паленке', 'Palenque'),
-    'TKL': ('Таку Лодж', 'Taku Lodge'),
-    'ISJ': ('Исла-Мухерес', 'Isla Mujeres'),
-    'IVH': ('Айвишак', 'Ivishak'),
-    'TKO': ('Тлокоенг', 'Tlokoeng'),
-    'UNC': ('Унгия', 'Unguia'),
-    'YEP': ('Эстеван Пойнт', 'Estevan Point'),
-    'BSM': ('Бише-кола', 'Bishe-kola'),
-    'UNE': ('Цгачас-Нек', 'Qachas Nek'),
-    'FUN': ('Тувалу', 'Funafuti Atol'),
-    'PKK': ('Пакокку', 'Pakokku'),
-    'KBF': ('Карубага', 'Karubaga'),
-    'UQE': ('Квин', 'Queen'),
-    'TLB': ('Тарбела', 'Tarbela'),
-    'TLT': ('Талуксак', 'Tuluksak'),
-    'HSG': ('Сага', 'Saga'),
-    'KRX': ('Кар Кар', 'Kar Kar'),
-    'TLH': ('Таллахасси', 'Tallahassee'),
-    'KLQ': ('Келуанг', 'Keluang'),
-    'TMT': ('Тромбетас', 'Trombetas'),
-    'URA': ('Уральск', 'Uralsk'),
-    'YFR': ('Форт Ресольюшен', 'Fort Resolution'),
-    'SRG': ('Семаранг', 'Semarang'),
-    'TLX': ('Талька', 'Talca'),
-    'TMA': ('Тифтон', 'Tifton'),
-    'KNM': ('Каньама', 'Kaniama'),
-    'KMT': ('Кампот', 'Kampot'),
-    'TMH': ('Танахмерах', 'Tanahmerah'),
-    'BGU': ('Бангасу', 'Bangassou'),
-    'ALI': ('Элис', 'Alice'),
-    'ZGR': ('Литл Гранд Рапидс', 'Little Grand Rapids'),
-    'TML': ('Тамале', 'Tamale'),
-    'HOM': ('Хомер', 'Homer'),
-    'USK': ('Усинск', 'Usinsk'),
-    'DNP': ('Данг', 'Dang'),
-    'USU': ('Бушуанга', 'Busuanga'),
-    'TMM': ('Туамасина', 'Tamatave'),
-    'TJB': ('Танджунг Балаи', 'Tanjung Balai'),
-    'WIR': ('Уэроа', 'Wairoa'),
-    'YOL': ('Йола', 'Yola'),
-    'TNP': ('Туэнтинин Палмс', 'Twentynine Palms'),
-    'AML': ('Пуэрто-Армуэллас', 'Puerto Armuellas'),
-    'BNV': ('Боана', 'Boana'),
-    'UTA': ('Мутаре', 'Mutare'),
-    'IZO': ('Идзумо', 'Izumo'),
-    'MCS': ('Монте Касерос', 'Monte Caseros'),
-    'TRM': ('Термал', 'Thermal'),
-    'KOR': ('Кокоро', 'Kokoro'),
-    'YHI': ('Холман', 'Holman'),
-    'TOH': ('Острова Торрес', 'Torres'),
-    'CZE': ('Коро', 'Coro'),
-    'ZHG': (None, 'Glarus'),
-    'STD': ('Санто-Доминго', 'Santo Domingo'),
-    'JJI': ('Хуанхуй', 'Juanjui'),
-    'DAN': ('Данвилл', 'Danville'),
-    'SSG': ('Малабо', 'Malabo'),
-    'ABU': ('Атамбуа', 'Atambua'),
-    'YHR': ('Шевери', 'Chevery'),
-    'TOU': ('Туо', 'Touho'),
-    'IXH': ('Кайлашихар', 'Kailashahar'),
-    'HBX': ('Хубли-Дхарвад', 'Hubli'),
-    'MKW': ('Маноквари', 'Manokwari'),
-    'UTM': ('Таника', 'Tunica'),
-    'MKB': ('Мекамбо', 'Mekambo'),
-    'TKG': ('Бандар-Лампунг', 'Bandar Lampung'),
-    'MFB': ('Монфорт', 'Monfort'),
-    'UDI': ('Уберландия', 'Uberlandia'),
-    'UTP': ('Паттайя', 'Utapao'),
-    'TPA': ('Тампа', 'Tampa'),
-    'SLX': ('Солт Кей', 'Salt Cay'),
-    'TSB': ('Цумеб', 'Tsumeb'),
-    'KBZ': ('Кайкаура', 'Kaikoura'),
-    'UTU': ('Уступо', 'Ustupo'),
-    'GPO': ('Хенераль Пико', 'General Pico'),
-    'YPR': ('Принс-Руперт', 'Prince Rupert'),
-    'WWP': ('Уол Пасс', 'Whale Pass'),
-    'XFL': (None, 'Shawinigan'),
-    'FLJ': ('Залив Фолс', 'Falls Bay'),
-    'WOE': ('Вонсдрехт', 'Woensdrecht'),
-    'BNK': ('Баллина', 'Ballina'),
-    'YJN': ('Сент Джин', 'St Jean'),
-    'RSN': ('Растон', 'Ruston'),
-    'TSH': ('Чикапа', 'Tshikapa'),
-    'UUA': ('Бугульма', 'Bugulma'),
-    'VIX': ('Витория', 'Vitoria'),
-    'AHL': ('Аишалтон', 'Aishalton'),
-    'TTL': ('Тортл Айленд', 'Turtle Island'),
-    'DGP': ('Даугавпилс', 'Daugavpils'),
-    'TUA': ('Тулькан', 'Tulcan'),
-    'XHO': (None, 'Dongguan'),
-    'CZU': ('Коросаль', 'Corozal'),
-    'TUQ': ('Туган', 'Tougan'),
-    'TWF': ('Туин-Фолс', 'Twin Falls'),
-    'YKS': ('Якутск', 'Yakutsk'),
-    'GAZ': ('Гуасопа', 'Guasopa'),
-    'TVA': ('Морафенобе', 'Morafenobe'),
-    'DNV': ('Дэнвилл', 'Danville'),
-    'ULN': ('Улан-Батор', 'Ulaanbaatar'),
-    'TVY': ('Давей', 'Dawe'),
-    'URN': ('Ургун', 'Urgoon'),
-    'UER': ('Пуэртольяно', 'Puertollano'),
-    'PBB': ('Паранаиба', 'Paranaiba'),
-    'XHA': (None, 'Yllasjarvi'),
-    'TZX': ('Трабзон', 'Trabzon'),
-    'SRD': ('Сан Рамон', 'San Ramon'),
-    'UAC': ('Сан Луис Рио Колорадо', 'San Luis Rio Colorado'),
-    'AYW': ('Аяваси', 'Ayawasi'),
-    'UBP': ('Убонратчатхани', 'Ubon Ratchathani'),
-    'UGS': ('Агшик', 'Ugashik'),
-    'UBT': ('Убатуба', 'Ubatuba'),
-    'UNU': ('Джуно', 'Juneau'),
-    'UDA': ('Ундарра', 'Undarra'),
-    'ONM': ('Сокорро', 'Socorro'),
-    'PTY': ('Панама', 'Panama City'),
-    'UEO': ('Кумедзима', 'Kume-jima'),
-    'HTN': ('Хотан', 'Hotan'),
-    'LHU': ('Каприви', 'Caprivi'),
-    'PQI': ('Преск-Айл', 'Presque Isle'),
-    'KOO': ('Конголо', 'Kongolo'),
-    'AIZ': ('Кайзер', 'Kaiser'),
-    'UKN': ('Уоюкон', 'Waukon'),
-    'ULE': ('Суле', 'Sule'),
-    'TPU': ('Тикапер', 'Tikapur'),
-    'ZVK': ('Саваннакхет', 'Savannakhet'),
-    'ULO': ('Улангом', 'Ulaangom'),
-    'WSF': ('Саричеф', 'Sarichef'),
-    'ULQ': ('Тулуа', 'Tulua'),
-    'KKW': ('Киквите', 'Kikwit'),
-    'ULY': ('Ульяновск', 'Ulyanovsk'),
-    'SXV': ('Салем', 'Salem'),
-    'TLU': ('Тол', 'Tolu'),
-    'AZZ': ('Амбриз', 'Ambriz'),
-    'UNN': ('Ранонг', 'Ranong'),
-    'UWA': ('Вэр', 'Ware'),
-    'SQO': ('Стуруман', 'Storuman'),
-    'UOS': ('Севани', 'Sewanee'),
-    'OXR': ('Вентура', 'Ventura'),
-    'UPP': ('Уполу Поинт', 'Upolu Point'),
-    'CGY': ('Кагаян-де-Оро', 'Cagayan De Oro'),
-    'UTB': ('Маттаберра', 'Muttaburra'),
-    'UUS': ('Южно-Сахалинск', 'Yuzhno-Sakhalinsk'),
-    'PRJ': ('Капри', 'Capri'),
-    'GYP': ('Джимпи', 'Gympie'),
-    'AXB': ('Алегзандрия Бэй', 'Alexandria Bay'),
-    'AOM': (None, 'Adam'),
-    'UVE': ('Увеа', 'Ouvea'),
-    'KHK': ('Харк', 'Khark Island'),
-    'WSY': ('Эрли-Бич', 'Airlie Beach'),
-    'UYN': ('Юйлинь', 'Yulin'),
-    'QLJ': (None, 'Lucerne'),
-    'ACS': ('Ачинск', 'Achinsk'),
-    'ATA': ('Анта', 'Anta'),
-    'ITU': ('Итуруп', 'Iturup'),
-    'VAN': ('Ван', 'Van'),
-    'WKN': ('Вакунаи', 'Wakunai'),
-    'KWS': ('Кваилабеси', 'Kwailabesi'),
-    'BHN': ('Бейхан', 'Beihan'),
-    'PBQ': ('Пимента-Буэну', 'Pimenta Bueno'),
-    'RLD': ('Ричленд', 'Richland'),
-    'VAL': ('Валенса', 'Valenca'),
-    'VCS': ('Пуло-Кондор', 'Con Dao'),
-    'VDB': ('Фагернес', 'Fagernes'),
-    'TYN': ('Тайюань', 'Taiyuan'),
-    'KLI': ('Кота Коли', 'Kota Koli'),
-    'LYB': ('Малый Кайман', 'Little Cayman'),
-    'KVL': ('Кивалина', 'Kivalina'),
-    'VDM': ('Вьедма', 'Viedma'),
-    'VHN': ('Ван Хорн', 'Van Horn'),
-    'VIF': ('Виесте', 'Vieste'),
-    'GDQ': ('Гондэр', 'Gondar'),
-    'JMS': ('Джеймстаун', 'Jamestown'),
-    'KRZ': ('Кири', 'Kiri'),
-    'LMP': ('Лампедуса', 'Lampedusa'),
-    'JRH': ('Джорхат', 'Jorhat'),
-    'VDS': ('Вадсё', 'Vadso'),
-    'RMD': ('Рамагундам', 'Ramagundam'),
-    'TAH': ('Танна', 'Tanna'),
-    'BFA': ('Бахиа-Негра', 'Bahia Negra'),
-    'VER': ('Веракрус', 'Veracruz'),
-    'AOO': ('Алтуна', 'Altoona'),
-    'YSF': ('Стони Рапидс', 'Stony Rapids'),
-    'VFA': ('Виктория-Фоллс', 'Victoria Falls'),
-    'WGT': ('Вангаратта', 'Wangaratta'),
-    'YQE': ('Кимберли', 'Kimberley'),
-    'HAQ': ('Ханимаду', 'Hanimaadhoo'),
-    'TCS': ('Трут-ор-Консекуэнсес', 'Truth Or Consequences'),
-    'VHY': ('Виши', 'Vichy'),
-    'BBJ': ('Битбург', 'Bitburg'),
-    'GDD': ('Гордон-Даунс', 'Gordon Downs'),
-    'MTG': ('Мато Гроссо', 'Mato Grosso'),
-    'VIG': ('Эль Вихия', 'El Vigia'),
-    'NUR': ('Нулларбор', 'Nullarbor'),
-    'TJS': ('Танджунг Селор', 'Tanjung Selor'),
-    'LNV': ('Остров Лиайр', 'Lihir Island'),
-    'BBV': ('Беребы', 'Bereby'),
-    'ENF': ('Энонтекиё', 'Enontekio'),
-    'NNB': ('Остров Санта Ана', 'Santa Ana'),
-    'VIK': ('Западный Кавик', 'Kavik'),
-    'VHM': ('Вихелмина', 'Vilhelmina'),
-    'NCO': ('Куонсет Поинт', 'Quonset Point'),
-    'MNO': ('Маноно', 'Manono'),
-    'VJQ': ('Гуруэ', 'Gurue'),
-    'BIQ': ('Биарриц', 'Biarritz'),
-    'IMB': ('Имбаимади', 'Imbaimadai'),
-    'NHZ': (None, 'Brunswick'),
-    'WTZ': ('Уитианга', 'Whitianga'),
-    'YAK': ('Якутат', 'Yakutat'),
-    'ZOF': ('Ошен Фолс', 'Ocean Falls'),
-    'TBY': ('Чабонг', 'Tsabong'),
-    'BHE': ('Бленем', 'Blenheim'),
-    'LBN': ('Баринго', 'Lake Baringo'),
-    'MDL': ('Мандалай', 'Mandalay'),
-    'CHT': ('Чатем', 'Chatham Island'),
-    'PPF': ('Парсонс', 'Parsons'),
-    'NNL': ('Нондалтон', 'Nondalton'),
-    'VKW': ('Запад Кавик', 'West Kavik'),
-    'QJI': ('Икамиут', 'Ikamiut'),
-    'EUM': ('Ноймюнстер', 'Neumuenster'),
-    'BKC': ('Бакленд', 'Buckland'),
-    'BZU': ('Бут', 'Buta'),
-    'LLW': ('Лилонгве', 'Lilongwe'),
-    'BMG': ('Блумингтон', 'Bloomington'),
-    'KZI': ('Козани', 'Kozani'),
-    'BBP': ('Бембридж', 'Bembridge'),
-    'EHM': ('Капе-Ньюэнхам', 'Cape Newenham'),
-    'KMH': ('Куруман', 'Kuruman'),
-    'PMX': ('Палмер', 'Palmer'),
-    'IMA': ('Иамалеле', 'Iamalele'),
-    'FLH': ('Флотта', 'Flotta'),
-    'VLM': ('Вильямонтес', 'Villamontes'),
-    'VOG': ('Волгоград', 'Volgograd'),
-    'OKE': ('Окино Эрабу', 'Okino Erabu'),
-    'XKG': (None, 'Grong'),
-    'QCY': (None, 'Coningsby'),
-    'BBY': ('Бамбари', 'Bambari'),
-    'TKH': ('Такхли', 'Takhli'),
-    'NBX': ('Набире', 'Nabire'),
-    'UKK': ('Усть-Каменогорск', 'Ust-Kamenogorsk'),
-    'VMU': ('Баимуру', 'Baimuru'),
-    'VPY': ('Шимойо', 'Chimoio'),
-    'LVI': ('Ливингстон', 'Livingstone'),
-    'WUM': ('Васум', 'Wasum'),
-    'TLG': ('Тулаги', 'Tulagi Island'),
-    'VIU': ('Виру', 'Viru'),
-    'AYT': ('Анталья', 'Antalya'),
-    'LZH': ('Лючжоу', 'Liuzhou'),
-    'LWO': ('Львов', 'Lviv'),
-    'FLN': ('Флорианополис', 'Florianopolis'),
-    'OLY': ('Олни', 'Olney'),
-    'BMC': ('Бригам Сити', 'Brigham City'),
-    'WUU': ('Вау', 'Wau'),
-    'YUM': ('Юма', 'Yuma'),
-    'BNS': ('Баринас', 'Barinas'),
-    'TRQ': ('Тарауака', 'Tarauaca'),
-    'CSH': ('Соловки', 'Solovetsky'),
-    'NGR': ('Нингерум', 'Ningerum'),
-    'PNT': ('Пуэрто Наталес', 'Puerto Natales'),
-    'VRY': ('Ваерой', 'Vaeroy'),
-    'GBN': ('Сан Джиованни Ротондо', 'San Giovanni Rotondo'),
-    'CXQ': ('Кристмас-Крик', 'Christmas Creek'),
-    'VTZ': ('Вишакхапатнам', 'Vishakhapatnam'),
-    'VLP': ('Вила-Рика', 'Vila Rica'),
-    'BSQ': ('Бисби', 'Bisbee'),
-    'FKS': ('Фукусима', 'Fukushima'),
-    'IND': ('Индианаполис', 'Indianapolis'),
-    'NKY': ('Нкейи', 'Nkayi'),
-    'VME': ('Вилья Мерседес', 'Villa Mercedes'),
-    'VUU': ('Мвуу Камп', 'Mvuu Camp'),
-    'LAQ': ('Эль-Байда', 'Beida'),
-    'KAW': ('Кавтаянг', 'Kawthaung'),
-    'PHT': ('Париж', 'Paris'),
-    'BGT': ('Багдад', 'Bagdad'),
-    'MXI': ('Мати', 'Mati'),
-    'OZZ': ('Варзазат', 'Ouarzazate'),
-    'XBO': ('Булза', 'Boulsa'),
-    'VNC': ('Венеция', 'Venice'),
-    'BSZ': ('Бартлетс', 'Bartletts'),
-    'FWM': ('Форт Вилльям', 'Fort William'),
-    'FOX': ('Фокс', 'Fox'),
-    'NFR': ('Джейкхарра', 'Nafoora'),
-    'VNS': ('Варанаси', 'Varanasi'),
-    'PAE': ('Эверетт', 'Everett'),
-    'LIW': ('Лойко', 'Loikaw'),
-    'ADT': ('Ада', 'Ada'),
-    'VQS': ('Вьекес', 'Vieques'),
-    'BYF': (None, 'Albert'),
-    'VRA': ('Варадеро', 'Varadero'),
-    'ARZ': (None, "N'zeto"),
-    'SSK': ('Стерт Крик', 'Sturt Creek'),
-    'XRP': (None, 'Riviere-a-Pierre'),
-    'TJC': ('Тикантики', 'Ticantiki'),
-    'AIS': ('Арораэ', 'Arorae Island'),
-    'VRB': ('Веро Бич', 'Vero Beach'),
-    'TTM': ('Таблон Де Тамара', 'Tablon De Tamara'),
-    'VSF': ('Спрингфилд', 'Springfield'),
-    'WBD': ('Бефандриана', 'Befandriana'),
-    'BIJ': ('Билиау', 'Biliau'),
-    'BZD': ('Балранолд', 'Balranald'),
-    'AIM': ('Аилук', 'Ailuk Island'),
-    'POY': ('Пауэлл', 'Powell'),
-    'VUS': ('Великий Устюг', 'Velikij Ustyug'),
-    'BYK': ('Буаке', 'Bouake'),
-    'ACC': ('Аккра', 'Accra'),
-    'AAY': ('Аль Гхайдах', 'Al Ghaydah'),
-    'VAP': ('Вальпараисо', 'Valparaiso'),
-    'WDI': ('Вондай', 'Wondai'),
-    'MRC': ('Колумбия', 'Columbia'),
-    'AGJ': ('Агуни', 'Aguni'),
-    'BBR': ('Бас-Тер', 'Basse Terre'),
-    'VXC': ('Лишинга', 'Lichinga'),
-    'HID': ('Остров Хорн', 'Horn Island'),
-    'VYS': ('Перу', 'Peru'),
-    'PCA': ('Портедж Крик', 'Portage Creek'),
-    'GBK': ('Гбангбаток', 'Gbangbatok'),
-    'AFD': ('Порт Альфред', 'Port Alfred'),
-    'TTB': ('Тортоли', 'Tortoli'),
-    'WAD': ('Андриамена', 'Andriamena'),
-    'WAT': ('Уотерфорд', 'Waterford'),
-    'YVE': ('Вернон', 'Vernon'),
-    'INH': ('Иньямбане', 'Inhambane'),
-    'NMG': ('Сан-Мигель', 'San Miguel'),
-    'XIL': ('Шилин-Хото', 'Xilinhot'),
-    'VTF': ('Ватулел', 'Vatulele'),
-    'LBS': ('Лабаза', 'Labasa'),
-    'BQQ': ('Барра', 'Barra'),
-    'BQG': (None, 'Bogorodskoye'),
-    'WBN': ('Уоберн', 'Woburn'),
-    'YLS': ('Лебель-Сюр-Кевийон', 'Lebel-Sur-Quevillon'),
-    'EAS': ('Сан-Себастьян', 'San Sebastian'),
-    'VGO': ('Виго', 'Vigo'),
-    'YHT': ('Хейнс-Джанкшен', 'Haines Junction'),
-    'WDN': ('Вэлдрон Айленд', 'Waldron Island'),
-    'BSP': ('Бенсбах', 'Bensbach'),
-    'BMP': ('Брамптон Айленд', 'Brampton Island'),
-    'KTE': ('Кертех', 'Kerteh'),
-    'NVG': ('Нуева Гуинеа', 'Nueva Guinea'),
-    'DRY': ('Драйсдэйл Ривер', 'Drysdale River'),
-    'WML': ('Малэмбанди', 'Malaimbandy'),
-    'BEK': ('Барели', 'Bareli'),
-    'WED': ('Ведау', 'Wedau'),
-    'SZI': ('Зайсан', 'Zaisan'),
-    'AHC': ('Херлонг', 'Herlong'),
-    'AKK': ('Акхайок', 'Akhiok'),
-    'XUW': ('Сторен', 'Storen'),
-    'XWD': (None, 'Wakefield'),
-    'RDM': ('Редмонд', 'Redmond'),
-    'LJA': ('Лодж', 'Lodja'),
-    'KWE': ('Гуйян', 'Guiyang'),
-    'QGY': ('Пер', 'Per'),
-    'CLN': ('Кароли', 'Carolina'),
-    'XWP': ('Хассельхольм', 'Hassleholm'),
-    'WMN': ('Маруанцентре', 'Maroantsetra'),
-    'YWM': ('Уилльямс Харбор', 'Williams Harbour'),
-    'VOK': ('Камп Дуглас', 'Camp Douglas'),
-    'XFE': (None, 'Parent'),
-    'VOL': ('Волос', 'Volos'),
-    'WMR': ('Мананара', 'Mananara'),
-    'QRS': (None, 'Resita'),
-    'FOA': ('Фоула', 'Foula'),
-    'WVB': ('Уолфиш-Бей', 'Walvis Bay'),
-    'RAT': ('Радужный', 'Raduzhnyi'),
-    'WNC': ('Туксекан Айленд', 'Tuxekan Island'),
-    'AIV': ('Алисевилл', 'Aliceville'),
-    'IAN': ('Кайана', 'Kiana'),
-    'YEI': ('Бурса', 'Bursa'),
-    'ZDE': (None, 'Arosa'),
-    'VLN': ('Валенсия', 'Valencia'),
-    'ALO': ('Ватерлоо', 'Waterloo'),
-    'WHT': ('Уартон', 'Wharton'),
-    'BXK': ('Бакай', 'Buckeye'),
-    'AXC': ('Арамак', 'Aramac'),
-    'XYE': ('Йе', 'Ye'),
-    'XXV': (None, 'Kumla'),
-    'FHZ': ('Факахина', 'Fakahina'),
-    'HSI': ('Хейстингс', 'Hastings'),
-    'AHM': (None, 'Ashland'),
-    'SJX': ('Сартанеджа', 'Sartaneja'),
-    'ORH': ('Вустер', 'Worcester'),
-    'GSH': ('Гошен', 'Goshen'),
-    'MCP': ('Макапа', 'Macapa'),
-    'HUD': ('Хумбольдт', 'Humboldt'),
-    'WLH': ('Валаха', 'Walaha'),
-    'BXZ': ('Бансил', 'Bunsil'),
-    'BKH': ('Кекаха', 'Kekaha'),
-    'KEE': ('Келле', 'Kelle'),
-    'TBZ': ('Тебриз', 'Tabriz'),
-    'AJU': ('Аракажу', 'Aracaju'),
-    'CZA': ('Чичен-ица', 'Chichen Itza'),
-    'CCY': ('Чарльз Сити', 'Charles City'),
-    'WLN': ('Литтл Наукати', 'Little Naukati'),
-    'AMW': ('Эймса', 'Ames'),
-    'MOD': ('Модесто', 'Modesto'),
-    'PLV': ('Полтава', 'Poltava'),
-    'YZF': ('Йеллоунайф', 'Yellowknife'),
-    'HLC': ('Хилл Сити', 'Hill City'),
-    'SBU': ('Спрингбок', 'Springbok'),
-    'EDE': ('Эдентон', 'Edenton'),
-    'DSN': ('Ордос', 'Dongsheng'),
-    'HDD': ('Хайдарабад', 'Hyderabad'),
-    'UIB': ('Кибдо', 'Quibdo'),
-    'AMT': ('Амата', 'Amata'),
-    'DAA': ('Форт Белвуар', 'Fort Belvoir'),
-    'SUA': ('Стьюарт', 'Stuart'),
-    'YYU': ('Капасказинг', 'Kapuskasing'),
-    'YAE': ('Альта Лейк', 'Alta Lake'),
-    'KGD': ('Калининград', 'Kaliningrad'),
-    'WMC': ('Уиннемакка', 'Winnemucca'),
-    'AOH': ('Лима', 'Lima'),
-    'NUQ': ('Маунтен Вью', 'Mountain View'),
-    'MQK': ('Сан Матиас', 'San Matias'),
-    'WND': ('Виндарра', 'Windarra'),
-    'XFD': (None, 'Stratford'),
-    'AKB': ('Атка', 'Atka'),
-    'IXQ': ('Камалпур', 'Kamalpur'),
-    'MIX': ('Мирити', 'Miriti'),
-    'WNP': ('Нага', 'Naga'),
-    'HME': ('Хасси-Мессауд', 'Hassi Messaoud'),
-    'CCX': ('Касерис', 'Caceres'),
-    'SVA': ('Савунга', 'Savoonga'),
-    'JUI': ('Юист', 'Juist'),
-    'PHZ': ('о. Пхи-Пхи', 'Phi Phi Island'),
-    'MRL': ('Майнерс Лейк', 'Miners Lake'),
-    'BOT': ('Боссет', 'Boset'),
-    'ZAF': (None, 'Arles'),
-    'RGI': ('Ранжироа', 'Rangiroa'),
-    'WPB': ('Порт Берге', 'Port Berge'),
-    'CHC': ('Крайстчерч', 'Christchurch'),
-    'CJS': ('Сьюдад-Хуарес', 'Ciudad Juarez'),
-    'ANZ': ('Ангус-Даунс', 'Angus Downs'),
-    'KKU': ('Екук', 'Ekuk'),
-    'LYG': ('Ляньюньган', 'Lianyungang'),
-    'MOX': ('Моррис', 'Morris'),
-    'KCP': ('Каменец-Подольский', 'Kamenets-podolskiy'),
-    'KVB': ('Шёвде', 'Skovde'),
-    'TUT': ('Таута', 'Tauta'),
-    'PAX': ('Пор-де-Пе', 'Port De Paix'),
-    'MXS': ('Чатем', 'Maota Savaii Island'),
-    'YAM': ('Су-Сент-Мари', 'Sault Ste. Marie'),
-    'YLX': ('Лонг Поинт', 'Long Point'),
-    'DYM': ('Диамантина Лейкс', 'Diamantina Lakes'),
-    'IZT': ('Сьюдад-Истепек', 'Ixtepec'),
-    'CPA': ('Капе-Пальмас', 'Cape Palmas'),
-    'KMF': ('Камины', 'Kamina'),
-    'ITR': ('Итумбиара', 'Itumbiara'),
-    'ARS': ('Арагарсас', 'Aragarcas'),
-    'SIE': ('Синиш', 'Sines'),
-    'PMO': ('Палермо', 'Palermo'),
-    'ROW': ('Розуэлл', 'Roswell'),
-    'JDZ': ('Цзиндэчжэнь', 'Jingdezhen'),
-    'HRC': ('Жайрем', 'Zhairem'),
-    'ULS': ('Мулатос', 'Mulatos'),
-    'CKH': ('Чокурдах', 'Chokurdah'),
-    'ART': ('Уотертаун', 'Watertown'),
-    'LNZ': ('Линц', 'Linz'),
-    'YAZ': ('Тофино', 'Tofino'),
-    'XFG': (None, 'Perce'),
-    'ZSY': (None, 'Scottsdale'),
-    'POL': ('Пемба', 'Pemba'),
-    'CPF': ('Кепу', 'Cepu'),
-    'ATU': ('Остров Атту', 'Attu Island'),
-    'AGK': ('Кагуа', 'Kagua'),
-    'SEV': ('Северодонецк', 'Severodoneck'),
-    'ASD': ('Андрос Таун', 'Andros Town'),
-    'BRT': ('о. Батерст', 'Bathurst Island'),
-    'RYB': ('Рыбинск', 'Rybinsk'),
-    'JFM': ('Фремантл', 'Fremantle'),
-    'BTN': ('Беннетсвилл', 'Bennettsville'),
-    'NZH': ('Маньчжурия', 'Manzhouli'),
-    'PON': ('Поптун', 'Poptun'),
-    'AUO': ('Оберн', 'Auburn'),
-    'UGO': ('Уиже', 'Uige'),
-    'JWN': ('Зенджан', 'Zanjan'),
-    'RVY': ('Ривера', 'Rivera'),
-    'PKS': ('Паксан', 'Paksane'),
-    'VCR': ('Карора', 'Carora'),
-    'TMU': ('Тамбор', 'Tambor'),
-    'EIH': ('Эйнасли', 'Einasleigh'),
-    'AVL': ('Ашвилл', 'Asheville'),
-    'CTL': ('Чарлвилл', 'Charleville'),
-    'OYE': ('Уам', 'Oyem'),
-    'MZX': ('Мена', 'Mena'),
-    'RIS': ('Рисири', 'Rishiri'),
-    'WSZ': ('Уэстпарк', 'Westport'),
-    'WPC': ('Пинчер Крик', 'Pincher Creek'),
-    'MZN': ('Миндж', 'Minj'),
-    'SBC': ('Селбанг', 'Selbang'),
-    'ELG': ('Эль-Голеа', 'El Golea'),
-    'SCT': ('Сокотра', 'Socotra'),
-    'KMA': ('Керема', 'Kerema'),
-    'BBD': ('Брейди', 'Brady'),
-    'BZH': ('Буми Хиллс', 'Bumi Hills'),
-    'ENE': ('Энде', 'Ende'),
-    'BPO': (None, "Bo'ao"),
-    'PPR': ('Пасэр Пангараян', 'Pasir Pangarayan'),
-    'AXG': ('Алгона', 'Algona'),
-    'MNP': ('Остров Марон', 'Maron'),
-    'ESD': ('Истсаунд', 'Eastsound'),
-    'PIA': ('Пеория', 'Peoria'),
-    'VSA': ('Вильяэрмоса', 'Villahermosa'),
-    'ATB': ('Атбара', 'Atbara'),
-    'HDA': ('Хидден Фоллс', 'Hidden Falls'),
-    'UAQ': ('Сан-Хуан', 'San Juan'),
-    'YAS': ('Острова Ясава', 'Yasawa Island'),
-    'YUB': ('Тектоякчек', 'Tuktoyaktuk'),
-    'PBD': ('Порбандаром', 'Porbandar'),
-    'TAW': ('Такуарембо', 'Tacuarembo'),
-    'LZC': ('Ласаро-Карденас', 'Lazaro Cardenas'),
-    'WTL': ('Тантутулиак', 'Tuntutuliak'),
-    'IGU': ('Фос-ду-Игуасу', 'Iguassu Falls'),
-    'AXA': ('Ангилья', 'Anguilla'),
-    'MUN': ('Матурин', 'Maturin'),
-    'BCV': ('Бельмопан', 'Belmopan'),
-    'DDG': ('Даньдун', 'Dandong'),
-    'WTN': ('Уаддингтон', 'Waddington'),
-    'BYX': ('Банияла', 'Baniyala'),
-    'KXU': ('Катиу', 'Katiu'),
-    'FKL': ('Франклин', 'Franklin'),
-    'PVE': ('Эль-Порвенир', 'El Porvenir'),
-    'MLV': ('Мурлуна', 'Merluna'),
-    'WTT': ('Уантоат', 'Wantoat'),
-    'WRO': ('Вроцлав', 'Wroclaw'),
-    'TKF': ('Траки', 'Truckee'),
-    'KLX': ('Каламата', 'Kalamata'),
-    'PDI': ('Пиндиу', 'Pindiu'),
-    'PQS': ('Пайлот-Стейшен', 'Pilot Station'),
-    'LUS': ('Лусанга', 'Lusanga'),
-    'USS': ('Санкти Спиритус', 'Sancti Spiritus'),
-    'WSJ': (None, 'San Juan'),
-    'TEK': ('Татитлек', 'Tatitlek'),
-    'TOD': ('Тиоман', 'Tioman'),
-    'VIQ': ('Викеке', 'Viqueque'),
-    'WUS': ('Уишань', 'Wuyishan'),
-    'MLI': ('Молин', 'Moline'),
-    'PPL': ('Фапла', 'Phaplu'),
-    'AMF': ('Ама', 'Ama'),
-    'KYA': ('Конья', 'Konya'),
-    'JBS': ('Плезантон', 'Pleasanton'),
-    'OAI': (None, 'Bagram'),
-    'SRS': ('Сан Маркос', 'San Marcos'),
-    'KRE': ('Кирундо', 'Kirundo'),
-    'KNU': ('Канпур', 'Kanpur'),
-    'TCX': ('Табас', 'Tabas'),
-    'UIZ': (None, 'Utica'),
-    'BCE': ('Брайс', 'Bryce'),
-    'CMY': ('Спарта', 'Sparta'),
-    'NKD': ('Синак', 'Sinak'),
-    'XIB': (None, 'Ingersoll'),
-    'LEO': ('Лекони', 'Leconi'),
-    'FMN': ('Фармингтон', 'Farmington'),
-    'HYC': ('Хай-Вайкомб', 'High Wycombe'),
-    'XAU': ('Саюль', 'Saul'),
-    'OLS': ('Ногалес', 'Nogales'),
-    'KTU': ('Кота', 'Kota'),
-    'BOA': ('Бома', 'Boma'),
-    'GLW': ('Глазго', 'Glasgow'),
-    'BDI': ('о. Берд', 'Bird Island'),
-    'LBX': ('Остров Лубанг', 'Lubang'),
-    'KUY': ('Камуси', 'Kamusi'),
-    'OYL': ('Мойали', 'Moyale'),
-    'LTF': ('Леитре', 'Leitre'),
-    'XMS': ('Макас', 'Macas'),
-    'XLB': ('Лак Брочет', 'Lac Brochet'),
-    'ZRY': (None, 'Herning'),
-    'KUW': ('Кугурурок Ривер', 'Kugururok River'),
-    'PIZ': ('Пойнт-Лей', 'Point Lay'),
-    'XIJ': ('Ахмед Аль Джабер', 'Ahmed Al Jaber'),
-    'XKY': ('Кая', 'Kaya'),
-    'GFK': ('Гранд-Форкс', 'Grand Forks'),
-    'WUA': ('Ухай', 'Wu Hai'),
-    'KXA': ('Касан', 'Kasaan'),
-    'XLF': ('Лиф Бэй', 'Leaf Bay'),
-    'XNU': ('Нуна', 'Nouna'),
-    'SAG': ('Ширди', 'Shirdi'),
-    'YBX': ('Блан-Саблон', 'Blanc Sablon'),
-    'BLK': ('Блэкпул', 'Blackpool'),
-    'WRG': ('Врангель', 'Wrangell'),
-    'YQM': ('Монктон', 'Moncton'),
-    'YCM': ('Сент Катаринес', 'St Catharines'),
-    'EGM': ('Сеге', 'Sege'),
-    'ITA': ('Итакуатиара', 'Itacoatiara'),
-    'XSE': ('Себба', 'Sebba'),
-    'RKO': ('Сипора', 'Sipora'),
-    'IMK': ('Симикот', 'Simikot'),
-    'WUD': ('Уудинна', 'Wudinna'),
-    'XUZ': ('Сюйчжоу', 'Xuzhou'),
-    'SCW': ('Сыктывкар', 'Syktyvkar'),
-    'XYI': ('Флен', 'Flen'),
-    'ZNE': ('Ньюман', 'Newman'),
-    'WVK': ('Манакара', 'Manakara'),
-    'RGL': ('Рио-Гальегос', 'Rio Gallegos'),
-    'YAF': ('Асбестос Хилл', 'Asbestos Hill'),
-    'XUF': (None, 'Cartagena'),
-    'RCS': ('Рочестер', 'Rochester'),
-    'YPL': ('Пикл Лейк', 'Pickle Lake'),
-    'ZIY': ('Лианхуашань', 'Lianhuashan'),
-    'SKP': ('Скопье', 'Skopje'),
-    'YAO': ('Яунде', 'Yaounde'),
-    'SVV': ('Сан Сальвадор Де', 'San Salvador De'),
-    'SKH': ('Суркхет', 'Surkhet'),
-    'OFK': ('Норфолк', 'Norfolk'),
-    'WYS': ('Йеллоустон', 'West Yellowstone'),
-    'JCM': ('Жакоби', 'Jacobina'),
-    'RAK': ('Марракеш', 'Marrakech'),
-    'KCJ': ('Комайо', 'Komaio'),
-    'IGA': ('Инагуа', 'Inagua'),
-    'ELV': ('Элфин Коув', 'Elfin Cove'),
-    'YBJ': ('Бэ-Жоан-Беес', 'Baie Johan Beetz'),
-    'MZS': ('Мостин', 'Mostyn'),
-    'YDG': ('Дигби', 'Digby'),
-    'XBN': ('Бинигуни', 'Biniguni'),
-    'YCQ': ('Четвинд', 'Chetwynd'),
-    'BDQ': ('Вадодара', 'Vadodara'),
-    'OIC': ('Норидж', 'Norwich'),
-    'TFR': ('Рамадан', 'Ramadan'),
-    'MSU': ('Масеру', 'Maseru'),
-    'GAI': ('Гейтерсберг', 'Gaithersburg'),
-    'JKH': ('Хиос', 'Chios'),
-    'SXG': ('Сенанга', 'Senanga'),
-    'NJA': ('Атсуги', 'Atsugi'),
-    'YCS': ('Честерфилд Инлет', 'Chesterfield Inlet'),
-    'CCV': ('Крейг Ков', 'Craig Cove'),
-    'KLK': ('Калокол', 'Kalokol'),
-    'MCH': ('Мачала', 'Machala'),
-    'YDO': ('Долбо', 'Dolbeau'),
-    'KMC': ('Кинг Кахлид Мил. Сити', 'King Khalid Mil. City'),
-    'YDR': ('Бродвью', 'Broadview'),
-    'IXJ': ('Джамму', 'Jammu'),
-    'LZM': ('Лузамба', 'Luzamba'),
-    'LYC': ('Люкселе', 'Lycksele'),
-    'SPQ': ('Сан Педро', 'San Pedro'),
-    'MLE': ('Мале', 'Male'),
-    'YDV': ('Блудвейн', 'Bloodvein'),
-    'AZT': ('Сапатока', 'Zapatoca'),
-    'CEW': ('Крествью', 'Crestview'),
-    'XCO': ('Колак', 'Colac'),
-    'JGR': ('Гроеннедаль', 'Groennedal'),
-    'XMH': ('Манихи', 'Manihi'),
-    'ZFR': (None, 'Frankfurt (Oder)'),
-    'PKY': ('Палангкарая', 'Palangkaraya'),
-    'HXX': ('Хей', 'Hay'),
-    'RBE': ('Ратанакири', 'Ratanakiri'),
-    'KAR': ('Камаранг', 'Kamarang'),
-    'ZKG': ('Кегаска', 'Kegaska'),
-    'ZDS': (None, 'Chiasso'),
-    'YFJ': ('Снэйр Лейк', 'Snare Lake'),
-    'WSX': ('Истсаунд', 'Westsound'),
-    'MHS': ('Маунт Шаста', 'Mount Shasta'),
-    'ABP': ('Аткамба', 'Atkamba'),
-    'LFT': ('Лафейетт', 'Lafayette'),
-    'NIF': ('Нифти', 'Nifty'),
-    'KMU': ('Кисмайо', 'Kismayu'),
-    'JOM': ('Нйомбе', 'Njombe'),
-    'XGG': ('Гором-Гором', 'Gorom-Gorom'),
-    'YZZ': ('Трейл', 'Trail'),
-    'RIF': ('Ричфилд', 'Richfield'),
-    'YAL': ('Алерт Бэй', 'Alert Bay'),
-    'HUI': ('Хюэ', 'Hue'),
-    'TSI': ('Тсили Тсили', 'Tsili Tsili'),
-    'XYU': ('Солвесборг', 'Solvesborg'),
-    'JKR': ('Джанакпур', 'Janakpur'),
-    'YAD': ('Муз Лейк', 'Moose Lake'),
-    'ILL': ('Уилмар', 'Willmar'),
-    'ZKL': ('Стинкул', 'Steenkool'),
-    'MUI': ('Форт Индиантаун', 'Fort Indiantown'),
-    'YFH': ('Форт Хоуп', 'Fort Hope'),
-    'YPO': ('Пиванак', 'Peawanuck'),
-    'LCX': ('Лунъянь', 'Longyan'),
-    'YBD': ('Нью Вестминистер', 'New Westminster'),
-    'ZAK': (None, 'Chiusa/Klausen'),
-    'SJL': ('Сао Габриель', 'Sao Gabriel'),
-    'ZHK': (None, 'Gstaad'),
-    'VLS': ('Валесдир', 'Valesdir'),
-    'YQA': ('Маскока', 'Muskoka'),
-    'YST': ('Ст. Терез Поинт', 'Ste Therese Point'),
-    'LTQ': ('Ле Туке-Париж-Пляж', 'Le Touquet'),
-    'BAA': ('Биалла', 'Bialla'),
-    'YEL': ('Эллиот Лейк', 'Elliot Lake'),
-    'KCR': ('Колорадо Крик', 'Colorado Creek'),
-    'YGG': ('Джанжэес Харбор', 'Ganges Harbor'),
-    'XNE': ('Ньюпорт', 'Newport'),
-    'LGE': ('Лэйк Грегори', 'Lake Gregory'),
-    'YGY': ('Десепсьон', 'Deception'),
-    'VLA': ('Вандалия', 'Vandalia'),
-    'EOR': ('Эль Дорадо', 'El Dorado'),
-    'THI': ('Тичитт', 'Tichitt'),
-    'BOM': ('Мумбаи', 'Mumbai'),
-    'PGE': ('Йегепа', 'Yegepa'),
-    'YLD': ('Шаплау-Ванкувер', 'Chapleau'),
-    'WLD': ('Уинфилд', 'Winfield'),
-    'XVC': (None, 'Crewe'),
-    'CNT': ('Чарата', 'Charata'),
-    'IHU': ('Иху', 'Ihu'),
-    'UTN': ('Апингтон', 'Upington'),
-    'KYT': ('Кяокто', 'Kyauktaw'),
-    'OMO': ('Мостар', 'Mostar'),
-    'YZA': ('Ашкрофт', 'Ashcroft'),
-    'YYG': ('Шарлоттаун', 'Charlottetown'),
-    'YQI': ('Ярмут', 'Yarmouth'),
-    'YSS': ('Слейт Айленд', 'Slate Island'),
-    'MEU': ('Монте Доурадо', 'Monte Dourado'),
-    'NGS': ('Нагасаки', 'Nagasaki'),
-    'AMU': ('Аманаб', 'Amanab'),
-    'OVA': ('Бекили', 'Bekily'),
-    'ZBO': ('Боуэн', 'Bowen'),
-    'LFB': ('Лумбо', 'Lumbo'),
-    'MJA': ('Манжа', 'Manja'),
-    'ZDP': (None, 'Burgdorf'),
-    'ZNC': ('Найак', 'Nyac'),
-    'CKW': (None, 'Christmas Creek Mine'),
-    'HBU': ('Булган, Ховд', 'Bulgan, Hovd'),
-    'TVF': ('Тиф-Ривер-Фолс', 'Thief River Falls'),
-    'KFE': (None, 'Cloudbreak'),
-    'AIG': ('Ялинга', 'Yalinga'),
-    'CFP': ('Карпентария Даунс', 'Carpentaria Downs'),
-    'SOF': ('София', 'Sofia'),
-    'LEE': ('Лисберг', 'Leesburg'),
-    'MJZ': ('Мирный', 'Mirnyj'),
-    'PRX': ('Париж', 'Paris'),
-    'YCY': ('Клайд Ривер', 'Clyde River'),
-    'LNB': ('Ламен Бэй', 'Lamen Bay'),
-    'XHV': (None, 'Brasov'),
-    'LKG': ('Локичоггио', 'Lokichoggio'),
-    'XLP': (None, 'Matapedia'),
-    'PZA': ('Пас Де Арипоро', 'Paz De Ariporo'),
-    'BFH': (None, 'Curitiba.'),
-    'XDU': (None, 'Hervey'),
-    'MEQ': ('Мелабоха', 'Meulaboh'),
-    'CND': ('Констанца', 'Constanta'),
-    'YGV': ('Авр-Сен-Пьер', 'Havre St Pierre'),
-    'ANI': ('Аниак', 'Aniak'),
-    'PZE': ('Пензанс', 'Penzance'),
-    'LPL': ('Ливерпуль', 'Liverpool'),
-    'OUR': ('Батури', 'Batouri'),
-    'IRN': ('Ириона', 'Iriona'),
-    'NOR': ('Нескёйпстадюр', 'Nordfjordur'),
-    'AHB': ('Абха', 'Abha'),
-    'MAK': ('Малакаль', 'Malakal'),
-    'LMG': ('Ламасса', 'Lamassa'),
-    'TIS': ('Терсдей Айленд', 'Thursday Island'),
-    'XNG': ('Куангнгай', 'Quang Ngai'),
-    'YRF': ('Картрайт', 'Cartwright'),
-    'WAJ': ('Вавои Фоллс', 'Wawoi Falls'),
-    'TUR': ('Тукуруи', 'Tucurui'),
-    'CTJ': ('Карролтон', 'Carrollton'),
-    'AHU': ('Эль-Хосейма', 'Al Hoceima'),
-    'CVL': ('Капе-Вогель', 'Cape Vogel'),
-    'YGQ': ('Джералдтон', 'Geraldton'),
-    'URU': ('Уроуби', 'Uroubi'),
-    'KBR': ('Кота-Бару', 'Kota Bharu'),
-    'CYG': ('Коррионг', 'Corryong'),
-    'TAV': ("Фити'Юта Вилладж", "Fiti'Uta Village"),
-    'RCR': ('Рочестер', 'Rochester'),
-    'LII': ('Мулиа', 'Mulia'),
-    'IUM': ('Саммит Лейк', 'Summit Lake'),
-    'MDF': ('Медфорд', 'Medford'),
-    'HDN': ('Хейден', 'Hayden'),
-    'GPL': ('Гуапилес', 'Guapiles'),
-    'YGR': ('Мадлен', 'Iles De La Madeleine'),
-    'MDM': ('Мандуку', 'Munduku'),
-    'ZPC': ('Пукон', 'Pucon'),
-    'LNE': ('Лонороре', 'Lonorore'),
-    'LTL': ('Ластаурвилль', 'Lastourville'),
-    'BSF': ('Похакулоа', 'Pohakuloa'),
-    'IRJ': ('Ла-Риоха', 'La Rioja'),
-    'DEA': ('Дера-Гази-Хан', 'Dera Ghazi Khan'),
-    'KDI': ('Кендари', 'Kendari'),
-    'IUL': ('Илу', 'Ilu'),
-    'HLG': ('Уилинг', 'Wheeling'),
-    'CTC': ('Катамарка', 'Catamarca'),
-    'AMH': ('Арба-Мынч', 'Arba Mintch'),
-    'YHE': ('Хоп', 'Hope'),
-    'NYI': ('Саняани', 'Sunyani'),
-    'TBH': ('Остров Таблас', 'Tablas'),
-    'YHO': ('Хопдейл', 'Hopedale'),
-    'TNE': ('Танегашима', 'Tanegashima'),
-    'YIK': ('Ивюживик', 'Ivujivik'),
-    'CGC': ('Капе-Глоукестер', 'Cape Gloucester'),
-    'ZSE': ('Сент-Пьер-де-ла-Реунион', 'St Pierre dela Reunion'),
-    'JAI': ('Джайпур', 'Jaipur'),
-    'PDA': ('Пуэрто Инирида', 'Puerto Inirida'),
-    'IXR': ('Ранчи', 'Ranchi'),
-    'LRH': ('Ла-Рошель', 'La Rochelle'),
-    'NRS': ('Империал Бич', 'Imperial Beach'),
-    'MCU': ('Монлюсон', 'Montlucon'),
-    'KEN': ('Кенеме', 'Kenema'),
-    'NVK': ('Нарвик', 'Narvik'),
-    'CVH': ('Кавиауэ', 'Caviahue'),
-    'LIO': ('Лимон', 'Limon'),
-    'OMK': ('Омак', 'Omak'),
-    'PMC': ('Пуэрто-Монт', 'Puerto Montt'),
-    'LWY': ('Лавас', 'Lawas'),
-    'IVL': ('Ивало', 'Ivalo'),
-    'LSQ': ('Лос Анджелес', 'Los Angeles'),
-    'ILR': ('Илорин', 'Ilorin'),
-    'LRL': ('Ниамтугу', 'Niamtougou'),
-    'ARR': ('Альто Рио Сенгер', 'Alto Rio Senguerr'),
-    'KGU': ('Кенингау', 'Keningau'),
-    'LYK': ('Лунйук', 'Lunyuk'),
-    'HPY': ('Бейтаун', 'Baytown'),
-    'RAE': ('Арар', 'Arar'),
-    'TDV': ('Танандава', 'Tanandava'),
-    'YJO': ('Бронсон Крик', 'Johnny Mountain'),
-    'ZTB': ('Тет-А-ла-Бален', 'Tete-a-La Baleine'),
-    'NTX': ('Натуна Ранаи', 'Natuna Ranai'),
-    'ILH': ('Иллесхайм', 'Illisheim'),
-    'MHD': ('Мешхед', 'Mashad'),
-    'SFM': ('Санфорд', 'Sanford'),
-    'BAW': ('Биавонке', 'Biawonque'),
-    'NIK': ('Найоколо-Коба', 'Niokolo Koba'),
-    'LUZ': ('Люблин', 'Swidnik'),
-    'ZHO': ('Хьюстон', 'Houston'),
-    'ITQ': ('Итака', 'Itaqui'),
-    'YIF': ('Пакуашипи', 'Pakuashipi'),
-    'KKE': ('Керайкри', 'Kerikeri'),
-    'JAT': ('Джабот', 'Jabot'),
-    'KES': ('Келси', 'Kelsey'),
-    'YGH': ('Форт Гуд Хоп', 'Fort Good Hope'),
-    'MBG': ('Мобридж', 'Mobridge'),
-    'JPD': (None, 'Pasadena'),
-    'CGV': ('Каигуна', 'Caiguna'),
-    'AOL': ('Пасо де Лос Либрес', 'Paso De Los Libres'),
-    'YNE': ('Норуэй Хаус', 'Norway House'),
-    'YJT': ('Стивенвилл', 'Stephenville'),
-    'LUI': ('Ла Юнион', 'La Union'),
-    'APH': ('Боулинг Грин', 'Bowling Green'),
-    'TOF': ('Томск', 'Tomsk'),
-    'JSO': ('Содерталге', 'Sodertalje'),
-    'KGY': ('Кингарой', 'Kingaroy'),
-    'PNR': ('Пуэнт-Нуар', 'Pointe Noire'),
-    'TEC': ('Телемаку-Борба', 'Telemaco Borba'),
-    'KKH': ('Конгиганак', 'Kongiganak'),
-    'TRE': ('Остров Тири', 'Tiree, Inner Hebrides'),
-    'XOQ': (None, 'Sira'),
-    'KLB': ('Калабо', 'Kalabo'),
-    'SPM': ('Спангдахлерн', 'Spangdahlem'),
-    'EAR': ('Карни', 'Kearney'),
-    'YPT': ('Пендер Харбор', 'Pender Harbor'),
-    'ONH': ('Онеонта', 'Oneonta'),
-    'ATT': ('Атмаутлуак', 'Atmautluak'),
-    'LKY': ('Маньяра', 'Lake Manyara'),
-    'MGN': ('Маганге', 'Magangue'),
-    'MNB': ('Мюанда', 'Moanda'),
-    'PKB': ('Паркерсберг', 'Parkersburg'),
-    'TIW': ('Такома', 'Tacoma'),
-    'KGF': ('Караганда', 'Karaganda'),
-    'MAW': ('Малден', 'Malden'),
-    'TKQ': ('Кигома', 'Kigoma'),
-    'LBO': ('Лусамбо', 'Lusambo'),
-    'DZI': ('Агустин Кодасси', 'Codazzi'),
-    'MKS': ('Мекане Селам', 'Mekane Selam'),
-    'PQC': ('Фукуок', 'Phu Quoc'),
-    'TLD': ('Тули Блок', 'Tuli Block'),
-    'KKX': ('Кагосима', 'Kikaiga Shima'),
-    'DJJ': ('Джаяпура', 'Jayapura'),
-    'YET': ('Эдсон', 'Edson'),
-    'APY': ('Алту-Парнаиба', 'Alto Parnaiba'),
-    'JTR': ('Санторини', 'Thira'),
-    'MGC': ('Мичиган Сити', 'Michigan City'),
-    'RBJ': ('Ребун', 'Rebun'),
-    'YLI': ('Иливиеска', 'Ylivieska'),
-    'YKE': ('оз. Ни', 'Knee Lake'),
-    'MLQ': ('Малалауа', 'Malalaua'),
-    'APV': ('Эппл-Валли', 'Apple Valley'),
-    'PPO': ('Роувелл Поинт', 'Powell Point'),
-    'KJU': ('Камираба', 'Kamiraba'),
-    'MVE': ('Монтевидео', 'Montevideo'),
-    'TNN': ('Тайнань', 'Tainan'),
-    'ASC': ('Аскеншн', 'Ascension'),
-    'TTQ': ('Тортугеро', 'Tortuquero'),
-    'TKM': ('Тикал', 'Tikal'),
-    'LAT': ('Ла Урибе', 'La Uribe'),
-    'DUT': ('Датч Харбор', 'Dutch Harbor'),
-    'KIZ': ('Кикинонда', 'Kikinonda'),
-    'KCH': ('Кучинг', 'Kuching'),
-    'MPJ': ('Моррилтон', 'Morrilton'),
-    'RVK': ('Рёрвик', 'Roervik'),
-    'KDP': ('Кандеп', 'Kandep'),
-    'ASK': ('Ямусукро', 'Yamoussoukro'),
-    'MBC': ('Мбигу', 'Mbigou'),
-    'GKT': ('Гатлинберг', 'Gatlinburg'),
-    'LCP': ('Лонкопуэ', 'Loncopue'),
-    'KHC': ('Керчь', 'Kerch'),
-    'UTL': ('Торремолинос', 'Torremolinos'),
-    'KGK': ('Колиганек', 'New Koliganek'),
-    'YLJ': ('Медоу Лейк', 'Meadow Lake'),
-    'KDO': ('Кадхдуу', 'Kadhdhoo'),
-    'NBA': ('Намбайюфа', 'Nambaiyufa'),
-    'ASX': ('Ашленд', 'Ashland'),
-    'YBK': ('Бейкер-Лейк', 'Baker Lake'),
-    'ASF': ('Астрахань', 'Astrakhan'),
-    'PCJ': ('Пуэрто Ла Виктория', 'Puerto La Victoria'),
-    'EFK': ('Ньюпорт', 'Newport'),
-    'KLG': ('Калскаг', 'Kalskag'),
-    'MOL': ('Молде', 'Molde'),
-    'LGT': ('Лас Гавиотас', 'Las Gaviotas'),
-    'KQL': ('Кол', 'Kol'),
-    'FNG': ('Фада-Нгурма', 'Fada Ngourma'),
-    'USH': ('Ушуайя', 'Ushuaia'),
-    'OIL': ('Ойл Сити', 'Oil City'),
-    'EUX': ('Синт-Эстатиус', 'Saint Eustatius'),
-    'URB': ('Урубупунга', 'Urubupunga'),
-    'XVG': (None, 'Darlington'),
-    'VEE': ('Венеши', 'Venetie'),
-    'YPG': ('Портидж-ла-Прери', 'Portage La Prairie'),
-    'SLO': ('Сейлем', 'Salem'),
-    'ZKB': ('Касаба Бэй', 'Kasaba Bay'),
-    'TYA': ('Тула', 'Tula'),
-    'BBC': ('Бей Сити', 'Bay City'),
-    'YMD': ('Принс-Патрик', 'Mould Bay'),
-    'YKF': ('Уотерлу', 'Kitchener'),
-    'LUV': ('Ланггур', 'Langgur'),
-    'VGD': ('Вологда', 'Vologda'),
-    'NGZ': ('Аламеда', 'Alameda'),
-    'YKJ': ('оз. Ки', 'Key Lake'),
-    'AWD': ('Анива', 'Aniwa'),
-    'BAT': ('Барретус', 'Barretos'),
-    'YAA': ('Анахим Лейк', 'Anahim Lake'),
-    'BIV': ('Бриа', 'Bria'),
-    'ATE': ('Антлерс', 'Antlers'),
-    'ELD': ('Эль-Дорадо', 'El Dorado'),
-    'SRW': ('Солсбери', 'Salisbury'),
-    'LTO': ('Лорето', 'Loreto'),
-    'NUK': ('Нукутаваке', 'Nukutavake'),
-    'QZF': (None, 'Font-Romeu'),
-    'AYA': ('Айяпель', 'Ayapel'),
-    'ZDC': (None, 'Aigle'),
-    'PFJ': ('Патркесфьордур', 'Patreksfjordur'),
-    'JDA': ('Джон Дей', 'John Day'),
-    'YNA': ('Наташкан', 'Natashquan'),
-    'FGD': ('Фдерик', 'Fderik'),
-    'PMN': ('Пумани', 'Pumani'),
-    'VSO': ('Пхуоклонг', 'Phuoclong'),
-    'AOP': (None, 'Andoas'),
-    'XLY': (None, 'Aldershot'),
-    'RKH': ('Рок Хилл', 'Rock Hill'),
-    'YLQ': ('Ла Тукью', 'La Tuque'),
-    'SOX': ('Согамосо', 'Sogamoso'),
-    'EVH': ('Эванс Хед', 'Evans Head'),
-    'BHL': ('Баия де Лос Анхелес', 'Bahia Angeles'),
-    'BWM': ('Боумен', 'Bowman'),
-    'YNM': ('Матагами', 'Matagami'),
-    'CDE': ('Каледония', 'Caledonia'),
-    'TZO': (None, 'Ankisatra'),
-    'BCO': ('Джинка', 'Jinka'),
-    'YMI': ('Минаки', 'Minaki'),
-    'CFR': ('Кан', 'Caen'),
-    'YMS': ('Юримагуас', 'Yurimaguas'),
-    'JHG': ('Дзинхонг', 'Jinghong'),
-    'LRB': ('Лерибе', 'Leribe'),
-    'AFA': ('Сан-Рафаэль', 'San Rafael'),
-    'PTF': ('Малололалиаи', 'Malololailai'),
-    'AYR': ('Эр', 'Ayr'),
-    'PDX': ('Портленд', 'Portland'),
-    'EYP': ('Йопаль', 'El Yopal'),
-    'FDU': ('Бандунду', 'Bandundu'),
-    'TMD': ('Тимбедра', 'Timbedra'),
-    'AAK': ('Аранука', 'Aranuka'),
-    'CLO': ('Кали', 'Cali'),
-    'YMT': ('Шибугамо', 'Chibougamau'),
-    'CZB': ('Крус-Алта', 'Cruz Alta'),
-    'PDC': ('Муэо', 'Mueo'),
-    'JAP': ('Пунта Ренес', 'Punta Renes'),
-    'AIN': ('Уэйнрайт', 'Wainwright'),
-    'YNG': ('Янгстаун', 'Youngstown'),
-    'WCH': ('Чайтен', 'Chaiten'),
-    'DNK': ('Днепр', 'Dnepropetrovsk'),
-    'CDQ': ('Кройдон', 'Croydon'),
-    'BCQ': ('Брак', 'Brack'),
-    'ALQ': ('Алегрети', 'Alegrete'),
-    'BFT': ('Бофорт', 'Beaufort'),
-    'BYG': ('Буффало', 'Buffalo'),
-    'SIZ': ('Сиссано', 'Sissano'),
-    'CHO': ('Шарлотсвилл', 'Charlottesville'),
-    'LEL': ('оз. Эвелла', 'Lake Evella'),
-    'AAT': ('Алтай', 'Altay'),
-    'TXK': ('Тексаркана', 'Texarkana'),
-    'BKG': ('Брансон', 'Branson'),
-    'DKS': ('Диксон', 'Dikson'),
-    'YNZ': ('Яньчэн', 'Yancheng'),
-    'AGT': ('Сьюдад-дель-Эсте', 'Ciudad del Este'),
-    'ABB': ('Асаба', 'Asaba'),
-    'RJN': ('Рафсанджане', 'Rafsanjan'),
-    'BDY': ('Бандон', 'Bandon'),
-    'SET': ('Сан Эстебан', 'San Esteban'),
-    'ADG': ('Адриан', 'Adrian'),
-    'LSM': ('Лонг Семадо', 'Long Semado'),
-    'AHS': ('Ауас', 'Ahuas'),
-    'YOS': ('Оуэн Саунд', 'Owen Sound'),
-    'YPJ': ('Опалюк', 'Aupaluk'),
-    'QCE': ('Коппер Маунтейн', 'Copper Mountain'),
-    'DUA': ('Дьюрант', 'Durant'),
-    'LEQ': ('Лендс-Энд', 'Lands End'),
-    'SOK': ('Семонгконг', 'Semongkong'),
-    'GGE': ('Джорджтаун', 'Georgetown'),
-    'YQF': ('Ред-Дир', 'Red Deer'),
-    'ZMR': (None, 'Merano/Meran'),
-    'LLX': ('Линдонвилл', 'Lyndonville'),
-    'CUM': ('Кумана', 'Cumana'),
-    'GTK': ('Сунгей Текай', 'Sungei Tekai'),
-    'NCY': ('Анси', 'Annecy'),
-    'YRI': ('Ривьер-дю-Лу', 'Riviere Du Loup'),
-    'NKV': ('Ничен Коув', 'Nichen Cove'),
-    'CST': ('Изгой', 'Castaway'),
-    'GEE': ('Джордж Таун', 'George Town'),
-    'ESU': ('Эс-Сувейра', 'Essaouira'),
-    'YRS': ('оз. Ред Сакер', 'Red Sucker Lake'),
-    'LHE': ('Лахор', 'Lahore'),
-    'DGT': ('Думагете', 'Dumaguete'),
-    'IDI': ('Индиана', 'Indiana'),
-    'SFZ': ('Потакет', 'Pawtucket'),
-    'CWW': ('Корова', 'Corowa'),
-    'ANU': ('Антигуа', 'Antigua'),
-    'IRB': ('Иран', 'Iraan'),
-    'BKW': ('Бекли', 'Beckley'),
-    'LYU': ('Эли', 'Ely'),
-    'PUQ': ('Пунта-Аренас', 'Punta Arenas'),
-    'MYW': ('Мтвара', 'Mtwara'),
-    'KCU': ('Масинди', 'Masindi'),
-    'MTY': ('Монтеррей', 'Monterrey'),
-    'KCM': ('Кахраманмараш', 'Kahramanmaras'),
-    'HET': ('Хух-Хото', 'Hohhot'),
-    'YNO': ('Север Спирит Лейк', 'North Spirit Lake'),
-    'ECH': ('Эчака', 'Echuca'),
-    'MKP': ('Макемо', 'Makemo'),
-    'MZY': ('Моссел Бей', 'Mossel Bay'),
-    'LZA': ('Люиза', 'Luiza'),
-    'PEA': ('Пеннешо', 'Penneshaw'),
-    'DTE': ('Дает', 'Daet'),
-    'PYX': ('Паттайя', 'Pattaya'),
-    'YAX': ('Энглинг-Лейк', 'Angling Lake'),
-    'EGO': ('Белгород', 'Belgorod'),
-    'MTT': ('Минатитлан', 'Minatitlan'),
-    'OUT': ('Боуссо', 'Bousso'),
-    'DOO': ('Доробисоро', 'Dorobisoro'),
-    'RAH': ('Рафха', 'Rafha'),
-    'UIT': ('Джалуит', 'Jaluit Island'),
-    'SJK': ('Сан-Жозе-дус-Кампус', 'Sao Jose Dos Campos'),
-    'OYK': ('Ояпоки', 'Oiapoque'),
-    'MZK': ('Маракеи', 'Marakei'),
-    'SJQ': ('Шешеке', 'Sesheke'),
-    'OYS': ('Йосемити', 'Yosemite'),
-    'MYJ': ('Мацуяма', 'Matsuyama'),
-    'REY': ('Рейес', 'Reyes'),
-    'HPN': ('Уэстчестер', 'Westchester County'),
-    'NOA': ('Новра', 'Nowra'),
-    'SUK': ('Батагай', 'Batagay-Alyta'),
-    'ASW': ('Асуан', 'Aswan'),
-    'LYP': ('Фейсалабад', 'Faisalabad'),
-    'YSJ': ('Сент-Джон', 'Saint John'),
-    'YEB': (None, 'Bar River'),
-    'AZD': ('Йезд', 'Yazd'),
-    'PBU': ('Путао', 'Putao'),
-    'RKD': ('Рокленд', 'Rockland'),
-    'AZO': ('Каламазу', 'Kalamazoo'),
-    'MEP': ('Мерсинг', 'Mersing'),
-    'RIX': ('Рига', 'Riga'),
-    'PVC': ('Провинстаун', 'Provincetown'),
-    'RZA': ('Санта Круз', 'Santa Cruz'),
-    'LWR': ('Леуварден', 'Leeuwarden'),
-    'LPS': ('Лопез Айленд', 'Lopez Island'),
-    'SSQ': ('Ла Сарре', 'La Sarre'),
-    'LPO': ('Ла Порт', 'Laporte'),
-    'SQX': ('Сан-Мигель-до-Оестре', 'Sao Miguel do Oeste'),
-    'FNJ': ('Пхеньян', 'Pyongyang'),
-    'PEL': ('Пеланенг', 'Pelaneng'),
-    'NME': ('Найтмьют', 'Nightmute'),
-    'TZN': ('о. Андрос', 'South Andros'),
-    'PWT': ('Бремертон', 'Bremerton'),
-    'HGZ': ('Хогатза', 'Hogatza'),
-    'OMG': ('Омега', 'Omega'),
-    'SHL': ('Шиллонг', 'Umroi'),
-    'KLP': ('Залив Келп', 'Kelp Bay'),
-    'TUN': ('Тунис', 'Tunis'),
-    'YNP': ('Нейчуашиш', 'Natuashish'),
-    'BIA': ('Бастия', 'Bastia'),
-    'OGN': ('Йонагуни Джима', 'Yonaguni Jima'),
-    'SLN': ('Салина', 'Salina'),
-    'OEA': ('Винсеннес', 'Vincennes'),
-    'TAB': ('Тобаго', 'Tobago'),
-    'NPH': ('Нефи', 'Nephi'),
-    'ZJY': ('Понза', 'Ponza'),
-    'WNZ': ('Вэньчжоу', 'Wenzhou'),
-    'QRW': ('Варри', 'Warri'),
-    'RIW': ('Ривертон', 'Riverton'),
-    'OPA': ('Копаскер', 'Kopasker'),
-    'CCQ': ('Кашуэйра', 'Cachoeira'),
-    'ERR': ('Эррол', 'Errol'),
-    'TEB': ('Тетерборо', 'Teterboro'),
-    'SOW': ('Шоу Лоу', 'Show Low'),
-    'IKB': ('Уилксборо', 'Wilkesboro'),
-    'RKR': ('Пото', 'Poteau'),
-    'SPP': ('Менонгве', 'Menongue'),
-    'SXE': ('Сэйл', 'Sale'),
-    'SCI': ('Сан-Кристобаль', 'San Cristobal'),
-    'SDJ': ('Сендай', 'Sendai'),
-    'YPQ': ('Питерборо', 'Peterborough'),
-    'YSO': ('Поствилл', 'Postville'),
-    'ZDI': (None, 'Bellinzona'),
-    'UBA': ('Убераба', 'Uberaba'),
-    'SKJ': ('Остров Сайткинак', 'Sitkinak Island'),
-    'DOI': ('Дойни', 'Doini'),
-    'IPC': ('Остров Пасхи', 'Easter Island'),
-    'YQQ': ('Комокс', 'Comox'),
-    'ONN': ('Залив Онен', 'Onion Bay'),
-    'YQV': ('Йорктон', 'Yorkton'),
-    'YQX': ('Гандер', 'Gander'),
-    'NCT': ('Никоя', 'Nicoya'),
-    'HAY': ('Хейкок', 'Haycock'),
-    'YRE': ('Остров Ресольюшен', 'Resolution Island'),
-    'SXT': ('Тамран Негара', 'Taman Negara'),
-    'YSP': ('Маратон', 'Marathon'),
-    'XUB': (None, 'Berkak'),
-    'OSI': ('Осиек', 'Osijek'),
-    'LOQ': ('Лобаце', 'Lobatse'),
-    'SGY': ('Скагуэй', 'Skagway'),
-    'YSD': ('Саффилд', 'Suffield'),
-    'XXK': ('Катринехольм', 'Katrineholm'),
-    'WEP': ('Веам', 'Weam'),
-    'LRI': ('Лорика', 'Lorica'),
-    'OAN': ('Оланчито', 'Olanchito'),
-    'YSE': ('Сквамиш', 'Squamish'),
-    'NTG': ('Наньтун', 'Nantong'),
-    'YRA': ('Раи Лейкс', 'Rae Lakes'),
-    'OTN': ('Октаун', 'Oaktown'),
-    'YSH': ('Смит Фоллс', 'Smith Falls'),
-    'USN': ('Ульсан', 'Ulsan'),
-    'MWI': ('Марамуни', 'Maramuni'),
-    'PBS': ('Патонг', 'Patong Beach'),
-    'YSN': ('Сэлмон Арм', 'Salmon Arm'),
-    'VNA': ('Салаван', 'Saravane'),
-    'LMA': ('Лейк Минчумина', 'Lake Minchumina'),
-    'SLI': ('Солвези', 'Solwezi'),
-    'YVB': ('Бонавантюр', 'Bonaventure'),
-    'LLU': ('Аллуитсуп Паа', 'Alluitsup Paa'),
-    'VBM': (None, 'Blue Mountain'),
-    'NIO': ('Ньоки', 'Nioki'),
-    'TBQ': ('Тарабо', 'Tarabo'),
-    'YSQ': ('Спринг Айленд', 'Spring Island'),
-    'ZDL': (None, 'Brig'),
-    'WON': ('Вондула', 'Wondoola'),
-    'YSV': ('Саглек', 'Saglek'),
-    'YMO': ('Музони', 'Moosonee'),
-    'WBR': ('Биг Рапидс', 'Big Rapids'),
-    'LSZ': ('Мали Лошинь', 'Mali Losinj'),
-    'YVV': ('Уиартон', 'Wiarton'),
-    'TBO': ('Табора', 'Tabora'),
-    'TBF': ('Табитеуея Эйрстрип', 'Tabiteuea North'),
-    'PPG': ('Паго-Паго', 'Pago Pago'),
-    'MBN': ('Маунт Барнетт', 'Mount Barnett'),
-    'PPB': ('Президенти-Пруденти', 'Presidente Prudente'),
-    'YLE': ('Ва-Ти', 'Wha Ti'),
-    'YTE': ('Кейп-Дорсет', 'Cape Dorset'),
-    'WEW': ('Ви Ва', 'Wee Waa'),
-    'JIQ': ('Цяньцзян', 'Qianjiang'),
-    'LUQ': ('Сан-Луис', 'San Luis'),
-    'YXH': ('Медисин-Хат', 'Medicine Hat'),
-    'TIH': ('Тикехау', 'Tikehau Atoll'),
-    'RMN': ('Румгинае', 'Rumginae'),
-    'HVE': ('Ханксвилл', 'Hanksville'),
-    'WGB': ('Бахаваинагар', 'Bahawalnagar'),
-    'YTK': ('Талагак', 'Tulugak'),
-    'STJ': ('Сент-Джозеф', 'St Joseph'),
-    'YTM': ('Мон-Трамблан', 'Mont Tremblant'),
-    'MLS': ('Майлс Сити', 'Miles City'),
-    'PTH': ('Порт Гейден', 'Port Heiden'),
-    'CUY': ('Кью', 'Cue'),
-    'YUT': ('Репалз Бэй', 'Repulse Bay'),
-    'EYR': ('Йерингтон', 'Yerington'),
-    'QFB': (None, 'Freiburg'),
-    'STB': ('Санта Барбара Эд', 'Santa Barbara Ed'),
-    'WTK': ('Нотак', 'Noatak'),
-    'YAT': ('Аттавапискэт', 'Attawapiskat'),
-    'NAC': ('Наракурт', 'Naracoorte'),
-    'YYM': ('Коули', 'Cowley'),
-    'ZFD': ('Фонд-дю-Лак', 'Fond Du Lac'),
-    'TIV': ('Тиват', 'Tivat'),
-    'YVM': ('Кикиктархуак', 'Qikiqtarjuaq'),
-    'YSR': ('Нанизивик', 'Nanisivik'),
-    'ZXM': (None, 'Rognan'),
-    'PED': ('Пардубице', 'Pardubice'),
-    'XPP': ('Поплар Ривер', 'Poplar River'),
-    'SZL': ('Канзас', 'Kansas'),
-    'PLI': ('Рануэй /', 'Palm Island'),
-    'TIJ': ('Тихуана', 'Tijuana'),
-    'YNC': ('Веминджи', 'Wemindji'),
-    'TAR': ('Таранто', 'Taranto'),
-    'YWA': ('Петавава', 'Petawawa'),
-    'PSC': ('Паско', 'Pasco'),
-    'SYI': ('Шелбивилл', 'Shelbyville'),
-    'MRX': ('Бендер-Махшехр', 'Bandar Mahshahr'),
-    'MOO': ('Мумба', 'Moomba'),
-    'RUS': ('Марау Саунд', 'Marau Sound'),
-    'YNL': ('Поинтс Норс Лендинг', 'Points North Landing'),
-    'FEJ': ('Феиджо', 'Feijo'),
-    'TOS': ('Тромсё', 'Tromso'),
-    'YCG': ('Каслгар', 'Castlegar'),
-    'YMC': ('Марикорт Эйрстип', 'Maricourt Airstrip'),
-    'DCK': ('Дал Крик', 'Dahl Creek'),
-    'KYX': ('Яалумет', 'Yalumet'),
-    'YHK': ('Йоа-Хейвен', 'Gjoa Haven'),
-    'PUE': ('Пуэрто Обалдиа', 'Puerto Obaldia'),
-    'MKA': ('Марианске-Лазне', 'Marianske Lazne'),
-    'RUY': ('Копан', 'Copan'),
-    'YYN': ('Свифт Керрент', 'Swift Current'),
-    'XQB': (None, 'Basingstoke'),
-    'UIH': ('Куинён', 'Qui Nhon'),
-    'YYI': ('Риверс', 'Rivers'),
-    'YYR': ('Хаппи Вэлли-Гуз Бей', 'Goose Bay'),
-    'XLW': ('Лемвердер', 'Lemwerder'),
-    'RKA': ('Аратика', 'Aratika'),
-    'YZC': ('Биттон Ривер', 'Beatton River'),
-    'ZJN': ('Суон Ривер', 'Swan River'),
-    'SAS': ('Солтон Сити', 'Salton City'),
-    'YEK': ('Арвиат', 'Arviat'),
-    'TJH': ('Тоёока', 'Toyooka'),
-    'YZE': ('Гор Бэй', 'Gore Bay'),
-    'PPT': ('Папеэте', 'Papeete'),
-    'TWY': ('Тава', 'Tawa'),
-    'YOE': ('Фолер', 'Falher'),
-    'FKN': ('Франклин', 'Franklin'),
-    'XXG': (None, 'Verdal'),
-    'ZAJ': ('Зарани', 'Zaranj'),
-    'TSU': ('Табитеуеа Саус', 'Tabiteuea South'),
-    'ZBF': ('Батерст', 'Bathurst'),
-    'YSG': ('Лутселк', 'Lutselke'),
-    'VLK': ('Волгодонск', 'Volgodonsk'),
-    'YAI': ('Чильян', 'Chillan'),
-    'FLC': ('Фоллс Крик', 'Falls Creek'),
-    'ZER': ('Зеро', 'Zero'),
-    'DGU': ('Дедугу', 'Dedougou'),
-    'YIE': ('Аршан', 'Arxan'),
-    'SDD': ('Лубанго', 'Lubango'),
-    'USQ': ('Ушак', 'Usak'),
-    'CHS': ('Чарлстон', 'Charleston'),
-    'ZGF': ('Гранд-Форкс', 'Grand Forks'),
-    'ZHA': ('Чжаньцзян', 'Zhanjiang'),
-    'SRC': ('Серси', 'Searcy'),
-    'MYD': ('Малинди', 'Malindi'),
-    'ZBL': ('Билоила', 'Biloela'),
-    'YRV': ('Ревелсток', 'Revelstoke'),
-    'XQU': ('Куаликум', 'Qualicum'),
-    'ZBM': ('Бромон', 'Bromont'),
-    'USO': ('Усино', 'Usino'),
-    'ZMH': (None, '108 Mile Ranch'),
-    'ZJJ': (None, 'Procida'),
-    'TRA': ('Тарамаджима', 'Taramajima'),
-    'ZHI': ('Гренхен', 'Grenchen'),
-    'ZFK': (None, 'Guderup'),
-    'PKW': ('Селеби-Пхикве', 'Selebi-Phikwe'),
-    'ZPO': ('Пайн Хауз', 'Pine House'),
-    'XFS': (None, 'Alexandria'),
-    'SBZ': ('Сибиу', 'Sibiu'),
-    'ZEM': ('Восточный Мейн', 'East Main'),
-    'XXT': (None, 'Arboga'),
-    'PLR': ('Пелл Сити', 'Pell City'),
-    'PXM': ('Пуэрто-Эскондидо', 'Puerto Escondido'),
-    'SII': ('Сиди Ифни', 'Sidi Ifni'),
-    'ZRS': ('Цюрс', 'Zurs'),
-    'TNJ': ('Танджунгпинанг', 'Tanjung Pinang'),
-    'PGU': ('Эселуйе', "Ala'Marvdasht"),
-    'NHV': ('Нуку-Хива', 'Nuku Hiva'),
-    'ZFM': ('Форт Макферсон', 'Fort Mcpherson'),
-    'NPT': ('Ньюпорт', 'Newport'),
-    'SMB': ('Керро Сомбреро', 'Cerro Sombrero'),
-    'VIS': ('Визалия', 'Visalia'),
-    'ZDG': (None, 'Baden'),
-    'NMN': ('Номане', 'Nomane'),
-    'SCZ': ('Санта-Круз Айленд', 'Santa Cruz Island'),
-    'SVU': ('Савусаву', 'Savusavu'),
-    'TTU': ('Тетаун', 'Tetuan'),
-    'NBS': ('Байшань', 'Baishan'),
-    'PUG': ('Порт Августа', 'Port Augusta'),
-    'TWB': ('Тувумба', 'Toowoomba'),
-    'QSF': ('Сетиф', 'Setif'),
-    'ORE': ('Орлеан', 'Orleans'),
-    'ZTH': ('Закинтос', 'Zakinthos'),
-    'ZVB': (None, 'Brumunddal'),
-    'ZIC': ('Виктория', 'Victoria'),
-    'BRW': ('Барроу', 'Barrow'),
-    'VOI': ('Воинджама', 'Voinjama'),
-    'ZTS': ('Тазис', 'Tahsis'),
-    'WAG': ('Уогга-Уогга', 'Wanganui'),
-    'NYN': ('Найнган', 'Nyngan'),
-    'SBG': ('Сабанг', 'Sabang'),
-    'RMS': ('Рамштейн', 'Ramstein'),
-    'WAR': ('Варис', 'Waris'),
-    'SUQ': ('Сукуа', 'Sucua'),
-    'TGP': ('Бор', 'Bor'),
-    'ZUL': ('Зилфи', 'Zilfi'),
-    'SSV': ('Сиаси', 'Siasi'),
-    'PFD': ('Порт Фредерик', 'Port Frederick'),
-    'PAV': ('Паулу-Афонсу', 'Paulo Afonso'),
-    'WBA': ('Вахаи', 'Wahai'),
-    'RAN': ('Равенна', 'Ravenna'),
-    'ZWR': ('Кота Кинабалу', 'Kota Kinabalu'),
-    'AMX': ('Амароо', 'Ammaroo'),
-    'TSK': ('Таскул', 'Taskul'),
-    'ZIP': ('Липари', 'Lipari'),
-    'WYE': ('Йенгема', 'Yengema'),
-    'XQD': (None, 'Bedford'),
-    'SLL': ('Салала', 'Salalah'),
-    'SJZ': ('Остров Сан-Жоржи', 'Sao Jorge Island'),
-    'YAB': ('Арктик-Бей', 'Arctic Bay'),
-    'DIS': ('Лубомо', 'Loubomo'),
-    'GBP': ('Гамбула', 'Gamboola'),
-    'YKQ': ('Васкаганиш', 'Waskaganish'),
-    'SWL': ('Спаниш Уэлс', 'Spanish Wells'),
-    'TKN': ('Токуносима', 'Tokunoshima'),
-    'HMS': (None, 'Homeshore'),
-    'DJM': ('Джамбала', 'Djambala'),
-    'BSU': ('Базанкусю', 'Basankusu'),
-    'WFK': ('Френчвилл', 'Frenchville'),
-    'YPI': ('Порт Симпсон', 'Port Simpson'),
-    'WNN': ('Озеро Уаннаммин', 'Wunnummin Lake'),
-    'XNR': (None, 'Aabenraa'),
-    'YDH': ('Дэниелс Харбор', 'Daniels Harbour'),
-    'BYH': (None, 'Blytheville'),
-    'ZJE': ('Панери', 'Panarea'),
-    'TEO': ('Терапо', 'Terapo'),
-    'SSA': ('Салвадор', 'Salvador'),
-    'SFD': ('Сан Фернандо де Апуре', 'San Fernando De Apure'),
-    'ZJX': ('Стромболи', 'Stromboli'),
-    'ULU': ('Гул', 'Gulu'),
-    'TKR': ('Такургаон', 'Thakurgaon'),
-    'DVD': (None, 'Andavadoaka'),
-    'TRK': ('Таракан', 'Tarakan'),
-    'SKV': ('Санта Катарина', 'Santa Katarina'),
-    'YIN': ('Кульджа', 'Yining'),
-    'ULA': ('Сан Хулиан', 'San Julian'),
-    'VLY': ('Англиси', 'Valley'),
-    'PUL': ('Поулсбо', 'Poulsbo'),
-    'YPS': ('Порт Хоксбери', 'Port Hawkesbury'),
-    'AYL': ('Энтони Лагун', 'Anthony Lagoon'),
-    'QZM': (None, 'Bullocks Flat'),
-    'XYP': ('Авеста Крибло', 'Avesta Krylbo'),
-    'TNC': ('Тин Сити', 'Tin City'),
-    'TGH': ('Тонгоа', 'Tongoa'),
-    'WBG': ('Шлезвиг-Йагель', 'Schleswig-jagel'),
-    'YCW': ('Чилливак', 'Chilliwack'),
-    'TJA': ('Тариха', 'Tarija'),
-    'YOD': ('Колд Лейк', 'Cold Lake'),
-    'VKT': ('Воркута', 'Vorkuta'),
-    'YTL': ('Биг-Траут', 'Big Trout'),
-    'YBR': ('Брандон', 'Brandon'),
-    'YLP': ('Минган', 'Mingan'),
-    'ZLO': ('Мансанильо', 'Manzanillo'),
-    'ATC': ('Артурс Таун', "Arthur's Town"),
-    'XHQ': ('Артвин', 'Artvin'),
-    'UBB': ('Остров Мабуьяг', 'Mabuiag Island'),
-    'DLL': ('Диллон', 'Dillon'),
-    'YHP': ('Поплэйр Хилл', 'Poplar Hill'),
-    'GTP': (None, 'Grants Pass'),
-    'TUO': ('Таупо', 'Taupo'),
-    'YKM': ('Якима', 'Yakima'),
-    'WHD': ('Хайдер', 'Hyder'),
-    'AIY': ('Атлантик-Сити', 'Atlantic City'),
-    'XXN': (None, 'Kil'),
-    'XED': ('Диснейленд Париж (жд-станция)', 'Disneyland Paris'),
-    'ZWV': (None, 'Glenview'),
-    'TTC': ('Тальталь', 'Taltal'),
-    'UPG': ('Макасар', 'Ujung Pandang'),
-    'RTB': ('Роатан', 'Roatan'),
-    'UKX': ('Усть-Кут', 'Ust-Kut'),
-    'PUB': ('Пуэбло', 'Pueblo'),
-    'PGK': ('Панкалпинанг', 'Pangkal Pinang'),
-    'RIB': ('Риберальта', 'Riberalta'),
-    'UZU': ('Курусу Куатия', 'Curuzu Cuatia'),
-    'PGL': ('Паскагула', 'Pascagoula'),
-    'RNO': ('Рино', 'Reno'),
-    'PHE': ('Порт-Хедленд', 'Port Hedland'),
-    'ZNZ': ('Занзибар', 'Zanzibar'),
-    'XXM': (None, 'Mjolby'),
-    'WIC': ('Уик', 'Wick'),
-    'YYE': ('Форт Нельсон', 'Fort Nelson'),
-    'VAW': ('Вардё', 'Vardoe'),
-    'SHX': ('Шагелук', 'Shageluk'),
-    'UIO': ('Кито', 'Quito'),
-    'YQZ': ('Квеснел', 'Quesnel'),
-    'VAR': ('Варна', 'Varna'),
-    'VAS': ('Сивас', 'Sivas'),
-    'SQI': ('Стрелинг Рокфоллс', 'Sterling Rockfalls'),
-    'YOT': ('Йотвата', 'Yotvata'),
-    'WEH': ('Вэйхай', 'Weihai'),
-    'ROU': ('Русе', 'Rousse'),
-    'SEW': ('Сива', 'Siwa'),
-    'SYJ': ('Сирджан', 'Sirjan'),
-    'EYK': ('Белоярский', 'Beloyarsky'),
-    'WBB': ('Стеббинс', 'Stebbins'),
-    'WMP': ('Мампикёни', 'Mampikony'),
-    'GMD': (None, 'Ben Slimane'),
-    'SSU': ('Уайт Сулпур Спрингс', 'White Sulphur Springs'),
-    'ZHW': (None, 'Langenthal'),
-    'ZSU': ('Дессау', 'Dessau'),
-    'ZDK': (None, 'Biel/Bienne'),
-    'SOH': ('Солита', 'Solita'),
-    'DNU': ('Динангат', 'Dinangat'),
-    'IRZ': ('Санта Исабел Рио Негро', 'Santa Isabel Rio Negro'),
-    'SON': ('Эспириту-Санто', 'Espiritu Santo'),
-    'HPA': ('Хаапай', "Ha'Apai"),
-    'ZTR': ('Житомир', 'Zhitomir'),
-    'SWU': ('Сувон', 'Suwon'),
-    'YTH': ('Томпсон', 'Thompson'),
-    'BPL': ('Боро-Тала', 'Bole'),
-    'YKU': ('Чисасиби', 'Chisasibi'),
-    'SSH': ('Шарм-эль-Шейх', 'Sharm el Sheikh'),
-    'TIL': ('Инверлейк', 'Inverlake'),
-    'WOR': ('Анкорефо', 'Ankorefo'),
-    'XAR': ('Арибинда', 'Aribinda'),
-    'THH': ('Тахароа', 'Taharoa'),
-    'SUE': ('Стерджен Бэй', 'Sturgeon Bay'),
-    'WUH': ('Ухань', 'Wuhan'),
-    'ZTZ': ('Чемнитц', 'Chemnitz'),
-    'YPF': ('Эскьимальт', 'Esquimalt'),
-    'TYG': ('Тулунгра', 'Thylungra'),
-    'TZC': (None, 'Caro'),
-    'TJU': ('Куляб', 'Kulyab'),
-    'QUG': (None, 'Chichester'),
-    'WFD': ('Вудфорд', 'Woodford'),
-    'THK': ('Тхакхэк', 'Thakhek'),
-    'YWL': ('Уильямс Лейк', 'Williams Lake'),
-    'HVZ': (None, 'Heviz'),
-    'MLJ': ('Миледжвилл', 'Milledgeville'),
-    'TTR': ('Тана Тораджа', 'Tana Toraja'),
-    'FRH': ('Френч Лик', 'French Lick'),
-    'DLK': ('Дулканинна', 'Dulkaninna'),
-    'TRW': ('Баирики', 'Tarawa'),
-    'XUV': ('Стореквина', 'Storekvina'),
-    'VGA': ('Виджаявада', 'Vijayawada'),
-    'TMC': ('Тамболака', 'Tambolaka'),
-    'XZD': (None, 'Kongsvinger'),
-    'XEH': (None, 'Ladysmith'),
-    'TMZ': ('Темс', 'Thames'),
-    'WMH': ('Маунтин-Хоум', 'Mountain Home'),
-    'RMU': (None, 'Corvera'),
-    'ZNW': (None, 'Limburg'),
-    'HOL': ('Холикачу', 'Holikachu'),
-    'YXE': ('Саскатун', 'Saskatoon'),
-    'XXA': ('Альвеста', 'Alvesta'),
-    'TUU': ('Табук', 'Tabuk'),
-    'TWE': ('Тейлор', 'Taylor'),
-    'ZYL': ('Силхет', 'Sylhet'),
-    'WRY': ('Вестрэй', 'Westray'),
-    'ZDA': ('Арау', 'Aarau'),
-    'OTT': (None, 'Cotriguacu'),
-    'APG': (None, 'Aberdeen'),
-    'YDF': ('Дир Лейк', 'Deer Lake'),
-    'YGC': ('Гранде Кэш', 'Grande Cache'),
-    'AEE': (None, 'Adareil'),
-    'UIP': ('Кемпер', 'Quimper'),
-    'ZDV': (None, 'Davos'),
-    'UKS': ('Севастополь', 'Sevastopol'),
-    'YCF': ('Кортес Бэй', 'Cortes Bay'),
-    'DWA': ('Двангва', 'Dwangwa'),
-    'ZZO': (None, 'Zonalnoye'),
-    'IAO': ('Сайяк (Сиаргао)', 'Sayak (Siargao)'),
-    'XXR': (None, 'Al'),
-    'UIR': ('Квиринди', 'Quirindi'),
-    'ZDW': (None, 'Delemont'),
-    'MKC': ('Канзас-Сити', 'Kansas City'),
-    'DEY': (None, 'Deyang'),
-    'ELA': ('Игл Лейк', 'Eagle Lake'),
-    'WEF': ('Вэйфан', 'Weifang'),
-    'WMX': ('Вамена', 'Wamena'),
-    'ZBE': ('Забрех', 'Zabreh'),
-    'ZDD': (None, 'Arbon'),
-    'LOO': ('Лагуат', 'Laghouat'),
-    'XPW': (None, 'Didcot'),
-    'VDH': ('Донгхой', 'Dong Hoi'),
-    'VCB': ('Вью Каув', 'View Cove'),
-    'CII': (None, 'Aydin'),
-    'WRW': ('Варравагин', 'Warrawagine'),
-    'WAE': ('Вади-Ад-Давасир', 'Wadi Ad Dawasir'),
-    'BJQ': (None, 'Bahja'),
-    'CMT': ('Камета', 'Cameta'),
-    'JTC': ('Бауру', 'Baura-Arealva'),
-    'WAQ': ('Бесалампи', 'Antsalova'),
-    'ZFW': ('Фэрвью', 'Fairview'),
-    'YKK': ('Киткатла', 'Kitkatla'),
-    'OZL': ('Орзола', 'Orzola'),
-    'QQD': (None, 'Dover'),
-    'YOA': ('Экати', 'Ekati'),
-    'VYD': ('Врайхайд', 'Vryheid'),
-    'ESA': (None, "Esa'Ala"),
-    'YUE': ('Юэндуму', 'Yuendumu'),
-    'XGW': (None, 'Gananoque'),
-    'HBK': (None, 'Holbrook'),
-    'ZQY': (None, 'Giessen'),
-    'YMF': ('Монтажн Харбор', 'Montagne Harbor'),
-    'DHO': (None, 'Horn River'),
-    'XFV': (None, 'Brantford'),
-    'XJL': (None, 'Joliette'),
-    'ZNV': (None, 'Koblenz'),
-    'YVT': ('Буффало Нарроус', 'Buffalo Narrows'),
-    'CDT': ('Кастельон-де-ла-Плана', 'Castellon de la Plana'),
-    'GLB': (None, 'Globe'),
-    'XGZ': (None, 'Bregenz'),
-    'YBF': ('Бамфилд', 'Bamfield'),
-    'YOK': ('Иокогама', 'Yokohama'),
-    'YVD': ('Йева', 'Yeva'),
-    'LVR': (None, 'Lucas Do Rio Verde'),
-    'ZHH': (None, 'Gossau SG'),
-    'WPR': ('Порвенир', 'Porvenir'),
-    'ZUK': (None, 'Lake Cook Road'),
-    'YQR': ('Реджайна', 'Regina'),
-    'EGP': ('Игл Пасс', 'Eagle Pass'),
-    'DNB': ('Данбар', 'Dunbar'),
-    'SSI': ('Брансуик', 'Brunswick'),
-    'WRZ': ('Уироила', 'Wirawila'),
-    'SVS': ('Стивенс Виллидж', 'Stevens Village'),
-    'ZRI': ('Серуи', 'Serui'),
-    'XUH': (None, 'Levanger'),
-    'ZIH': ('Икстапа', 'Ixtapa/Zihuatanejo'),
-    'OLL': (None, 'Oyo'),
-    'AIE': ('Айоме', 'Aiome'),
-    'YVQ': ('Норман Уэлс', 'Norman Wells'),
-    'HRM': ('Хасси-Рмель', "Hassi R'mel"),
-    'LLB': ('Либо', 'Libo City'),
-    'WTE': ('Вотье', 'Wotje Island'),
-    'ZIG': ('Зигиншор', 'Ziguinchor'),
-    'ZWJ': (None, 'Haugastol'),
-    'QYZ': (None, 'Heerenveen'),
-    'ZAO': ('Каор', 'Cahors'),
-    'QYH': (None, 'Hengelo'),
-    'ZBZ': ('Син Хуи', 'Xin Hui'),
-    'ZDQ': (None, 'Champery'),
-    'QPT': ('Патус-ди-Минас', 'Patos De Minas'),
-    'YWO': ('Люпин', 'Lupin'),
-    'XDL': (None, 'Chandler'),
-    'ZDR': (None, "Chateau-d'Oex"),
-    'YXI': ('Киллало', 'Killaloe'),
-    'MIO': (None, 'Miami'),
-    'GGM': ('Какамега', 'Kakamega'),
-    'KGT': ('Кандин', 'Kangding'),
-    'SWG': ('Сатваг', 'Satwag'),
-    'GAH': ('Гейнда', 'Gayndah'),
-    'QCA': (None, 'Makkah'),
-    'JRF': ('Каполей', 'Kapolei'),
-    'YCA': ('Кортеней', 'Courtenay'),
-    'XGJ': (None, 'Cobourg'),
-    'NPR': (None, 'Novo Progresso'),
-    'YNR': ('Арнс', 'Arnes'),
-    'YCT': ('Коронейшен', 'Coronation'),
-    'VSK': (None, 'Kennewick'),
-    'QPA': ('Падуя', 'Padova'),
-    'QWL': (None, 'Crackenback Village'),
-    'XQH': (None, 'Derby'),
-    'YMH': ('Мэри-Харбор', "Mary's Harbour"),
-    'ZWA': ('Андапа', 'Andapa'),
-    'DTI': (None, 'Diamantina'),
-    'YNT': ('Яньтай', 'Yantai'),
-    'ZMC': (None, 'Miedzyzdroje'),
-    'EZV': ('Березово', 'Berezovo'),
-    'OHE': ('Мохэ', 'Mohe'),
-    'KZR': ('Кютахья', 'Kutahya'),
-    'REQ': (None, 'Reko Diq'),
-    'YGX': ('Гиллам', 'Gillam'),
-    'YRM': ('Роки Маунтин Хаус', 'Rocky Mountain House'),
-    'AGW': ('Агнью', 'Agnew'),
-    'ZJZ': (None, 'Rorschach'),
-    'ZPB': ('Сачиго Лейк', 'Sachigo Lake'),
-    'QNM': (None, 'Namur'),
-    'ZMW': (None, 'Brande'),
-    'ZST': ('Стьюард', 'Stewart'),
-    'GEN': ('Пуэнте-Хениль', 'Puente Genil'),
-    'BWW': ('Кайо Лас Брухас', 'Cayo Las Brujas'),
-    'DEO': ('Диэрборн', 'Dearborn'),
-    'NYT': ('Нейпьидо', 'Naypyidaw'),
-    'PLL': (None, 'Ponta Pelada'),
-    'XRG': (None, 'Rugeley'),
-    'YNK': ('Нутка Саунд', 'Nootka Sound'),
-    'XEL': (None, 'New Carlisle'),
-    'YXC': ('Кранбрук', 'Cranbrook'),
-    'XEM': (None, 'New Richmond'),
-    'XAT': ('Антиб', 'Antibes'),
-    'RGK': ('Горно-Алтайск', 'Gorno-Altaysk'),
-    'FLY': ('Финли', 'Finley'),
-    'ZHB': (None, 'Engelberg'),
-    'LQS': (None, 'Lingshui'),
-    'ZLH': (None, 'Wil'),
-    'RNM': (None, 'Qarn Alam'),
-    'XXO': ('Лексунд', 'Leksand'),
-    'WMI': ('Модлин', 'Nowy Dwor Mazowiecki'),
-    'SAF': ('Санта-Фе', 'Santa Fe'),
-    'ZJC': (None, 'Lenzburg'),
-    'FRN': ('Форт Ричардсон', 'Fort Richardson'),
-    'YYY': ('Мон-Жоли', 'Mont Joli'),
-    'PYS': (None, 'Paradise'),
-    'ZEG': ('Сенгго', 'Senggo'),
-    'YLK': (None, 'Oro Station'),
-    'XID': (None, 'Maxville'),
-    'SED': (None, 'Sedom'),
-    'XQG': (None, 'Berwick-upon-Tweed'),
-    'YYT': ('Сент-Джонс', "St. John's"),
-    'QWZ': (None, 'Best'),
-    'MFY': (None, "Mayfa'ah"),
-    'NSL': (None, 'Slayton'),
-    'RRR': ('Рароя', 'Raroia'),
-    'XKN': (None, 'Finse'),
-    'SZF': ('Самсун', 'Samsun'),
-    'TLY': ('Пластун', 'Plastun'),
-    'GPD': ('Маунт Гордон Майн', 'Mount Gordon Mine'),
-    'SCJ': ('Смит Коув', 'Smith Cove'),
-    'ZKJ': (None, 'Schaffhausen'),
-    'ZHF': (None, 'Fribourg'),
-    'FVM': ('Фувамула', 'Fumawula'),
-    'QQY': (None, 'York'),
-    'ICS': (None, 'Cascade'),
-    'NCJ': (None, 'Sunchales'),
-    'ZEJ': (None, 'Gelsenkirchen'),
-    'XUM': (None, 'Neslandsvatn'),
-    'EWR': ('Ньюарк', 'Newark'),
-    'ZKC': (None, 'Sarnen'),
-    'OLR': (None, 'Salerno'),
-    'GVN': ('Советская Гавань', 'Sovetskaya Gavan'),
-    'GMO': ('Гомбе', 'Gombe'),
-    'SPO': ('Сан Пабло', 'San Pablo'),
-    'SBO': (None, 'Salina'),
-    'IDH': (None, 'Grangeville'),
-    'GTZ': ('Грумети', 'Grumeti'),
-    'ZTW': (None, 'Tsuen Wan'),
-    'RMY': (None, 'Mariposa'),
-    'XHI': (None, 'Herzogenaurach'),
-    'HIA': ('Хуайань', "Huai'an"),
-    'JBQ': ('Санто-Доминго', 'Santo Domingo'),
-    'QGL': (None, 'St Gallen'),
-    'ZPA': (None, 'Offenburg'),
-    'XCC': (None, 'Le Creusot/Montceau'),
-    'SPV': ('Сепик Плейнс', 'Sepik Plains'),
-    'RGO': (None, 'Orang'),
-    'RMQ': ('Тайчжун', 'Shalu'),
-    'LRF': (None, 'Jacksonville'),
-    'JDG': (None, 'Jeongseok'),
-    'XOR': (None, 'Otta'),
-    'GBZ': ('Грейт-Барриер', 'Great Barrier Island'),
-    'XPT': (None, 'Preston'),
-    'PDD': ('Понта де Оуро', 'Ponta de Ouro'),
-    'XKJ': (None, 'Steinkjer'),
-    'XWS': ('Суиндон', 'Swindon'),
-    'FPR': ('Форт Пирс', 'Fort Pierce'),
-    'YWQ': ('Чуте-Дес-Пассес', 'Chute-Des-Passes'),
-    'ZRW': (None, 'Rastatt'),
-    'ZHS': (None, 'Klosters'),
-    'TQL': ('Тарко-Сале', 'Tarko-Sale'),
-    'EEL': (None, 'Tudela'),
-    'CWX': (None, 'Willcox'),
-    'ZKZ': (None, 'Vevey'),
-    'ZSO': (None, 'Suhl'),
-    'SNQ': ('Сан-Кинтин', 'San Quintin'),
-    'ZWM': (None, 'Wismar'),
-    'ROZ': (None, 'Rota'),
-    'XEJ': (None, 'Langford'),
-    'DPT': ('Депутатский', 'Deputatsky'),
-    'XFC': (None, 'Fredericton Junction'),
-    'ZLL': (None, 'Zofingen'),
-    'RIL': ('Райфл', 'Rifle'),
-    'QXZ': (None, 'Woergl'),
-    'AHW': (None, 'Saih Rawl'),
-    'QWU': (None, 'Wuerzburg'),
-    'ADI': ('Арандис', 'Arandis'),
-    'AUW': ('Уосо', 'Wausau'),
-    'PTZ': ('Пастаза', 'Pastaza'),
-    'XSR': (None, 'Salisbury'),
-    'ZLI': (None, 'Winterthur'),
-    'ZLE': (None, 'Wengen'),
-    'BKT': ('Блэкстоун', 'Blackstone'),
-    'AZL': (None, 'Sapezal'),
-    'ZIZ': ('Замзама', 'Zamzama'),
-    'XQL': (None, 'Lancaster'),
-    'YZY': ('Чжанъе', 'Zhangye'),
-    'IGH': ('Ингам', 'Ingham'),
-    'QLV': ('Леверкузен', 'Leverkusen'),
-    'ZKA': (None, 'Sargans'),
-    'YVZ': ('Дир Лейк', 'Deer Lake'),
-    'ZWT': (None, 'Lutherstadt Wittenberg'),
-    'WIB': (None, 'Wilbarger'),
-    'NLI': ('Николаевск-на-Амуре', 'Nikolaevsk-na-Amure'),
-    'YVC': ('Ла Рондж', 'La Ronge'),
-    'UKG': ('Усть-Куйга', 'Ust-Kuiga'),
-    'VTM': (None, 'Nevatim'),
-    'MDN': (None, 'Madison'),
-    'PTL': ('Порт Армстронг', 'Port Armstrong'),
-    'JCT': ('Джанкшен', 'Junction'),
-    'XNK': (None, 'Newark'),
-    'ZIQ': (None, 'Salina Island'),
-    'KDN': ('Нданде', 'Ndende'),
-    'ZJQ': (None, 'Morges'),
-    'YVN': (None, 'Cape Dyer'),
-    'PXH': (None, 'Prominent Hill'),
-    'RQW': (None, 'Qayyarah'),
-    'YVS': (None, 'Ski'),
-    'EWO': ('Это', 'Ewo'),
-    'OSO': (None, 'Osborne Mine'),
-    'UMA': ('Пунта Де Маиси', 'Punta De Maisi'),
-    'YRN': ('Овекено Вилладж', 'Owekeno Village'),
-    'QWA': (None, 'Oshawa'),
-    'UWP': (None, 'Wuppertal'),
-    'KBH': ('Калат', 'Kalat'),
-    'WAY': ('Уэйнсберг', 'Waynesburg'),
-    'MTC': (None, 'Mt Clemens'),
-    'CDS': ('Чилдресс', 'Childress'),
-    'ZMQ': (None, 'Raufoss'),
-    'GSJ': (None, 'Puerto San Jose'),
-    'XHD': (None, 'Ruka'),
-    'ZSQ': (None, 'Salzwedel'),
-    'XUS': (None, 'Snartemo'),
-    'NKN': ('Нанкина', 'Nankina'),
-    'IGT': ('Назрань', 'Ordzhonikidzevskaya'),
-    'NOG': ('Ногалес', 'Nogales'),
-    'OHH': ('Оха', 'Okha'),
-    'YJS': (None, 'Samjiyon'),
-    'ZHR': (None, 'Kandersteg'),
-    'RBX': ('Румбек', 'Rumbek'),
-    'ZJV': (None, 'Pontresina'),
-    'MWR': ('Мотсвари', 'Motswari'),
-    'ZRC': (None, 'San Pedro de Alcantara'),
-    'QSC': (None, 'Sao Carlos'),
-    'TNB': ('Танах Грогот', 'Tanah Grogot'),
-    'XRE': ('Рединг', 'Reading'),
-    'YKY': ('Киндерсли', 'Kindersley'),
-    'ZND': ('Зиндер', 'Zinder'),
-    'LEU': (None, 'Seo de Urgel'),
-    'YQJ': ('Квадра-Айленд', 'Quadra Island'),
-    'XRC': (None, 'Runcorn'),
-    'OUH': ('Оудтшурн', 'Oudtshoorn'),
-    'NIX': ('Найоро', 'Nioro'),
-    'NOP': ('Синоп', 'Sinop'),
-    'UKH': (None, 'Mukhaizna'),
-    'LIB': ('Лимбунья', 'Limbunya'),
-    'DSO': (None, 'Sondok'),
-    'AXL': ('Александрия', 'Alexandria'),
-    'NCN': ('Ченега', 'New Chenega'),
-    'XRU': (None, 'Rugby'),
-    'WCR': ('Чандалар', 'Chandalar'),
-    'LMI': ('Луми', 'Lumi'),
-    'ZXU': (None, 'Rygge'),
-    'PSV': ('Папа Стор', 'Papa Stour'),
-    'BFO': ('Буффало Рейндж', 'Buffalo Range'),
-    'XGQ': (None, 'Saariselka'),
-    'LDK': ('Лидкопинг', 'Lidkoping'),
-    'QLE': (None, 'Leeton'),
-    'RUD': ('Шахруд', 'Shahrud'),
-    'XQT': (None, 'Lichfield'),
-    'SLF': ('Сулайел', 'Sulayel'),
-    'HMB': ('Сохаг', 'Sohag'),
-    'ONY': ('Олни', 'Olney'),
-    'CCG': ('Крейн', 'Crane'),
-    'ZVG': (None, 'Springvale'),
-    'ZHV': (None, 'La Chaux-de-Fonds'),
-    'MBV': ('Маса', 'Masa'),
-    'WNH': ('Вэньшань', 'Wenshan'),
-    'QYQ': (None, 'Sulsted'),
-    'WRA': ('Вардер', 'Warder'),
-    'TGC': ('Танджунг Манис', 'Sarikei'),
-    'ZLJ': (None, 'Yverdon-les-Bains'),
-    'DEE': ('Южно-Курильск', 'Kunashir Island'),
-    'ZKU': (None, 'Sursee'),
-    'QXV': (None, 'Svendborg'),
-    'DRF': ('Дрифт Ривер', 'Drift River'),
-    'GGC': ('Ламбала', 'Lumbala'),
-    'TDT': ('Танда Тула', 'Timbavati'),
-    'VCL': ('Тамки', 'Tamky-Chulai Airport'),
-    'ZQZ': ('Чжанцзякоу', 'Zhangjiakou'),
-    'ZLM': (None, 'Zug'),
-    'GGA': (None, 'La Graciosa'),
-    'YLT': ('Алерт', 'Alert'),
-    'EIK': ('Ейск', 'Yeysk'),
-    'QYC': (None, 'Drachten'),
-    'NIN': ('Нинилчайк', 'Ninilchik'),
-    'XVK': (None, 'Voss'),
-    'GBR': ('Грэйт Баррингтон', 'Great Barrington'),
-    'IVW': ('Инверуэй', 'Inverway'),
-    'XLZ': (None, 'Truro'),
-    'PYK': (None, 'Karaj'),
-    'JCB': ('Жоасаба', 'Joacaba'),
-    'TLQ': ('Турфан', 'Turpan'),
-    'CMU': ('Кундиава', 'Kundiawa'),
-    'XCL': ('оз. Клафф', 'Cluff Lake'),
-    'ZMX': (None, 'Tynset'),
-    'RLR': (None, 'Isalo'),
-    'AUU': ('Орукун', 'Aurukun Mission'),
-    'QYX': ('Уппсала', 'Uppsala'),
-    'NSP': ('Сангли Поинт', 'Sangley Point'),
-    'NSE': ('Милтон', 'Milton'),
-    'ZKW': (None, 'Wetzikon'),
-    'YTJ': ('Террас Бэй', 'Terrace Bay'),
-    'MVO': ('Монго', 'Mongo'),
-    'YUS': ('Юйшу', 'Yushu'),
-    'SVT': ('Савути', 'Savuti'),
-    'YZU': ('Уайткорт', 'Whitecourt'),
-    'WIT': (None, 'Wittenoom'),
-    'LWE': ('Леволеба', 'Lewoleba'),
-    'MNR': ('Монгу', 'Mongu'),
-    'XVW': (None, 'Wolverhampton'),
-    'QHJ': (None, 'Hjorring'),
-    'MZC': ('Митзик', 'Mitzic'),
-    'NLT': ('Кюнес', 'Xinyuan'),
-    'MFF': ('Моанда', 'Moanda'),
-    'PLY': ('Плимут', 'Plymouth'),
-    'QZB': (None, 'Zermatt'),
-    'XGP': (None, 'Dombas'),
-    'NHS': ('Нушки', 'Nushki'),
-    'ZAA': ('Элис Арм', 'Alice Arm'),
-    'DGR': ('Даргавилл', 'Dargaville'),
-    'LOX': ('Лос Таблонес', 'Los Tablones'),
-    'DRE': ('Остров Драммонд', 'Drummond Island'),
-    'BXM': ('Батом', 'Batom'),
-    'KSX': ('Яасуру', 'Yasuru'),
-    'GMN': ('Греймут', 'Greymouth'),
-    'KTY': ('Катукурунда', 'Katukurunda'),
-    'GLC': ('Гелади', 'Geladi'),
-    'EKE': ('Экереку', 'Ekereku'),
-    'OEC': ('Окуси-Амбено', 'Ocussi'),
-    'ODL': ('Кордилло-Даунс', 'Cordillo Downs'),
-    'DNQ': ('Дениликин', 'Deniliquin'),
-    'KBQ': ('Касунгу', 'Kasungu'),
-    'XRD': (None, 'Egersund'),
-    'KCD': ('Камур', 'Kamur'),
-    'OKM': ('Окмулги', 'Okmulgee'),
-    'FEB': ('Санфебагар', 'Sanfebagar'),
-    'LXV': ('Лидвилл', 'Leadville'),
-    'BSI': ('Блэрсвилл', 'Blairsville'),
-    'KXF': ('Коро', 'Koro Island'),
-    'LNN': ('Уиллоуби', 'Willoughby'),
-    'ARG': ('Уолнат Ридж', 'Walnut Ridge'),
-    'WMD': ('Мандаб', 'Mandabe'),
-    'XVM': (None, 'Vuokatti'),
-    'YCJ': ('Кейп Сент Джеймс', 'Cape St James'),
-    'WSR': ('Васиор', 'Wasior'),
-    'RKC': ('Ирика', 'Yreka'),
-    'ERB': ('Эрнабелла', 'Ernabella'),
-    'RNZ': ('Ренсселаер', 'Rensselaer'),
-    'WBQ': ('Бивер', 'Beaver'),
-    'DKV': ('Калчекатжара', 'Docker River'),
-    'ZIJ': (None, 'Nykobing Sjaelland'),
-    'YMJ': ('Моуз Джоу', 'Moose Jaw'),
-    'VGG': ('Вангриенг', 'Vangrieng'),
-    'TLI': ('Толитоли', 'Tolitoli'),
-    'UUK': ('Купарук', 'Kuparuk'),
-    'SVI': ('Сан Виценте', 'San Vicente'),
-    'PTC': ('Порт Элис', 'Port Alice'),
-    'DGG': ('Дауго', 'Daugo'),
-    'SSL': ('Санта Росалия', 'Santa Rosalia'),
-    'QZC': (None, 'Smiggin Holes'),
-    'ZSG': (None, 'Sonneberg'),
-    'KRI': ('Кикори', 'Kikori')
-}
+"""Lookup of reference data by IATA codes: names, cities of airports,
+cities of countries, coordinates and time zones.
+
+Tables are kept in compact binary files in wf/data, generated by json/extract.py,
+and are memory-mapped lazily on the first lookup, so importing the module costs nothing
+and a process keeps in memory only pages of the file, which were looked up.
+
+Table file format, all numbers are little-endian:
+    header: b"WFT1", key size (uint8), number of fields (uint16), number of entries (uint32)
+    index: entries sorted by key, each is key padded with zero bytes to key size
+        and offset of its values from the beginning of the file (uint32)
+    values: for every entry, fields one by one, each is length of UTF-8 encoded field (uint16),
+        NONE_LENGTH for None, followed by the encoded field
+
+Tables with examples:
+    CITY_CODE_TO_NAME: {'KRI': ('Кикори', 'Kikori')}
+    AIRPORT_TO_CITY: {'SVO': ('MOW', '55.97', '37.41')}, city code, latitude and longitude
+    AIRPORT_TO_NAME: {'SVO': ('Шереметьево', 'Sheremetyevo International Airport')}
+    COUNTRY_TO_CITY_CODES: {'PT': ('FAO LIS OPO',)}, see get_city_codes()
+    CODE_TO_LOCATION: {'OPO': ('41.24', '-8.68', 'Europe/Lisbon')}, see get_location()
+"""
+
+import mmap
+import os
+import struct
+import threading
+
+from collections.abc import Mapping
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), 'data')
+
+MAGIC = b"WFT1"
+HEADER = struct.Struct("<4sBHI")
+OFFSET = struct.Struct("<I")
+LENGTH = struct.Struct("<H")
+NONE_LENGTH = 0xFFFF
+
+# separates codes in a field with a list of codes
+CODES_SEPARATOR = " "
+
+
+class CodeTable(Mapping):
+    """Read-only mapping of codes to tuples of fields, stored in a table file at path."""
+
+    def __init__(self, path):
+        self.path = path
+        self.__mmap = None
+        self.__lock = threading.Lock()
+
+    def __repr__(self):
+        return f"CodeTable({self.path!r})"
+
+    def __getitem__(self, key):
+        offset = self._find(key)
+        if offset is None:
+            raise KeyError(key)
+        return self._read_fields(offset)
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __iter__(self):
+        data, key_size, _, size = self._open()
+        for index in range(size):
+            position = HEADER.size + index * (key_size + OFFSET.size)
+            yield data[position:position + key_size].rstrip(b"\0").decode("utf-8")
+
+    def __len__(self):
+        return self._open()[3]
+
+    def _open(self):
+        """Maps the file on the first call, returns mapped data and header fields."""
+
+        if self.__mmap is None:
+            with self.__lock:
+                if self.__mmap is None:
+                    with open(self.path, "rb") as table_file:
+                        data = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+                    magic, key_size, fields_number, size = HEADER.unpack_from(data)
+                    if magic != MAGIC:
+                        raise ValueError(f"{self.path} is not a code table file.")
+                    self.__header = (key_size, fields_number, size)
+                    self.__mmap = data
+
+        return (self.__mmap,) + self.__header
+
+    def _find(self, key):
+        """Returns offset of values of the key by binary search over the index or None."""
+
+        data, key_size, _, size = self._open()
+        if not isinstance(key, str):
+            return None
+        try:
+            encoded_key = key.encode("utf-8")
+        except UnicodeEncodeError:  # lone surrogates
+            return None
+        if len(encoded_key) > key_size:
+            return None
+        encoded_key = encoded_key.ljust(key_size, b"\0")
+
+        record_size = key_size + OFFSET.size
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            position = HEADER.size + middle * record_size
+            middle_key = data[position:position + key_size]
+            if middle_key < encoded_key:
+                low = middle + 1
+            elif middle_key > encoded_key:
+                high = middle
+            else:
+                return OFFSET.unpack_from(data, position + key_size)[0]
+
+        return None
+
+    def _read_fields(self, offset):
+        data, _, fields_number, _ = self._open()
+
+        fields = []
+        for _ in range(fields_number):
+            length, = LENGTH.unpack_from(data, offset)
+            offset += LENGTH.size
+            if length == NONE_LENGTH:
+                fields.append(None)
+                continue
+            fields.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+
+        return tuple(fields)
+
+
+def write_code_table(path, table):
+    """Writes table file at path from dict of codes and tuples of fields,
+    fields are strings or None, see the module docstring for the format.
+    """
+
+    fields_number = len(next(iter(table.values()), ()))
+    key_size = max((len(key.encode("utf-8")) for key in table), default=0)
+    codes = sorted(table, key=lambda key: key.encode("utf-8"))
+
+    values = bytearray()
+    offsets = []
+    values_start = HEADER.size + len(codes) * (key_size + OFFSET.size)
+
+    for code in codes:
+        fields = table[code]
+        if len(fields) != fields_number:
+            raise ValueError(f"All entries should have {fields_number} fields, "
+                             f"'{code}' has {len(fields)}.")
+
+        offsets.append(values_start + len(values))
+        for field in fields:
+            if field is None:
+                values += LENGTH.pack(NONE_LENGTH)
+                continue
+            encoded_field = field.encode("utf-8")
+            values += LENGTH.pack(len(encoded_field)) + encoded_field
+
+    with open(path, "wb") as table_file:
+        table_file.write(HEADER.pack(MAGIC, key_size, fields_number, len(codes)))
+        for code, offset in zip(codes, offsets):
+            table_file.write(code.encode("utf-8").ljust(key_size, b"\0") + OFFSET.pack(offset))
+        table_file.write(values)
+
+
+def get_table_path(name):
+    """Returns path of the table file by name of the table, e.g. 'city_code_to_name'."""
+
+    return os.path.join(DATA_PATH, f'{name}.bin')
+
+
+CITY_CODE_TO_NAME = CodeTable(get_table_path('city_code_to_name'))
+AIRPORT_TO_CITY = CodeTable(get_table_path('airport_to_city'))
+AIRPORT_TO_NAME = CodeTable(get_table_path('airport_to_name'))
+COUNTRY_TO_CITY_CODES = CodeTable(get_table_path('country_to_city_codes'))
+CODE_TO_LOCATION = CodeTable(get_table_path('code_to_location'))
+
+
+def get_city_code(code):
+    """Returns code of the city by city or airport code or None, if the code is unknown."""
+
+    if code in CITY_CODE_TO_NAME:
+        return code
+
+    try:
+        return AIRPORT_TO_CITY[code][0]
+    except KeyError:
+        return None
+
+
+def get_city_codes(country_code):
+    """Returns list of codes of cities of the country, empty for unknown country."""
+
+    try:
+        city_codes, = COUNTRY_TO_CITY_CODES[country_code]
+    except KeyError:
+        return []
+
+    return city_codes.split(CODES_SEPARATOR)
+
+
+def get_location(code):
+    """Returns latitude, longitude and time zone of the city or airport by code,
+    e.g. (41.24, -8.68, 'Europe/Lisbon'). Missing values and values of unknown code are None.
+    """
+
+    latitude, longitude, time_zone = CODE_TO_LOCATION.get(code, (None, None, None))
+
+    return (
+        None if latitude is None else float(latitude),
+        None if longitude is None else float(longitude),
+        time_zone,
+    )
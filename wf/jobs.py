@@ -0,0 +1,145 @@
+"""Running of scheduled jobs.
+
+Jobs run on a bounded pool of threads, and each job runs in a single flight:
+if a job is triggered while its previous run is not finished, it is handled by job policy:
+    "skip" - the trigger is ignored;
+    "queue" - the job runs once more for every trigger after the current run;
+    "coalesce" - all triggers are merged into one more run after the current run.
+A job, that runs longer than its deadline, is reported, and durations of runs are kept.
+"""
+
+import logging
+import threading
+import time
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+LOG = logging.getLogger(__name__)
+
+POLICIES = ("skip", "queue", "coalesce")
+
+# number of the last runs kept for each job
+HISTORY_SIZE = 100
+
+
+class JobRunner():
+    """Runs registered jobs by name on a pool of max_workers threads."""
+
+    def __init__(self, max_workers=4):
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.__lock = threading.Lock()
+        self.__jobs = {}
+
+    def __repr__(self):
+        return f"JobRunner({list(self.__jobs)})"
+
+    def add(self, name, func, policy="skip", deadline=None):
+        """Registers a job.
+
+        :param name: unique name of the job
+        :param func: function without arguments to run
+        :param policy: what to do, if the job is triggered while running, see POLICIES
+        :param deadline: seconds, longer runs are reported as overdue
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Job policy should be one of {POLICIES}, not '{policy}'.")
+
+        with self.__lock:
+            self.__jobs[name] = {
+                "func": func,
+                "policy": policy,
+                "deadline": deadline,
+                "running": False,
+                "pending": 0,
+                "history": deque(maxlen=HISTORY_SIZE),
+            }
+
+    def submit(self, name):
+        """Triggers a run of the job. Returns False, if the trigger is skipped."""
+
+        with self.__lock:
+            job = self.__jobs[name]
+
+            if job["running"]:
+                if job["policy"] == "skip":
+                    LOG.warning(f"Job '{name}' is still running, the run is skipped")
+                    return False
+                if job["policy"] == "queue":
+                    job["pending"] += 1
+                else:
+                    job["pending"] = 1
+                LOG.info(f"Job '{name}' is still running, {job['pending']} runs are pending")
+                return True
+
+            job["running"] = True
+
+        self.__executor.submit(self._run, name)
+        return True
+
+    def get_history(self, name):
+        """Returns list of the last runs of the job: [{
+            "started_at": datetime(2019, 11, 3, 12, 0, 0),
+            "duration": 35.2,  # seconds
+            "overdue": False,  # True, if the run took longer than the deadline
+            "error": None,  # or error description, if the run failed
+        }]
+        """
+
+        with self.__lock:
+            return list(self.__jobs[name]["history"])
+
+    def shutdown(self, wait=True):
+        """Stops the pool, waits for running jobs by default."""
+
+        self.__executor.shutdown(wait=wait)
+
+    def _run(self, name):
+        """Runs the job until there are no pending runs."""
+
+        job = self.__jobs[name]
+
+        while True:
+            record = self._run_once(name, job)
+
+            with self.__lock:
+                job["history"].append(record)
+                if not job["pending"]:
+                    job["running"] = False
+                    return
+                job["pending"] -= 1
+
+    def _run_once(self, name, job):
+        """Runs the job once and returns record about the run."""
+
+        record = {
+            "started_at": datetime.now(),
+            "duration": None,
+            "overdue": False,
+            "error": None,
+        }
+
+        timer = None
+        if job["deadline"] is not None:
+            timer = threading.Timer(
+                job["deadline"], LOG.error,
+                args=(f"Job '{name}' runs longer than {job['deadline']}s deadline",))
+            timer.daemon = True
+            timer.start()
+
+        started_at = time.monotonic()
+        try:
+            job["func"]()
+        except Exception as e:
+            LOG.exception(f"Job '{name}' failed: {e}")
+            record["error"] = repr(e)
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+        record["duration"] = time.monotonic() - started_at
+        record["overdue"] = job["deadline"] is not None and record["duration"] > job["deadline"]
+        LOG.info(f"Job '{name}' finished in {record['duration']:.2f}s")
+
+        return record
@@ -3,13 +3,11 @@
 
 import logging
 import os
-import requests
 import smtplib
 
-import telegram
-
 from email.message import EmailMessage
 
+import wf.transport
 import wf.utils
 
 IFTTT_KEY = os.environ['IFTTT_KEY']
@@ -23,6 +21,8 @@ OWNER_EMAIL = os.environ['OWNER_EMAIL']
 VK_TOKEN = os.environ['VK_TOKEN']
 VK_OWNER_ID_GROUP = os.environ['VK_OWNER_ID_GROUP']
 
+TELEGRAM_CHANNEL = '@weekendflights'
+
 LOG = logging.getLogger(__name__)
 
 
@@ -41,7 +41,7 @@ def send_found_len_by_ifttt(found_flights_number, search_name):
     data_to_send = {'value1': notification}
 
     # Sending post request to IFTTT webhook url
-    requests.post(ifttt_event_url, json=data_to_send)
+    wf.transport.post(ifttt_event_url, json=data_to_send)
 
 
 def post_bulk_to_channel(flights, search_name):
@@ -50,9 +50,17 @@ def post_bulk_to_channel(flights, search_name):
     if not flights:
         return
 
-    bot = telegram.Bot(token=WF_BOT_TOKEN)
     bulk_message = create_bulk_message(flights, search_name)
-    bot.send_message(chat_id='@weekendflights', text=bulk_message, disable_web_page_preview=True)
+
+    # Bot API documentation: https://core.telegram.org/bots/api#sendmessage
+    response = wf.transport.post(
+        f'https://api.telegram.org/bot{WF_BOT_TOKEN}/sendMessage',
+        json={
+            'chat_id': TELEGRAM_CHANNEL,
+            'text': bulk_message,
+            'disable_web_page_preview': True,
+        })
+    response.raise_for_status()
 
 
 def send_failure_email(traceback_info):
@@ -113,7 +121,7 @@ def post_bulk_to_vk(flights, search_name):
 
     bulk_message = create_bulk_message(flights, search_name)
 
-    requests.post(
+    wf.transport.post(
         'https://api.vk.com/method/wall.post',
         data={
             'access_token': VK_TOKEN,
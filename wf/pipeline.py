@@ -0,0 +1,218 @@
+"""Streaming pipeline of flights searching: fetch -> filter and format -> save.
+
+Every page of latest flights is filtered, formatted and saved for searches,
+that need it, as soon as the page is fetched, instead of collecting all pages first.
+Prices of all flights of a fetched page are recorded once, see wf.prices.
+Stages are connected by bounded queues of QUEUE_SIZE items, so fetching waits
+when later stages fall behind, and only a few pages are held in memory at once:
+    fetch threads -> fetched pages queue -> evaluate threads -> formatted flights queue -> saver
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import wf.batch
+import wf.flights
+import wf.planner
+import wf.prices
+
+LOG = logging.getLogger(__name__)
+
+# maximum number of items waiting between stages of the pipeline
+QUEUE_SIZE = int(os.environ.get('WF_PIPELINE_QUEUE_SIZE', 16))
+
+# pages of at least BATCH_MIN_SIZE flights, which are needed by several searches,
+# are filtered as wf.batch.FlightBatch, if NumPy is installed,
+# smaller or not shared pages are faster to check one by one
+BATCH_MIN_SIZE = int(os.environ.get('WF_BATCH_MIN_SIZE', 200))
+
+# marks the end of a stage input
+_DONE = object()
+
+
+class Pipeline():
+    """Evaluates pages of latest flights for searches of the plan, see wf.planner.
+    Keeps report about every search, see wf.planner.create_report().
+    """
+
+    def __init__(self, plan, now=None):
+        self.__plan = plan
+        self.__now = now
+        self.__search_plans = {
+            search_plan["search"]["_id"]: search_plan for search_plan in plan["searches"]
+        }
+        self.__reports = {}
+        self.__lock = threading.Lock()
+
+        for search_id, search_plan in self.__search_plans.items():
+            report = wf.planner.create_report(search_plan["search"])
+            report.update(latest=0, filtered=0, saved=0, duration=0.0)
+            self.__reports[search_id] = report
+
+    def __repr__(self):
+        return f"Pipeline({len(self.__search_plans)} searches)"
+
+    def get_reports(self):
+        """Returns reports about searches of the plan in the plan order."""
+
+        with self.__lock:
+            return [dict(report) for report in self.__reports.values()]
+
+    def fetch_page(self, page):
+        """Returns raw flights of the page, empty list, if fetching failed.
+        Prices of a page, which was not taken from the cache, are recorded.
+        """
+
+        origin, destination_code, beginning_of_period = page
+        try:
+            flights_data, record = wf.flights.fetch_latest_page(
+                destination_code, beginning_of_period, origin=origin)
+        except Exception as e:
+            LOG.exception(f"Failed to fetch {page} page: {e}")
+            return []
+
+        if flights_data and not record["cached"]:
+            self.record_prices(page, flights_data)
+
+        return flights_data
+
+    def record_prices(self, page, flights_data):
+        """Records prices of raw flights of the page, failure is only logged,
+        so it doesn't affect searches.
+        """
+
+        try:
+            wf.prices.record(flights_data, observed_at=self.__now)
+        except Exception as e:
+            LOG.exception(f"Failed to record prices of {page} page: {e}")
+
+    def evaluate_page(self, page, flights_data):
+        """Filters and formats flights of the page for every search, that needs the page.
+        Returns list of search id and its formatted flights to save, empty lists are left out.
+        A failed search is reported and not evaluated any more.
+        Large page, needed by several searches, is converted to wf.batch.FlightBatch
+        once for all of them, if NumPy is installed, see BATCH_MIN_SIZE.
+        """
+
+        if (len(self.__plan["pages"].get(page, [])) > 1 and
+                len(flights_data) >= BATCH_MIN_SIZE):
+            try:
+                flights_data = wf.batch.make_batch(flights_data)
+            except Exception as e:
+                LOG.warning(f"Failed to make batch of {page} page, "
+                            f"flights are filtered one by one: {e!r}")
+
+        evaluated = []
+        for search_id in self.__plan["pages"].get(page, []):
+            search_plan = self.__search_plans[search_id]
+            if self.__reports[search_id]["error"]:
+                continue
+
+            started_at = time.monotonic()
+            try:
+                filtered_flights = wf.flights.filter_flights(
+                    flights_data,
+                    search_plan["date_pairs"],
+                    search_plan["search"]["max_price"],
+                    now=self.__now,
+                )
+                formatted_flights = wf.flights.format_flights(filtered_flights)
+            except Exception as e:
+                self._fail(search_id, e, started_at)
+                continue
+
+            with self.__lock:
+                report = self.__reports[search_id]
+                report["latest"] += len(flights_data)
+                report["filtered"] += len(filtered_flights)
+                report["duration"] += time.monotonic() - started_at
+
+            if formatted_flights:
+                evaluated.append((search_id, formatted_flights))
+
+        return evaluated
+
+    def save(self, search_id, formatted_flights):
+        """Saves formatted flights of the search, a failed search is reported."""
+
+        if self.__reports[search_id]["error"]:
+            return
+
+        started_at = time.monotonic()
+        try:
+            unique_flights = wf.flights.save_unique_flights(search_id, formatted_flights)
+        except Exception as e:
+            self._fail(search_id, e, started_at)
+            return
+
+        with self.__lock:
+            report = self.__reports[search_id]
+            report["saved"] += len(unique_flights)
+            report["duration"] += time.monotonic() - started_at
+
+    def run(self, pages, workers=1, queue_size=None):
+        """Fetches given pages and streams them through evaluating and saving stages.
+        Returns reports about searches, see get_reports().
+
+        :param pages: pages to fetch, see wf.planner.schedule()
+        :param workers: number of threads, which filter and format fetched pages
+        :param queue_size: maximum number of items waiting between stages, QUEUE_SIZE by default
+        """
+
+        fetched = queue.Queue(maxsize=queue_size or QUEUE_SIZE)
+        formatted = queue.Queue(maxsize=queue_size or QUEUE_SIZE)
+
+        evaluators = [
+            threading.Thread(target=self._evaluate_pages, args=(fetched, formatted), daemon=True)
+            for _ in range(workers)
+        ]
+        saver = threading.Thread(target=self._save_flights, args=(formatted,), daemon=True)
+        for thread in evaluators + [saver]:
+            thread.start()
+
+        try:
+            with ThreadPoolExecutor(max_workers=wf.flights.FETCH_WORKERS) as fetchers:
+                for page in pages:
+                    fetchers.submit(self._fetch_page, page, fetched)
+        finally:
+            for _ in evaluators:
+                fetched.put(_DONE)
+            for thread in evaluators:
+                thread.join()
+            formatted.put(_DONE)
+            saver.join()
+
+        return self.get_reports()
+
+    def _fetch_page(self, page, fetched):
+        fetched.put((page, self.fetch_page(page)))
+
+    def _evaluate_pages(self, fetched, formatted):
+        while True:
+            item = fetched.get()
+            if item is _DONE:
+                return
+
+            for evaluated in self.evaluate_page(*item):
+                formatted.put(evaluated)
+
+    def _save_flights(self, formatted):
+        while True:
+            item = formatted.get()
+            if item is _DONE:
+                return
+
+            self.save(*item)
+
+    def _fail(self, search_id, error, started_at):
+        with self.__lock:
+            report = self.__reports[search_id]
+            LOG.error(f"While flights searching for '{report['name']}' search "
+                      f"exception happened: {error!r}", exc_info=error)
+            report["error"] = repr(error)
+            report["duration"] += time.monotonic() - started_at
@@ -0,0 +1,166 @@
+"""Planning of latest flights requests for all searches of a cycle.
+
+Searches often overlap, e.g. weekend search for the next 12 months
+and vacation search to the same city need the same pages of latest flights.
+Planner collects pages of every search, so each unique page
+(origin, destination_code, beginning_of_period) is requested only once per cycle,
+and every fetched page is evaluated for all searches, that need it, see wf.pipeline.
+
+plan model explanation with examples: {
+    searches: [
+        {
+            search: search document, see wf.searches
+            date_pairs: suitable date pairs of the search,
+                wf.utils.DatePairsRule or wf.utils.DatePairsIndex
+            pages: [("MOW", "OPO", "2019-11-01"), ("MOW", "OPO", "2019-12-01")]
+                pages of the search in the order of wf.flights.get_pages()
+        },
+    ]
+    pages: {
+        ("MOW", "OPO", "2019-11-01"): [search_id, ...]
+            unique pages to request and ids of searches, that need the page
+    }
+    priorities: {
+        ("MOW", "OPO", "2019-11-01"): 1
+            the highest priority of searches, that need the page, see wf.searches
+    }
+    failures: [
+        {search: search document, error: "ValueError('Given dates already passed')"}
+            searches, which failed to be planned
+    ]
+}
+"""
+
+import logging
+
+import wf.flights
+import wf.searches
+import wf.utils
+
+LOG = logging.getLogger(__name__)
+
+
+def make_plan(searches):
+    """Returns plan of latest flights requests for given searches.
+    Malformed searches are logged and left out of the plan to failures.
+    """
+
+    plan = {
+        "searches": [],
+        "pages": {},
+        "priorities": {},
+        "failures": [],
+    }
+
+    for search in searches:
+        try:
+            months, date_pairs = wf.searches.get_months_and_date_pairs(search)
+            destinations = wf.searches.get_destinations(search)
+        except Exception as e:
+            LOG.exception(f"Failed to plan '{search.get('name')}' search: {e}")
+            plan["failures"].append({"search": search, "error": repr(e)})
+            continue
+
+        pages = wf.flights.get_pages(destinations, months)
+
+        plan["searches"].append({
+            "search": search,
+            "date_pairs": wf.utils.index_date_pairs(date_pairs),
+            "pages": pages,
+        })
+        priority = search.get("priority", 0)
+        for page in pages:
+            plan["pages"].setdefault(page, []).append(search["_id"])
+            plan["priorities"][page] = max(priority, plan["priorities"].get(page, priority))
+
+    requested_number = sum(len(search_plan["pages"]) for search_plan in plan["searches"])
+    LOG.info(f"Planned {len(plan['pages'])} unique requests "
+             f"instead of {requested_number} for {len(searches)} searches")
+
+    return plan
+
+
+def schedule(plan, budget=None, retries=0):
+    """Returns pages of the plan in order they should be requested.
+
+    Pages are ordered by the highest priority of searches, that need them,
+    then by number of such searches and then by month, the nearest first.
+    If budget (number of requests left) is given and it is not enough
+    for all pages, the least important pages, which are not cached, are dropped.
+    Every page, which is not cached, takes 1 + retries requests of the budget,
+    so scheduled pages don't run out of quota, even if their requests are retried.
+    """
+
+    def importance(page):
+        _, _, beginning_of_period = page
+        return (-plan["priorities"][page], -len(plan["pages"][page]), beginning_of_period)
+
+    pages = sorted(plan["pages"], key=importance)
+
+    if budget is None:
+        return pages
+
+    scheduled_pages = []
+    dropped_pages = []
+    for page in pages:
+        if wf.flights.is_page_cached(page):
+            scheduled_pages.append(page)
+        elif budget >= 1 + retries:
+            scheduled_pages.append(page)
+            budget -= 1 + retries
+        else:
+            dropped_pages.append(page)
+
+    if dropped_pages:
+        LOG.warning(f"Not enough requests quota, {len(dropped_pages)} pages are dropped: "
+                    f"{dropped_pages}")
+
+    return scheduled_pages
+
+
+def get_failure_reports(plan):
+    """Returns reports about searches, which failed to be planned, see create_report()."""
+
+    reports = []
+    for failure in plan["failures"]:
+        report = create_report(failure["search"])
+        report["error"] = failure["error"]
+        reports.append(report)
+
+    return reports
+
+
+def log_reports(reports):
+    """Logs summary of reports about searches of a cycle."""
+
+    failed_names = [report["name"] for report in reports if report["error"]]
+    saved_number = sum(report["saved"] or 0 for report in reports)
+    LOG.info(f"Evaluated {len(reports)} searches, {saved_number} new flights saved, "
+             f"{len(failed_names)} searches failed: {failed_names}")
+
+    durations = [report for report in reports if report["duration"] is not None]
+    if durations:
+        slowest = max(durations, key=lambda report: report["duration"])
+        LOG.info(f"The slowest search '{slowest['name']}' took {slowest['duration']:.2f}s")
+
+
+def create_report(search):
+    """Returns empty report about the search of a cycle: {
+        "name": "Ufa on weekends",
+        "latest": 1200,  # number of latest flights of the search
+        "filtered": 10,  # number of flights left after filtering
+        "saved": 2,  # number of saved unique flights
+        "duration": 0.2,  # seconds spent on the search
+        "error": None,  # or error description, if the search failed
+    }
+    Numbers of flights of the stages, which were not reached, are None.
+    """
+
+    return {
+        "name": search.get("name"),
+        "latest": None,
+        "filtered": None,
+        "saved": None,
+        "duration": None,
+        "error": None,
+    }
@@ -0,0 +1,101 @@
+"""Price history of routes, made to tell if a price is good for the route.
+
+Flights are kept only for 30 days and are unique by price, so they can't answer it.
+Instead every route keeps one document with aggregates, which are updated
+with exact prices of every fetched page of latest flights before they are filtered
+for searches, see wf.pipeline.Pipeline.fetch_page(),
+so a check of a price is one lookup by the unique route index.
+
+price history model explanation with examples: {
+    origin: "Moscow"
+    destination: "Porto"
+    departure_date: "2019-12-28"
+    arrival_date: "2020-01-07"
+        the route, see wf.storage.base.ROUTE_KEY, cities are named as in flights
+    min_price: 4251
+    last_price: 4530
+    observations: 12
+        number of fetched pages, the route was seen in
+    histogram: {"4200": 3, "4500": 9}
+        number of observations by price rounded to wf.storage.base.PRICE_STEP,
+        median is counted from it
+    first_observed_at: datetime(2019, 11, 3, 12, 0)
+    last_observed_at: datetime(2019, 11, 3, 18, 0)
+}
+"""
+
+import logging
+
+from datetime import datetime
+
+import wf.flights
+import wf.storage
+
+from wf.storage.base import ROUTE_KEY
+
+LOG = logging.getLogger(__name__)
+
+
+def record(flights_data, observed_at=None):
+    """Adds prices of raw flights of Travelpayouts to price history of their routes.
+    The lowest price of a route is recorded, if there are several flights of the route.
+    Returns number of updated routes.
+    """
+
+    observed_at = observed_at or datetime.now()
+
+    observations = {}
+    for flight in flights_data:
+        key = (
+            wf.flights.get_city_name(flight["origin"]),
+            wf.flights.get_city_name(flight["destination"]),
+            flight["depart_date"],
+            flight["return_date"],
+        )
+        price = flight["value"]
+        if key not in observations or price < observations[key]["price"]:
+            observation = dict(zip(ROUTE_KEY, key))
+            observation.update(price=price, observed_at=observed_at)
+            observations[key] = observation
+
+    wf.storage.get_backend().record_prices(list(observations.values()))
+
+    LOG.debug(f"Recorded prices of {len(observations)} routes")
+    return len(observations)
+
+
+def get_stats(route):
+    """Returns price aggregates of the route or None, if the route was never seen: {
+        "min_price": 4200,
+        "median_price": 4500,
+        "last_price": 4500,
+        "observations": 12,
+    }
+    Route is a dict with ROUTE_KEY fields, e.g. a flight.
+    """
+
+    history = wf.storage.get_backend().get_price_history(route)
+    if history is None:
+        return None
+
+    return {
+        "min_price": history["min_price"],
+        "median_price": get_median(history["histogram"]),
+        "last_price": history["last_price"],
+        "observations": history["observations"],
+    }
+
+
+def get_median(histogram):
+    """Returns median price of histogram of prices, the lower one for even number of prices."""
+
+    counts = sorted((int(price), count) for price, count in histogram.items())
+    middle = (sum(count for _, count in counts) + 1) // 2
+
+    seen = 0
+    for price, count in counts:
+        seen += count
+        if seen >= middle:
+            return price
+
+    return None
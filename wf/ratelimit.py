@@ -0,0 +1,103 @@
+"""Client-side rate limiting of partner APIs.
+
+Travelpayouts limits number of requests per second and per day,
+so requests are spent deliberately instead of bursting and getting throttled.
+"""
+
+import threading
+import time
+
+from datetime import datetime
+
+import wf.storage
+
+
+class QuotaExceeded(Exception):
+    """Raised when daily quota of requests is spent."""
+
+
+class TokenBucket():
+    """Thread-safe token bucket: allows `rate` requests per second on average
+    and bursts of up to `capacity` requests.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1, rate)
+        self.__tokens = self.capacity
+        self.__updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __repr__(self):
+        return f"TokenBucket(rate={self.rate}, capacity={self.capacity})"
+
+    def acquire(self):
+        """Takes one token, waits until the token is available."""
+
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__tokens = min(
+                    self.capacity, self.__tokens + (now - self.__updated_at) * self.rate)
+                self.__updated_at = now
+
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+
+                delay = (1 - self.__tokens) / self.rate
+
+            time.sleep(delay)
+
+
+class RateLimiter():
+    """Limits requests per second with a token bucket and requests per UTC day with a quota.
+    Zero rate or quota means no limit.
+    Requests of a limiter with a name are counted in the storage backend, see wf.storage,
+    so the daily quota is not reset by a restart, otherwise they are counted in memory.
+    """
+
+    def __init__(self, rate=0, daily_quota=0, name=None):
+        self.rate = rate
+        self.daily_quota = daily_quota
+        self.name = name
+        self.__bucket = TokenBucket(rate) if rate else None
+        self.__day = None
+        self.__spent = 0
+        self.__lock = threading.Lock()
+
+    def __repr__(self):
+        return f"RateLimiter(rate={self.rate}, daily_quota={self.daily_quota}, name={self.name!r})"
+
+    def remaining(self):
+        """Returns number of requests left for today or None if there is no daily quota."""
+
+        if not self.daily_quota:
+            return None
+
+        return max(0, self.daily_quota - self._spend(0))
+
+    def acquire(self):
+        """Spends one request of the daily quota and waits for a token of the bucket.
+        Raises QuotaExceeded, if daily quota is spent.
+        """
+
+        if self.daily_quota and self._spend(1) > self.daily_quota:
+            raise QuotaExceeded(f"Daily quota of {self.daily_quota} requests is spent")
+
+        if self.__bucket is not None:
+            self.__bucket.acquire()
+
+    def _spend(self, number):
+        """Adds number of requests spent today, returns total number of them."""
+
+        today = datetime.utcnow().date()
+        if self.name is not None:
+            return wf.storage.get_backend().add_requests(self.name, today.isoformat(), number)
+
+        with self.__lock:
+            if today != self.__day:
+                self.__day = today
+                self.__spent = 0
+            self.__spent += number
+            return self.__spent
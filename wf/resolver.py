@@ -0,0 +1,209 @@
+"""Resolution of free-text destination names to IATA codes of cities,
+e.g. "Лиссабон", "Lisbon" or "lisabon" to "LIS", "Шереметьево" to "MOW".
+
+Names of cities and airports from wf.iata_converters are indexed by trigrams
+of their normalized forms: English, Russian and Russian transliterated to Latin,
+so Russian names match English queries and vice versa.
+A name is resolved by similarity of trigrams of the query and of indexed names,
+only names, which share trigrams with the query, are compared.
+A query, which doesn't match a name exactly, is resolved only to a clear winner,
+see RESOLVE_MIN_SIMILARITY and RESOLVE_MIN_LEAD, e.g. "Spain" is not resolved
+to Port of Spain, and a name of several places, e.g. "Alexandria", is not resolved at all,
+a wrong destination is worse than none.
+"""
+
+import logging
+import re
+import threading
+
+from collections import Counter
+
+import wf.iata_converters
+
+LOG = logging.getLogger(__name__)
+
+# names with lower similarity of trigrams to the query are not suggested
+MIN_SIMILARITY = 0.45
+
+# not exactly matched query is resolved, only if the most similar name has
+# at least RESOLVE_MIN_SIMILARITY and is more similar than names of other codes
+# by at least RESOLVE_MIN_LEAD
+RESOLVE_MIN_SIMILARITY = 0.7
+RESOLVE_MIN_LEAD = 0.15
+
+TRANSLITERATION = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e', 'ж': 'zh',
+    'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o',
+    'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u', 'ф': 'f', 'х': 'kh', 'ц': 'ts',
+    'ч': 'ch', 'ш': 'sh', 'щ': 'shch', 'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu',
+    'я': 'ya',
+}
+
+# words of airport names, which don't help to tell one place from another
+STOP_WORDS = {
+    'airport', 'international', 'regional', 'municipal',
+    'аэропорт', 'международный',
+}
+
+NOT_WORD_CHARACTERS = re.compile(r'[\W_]+')
+
+_index = None
+_lock = threading.Lock()
+
+
+def normalize(name):
+    """Returns name in lower case without punctuation and words from STOP_WORDS."""
+
+    words = NOT_WORD_CHARACTERS.sub(' ', name.lower().replace('ё', 'е')).split()
+    return ' '.join(word for word in words if word not in STOP_WORDS)
+
+
+def transliterate(name):
+    """Returns Russian name written in Latin letters, other characters are kept."""
+
+    return ''.join(TRANSLITERATION.get(character, character) for character in name)
+
+
+def get_trigrams(name):
+    """Returns set of trigrams of the normalized name padded by spaces."""
+
+    padded_name = f'  {name} '
+    return {padded_name[index:index + 3] for index in range(len(padded_name) - 2)}
+
+
+class NameIndex():
+    """Trigram index of names of places. Each name is indexed with the code it resolves to
+    and the rank of the code, codes with higher rank win ties of similarity.
+    """
+
+    def __init__(self):
+        self.__names = []  # [(name, code, rank, trigrams number)]
+        self.__postings = {}  # trigram -> [name index]
+        self.__exact = {}  # name -> [name index]
+
+    def __repr__(self):
+        return f"NameIndex({len(self.__names)} names)"
+
+    def __len__(self):
+        return len(self.__names)
+
+    def add(self, name, code, rank=0):
+        """Adds the name in all its forms, see the module docstring."""
+
+        normalized_name = normalize(name)
+        forms = {normalized_name, transliterate(normalized_name)}
+        forms.discard('')
+
+        for form in forms:
+            trigrams = get_trigrams(form)
+            name_index = len(self.__names)
+            self.__names.append((form, code, rank, len(trigrams)))
+            self.__exact.setdefault(form, []).append(name_index)
+            for trigram in trigrams:
+                self.__postings.setdefault(trigram, []).append(name_index)
+
+    def find(self, query, limit=5, min_similarity=MIN_SIMILARITY):
+        """Returns list of up to limit suggestions (similarity, code, name) for the query,
+        the most similar first, each code is suggested once.
+        """
+        normalized_query = normalize(query)
+        forms = {normalized_query, transliterate(normalized_query)}
+        forms.discard('')
+
+        similarities = {}  # name index -> similarity
+        for form in forms:
+            for name_index in self.__exact.get(form, []):
+                similarities[name_index] = 1.0
+
+            trigrams = get_trigrams(form)
+            common_numbers = Counter()
+            for trigram in trigrams:
+                common_numbers.update(self.__postings.get(trigram, ()))
+
+            for name_index, common_number in common_numbers.items():
+                # Dice coefficient of sets of trigrams
+                similarity = 2 * common_number / (len(trigrams) + self.__names[name_index][3])
+                if similarity > similarities.get(name_index, 0):
+                    similarities[name_index] = similarity
+
+        ranked = sorted(
+            similarities.items(),
+            key=lambda item: (-item[1], -self.__names[item[0]][2], self.__names[item[0]][1]),
+        )
+
+        suggestions = []
+        suggested_codes = set()
+        for name_index, similarity in ranked:
+            if similarity < min_similarity or len(suggestions) >= limit:
+                break
+            name, code, _, _ = self.__names[name_index]
+            if code not in suggested_codes:
+                suggested_codes.add(code)
+                suggestions.append((similarity, code, name))
+
+        return suggestions
+
+
+def get_index():
+    """Returns NameIndex of names of all cities and airports, builds it on the first call.
+    Cities are ranked by number of their airports, so LON is suggested before London in Canada.
+    """
+    global _index
+
+    with _lock:
+        if _index is None:
+            airports_numbers = Counter(
+                city_code for city_code, _, _ in wf.iata_converters.AIRPORT_TO_CITY.values())
+
+            index = NameIndex()
+            for code, names in wf.iata_converters.CITY_CODE_TO_NAME.items():
+                for name in names:
+                    if name:
+                        index.add(name, code, rank=airports_numbers[code])
+
+            for code, names in wf.iata_converters.AIRPORT_TO_NAME.items():
+                city_code = wf.iata_converters.AIRPORT_TO_CITY[code][0]
+                for name in names:
+                    if name and city_code:
+                        index.add(name, city_code, rank=airports_numbers[city_code])
+
+            _index = index
+            LOG.debug(f"Indexed {len(_index)} names of cities and airports")
+
+        return _index
+
+
+def suggest(query, limit=5):
+    """Returns list of up to limit suggestions (similarity, city code, matched name)
+    for the name of a city or an airport, the most similar first.
+    """
+
+    return get_index().find(query, limit=limit)
+
+
+def resolve(query):
+    """Returns code of the only city, which name matches the query exactly,
+    or of the city, which name is clearly the most similar to it, otherwise None,
+    see suggest() for candidates.
+    """
+
+    suggestions = suggest(query, limit=2)
+    if not suggestions:
+        return None
+
+    similarity, code, name = suggestions[0]
+    next_similarity = suggestions[1][0] if len(suggestions) > 1 else 0.0
+
+    if similarity == 1.0 and next_similarity == 1.0:
+        LOG.debug(f"'{query}' is not resolved, it is a name of several places, "
+                  f"e.g. {code} and {suggestions[1][1]}")
+        return None
+
+    if similarity < 1.0 and (similarity < RESOLVE_MIN_SIMILARITY or
+                             similarity - next_similarity < RESOLVE_MIN_LEAD):
+        LOG.debug(f"'{query}' is not resolved, the most similar name is '{name}' of {code} "
+                  f"with {similarity:.2f} similarity")
+        return None
+
+    LOG.debug(f"Resolved '{query}' to {code} by '{name}' name with {similarity:.2f} similarity")
+    return code
@@ -12,6 +12,12 @@
     search model explanation with examples: {
         name: e.g. "Portugal in may"
         destinations: ["OPO", "LIS"]
+            IATA codes of cities, airports or countries,
+            names of cities and airports are resolved to codes by add(), see resolve_destinations()
+        nearby: {"code": "LIS", "radius": 300}
+            or {"latitude": 38.7, "longitude": -9.1, "radius": 300}
+            optional, cities with airports within radius km from the city or the point
+            are added to destinations at plan time, see get_destinations()
         max_price: 14000
         trip_type: "weekends" | "vacation" | "looking_around"
             "weekends" means, that only flights will be searched for weekends
@@ -41,25 +47,29 @@
         trip_max_length: 14
             minimal number of days in a trip
             required only if trip_type == vacation (required for get_date_pairs() function)
+        is_active: True
+            only active searches are searched and posted, has to be boolean
+        priority: 1
+            optional, 0 by default; when requests quota is tight,
+            flights for searches with higher priority are requested first
     }
 """
 
 import logging
 
-import wf.db
+import wf.flights
+import wf.geo
+import wf.iata_converters
+import wf.resolver
+import wf.storage
+import wf.utils
 
 LOG = logging.getLogger(__name__)
 
 
-def get_collection():
-    """Returns searches collection."""
-
-    db = wf.db.Database("wf")
-    return db.searches
-
-
 def add(name, destinations, max_price, trip_type, next_x_months=None, departure_date=None,
-        arrival_date=None, trip_min_length=None, trip_max_length=None):
+        arrival_date=None, trip_min_length=None, trip_max_length=None, priority=0,
+        nearby=None):
     """Adds a search into a database."""
 
     LOG.info(f'Adding a "{name}" search to the database...')
@@ -79,11 +89,16 @@ def add(name, destinations, max_price, trip_type, next_x_months=None, departure_
 
     search = {
         "name": name,
-        "destinations": destinations,
+        "destinations": resolve_destinations(destinations),
         "max_price": max_price,
         "trip_type": trip_type,
+        "priority": priority,
     }
 
+    if nearby is not None:
+        get_nearby_destinations(nearby)  # validates nearby before saving
+        search["nearby"] = nearby
+
     if trip_type == "weekends":
         search["next_x_months"] = next_x_months
 
@@ -93,8 +108,7 @@ def add(name, destinations, max_price, trip_type, next_x_months=None, departure_
         search["trip_min_length"] = trip_min_length
         search["trip_max_length"] = trip_max_length
 
-    searches_collection = get_collection()
-    searches_collection.insert_one(search)
+    wf.storage.get_backend().add_search(search)
 
 
 def remove(name):
@@ -102,12 +116,116 @@ def remove(name):
 
     LOG.info(f'Removing a "{name}" search from the database...')
 
-    searches_collection = get_collection()
-    searches_collection.delete_one({"name": name})
+    wf.storage.get_backend().remove_search(name)
 
 
 def get_all():
     """Returns list of all searches, where each search is a dict."""
 
-    searches_collection = get_collection()
-    return list(searches_collection.find())
+    return wf.storage.get_backend().get_searches()
+
+
+def get_months_and_date_pairs(search):
+    """Returns months to search flights in and suitable date pairs for given search.
+    See wf.utils.get_next_months() for months format,
+    date pairs are returned as wf.utils.DatePairsRule.
+    """
+
+    trip_type = search["trip_type"]
+
+    if trip_type == "weekends":
+        next_x_months = search["next_x_months"]
+        months = wf.utils.get_next_months(next_x_months)
+        date_pairs = wf.utils.DatePairsRule(on_weekends=True, next_x_months=next_x_months)
+
+    elif trip_type == "vacation":
+        departure_date = search["departure_date"]
+        arrival_date = search["arrival_date"]
+        months = wf.utils.get_months_from_dates(departure_date, arrival_date)
+        date_pairs = wf.utils.DatePairsRule(
+            departure_date=departure_date,
+            arrival_date=arrival_date,
+            trip_min_length=int(search["trip_min_length"]),
+            trip_max_length=int(search["trip_max_length"]),
+        )
+
+    else:
+        raise ValueError(f"Searching flights for '{trip_type}' trip type is not supported.")
+
+    return months, date_pairs
+
+
+def resolve_destinations(destinations):
+    """Returns destinations, where names of cities and airports are replaced by city codes,
+    e.g. ["Лиссабон", "OPO"] -> ["LIS", "OPO"]. Raises ValueError for destination,
+    which is unknown or ambiguous, see wf.resolver.resolve(), with similar places in the message.
+    """
+    resolved_destinations = []
+
+    for destination in destinations:
+        if is_code(destination):
+            code = destination
+        else:
+            code = wf.resolver.resolve(destination)
+            if code is None:
+                candidates = ", ".join(
+                    f"{candidate} ({name})"
+                    for _, candidate, name in wf.resolver.suggest(destination)
+                )
+                raise ValueError(f"Destination '{destination}' is not resolved, "
+                                 f"similar places: {candidates or 'none'}. "
+                                 f"Use IATA code of a city, an airport or a country.")
+            LOG.info(f'Destination "{destination}" is resolved to {code}')
+
+        if code not in resolved_destinations:
+            resolved_destinations.append(code)
+
+    return resolved_destinations
+
+
+def is_code(destination):
+    """Checks if destination is IATA code of a city, an airport or a country."""
+
+    return (destination in wf.iata_converters.CITY_CODE_TO_NAME or
+            destination in wf.iata_converters.AIRPORT_TO_CITY or
+            destination in wf.iata_converters.COUNTRY_TO_CITY_CODES)
+
+
+def get_destinations(search):
+    """Returns destinations of the search with cities nearby, if the search has nearby field."""
+
+    destinations = list(search["destinations"])
+
+    if search.get("nearby"):
+        for destination in get_nearby_destinations(search["nearby"]):
+            if destination not in destinations:
+                destinations.append(destination)
+
+    return destinations
+
+
+def get_nearby_destinations(nearby):
+    """Returns codes of cities with airports within radius from the city or the point,
+    see search model for nearby format, the origin of flights, see wf.flights.ORIGIN,
+    is left out. Raises ValueError for malformed nearby or unknown city.
+    """
+    if "radius" not in nearby or not (
+            "code" in nearby or "latitude" in nearby and "longitude" in nearby):
+        raise ValueError(f"Nearby {nearby} should have radius "
+                         f"and either code or latitude and longitude.")
+
+    if "code" in nearby:
+        latitude, longitude, _ = wf.iata_converters.get_location(nearby["code"])
+        if latitude is None or longitude is None:
+            raise ValueError(f"Location of '{nearby['code']}' is unknown.")
+    else:
+        latitude, longitude = float(nearby["latitude"]), float(nearby["longitude"])
+
+    city_codes = wf.geo.get_nearby_city_codes(latitude, longitude, float(nearby["radius"]))
+    return [code for code in city_codes if code != wf.flights.ORIGIN]
+
+
+def get_active():
+    """Returns list of active searches, where each search is a dict."""
+
+    return wf.storage.get_backend().get_searches(active_only=True)
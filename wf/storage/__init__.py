@@ -0,0 +1,58 @@
+"""Storage of searches and flights.
+
+Backend is chosen by WF_STORAGE environmental variable:
+    "mongo" - MongoDB Atlas, see wf.db, used by default;
+    "memory" - in-memory storage, made for tests and benchmarks;
+    "sqlite" - SQLite database at WF_STORAGE_PATH (in-memory database by default).
+All backends have the same semantics, see wf.storage.base.Storage.
+"""
+
+import logging
+import os
+import threading
+
+LOG = logging.getLogger(__name__)
+
+_backend = None
+_lock = threading.Lock()
+
+
+def create_backend(name, path=None):
+    """Returns a new storage backend by its name."""
+
+    if name == "mongo":
+        from wf.storage.mongo import MongoStorage
+        return MongoStorage()
+
+    if name == "memory":
+        from wf.storage.memory import MemoryStorage
+        return MemoryStorage()
+
+    if name == "sqlite":
+        from wf.storage.sqlite import SqliteStorage
+        return SqliteStorage(path or ":memory:")
+
+    raise ValueError(f"Storage backend '{name}' is not supported.")
+
+
+def get_backend():
+    """Returns storage backend of the process, creates it on the first call."""
+
+    global _backend
+
+    with _lock:
+        if _backend is None:
+            name = os.environ.get('WF_STORAGE', 'mongo')
+            LOG.info(f"Using {name} storage")
+            _backend = create_backend(name, path=os.environ.get('WF_STORAGE_PATH'))
+
+    return _backend
+
+
+def set_backend(backend):
+    """Sets storage backend of the process, e.g. to run cycles offline."""
+
+    global _backend
+
+    with _lock:
+        _backend = backend
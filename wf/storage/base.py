@@ -0,0 +1,177 @@
+"""Interface of searches, flights and price history storage."""
+
+import os
+
+# flights are unique by these fields, duplicates are not stored
+FLIGHT_UNIQUE_KEY = ("destination", "price", "departure_date", "arrival_date")
+
+# flights of a route in "route" deduplication mode are unique by these fields
+FLIGHT_ROUTE_KEY = ("destination", "departure_date", "arrival_date")
+
+# deduplication of flights, WF_DEDUP_MODE environmental variable:
+#     "price" - flights are unique by FLIGHT_UNIQUE_KEY, so every new price of a route is new,
+#         see Storage.insert_unique_flights(), used by default;
+#     "route" - one flight is kept for FLIGHT_ROUTE_KEY with the latest price, it is new
+#         only when the price drops enough below the last notified one,
+#         see Storage.upsert_route_flights().
+# A database keeps flights of one mode, indexes of wf.db.INDEXES depend on it.
+DEDUP_MODE = os.environ.get('WF_DEDUP_MODE', 'price')
+
+# flights are deleted in 30 days after they were added
+FLIGHT_TTL = 2630000  # seconds
+
+# price history is kept for every route, routes are unique by these fields
+ROUTE_KEY = ("origin", "destination", "departure_date", "arrival_date")
+
+# prices are rounded to PRICE_STEP for the histogram of price history
+PRICE_STEP = 100
+
+
+class DuplicateSearchError(Exception):
+    """Raised when a search with the same name is already stored."""
+
+
+class Storage():
+    """Storage of searches, flights and price history.
+
+    Implementations have to keep the same semantics:
+        searches are unique by name;
+        flights are unique by FLIGHT_UNIQUE_KEY or FLIGHT_ROUTE_KEY, see DEDUP_MODE;
+        every new flight is claimed only once, even by concurrent callers;
+        flights are expired in FLIGHT_TTL seconds after their "added_at" time;
+        price history is unique by ROUTE_KEY and is never expired;
+        number of requests spent is counted atomically, see add_requests().
+    Documents are dicts in formats described in wf.searches, wf.flights and wf.prices,
+    stored documents get "_id" field.
+    """
+
+    def initiate(self):
+        """Prepares storage to work, e.g. creates indexes or tables."""
+
+    def add_search(self, search):
+        """Stores a search, raises DuplicateSearchError if its name is taken."""
+
+        raise NotImplementedError
+
+    def remove_search(self, name):
+        """Removes a search by name."""
+
+        raise NotImplementedError
+
+    def get_searches(self, active_only=False):
+        """Returns list of all or only active searches."""
+
+        raise NotImplementedError
+
+    def insert_unique_flights(self, flights):
+        """Stores flights, which are not stored yet, returns list of stored flights."""
+
+        raise NotImplementedError
+
+    def find_flights(self, filter_query=None):
+        """Returns list of flights with fields equal to the ones of filter_query."""
+
+        raise NotImplementedError
+
+    def claim_new_flights(self, search_id):
+        """Marks all new flights of the search as not new and returns them."""
+
+        raise NotImplementedError
+
+    def expire_flights(self, now=None):
+        """Deletes flights added earlier than FLIGHT_TTL seconds before now.
+        Returns number of deleted flights.
+        """
+
+        raise NotImplementedError
+
+    def upsert_route_flights(self, flights, min_drop_amount=0, min_drop_percent=0):
+        """Stores flights in "route" deduplication mode: a flight of a new route is inserted,
+        a stored flight of the route gets fields of the given one and keeps "search_id"
+        and "is_new", unless the price is a drop below its "notified_price", see is_price_drop().
+        Inserted flights and flights of dropped prices are marked new, get "search_id"
+        of the given flight and "notified_price" of its price.
+        Returns list of flights, which were marked new.
+        """
+
+        raise NotImplementedError
+
+    def record_prices(self, observations):
+        """Adds observed prices to price history of their routes, see add_price().
+        Observations are dicts with ROUTE_KEY fields, "price" and "observed_at",
+        one observation per route.
+        """
+
+        raise NotImplementedError
+
+    def get_price_history(self, route):
+        """Returns price history of the route, given as dict of ROUTE_KEY fields, or None."""
+
+        raise NotImplementedError
+
+    def add_requests(self, name, day, number=1):
+        """Adds number of requests to the API by name, e.g. "travelpayouts", spent in the day,
+        given as ISO date. Returns total number of requests spent in the day,
+        zero number only reads it. Made to keep daily quotas across restarts, see wf.ratelimit.
+        """
+
+        raise NotImplementedError
+
+
+def add_price(history, observation):
+    """Adds observation of a price to price history of its route and returns the history.
+    A new history is created, if history is None, see wf.prices for the format.
+    """
+
+    price = observation["price"]
+    observed_at = observation["observed_at"]
+
+    if history is None:
+        history = {field: observation[field] for field in ROUTE_KEY}
+        history.update({
+            "min_price": price,
+            "observations": 0,
+            "histogram": {},
+            "first_observed_at": observed_at,
+        })
+
+    history["min_price"] = min(history["min_price"], price)
+    history["last_price"] = price
+    history["last_observed_at"] = observed_at
+    history["observations"] += 1
+    histogram_key = str(price - price % PRICE_STEP)
+    history["histogram"][histogram_key] = history["histogram"].get(histogram_key, 0) + 1
+
+    return history
+
+
+def check_price_drop(min_drop_amount, min_drop_percent):
+    """Raises ValueError, if thresholds of a price drop are not valid:
+    amount has to be at least 0 and percent has to be from 0 up to, but not including, 100.
+    """
+
+    if min_drop_amount < 0:
+        raise ValueError(f"Price drop amount should be at least 0, got {min_drop_amount}.")
+    if not 0 <= min_drop_percent < 100:
+        raise ValueError(f"Price drop percent should be at least 0 and less than 100, "
+                         f"got {min_drop_percent}.")
+
+
+def get_drop_threshold(price, min_drop_amount=0, min_drop_percent=0):
+    """Returns the lowest notified price, from which the price is a drop
+    by at least min_drop_amount and at least min_drop_percent, see is_price_drop().
+    Raises ValueError for invalid thresholds, see check_price_drop().
+    """
+
+    check_price_drop(min_drop_amount, min_drop_percent)
+
+    return max(price + min_drop_amount, price * 100 / (100 - min_drop_percent))
+
+
+def is_price_drop(notified_price, price, min_drop_amount=0, min_drop_percent=0):
+    """Checks if the price is lower than the notified price by at least min_drop_amount
+    and by at least min_drop_percent percents of the notified price, 0 disables a threshold.
+    """
+
+    return (notified_price > price and
+            notified_price >= get_drop_threshold(price, min_drop_amount, min_drop_percent))
@@ -0,0 +1,163 @@
+"""In-memory storage of searches, flights and price history, made for tests and benchmarks."""
+
+import copy
+import threading
+import uuid
+
+from datetime import datetime, timedelta
+
+from wf.storage.base import (
+    DuplicateSearchError, FLIGHT_ROUTE_KEY, FLIGHT_TTL, FLIGHT_UNIQUE_KEY, ROUTE_KEY, Storage,
+    add_price, check_price_drop, is_price_drop,
+)
+
+
+class MemoryStorage(Storage):
+    """Thread-safe storage in dicts of the process memory.
+    Returned documents are copies, so changing them doesn't change stored ones.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__searches = {}  # name -> search
+        self.__flights = {}  # _id -> flight
+        self.__flight_ids = {}  # unique key -> _id
+        self.__route_flight_ids = {}  # route key -> _id, see upsert_route_flights()
+        self.__new_flight_ids = {}  # search_id -> list of _id of new flights
+        self.__prices = {}  # route key -> price history
+        self.__requests = {}  # (name, day) -> number of spent requests
+
+    def __repr__(self):
+        return f"MemoryStorage({len(self.__searches)} searches, {len(self.__flights)} flights)"
+
+    def add_search(self, search):
+        with self.__lock:
+            if search["name"] in self.__searches:
+                raise DuplicateSearchError(f"Search '{search['name']}' already exists")
+            search.setdefault("_id", uuid.uuid4().hex)
+            self.__searches[search["name"]] = dict(search)
+
+    def remove_search(self, name):
+        with self.__lock:
+            self.__searches.pop(name, None)
+
+    def get_searches(self, active_only=False):
+        with self.__lock:
+            return [
+                dict(search) for search in self.__searches.values()
+                if not active_only or search.get("is_active") is True
+            ]
+
+    def insert_unique_flights(self, flights):
+        inserted_flights = []
+
+        with self.__lock:
+            for flight in flights:
+                key = tuple(flight.get(field) for field in FLIGHT_UNIQUE_KEY)
+                if key in self.__flight_ids:
+                    continue
+
+                flight.setdefault("_id", uuid.uuid4().hex)
+                self.__flights[flight["_id"]] = dict(flight)
+                self.__flight_ids[key] = flight["_id"]
+                if flight.get("is_new"):
+                    self.__new_flight_ids.setdefault(flight["search_id"], []).append(flight["_id"])
+                inserted_flights.append(flight)
+
+        return inserted_flights
+
+    def upsert_route_flights(self, flights, min_drop_amount=0, min_drop_percent=0):
+        check_price_drop(min_drop_amount, min_drop_percent)
+        new_flights = []
+
+        with self.__lock:
+            for flight in flights:
+                key = tuple(flight.get(field) for field in FLIGHT_ROUTE_KEY)
+                stored_flight = self.__flights.get(self.__route_flight_ids.get(key))
+
+                if stored_flight is None:
+                    flight.setdefault("_id", uuid.uuid4().hex)
+                    stored_flight = dict(flight, notified_price=flight["price"])
+                    self.__flights[flight["_id"]] = stored_flight
+                    self.__route_flight_ids[key] = flight["_id"]
+                elif is_price_drop(stored_flight["notified_price"], flight["price"],
+                                   min_drop_amount, min_drop_percent):
+                    stored_flight.update(
+                        {field: value for field, value in flight.items() if field != "_id"},
+                        notified_price=flight["price"],
+                    )
+                else:
+                    stored_flight.update(
+                        (field, value) for field, value in flight.items()
+                        if field not in ("_id", "search_id", "is_new")
+                    )
+                    continue
+
+                stored_flight["is_new"] = True
+                self.__new_flight_ids.setdefault(
+                    stored_flight["search_id"], []).append(stored_flight["_id"])
+                new_flights.append(dict(stored_flight))
+
+        return new_flights
+
+    def find_flights(self, filter_query=None):
+        filter_items = (filter_query or {}).items()
+
+        with self.__lock:
+            return [
+                dict(flight) for flight in self.__flights.values()
+                if all(flight.get(field) == value for field, value in filter_items)
+            ]
+
+    def claim_new_flights(self, search_id):
+        claim_id = uuid.uuid4().hex
+        claimed_at = datetime.now()
+
+        with self.__lock:
+            new_flights = []
+            for flight_id in self.__new_flight_ids.pop(search_id, []):
+                flight = self.__flights.get(flight_id)
+                if flight is None or not flight.get("is_new") or flight["search_id"] != search_id:
+                    continue
+                flight.update({"is_new": False, "claim_id": claim_id, "claimed_at": claimed_at})
+                new_flights.append(dict(flight))
+
+        return new_flights
+
+    def expire_flights(self, now=None):
+        expire_before = (now or datetime.now()) - timedelta(seconds=FLIGHT_TTL)
+
+        with self.__lock:
+            expired_flights = [
+                flight for flight in self.__flights.values()
+                if flight["added_at"] < expire_before
+            ]
+            for flight in expired_flights:
+                del self.__flights[flight["_id"]]
+                for flight_ids, key_fields in ((self.__flight_ids, FLIGHT_UNIQUE_KEY),
+                                               (self.__route_flight_ids, FLIGHT_ROUTE_KEY)):
+                    key = tuple(flight.get(field) for field in key_fields)
+                    if flight_ids.get(key) == flight["_id"]:
+                        del flight_ids[key]
+
+        return len(expired_flights)
+
+    def record_prices(self, observations):
+        with self.__lock:
+            for observation in observations:
+                key = tuple(observation[field] for field in ROUTE_KEY)
+                history = add_price(self.__prices.get(key), observation)
+                history.setdefault("_id", uuid.uuid4().hex)
+                self.__prices[key] = history
+
+    def get_price_history(self, route):
+        key = tuple(route.get(field) for field in ROUTE_KEY)
+
+        with self.__lock:
+            history = self.__prices.get(key)
+            return copy.deepcopy(history) if history is not None else None
+
+    def add_requests(self, name, day, number=1):
+        with self.__lock:
+            self.__requests[(name, day)] = self.__requests.get((name, day), 0) + number
+            return self.__requests[(name, day)]
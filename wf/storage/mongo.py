@@ -0,0 +1,201 @@
+"""MongoDB storage of searches, flights and price history, see wf.db for connection handling."""
+
+import logging
+import uuid
+
+from datetime import datetime
+
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+import wf.db
+
+from wf.storage.base import (
+    DuplicateSearchError, FLIGHT_ROUTE_KEY, PRICE_STEP, ROUTE_KEY, Storage,
+    get_drop_threshold,
+)
+
+LOG = logging.getLogger(__name__)
+
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+
+class MongoStorage(Storage):
+    """Storage in "wf" MongoDB database.
+    Uniqueness and TTL of flights are handled by indexes, see wf.db.INDEXES.
+    """
+
+    def __repr__(self):
+        return "MongoStorage()"
+
+    @property
+    def searches(self):
+        return wf.db.get_database("wf").searches
+
+    @property
+    def flights(self):
+        return wf.db.get_database("wf").flights
+
+    @property
+    def prices(self):
+        return wf.db.get_database("wf").prices
+
+    @property
+    def requests(self):
+        return wf.db.get_database("wf").requests
+
+    def initiate(self):
+        wf.db.initiate_db()
+
+    def add_search(self, search):
+        try:
+            self.searches.insert_one(search)
+        except DuplicateKeyError as e:
+            raise DuplicateSearchError(f"Search '{search['name']}' already exists") from e
+
+    def remove_search(self, name):
+        self.searches.delete_one({"name": name})
+
+    def get_searches(self, active_only=False):
+        filter_query = {"is_active": True} if active_only else {}
+        return list(self.searches.find(filter_query))
+
+    def insert_unique_flights(self, flights):
+        """Inserts flights with one unordered request, duplicates are recognized
+        by unique index errors. Raises BulkWriteError, if any flight failed
+        not because of duplication.
+        """
+
+        if not flights:
+            return []
+
+        try:
+            self.flights.insert_many(flights, ordered=False)
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            if e.details.get("writeConcernErrors") or any(
+                    error["code"] != DUPLICATE_KEY_ERROR_CODE for error in write_errors):
+                raise
+
+            duplicate_indexes = {error["index"] for error in write_errors}
+            return [
+                flight for index, flight in enumerate(flights) if index not in duplicate_indexes]
+
+        return flights
+
+    def upsert_route_flights(self, flights, min_drop_amount=0, min_drop_percent=0):
+        """Stores flights with one unordered bulk request of two updates for each flight:
+        the first one marks the stored flight new, if its notified price is high enough,
+        the second one updates fields or inserts the flight. Updates are atomic,
+        so concurrent callers mark a price drop new once. Flights marked new get a unique
+        save id and are read by it with one query. Raises BulkWriteError, if any update
+        failed not because of duplication of concurrent inserts.
+        """
+
+        if not flights:
+            return []
+
+        save_id = uuid.uuid4().hex
+        requests = []
+
+        for flight in flights:
+            route_filter = {field: flight.get(field) for field in FLIGHT_ROUTE_KEY}
+            fields = {
+                field: value for field, value in flight.items()
+                if field not in FLIGHT_ROUTE_KEY and field not in ("_id", "search_id", "is_new")
+            }
+            new_fields = {
+                "search_id": flight["search_id"],
+                "is_new": True,
+                "notified_price": flight["price"],
+                "save_id": save_id,
+            }
+            threshold = get_drop_threshold(flight["price"], min_drop_amount, min_drop_percent)
+
+            requests.append(UpdateOne(
+                dict(route_filter, notified_price={"$gt": flight["price"], "$gte": threshold}),
+                {"$set": dict(fields, **new_fields)},
+            ))
+            requests.append(UpdateOne(
+                route_filter, {"$set": fields, "$setOnInsert": new_fields}, upsert=True))
+
+        try:
+            self.flights.bulk_write(requests, ordered=False)
+        except BulkWriteError as e:
+            if e.details.get("writeConcernErrors") or any(
+                    error["code"] != DUPLICATE_KEY_ERROR_CODE
+                    for error in e.details.get("writeErrors", [])):
+                raise
+
+        return list(self.flights.find({
+            "destination": {"$in": list({flight["destination"] for flight in flights})},
+            "save_id": save_id,
+        }))
+
+    def find_flights(self, filter_query=None):
+        return list(self.flights.find(filter_query or {}))
+
+    def claim_new_flights(self, search_id):
+        """Claims all new flights of the search by one update with a unique claim id
+        and then reads them by the claim id with one query. Each document is updated
+        atomically, so concurrent callers never get the same flight.
+        """
+
+        claim_id = uuid.uuid4().hex
+
+        claim_result = self.flights.update_many(
+            {"search_id": search_id, "is_new": True},
+            {"$set": {"is_new": False, "claim_id": claim_id, "claimed_at": datetime.now()}})
+
+        if not claim_result.modified_count:
+            return []
+
+        return list(self.flights.find({"claim_id": claim_id}))
+
+    def expire_flights(self, now=None):
+        """Does nothing, flights are expired by MongoDB with TTL index."""
+
+        return 0
+
+    def record_prices(self, observations):
+        """Updates price history of all routes with one unordered bulk request,
+        histories of new routes are created by upserts.
+        """
+
+        if not observations:
+            return
+
+        requests = []
+        for observation in observations:
+            price = observation["price"]
+            requests.append(UpdateOne(
+                {field: observation[field] for field in ROUTE_KEY},
+                {
+                    "$min": {"min_price": price},
+                    "$inc": {"observations": 1, f"histogram.{price - price % PRICE_STEP}": 1},
+                    "$set": {
+                        "last_price": price,
+                        "last_observed_at": observation["observed_at"],
+                    },
+                    "$setOnInsert": {"first_observed_at": observation["observed_at"]},
+                },
+                upsert=True,
+            ))
+
+        self.prices.bulk_write(requests, ordered=False)
+
+    def get_price_history(self, route):
+        return self.prices.find_one({field: route.get(field) for field in ROUTE_KEY})
+
+    def add_requests(self, name, day, number=1):
+        """Increments the counter of the day atomically, it is created by upsert,
+        "_id" is made of name and day, so no other unique index is needed.
+        """
+
+        counter = self.requests.find_one_and_update(
+            {"_id": f"{name}:{day}"},
+            {"$inc": {"spent": number}, "$setOnInsert": {"name": name, "day": day}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return counter["spent"]
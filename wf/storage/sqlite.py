@@ -0,0 +1,304 @@
+"""SQLite storage of searches, flights and price history, made to run cycles offline."""
+
+import json
+import sqlite3
+import threading
+import uuid
+
+from datetime import datetime, timedelta
+
+from wf.storage.base import (
+    DuplicateSearchError, FLIGHT_ROUTE_KEY, FLIGHT_TTL, FLIGHT_UNIQUE_KEY, ROUTE_KEY, Storage,
+    add_price, check_price_drop, is_price_drop,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    is_active INTEGER NOT NULL,
+    document TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS flights (
+    id TEXT PRIMARY KEY,
+    search_id TEXT,
+    destination TEXT,
+    price INTEGER,
+    departure_date TEXT,
+    arrival_date TEXT,
+    added_at TEXT NOT NULL,
+    is_new INTEGER NOT NULL,
+    claim_id TEXT,
+    claimed_at TEXT,
+    document TEXT NOT NULL,
+    UNIQUE (destination, price, departure_date, arrival_date)
+);
+CREATE INDEX IF NOT EXISTS flights_new ON flights (search_id) WHERE is_new = 1;
+CREATE INDEX IF NOT EXISTS flights_claim_id ON flights (claim_id) WHERE claim_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS flights_added_at ON flights (added_at);
+CREATE INDEX IF NOT EXISTS flights_route ON flights (destination, departure_date, arrival_date);
+CREATE TABLE IF NOT EXISTS prices (
+    id TEXT PRIMARY KEY,
+    origin TEXT,
+    destination TEXT,
+    departure_date TEXT,
+    arrival_date TEXT,
+    document TEXT NOT NULL,
+    UNIQUE (origin, destination, departure_date, arrival_date)
+);
+CREATE TABLE IF NOT EXISTS requests (
+    name TEXT,
+    day TEXT,
+    spent INTEGER NOT NULL,
+    PRIMARY KEY (name, day)
+);
+"""
+
+ROUTE_CONDITION = " AND ".join(f"{field} IS ?" for field in ROUTE_KEY)
+FLIGHT_ROUTE_CONDITION = " AND ".join(f"{field} IS ?" for field in FLIGHT_ROUTE_KEY)
+
+
+def _encode(value):
+    """Encodes values, which are not JSON serializable."""
+
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    return str(value)
+
+
+def _decode(value):
+    """Decodes values encoded by _encode()."""
+
+    if list(value) == ["$date"]:
+        return datetime.fromisoformat(value["$date"])
+    return value
+
+
+def _format_datetime(value):
+    """Formats datetime to be compared as a string."""
+
+    return value.isoformat(timespec='microseconds')
+
+
+def _dumps(document):
+    return json.dumps(document, default=_encode, ensure_ascii=False)
+
+
+def _loads(document):
+    return json.loads(document, object_hook=_decode)
+
+
+class SqliteStorage(Storage):
+    """Storage in SQLite database at given path, ":memory:" for in-memory database.
+    Documents are stored as JSON, fields needed for queries are stored in columns.
+    Only equality of "_id", "search_id", "is_new", "claim_id" and FLIGHT_UNIQUE_KEY fields
+    is supported by find_flights().
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.initiate()
+
+    def __repr__(self):
+        return f"SqliteStorage({self.path})"
+
+    def initiate(self):
+        with self.__lock, self.__connection:
+            self.__connection.executescript(SCHEMA)
+
+    def add_search(self, search):
+        search.setdefault("_id", uuid.uuid4().hex)
+
+        with self.__lock, self.__connection:
+            try:
+                self.__connection.execute(
+                    "INSERT INTO searches (id, name, is_active, document) VALUES (?, ?, ?, ?)",
+                    (str(search["_id"]), search["name"], search.get("is_active") is True,
+                     _dumps(search)))
+            except sqlite3.IntegrityError as e:
+                raise DuplicateSearchError(f"Search '{search['name']}' already exists") from e
+
+    def remove_search(self, name):
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM searches WHERE name = ?", (name,))
+
+    def get_searches(self, active_only=False):
+        query = "SELECT document FROM searches"
+        if active_only:
+            query += " WHERE is_active = 1"
+        query += " ORDER BY rowid"
+
+        with self.__lock:
+            rows = self.__connection.execute(query).fetchall()
+
+        return [_loads(document) for document, in rows]
+
+    def insert_unique_flights(self, flights):
+        inserted_flights = []
+
+        with self.__lock, self.__connection:
+            for flight in flights:
+                flight.setdefault("_id", uuid.uuid4().hex)
+                cursor = self.__connection.execute(
+                    "INSERT OR IGNORE INTO flights (id, search_id, destination, price, "
+                    "departure_date, arrival_date, added_at, is_new, document) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (str(flight["_id"]), str(flight["search_id"]),
+                     *(flight.get(field) for field in FLIGHT_UNIQUE_KEY),
+                     _format_datetime(flight["added_at"]), bool(flight.get("is_new")),
+                     _dumps(flight)))
+                if cursor.rowcount:
+                    inserted_flights.append(flight)
+
+        return inserted_flights
+
+    def upsert_route_flights(self, flights, min_drop_amount=0, min_drop_percent=0):
+        check_price_drop(min_drop_amount, min_drop_percent)
+        new_flights = []
+
+        with self.__lock, self.__connection:
+            for flight in flights:
+                row = self.__connection.execute(
+                    f"SELECT id, document FROM flights WHERE {FLIGHT_ROUTE_CONDITION}",
+                    [flight.get(field) for field in FLIGHT_ROUTE_KEY]).fetchone()
+
+                if row is None:
+                    flight.setdefault("_id", uuid.uuid4().hex)
+                    flight["notified_price"] = flight["price"]
+                    self.__connection.execute(
+                        "INSERT INTO flights (id, search_id, destination, price, "
+                        "departure_date, arrival_date, added_at, is_new, document) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)",
+                        (str(flight["_id"]), str(flight["search_id"]),
+                         *(flight.get(field) for field in FLIGHT_UNIQUE_KEY),
+                         _format_datetime(flight["added_at"]), _dumps(flight)))
+                    new_flights.append(dict(flight, is_new=True))
+                    continue
+
+                flight_id, document = row
+                stored_flight = _loads(document)
+                is_new = is_price_drop(stored_flight["notified_price"], flight["price"],
+                                       min_drop_amount, min_drop_percent)
+                if is_new:
+                    stored_flight.update(
+                        {field: value for field, value in flight.items() if field != "_id"},
+                        notified_price=flight["price"],
+                    )
+                else:
+                    stored_flight.update(
+                        (field, value) for field, value in flight.items()
+                        if field not in ("_id", "search_id", "is_new"))
+
+                # is_new and claim fields of the document are kept in columns, see _load_flight()
+                self.__connection.execute(
+                    "UPDATE flights SET search_id = ?, price = ?, added_at = ?, "
+                    "is_new = is_new OR ?, document = ? WHERE id = ?",
+                    (str(stored_flight["search_id"]), stored_flight["price"],
+                     _format_datetime(stored_flight["added_at"]), is_new,
+                     _dumps(stored_flight), flight_id))
+                if is_new:
+                    new_flights.append(dict(stored_flight, is_new=True))
+
+        return new_flights
+
+    def find_flights(self, filter_query=None):
+        columns = {
+            "_id": "id", "search_id": "search_id", "is_new": "is_new", "claim_id": "claim_id",
+        }
+        columns.update((field, field) for field in FLIGHT_UNIQUE_KEY)
+
+        conditions = []
+        values = []
+        for field, value in (filter_query or {}).items():
+            if field not in columns:
+                raise ValueError(f"Filtering flights by '{field}' is not supported.")
+            conditions.append(f"{columns[field]} = ?")
+            values.append(str(value) if field in ("_id", "search_id") else value)
+
+        query = "SELECT document, is_new, claim_id, claimed_at FROM flights"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY rowid"
+
+        with self.__lock:
+            rows = self.__connection.execute(query, values).fetchall()
+
+        return [self._load_flight(row) for row in rows]
+
+    def claim_new_flights(self, search_id):
+        claim_id = uuid.uuid4().hex
+
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "UPDATE flights SET is_new = 0, claim_id = ?, claimed_at = ? "
+                "WHERE search_id = ? AND is_new = 1",
+                (claim_id, _format_datetime(datetime.now()), str(search_id)))
+            rows = self.__connection.execute(
+                "SELECT document, is_new, claim_id, claimed_at FROM flights "
+                "WHERE claim_id = ? ORDER BY rowid",
+                (claim_id,)).fetchall()
+
+        return [self._load_flight(row) for row in rows]
+
+    def expire_flights(self, now=None):
+        expire_before = (now or datetime.now()) - timedelta(seconds=FLIGHT_TTL)
+
+        with self.__lock, self.__connection:
+            cursor = self.__connection.execute(
+                "DELETE FROM flights WHERE added_at < ?", (_format_datetime(expire_before),))
+
+        return cursor.rowcount
+
+    @staticmethod
+    def _load_flight(row):
+        """Returns flight document from a row of document, is_new, claim_id and claimed_at,
+        since those columns are updated instead of the document.
+        """
+
+        document, is_new, claim_id, claimed_at = row
+
+        flight = _loads(document)
+        flight["is_new"] = bool(is_new)
+        if claim_id is not None:
+            flight["claim_id"] = claim_id
+            flight["claimed_at"] = datetime.fromisoformat(claimed_at)
+
+        return flight
+
+    def record_prices(self, observations):
+        with self.__lock, self.__connection:
+            for observation in observations:
+                route_values = [observation[field] for field in ROUTE_KEY]
+                row = self.__connection.execute(
+                    f"SELECT document FROM prices WHERE {ROUTE_CONDITION}",
+                    route_values).fetchone()
+
+                history = add_price(_loads(row[0]) if row else None, observation)
+                history.setdefault("_id", uuid.uuid4().hex)
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO prices "
+                    "(id, origin, destination, departure_date, arrival_date, document) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (history["_id"], *route_values, _dumps(history)))
+
+    def get_price_history(self, route):
+        with self.__lock:
+            row = self.__connection.execute(
+                f"SELECT document FROM prices WHERE {ROUTE_CONDITION}",
+                [route.get(field) for field in ROUTE_KEY]).fetchone()
+
+        return _loads(row[0]) if row else None
+
+    def add_requests(self, name, day, number=1):
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR IGNORE INTO requests (name, day, spent) VALUES (?, ?, 0)", (name, day))
+            self.__connection.execute(
+                "UPDATE requests SET spent = spent + ? WHERE name = ? AND day = ?",
+                (number, name, day))
+            row = self.__connection.execute(
+                "SELECT spent FROM requests WHERE name = ? AND day = ?", (name, day)).fetchone()
+
+        return row[0]
@@ -0,0 +1,20 @@
+"""Fixtures shared by all tests."""
+
+import pytest
+
+import wf.storage
+
+from wf.storage.memory import MemoryStorage
+
+
+@pytest.fixture(autouse=True)
+def storage_backend():
+    """Sets in-memory storage backend for the test, restores the previous one after it."""
+
+    previous_backend = wf.storage._backend
+    backend = MemoryStorage()
+    wf.storage.set_backend(backend)
+
+    yield backend
+
+    wf.storage.set_backend(previous_backend)
@@ -0,0 +1,93 @@
+"""Tests for batch module."""
+
+import mock
+import random
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from freezegun import freeze_time
+
+import wf.batch
+import wf.flights
+import wf.utils
+
+numpy = pytest.importorskip("numpy")
+
+
+def mock_flights(number):
+    """Returns random raw flights from Travelpayouts, some of them are malformed."""
+
+    rand = random.Random(42)
+    flights = []
+    for _ in range(number):
+        departure_date = datetime(2019, 11, 1) + timedelta(days=rand.randint(0, 60))
+        arrival_date = departure_date + timedelta(days=rand.randint(0, 10))
+        found_at = datetime(2019, 11, 3, 12) - timedelta(minutes=rand.randint(0, 720))
+        flights.append({
+            "value": rand.randint(1000, 30000),
+            "origin": "MOW",
+            "destination": rand.choice(["LIS", "OPO", "FAO"]),
+            "depart_date": str(departure_date.date()),
+            "return_date": str(arrival_date.date()),
+            "found_at": found_at.isoformat(),
+        })
+
+    flights[0]["return_date"] = "2019-13-01"
+    return flights
+
+
+@freeze_time("2019-11-3 12:00:00")
+def test_filter():
+    """Tests that FlightBatch.filter() selects the same flights as filtering one by one."""
+
+    flights = mock_flights(2000)
+    date_pairs = wf.utils.DatePairsRule(
+        departure_date="2019-11-05", arrival_date="2019-12-20", on_weekends=True)
+    found_since = datetime(2019, 11, 3, 6)
+
+    expected_flights = [
+        flight for flight in flights
+        if flight["value"] <= 15000 and
+        flight["destination"] != "FAO" and
+        wf.utils.parse_found_at(flight["found_at"]) >= found_since and
+        (flight["depart_date"], flight["return_date"]) in date_pairs
+    ]
+
+    batch = wf.batch.FlightBatch(flights)
+    mask = batch.filter(date_pairs, 15000, found_since, {"FAO"})
+
+    assert expected_flights
+    assert batch.select(mask) == expected_flights
+
+
+@freeze_time("2019-11-3 12:00:00")
+def test_filter_flights_with_batch():
+    """Tests that filter_flights() gives the same result for a list and a batch of flights."""
+
+    flights = mock_flights(300)
+    date_pairs = wf.utils.get_date_pairs(departure_date="2019-11-05", arrival_date="2019-12-20")
+    now = datetime(2019, 11, 3, 12)
+
+    small_flights = wf.flights.filter_flights(
+        flights[:100], date_pairs, 10000, unwilling_destinations=["OPO"], now=now)
+    batch_flights = wf.flights.filter_flights(
+        wf.batch.FlightBatch(flights[:100]), date_pairs, 10000,
+        unwilling_destinations=["OPO"], now=now)
+
+    assert small_flights == batch_flights
+    assert len(wf.flights.filter_flights(flights, date_pairs, 0, now=now)) == 0
+
+
+@freeze_time("2019-11-3 12:00:00")
+@mock.patch('wf.batch.make_batch')
+def test_filter_flights_does_not_batch_lists(mocked_make_batch):
+    """Tests that filter_flights() checks large lists one by one, without making a batch."""
+
+    flights = mock_flights(300)
+    date_pairs = wf.utils.get_date_pairs(departure_date="2019-11-05", arrival_date="2019-12-20")
+
+    wf.flights.filter_flights(flights, date_pairs, 10000, now=datetime(2019, 11, 3, 12))
+
+    assert not mocked_make_batch.called
@@ -0,0 +1,67 @@
+"""Tests for cache module."""
+
+from freezegun import freeze_time
+
+import wf.cache
+
+
+def test_ttl_cache_expiration():
+    """Tests that entries expire in ttl seconds."""
+
+    cache = wf.cache.TTLCache(ttl=60, maxsize=10)
+
+    with freeze_time("2019-11-3 12:00:00") as frozen_time:
+        cache.set(("MOW", "OPO"), [1, 2])
+        assert cache.get(("MOW", "OPO")) == [1, 2]
+
+        frozen_time.tick(61)
+        assert cache.get(("MOW", "OPO")) is None
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_cache_eviction():
+    """Tests that the least recently used entries are evicted."""
+
+    cache = wf.cache.TTLCache(ttl=60, maxsize=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_storage(tmp_path):
+    """Tests that stored entries are available in a new cache with the same path."""
+
+    path = str(tmp_path / "cache.sqlite")
+
+    cache = wf.cache.TTLCache(ttl=60, maxsize=10, path=path)
+    cache.set(("MOW", "OPO", "2019-11-01", "month"), [{"value": 4200}])
+
+    restarted_cache = wf.cache.TTLCache(ttl=60, maxsize=10, path=path)
+    assert restarted_cache.get(("MOW", "OPO", "2019-11-01", "month")) == [{"value": 4200}]
+
+
+def test_ttl_cache_weight(tmp_path):
+    """Tests that total weight of values in memory is limited
+    and evicted entries are still available from the database.
+    """
+    cache = wf.cache.TTLCache(ttl=60, maxsize=10, maxweight=3, path=str(tmp_path / "cache.sqlite"))
+
+    cache.set("a", [1, 2])
+    cache.set("b", [3, 4])
+    assert (len(cache), cache.weight) == (1, 2)
+
+    cache.set("c", [5, 6, 7, 8])  # heavier than maxweight, stored only in the database
+    assert (len(cache), cache.weight) == (1, 2)
+
+    assert "a" in cache
+    assert cache.get("a") == [1, 2]
+    assert cache.get("c") == [5, 6, 7, 8]
+    assert cache.weight <= 3
@@ -1 +1,95 @@
 """Tests for db module."""
+
+import mock
+import pymongo.collection
+
+import wf.db
+
+
+@mock.patch('wf.db.MongoClient')
+def test_get_client(mocked_mongo_client):
+    """Tests that one client is created for the process."""
+
+    wf.db.close_client()
+
+    client = wf.db.get_client()
+    assert wf.db.get_client() is client
+    assert mocked_mongo_client.call_count == 1
+    assert mocked_mongo_client.call_args.kwargs['maxPoolSize'] == wf.db.DB_MAX_POOL_SIZE
+
+    wf.db.close_client()
+    client.close.assert_called_once_with()
+
+
+@mock.patch('wf.db.MongoClient')
+def test_get_database(mocked_mongo_client):
+    """Tests that database and collection wrappers are cached."""
+
+    wf.db.close_client()
+    mocked_database = mocked_mongo_client.return_value.__getitem__.return_value
+    mocked_database.flights = mock.Mock(spec=pymongo.collection.Collection)
+
+    database = wf.db.get_database("wf")
+    assert wf.db.get_database("wf") is database
+    assert isinstance(database.flights, wf.db.Collection)
+    assert database.flights is database.flights
+
+    wf.db.close_client()
+
+
+def test_get_pool_stats():
+    """Tests that pool events are counted."""
+
+    wf.db.POOL_STATS.reset()
+    event = mock.Mock()
+
+    wf.db.POOL_STATS.connection_created(event)
+    wf.db.POOL_STATS.connection_created(event)
+    wf.db.POOL_STATS.connection_closed(event)
+    wf.db.POOL_STATS.connection_checked_out(event)
+    wf.db.POOL_STATS.connection_checked_out(event)
+    wf.db.POOL_STATS.connection_checked_in(event)
+
+    stats = wf.db.get_pool_stats()
+    assert stats["connections_open"] == 1
+    assert stats["connections_in_use"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["max_pool_size"] == wf.db.DB_MAX_POOL_SIZE
+
+
+@mock.patch('wf.db.get_database')
+def test_create_indexes(mocked_get_database):
+    """Tests that every index of the registry is created."""
+
+    wf.db.create_indexes()
+
+    mocked_db = mocked_get_database.return_value
+    created_indexes = (
+        mocked_db.flights.create_index.call_args_list +
+        mocked_db.searches.create_index.call_args_list +
+        mocked_db.prices.create_index.call_args_list
+    )
+    assert len(created_indexes) == len(wf.db.INDEXES)
+    assert mock.call(
+        [("search_id", 1), ("is_new", 1)],
+        partialFilterExpression={"is_new": True},
+    ) in created_indexes
+
+
+@mock.patch('wf.db.get_database')
+def test_verify_query_plans(mocked_get_database):
+    """Tests that queries scanning whole collection are reported."""
+
+    index_plan = {"queryPlanner": {"winningPlan": {
+        "stage": "FETCH", "inputStage": {"stage": "IXSCAN", "indexName": "name_1"}}}}
+    collscan_plan = {"queryPlanner": {"winningPlan": {
+        "stage": "SUBPLAN", "inputStages": [{"stage": "COLLSCAN"}]}}}
+
+    mocked_db = mocked_get_database.return_value
+    mocked_db.flights.find.return_value.explain.return_value = index_plan
+    mocked_db.searches.find.return_value.explain.return_value = collscan_plan
+
+    collscan_shapes = wf.db.verify_query_plans()
+
+    assert collscan_shapes == [
+        shape for shape in wf.db.QUERY_SHAPES if shape["collection"] == "searches"]
@@ -3,6 +3,10 @@
 import mock
 import os
 import datetime
+import subprocess
+import sys
+
+import pytest
 
 from freezegun import freeze_time
 
@@ -28,13 +32,16 @@ def mock_requests_get(*args, **kwargs):
         def __init__(self, *args, **kwargs):
             self.json_data = {'data': {'key': 'value'}}
 
+        def raise_for_status(self):
+            pass
+
         def json(self):
             return self.json_data
 
     return MockResponse()
 
 
-@mock.patch('requests.get', side_effect=mock_requests_get)
+@mock.patch('wf.transport.get', side_effect=mock_requests_get)
 def test_get_latest(mocked_requests_get):
     """Tests get_latest() function.
 
@@ -44,8 +51,9 @@ def test_get_latest(mocked_requests_get):
 
     This answer explained a lot: https://stackoverflow.com/a/28507806.
     """
+    wf.flights.PAGES_CACHE.clear()
     mocked_destination_codes, mocked_months = mock_search_conditions()
-    wf.flights.get_latest(mocked_destination_codes, mocked_months)
+    wf.flights.get_latest(mocked_destination_codes, mocked_months, workers=1)
     assert mocked_requests_get.call_count == len(mocked_destination_codes) * len(mocked_months)
 
     TRAVELPAYOUTS_TOKEN = os.environ['TRAVELPAYOUTS_TOKEN']
@@ -61,10 +69,77 @@ def test_get_latest(mocked_requests_get):
             'period_type': 'month',
             'limit': 1000,
             'show_to_affiliates': False,
-        }) for destination_code in mocked_destination_codes for month in mocked_months]
+        },
+        limiter=wf.flights.TRAVELPAYOUTS_LIMITER,
+    ) for destination_code in mocked_destination_codes for month in mocked_months]
     assert mocked_requests_get.call_args_list == expected_args
 
 
+def mock_requests_get_by_destination(*args, **kwargs):
+    """Mocks requests.get() function, returning destination and month as data.
+    Requests to 'ERR' destination fail.
+    """
+    params = kwargs['params']
+    if params['destination'] == 'ERR':
+        raise ConnectionError('connection refused')
+
+    response = mock.Mock()
+    response.json.return_value = {
+        'data': [(params['destination'], params['beginning_of_period'])]
+    }
+    return response
+
+
+def test_get_pages():
+    """Tests get_pages() function: repeated pages are requested once in the first order."""
+    destination_codes = ['OPO', 'LIS', 'OPO']
+    months = {
+        'november': '2019-11-01',
+        'december': '2019-12-01',
+        'next_november': '2019-11-01',
+    }
+
+    pages = wf.flights.get_pages(destination_codes, months)
+
+    assert pages == [
+        ('MOW', 'OPO', '2019-11-01'), ('MOW', 'LIS', '2019-11-01'),
+        ('MOW', 'OPO', '2019-12-01'), ('MOW', 'LIS', '2019-12-01'),
+    ]
+
+
+@mock.patch('wf.transport.get', side_effect=mock_requests_get_by_destination)
+def test_get_latest_concurrently(mocked_requests_get):
+    """Tests get_latest() function with several workers.
+
+    Flights should be returned in the same order as with serial requests,
+    and every request, including failed one, should be reported.
+    """
+    destination_codes = ['OPO', 'ERR', 'LIS']
+    months = {
+        'november': '2019-11-01',
+        'december': '2019-12-01',
+    }
+    report = []
+
+    wf.flights.PAGES_CACHE.clear()
+    flights = wf.flights.get_latest(destination_codes, months, workers=4, report=report)
+
+    assert flights == [
+        ('OPO', '2019-11-01'), ('LIS', '2019-11-01'),
+        ('OPO', '2019-12-01'), ('LIS', '2019-12-01'),
+    ]
+    assert mocked_requests_get.call_count == 6
+    assert len(report) == 6
+    assert [record['destination'] for record in report if record['error']] == ['ERR', 'ERR']
+    assert all(record['latency'] is not None for record in report)
+
+    # successful pages are taken from cache the second time
+    report = []
+    wf.flights.get_latest(destination_codes, months, workers=4, report=report)
+    assert mocked_requests_get.call_count == 8
+    assert [record['cached'] for record in report] == [True, False, True] * 2
+
+
 def mocked_get_latest():
     """Mocks get_lastest() function."""
 
@@ -213,6 +288,23 @@ def test_filter_flights():
     assert filtered_flights == expected_result
 
 
+def test_filter_flights_with_given_now():
+    """Tests that filter_flights() counts hours passed from given time."""
+
+    flights = mocked_get_latest()
+    date_pairs = [('2019-11-12', '2019-11-26')]
+
+    filtered_flights = wf.flights.filter_flights(
+        flights, date_pairs, 17000,
+        max_hours_passed=1, now=datetime.datetime(2019, 11, 3, 10, 37, 26))
+    assert filtered_flights == flights[:1]
+
+    filtered_flights = wf.flights.filter_flights(
+        flights, date_pairs, 17000,
+        max_hours_passed=1, now=datetime.datetime(2019, 11, 3, 10, 37, 27))
+    assert filtered_flights == []
+
+
 def mock_flights():
     return [
         {
@@ -258,3 +350,91 @@ def test_format_flights():
     ]
 
     assert expected_result == formatted_flights
+    assert formatted_flights[0].to_document(is_new=True) == dict(expected_result[0], is_new=True)
+
+
+def test_flight():
+    """Tests Flight record: it is compact and derived fields are computed on access."""
+
+    flight = wf.flights.Flight.from_raw(mock_flights()[0])
+
+    assert not hasattr(flight, '__dict__')
+    assert flight['destination'] == 'Porto' and flight.destination_code == 'OPO'
+    assert flight.get('search_id') is None
+    with pytest.raises(KeyError):
+        flight['search_id']
+
+
+def test_save_unique_flights():
+    """Tests save_unique_flights() function.
+
+    Flights should be inserted in batches and only unique flights should be returned.
+    """
+    flights = [
+        {'origin': 'Moscow', 'destination': 'Porto', 'price': price,
+         'departure_date': '2019-11-12', 'arrival_date': '2019-11-26'}
+        for price in (4200, 4300, 4200)
+    ]
+
+    unique_flights = wf.flights.save_unique_flights('search_id', flights, batch_size=2)
+
+    assert [flight['price'] for flight in unique_flights] == [4200, 4300]
+    assert all(flight['search_id'] == 'search_id' and flight['is_new']
+               for flight in unique_flights)
+    assert all('search_id' not in flight for flight in flights)
+    assert len(wf.flights.get_all({'search_id': 'search_id'})) == 2
+
+
+@mock.patch('wf.storage.base.DEDUP_MODE', 'route')
+def test_save_unique_flights_by_route():
+    """Tests save_unique_flights() function in "route" deduplication mode."""
+
+    flights = [
+        {'origin': 'Moscow', 'destination': 'Porto', 'price': price,
+         'departure_date': '2019-11-12', 'arrival_date': '2019-11-26'}
+        for price in (4500, 4400, 3900)
+    ]
+
+    with mock.patch('wf.flights.PRICE_DROP_AMOUNT', 500):
+        assert len(wf.flights.save_unique_flights('search_id', flights[:1])) == 1
+        assert wf.flights.save_unique_flights('search_id', flights[1:2]) == []
+        assert len(wf.flights.save_unique_flights('search_id', flights[2:])) == 1
+
+    stored_flights = wf.flights.get_all()
+    assert [(flight['price'], flight['notified_price']) for flight in stored_flights] == [
+        (3900, 3900)]
+
+
+def test_get_new_flights():
+    """Tests get_new_flights() function: new flights are returned only once."""
+
+    flights = [
+        {'origin': 'Moscow', 'destination': 'Porto', 'price': price,
+         'departure_date': '2019-11-12', 'arrival_date': '2019-11-26'}
+        for price in (4200, 4300)
+    ]
+    wf.flights.save_unique_flights('search_id', flights)
+
+    new_flights = wf.flights.get_new_flights('search_id')
+
+    assert [flight['price'] for flight in new_flights] == [4200, 4300]
+    assert not any(flight['is_new'] for flight in new_flights)
+    assert wf.flights.get_new_flights('search_id') == []
+
+
+@pytest.mark.parametrize("variable, value", [
+    ("WF_PRICE_DROP_PERCENT", "100"),
+    ("WF_PRICE_DROP_AMOUNT", "-100"),
+])
+def test_invalid_price_drop_fails_on_load(variable, value):
+    """Tests that invalid thresholds of a price drop fail import of the module."""
+
+    result = subprocess.run(
+        [sys.executable, "-c", "import wf.flights"],
+        env=dict(os.environ, **{variable: value}),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    assert result.returncode != 0
+    assert b"ValueError: Price drop" in result.stderr
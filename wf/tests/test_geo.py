@@ -0,0 +1,46 @@
+"""Tests for geo module."""
+
+import random
+
+import wf.geo
+
+
+def test_get_distance():
+    """Tests get_distance() function on Lisbon - Porto distance."""
+
+    distance = wf.geo.get_distance(38.72, -9.14, 41.15, -8.61)
+
+    assert 270 < distance < 280
+
+
+def test_find_within():
+    """Tests that GridIndex finds the same points as checking every point,
+    including points across the antimeridian and near the poles.
+    """
+    rand = random.Random(42)
+    points = [
+        (str(index), rand.uniform(-90, 90), rand.uniform(-180, 180))
+        for index in range(2000)
+    ]
+    points += [("WEST", 0.0, 179.9), ("EAST", 0.0, -179.9), ("POLE", 89.9, 10.0)]
+    index = wf.geo.GridIndex(points)
+
+    for latitude, longitude, radius in [(0, 180, 50), (89, -170, 300), (38.7, -9.1, 1500)]:
+        expected = sorted(
+            (wf.geo.get_distance(latitude, longitude, point_latitude, point_longitude), code)
+            for code, point_latitude, point_longitude in points
+            if wf.geo.get_distance(
+                latitude, longitude, point_latitude, point_longitude) <= radius
+        )
+        assert index.find_within(latitude, longitude, radius) == expected
+
+    assert {code for _, code in index.find_within(0, 180, 50)} == {"EAST", "WEST"}
+
+
+def test_get_nearby_city_codes():
+    """Tests that cities with airports near Lisbon are found, the nearest first."""
+
+    city_codes = wf.geo.get_nearby_city_codes(38.72, -9.14, 300)
+
+    assert city_codes[0] == "LIS"
+    assert "OPO" in city_codes and "MAD" not in city_codes
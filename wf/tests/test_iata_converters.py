@@ -0,0 +1,52 @@
+"""Tests for iata_converters module."""
+
+import pytest
+
+import wf.iata_converters
+
+
+def test_city_code_to_name():
+    """Tests that CITY_CODE_TO_NAME is looked up as a dict of codes."""
+
+    city_code_to_name = wf.iata_converters.CITY_CODE_TO_NAME
+
+    assert city_code_to_name['MOW'] == ('Москва', 'Moscow')
+    assert city_code_to_name['ZSG'] == (None, 'Sonneberg')
+    assert 'MOW' in city_code_to_name and 'XXX' not in city_code_to_name
+    assert city_code_to_name.get('XXX') is None
+    with pytest.raises(KeyError):
+        city_code_to_name['XXX']
+
+
+def test_write_code_table(tmp_path):
+    """Tests that written table file is read the same way as the source dict."""
+
+    table = {
+        'OPO': ('Порту', 'Porto'),
+        'LIS': ('Лиссабон', None),
+        'БАТ': ('Батуми', 'Batumi'),
+        'PT': ('', 'Portugal'),
+    }
+    path = str(tmp_path / 'table.bin')
+
+    wf.iata_converters.write_code_table(path, table)
+    code_table = wf.iata_converters.CodeTable(path)
+
+    assert dict(code_table) == table
+    assert list(code_table) == ['LIS', 'OPO', 'PT', 'БАТ']
+    assert 'OP' not in code_table and 1 not in code_table
+
+
+def test_lookups():
+    """Tests lookups of cities of airports and countries and locations."""
+
+    assert wf.iata_converters.get_city_code('SVO') == 'MOW'
+    assert wf.iata_converters.get_city_code('MOW') == 'MOW'
+    assert wf.iata_converters.get_city_code('XXX') is None
+
+    assert {'LIS', 'OPO', 'FAO'} <= set(wf.iata_converters.get_city_codes('PT'))
+    assert wf.iata_converters.get_city_codes('XX') == []
+
+    latitude, longitude, time_zone = wf.iata_converters.get_location('OPO')
+    assert (round(latitude), round(longitude), time_zone) == (41, -9, 'Europe/Lisbon')
+    assert wf.iata_converters.get_location('XXX') == (None, None, None)
@@ -0,0 +1,70 @@
+"""Tests for jobs module."""
+
+import threading
+import time
+
+import pytest
+
+import wf.jobs
+
+
+def blocking_job(runs):
+    """Returns job, which counts its runs and waits for the returned event to finish."""
+
+    release = threading.Event()
+
+    def job():
+        runs.append(1)
+        release.wait(timeout=5)
+
+    return job, release
+
+
+@pytest.mark.parametrize("policy, expected_submits, expected_runs", [
+    ("skip", [True, False, False], 1),
+    ("queue", [True, True, True], 3),
+    ("coalesce", [True, True, True], 2),
+])
+def test_job_runner_policies(policy, expected_submits, expected_runs):
+    """Tests that triggers of a running job are handled by its policy."""
+
+    runs = []
+    job, release = blocking_job(runs)
+
+    job_runner = wf.jobs.JobRunner(max_workers=2)
+    job_runner.add("job", job, policy=policy)
+
+    submits = [job_runner.submit("job") for _ in range(3)]
+    release.set()
+    job_runner.shutdown()
+
+    assert submits == expected_submits
+    assert len(runs) == expected_runs
+    assert len(job_runner.get_history("job")) == expected_runs
+
+
+def test_job_runner_history():
+    """Tests that failures and overdue runs are recorded."""
+
+    def failing_job():
+        time.sleep(0.01)
+        raise RuntimeError("failure")
+
+    job_runner = wf.jobs.JobRunner()
+    job_runner.add("failing", failing_job, deadline=0)
+
+    job_runner.submit("failing")
+    job_runner.shutdown()
+
+    history = job_runner.get_history("failing")
+    assert len(history) == 1
+    assert history[0]["error"] == "RuntimeError('failure')"
+    assert history[0]["overdue"]
+    assert history[0]["duration"] >= 0
+
+
+def test_job_runner_unknown_policy():
+    """Tests that only known policies are accepted."""
+
+    with pytest.raises(ValueError):
+        wf.jobs.JobRunner().add("job", print, policy="parallel")
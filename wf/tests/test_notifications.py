@@ -35,7 +35,7 @@ def mock_found_tickets_list():
     return [flight1, flight2]
 
 
-@mock.patch('requests.post', side_effect=mock.Mock())
+@mock.patch('wf.transport.post', side_effect=mock.Mock())
 def test_send_found_len_by_ifttt(mocked_requests_post):
     """Tests send_found_len_by_ifttt function."""
 
@@ -0,0 +1,194 @@
+"""Tests for pipeline module."""
+
+import gc
+import mock
+import weakref
+
+from freezegun import freeze_time
+
+import wf.cache
+import wf.flights
+import wf.pipeline
+import wf.planner
+import wf.prices
+
+
+def mock_searches():
+    """Returns mocked searches to Lisbon in December."""
+
+    return [
+        {
+            "_id": 1, "name": "Lisbon in december", "max_price": 20000,
+            "destinations": ["LIS"],
+            "trip_type": "vacation",
+            "departure_date": "2019-12-20", "arrival_date": "2020-01-08",
+            "trip_min_length": 7, "trip_max_length": 14,
+        },
+        {
+            "_id": 2, "name": "Cheap Lisbon in december", "max_price": 5000,
+            "destinations": ["LIS"],
+            "trip_type": "vacation",
+            "departure_date": "2019-12-20", "arrival_date": "2020-01-08",
+            "trip_min_length": 7, "trip_max_length": 14,
+        },
+    ]
+
+
+def mock_latest_page(destination_code, beginning_of_period, origin):
+    """Returns mocked page of latest flights with one flight in December."""
+
+    flights_data = []
+    if beginning_of_period == "2019-12-01":
+        flights_data.append({
+            "value": 4000, "origin": origin, "destination": destination_code,
+            "depart_date": "2019-12-21", "return_date": "2019-12-29",
+            "found_at": "2019-11-03T10:00:00",
+        })
+    return flights_data, {"cached": False}
+
+
+@freeze_time("2019-11-3 12:00:00")
+@mock.patch('wf.flights.save_unique_flights', side_effect=lambda search_id, flights: flights)
+@mock.patch('wf.flights.fetch_latest_page', side_effect=mock_latest_page)
+def test_run(mocked_fetch_latest_page, mocked_save_unique_flights):
+    """Tests Pipeline.run() method: fetched pages are evaluated and saved for every search."""
+
+    plan = wf.planner.make_plan(mock_searches())
+    pipeline = wf.pipeline.Pipeline(plan)
+
+    reports = pipeline.run(wf.planner.schedule(plan), workers=2, queue_size=1)
+
+    assert mocked_fetch_latest_page.call_count == 2
+    assert mocked_save_unique_flights.call_count == 2
+    assert [(report["name"], report["latest"], report["filtered"], report["saved"])
+            for report in reports] == [
+        ("Lisbon in december", 1, 1, 1),
+        ("Cheap Lisbon in december", 1, 1, 1),
+    ]
+    assert all(report["error"] is None for report in reports)
+
+
+@freeze_time("2019-11-3 12:00:00")
+@mock.patch('wf.flights.save_unique_flights')
+@mock.patch('wf.flights.fetch_latest_page', side_effect=mock_latest_page)
+def test_run_isolates_failed_search(mocked_fetch_latest_page, mocked_save_unique_flights):
+    """Tests that failure of one search is reported with partial results
+    and doesn't affect other searches.
+    """
+    def save_unique_flights(search_id, flights):
+        if search_id == 1:
+            raise RuntimeError("Storage is down")
+        return flights
+
+    mocked_save_unique_flights.side_effect = save_unique_flights
+
+    plan = wf.planner.make_plan(mock_searches())
+    reports = wf.pipeline.Pipeline(plan).run(wf.planner.schedule(plan))
+
+    assert (reports[0]["filtered"], reports[0]["saved"]) == (1, 0)
+    assert reports[0]["error"] == "RuntimeError('Storage is down')"
+    assert (reports[1]["filtered"], reports[1]["saved"]) == (1, 1)
+    assert reports[1]["error"] is None
+
+
+@freeze_time("2019-11-3 12:00:00")
+@mock.patch('wf.flights.save_unique_flights', side_effect=lambda search_id, flights: flights)
+@mock.patch('wf.flights.fetch_latest_page')
+def test_run_records_prices_once(mocked_fetch_latest_page, mocked_save_unique_flights):
+    """Tests that prices of a fetched page are recorded once for all searches,
+    including prices above max price of searches, and cached pages are not recorded again.
+    """
+    def fetch_latest_page(destination_code, beginning_of_period, origin):
+        flights_data, record = mock_latest_page(destination_code, beginning_of_period, origin)
+        flights_data += [dict(flight, value=30017) for flight in flights_data]
+        return flights_data, record
+
+    mocked_fetch_latest_page.side_effect = fetch_latest_page
+
+    plan = wf.planner.make_plan(mock_searches())
+    wf.pipeline.Pipeline(plan).run(wf.planner.schedule(plan))
+
+    route = {
+        "origin": "Moscow", "destination": "Lisbon",
+        "departure_date": "2019-12-21", "arrival_date": "2019-12-29",
+    }
+    assert wf.prices.get_stats(route) == {
+        "min_price": 4000, "median_price": 4000, "last_price": 4000, "observations": 1,
+    }
+
+    mocked_fetch_latest_page.side_effect = lambda *args, **kwargs: (
+        fetch_latest_page(*args, **kwargs)[0], {"cached": True})
+    wf.pipeline.Pipeline(plan).run(wf.planner.schedule(plan))
+
+    assert wf.prices.get_stats(route)["observations"] == 1
+
+
+@freeze_time("2019-11-3 12:00:00")
+@mock.patch('wf.prices.record', side_effect=RuntimeError("Storage is down"))
+@mock.patch('wf.flights.save_unique_flights', side_effect=lambda search_id, flights: flights)
+@mock.patch('wf.flights.fetch_latest_page', side_effect=mock_latest_page)
+def test_run_isolates_failed_prices(mocked_fetch_latest_page, mocked_save_unique_flights,
+                                    mocked_record):
+    """Tests that failure of recording prices doesn't affect saving of flights."""
+
+    plan = wf.planner.make_plan(mock_searches())
+    reports = wf.pipeline.Pipeline(plan).run(wf.planner.schedule(plan))
+
+    mocked_record.assert_called_once()
+    assert [report["saved"] for report in reports] == [1, 1]
+    assert all(report["error"] is None for report in reports)
+
+
+@freeze_time("2019-11-3 12:00:00")
+@mock.patch('wf.pipeline.BATCH_MIN_SIZE', 1)
+@mock.patch('wf.batch.make_batch', side_effect=lambda flights_data: flights_data)
+def test_evaluate_page_batches_shared_pages(mocked_make_batch):
+    """Tests that a page is converted to a batch only, if several searches need it."""
+
+    plan = wf.planner.make_plan(mock_searches())
+    pipeline = wf.pipeline.Pipeline(plan)
+    page = ("MOW", "LIS", "2019-12-01")
+    flights_data, _ = mock_latest_page("LIS", "2019-12-01", "MOW")
+
+    pipeline.evaluate_page(page, flights_data)
+    mocked_make_batch.assert_called_once_with(flights_data)
+
+    plan["pages"][page] = plan["pages"][page][:1]
+    pipeline.evaluate_page(page, flights_data)
+    mocked_make_batch.assert_called_once()
+
+
+class MockPage(list):
+    """Page of flights, which can be referenced weakly."""
+
+
+@freeze_time("2019-11-3 12:00:00")
+@mock.patch('wf.flights.PAGES_CACHE', wf.cache.TTLCache(ttl=3600, maxsize=100, maxweight=1000))
+@mock.patch('wf.flights.save_unique_flights', side_effect=lambda search_id, flights: flights)
+@mock.patch('wf.transport.get')
+def test_run_releases_pages(mocked_get, mocked_save_unique_flights):
+    """Tests that pages streamed through the pipeline are not kept in memory."""
+
+    pages = []
+
+    def get(url, params, limiter):
+        flights_data, _ = mock_latest_page(
+            params["destination"], params["beginning_of_period"], params["origin"])
+        page = MockPage(flights_data * 600)
+        pages.append(weakref.ref(page))
+        return mock.Mock(json=lambda: {"data": page})
+
+    mocked_get.side_effect = get
+
+    searches = mock_searches()
+    for search in searches:
+        search["destinations"] = ["LIS", "OPO", "FAO", "PXO"]
+    plan = wf.planner.make_plan(searches)
+    wf.pipeline.Pipeline(plan).run(wf.planner.schedule(plan))
+    gc.collect()
+
+    # only pages within WF_PAGES_CACHE_ROWS are kept, empty pages weigh nothing
+    alive_pages = [page() for page in pages if page() is not None]
+    assert len(pages) == 8
+    assert sum(len(page) for page in alive_pages) <= 1000
+    assert wf.flights.PAGES_CACHE.weight <= 1000
@@ -0,0 +1,127 @@
+"""Tests for planner module."""
+
+import pytest
+
+from freezegun import freeze_time
+
+import wf.flights
+import wf.planner
+import wf.searches
+
+
+def mock_searches():
+    """Returns mocked overlapping searches."""
+
+    return [
+        {
+            "_id": 1, "name": "Porto and Lisbon on weekends", "max_price": 15000,
+            "destinations": ["OPO", "LIS"],
+            "trip_type": "weekends", "next_x_months": 3,
+        },
+        {
+            "_id": 2, "name": "Lisbon in december", "max_price": 20000,
+            "destinations": ["LIS"],
+            "trip_type": "vacation",
+            "departure_date": "2019-12-20", "arrival_date": "2020-01-08",
+            "trip_min_length": 7, "trip_max_length": 14,
+        },
+    ]
+
+
+@freeze_time("2019-11-3 12:00:00")
+def test_make_plan():
+    """Tests make_plan() function: overlapping pages are requested once."""
+
+    plan = wf.planner.make_plan(mock_searches())
+
+    assert plan["pages"] == {
+        ("MOW", "OPO", "2019-11-01"): [1],
+        ("MOW", "LIS", "2019-11-01"): [1],
+        ("MOW", "OPO", "2019-12-01"): [1],
+        ("MOW", "LIS", "2019-12-01"): [1, 2],
+        ("MOW", "OPO", "2020-01-01"): [1],
+        ("MOW", "LIS", "2020-01-01"): [1, 2],
+    }
+    assert [search_plan["search"]["_id"] for search_plan in plan["searches"]] == [1, 2]
+    assert plan["searches"][1]["pages"] == [
+        ("MOW", "LIS", "2019-12-01"),
+        ("MOW", "LIS", "2020-01-01"),
+    ]
+
+
+@freeze_time("2019-11-3 12:00:00")
+def test_make_plan_skips_malformed_search():
+    """Tests that malformed search is left out of the plan."""
+
+    searches = mock_searches()
+    searches[0]["trip_type"] = "unknown"
+
+    plan = wf.planner.make_plan(searches)
+
+    assert [search_plan["search"]["_id"] for search_plan in plan["searches"]] == [2]
+    assert list(plan["pages"]) == [("MOW", "LIS", "2019-12-01"), ("MOW", "LIS", "2020-01-01")]
+    assert plan["failures"][0]["search"]["_id"] == 1
+
+    reports = wf.planner.get_failure_reports(plan)
+    assert reports[0]["name"] == "Porto and Lisbon on weekends"
+    assert reports[0]["error"].startswith("ValueError")
+
+
+@freeze_time("2019-11-3 12:00:00")
+def test_schedule():
+    """Tests schedule() function: pages of prioritized search go first,
+    and the least important pages are dropped, if budget is not enough.
+    """
+    searches = mock_searches()
+    searches[1]["priority"] = 1
+    plan = wf.planner.make_plan(searches)
+
+    wf.flights.PAGES_CACHE.clear()
+    wf.flights.PAGES_CACHE.set(("MOW", "OPO", "2020-01-01", "month"), [])
+
+    assert wf.planner.schedule(plan, budget=3) == [
+        ("MOW", "LIS", "2019-12-01"),
+        ("MOW", "LIS", "2020-01-01"),
+        ("MOW", "OPO", "2019-11-01"),
+        ("MOW", "OPO", "2020-01-01"),  # cached, so doesn't spend the budget
+    ]
+    # every page takes two requests, if it's retried once
+    assert wf.planner.schedule(plan, budget=5, retries=1) == [
+        ("MOW", "LIS", "2019-12-01"),
+        ("MOW", "LIS", "2020-01-01"),
+        ("MOW", "OPO", "2020-01-01"),
+    ]
+    assert len(wf.planner.schedule(plan)) == 6
+
+
+@freeze_time("2019-11-3 12:00:00")
+def test_make_plan_with_nearby():
+    """Tests that cities nearby are added to destinations of the search."""
+
+    searches = mock_searches()[1:]
+    searches[0]["nearby"] = {"code": "LIS", "radius": 300}
+
+    plan = wf.planner.make_plan(searches)
+
+    destinations = {destination for _, destination, _ in plan["pages"]}
+    assert {"LIS", "OPO", "FAO"} <= destinations and "MAD" not in destinations
+
+
+def test_get_nearby_destinations_without_origin():
+    """Tests that the origin of flights is not added as a destination nearby."""
+
+    destinations = wf.searches.get_nearby_destinations(
+        {"latitude": 55.75, "longitude": 37.62, "radius": 200})
+
+    assert destinations and wf.flights.ORIGIN not in destinations
+
+
+@pytest.mark.parametrize("nearby", [
+    {"code": "LIS"},
+    {"latitude": 38.72, "radius": 300},
+])
+def test_get_nearby_destinations_malformed(nearby):
+    """Tests that malformed nearby is rejected with ValueError."""
+
+    with pytest.raises(ValueError, match="should have radius"):
+        wf.searches.get_nearby_destinations(nearby)
@@ -0,0 +1,56 @@
+"""Tests of wf.prices module."""
+
+import datetime
+
+import wf.prices
+
+
+def mock_flight(price, destination="OPO"):
+    """Returns mocked raw flight of Travelpayouts."""
+
+    return {
+        "origin": "MOW",
+        "destination": destination,
+        "depart_date": "2019-11-12",
+        "return_date": "2019-11-26",
+        "value": price,
+    }
+
+
+def mock_route(destination="Porto"):
+    """Returns route of mocked flights."""
+
+    return {
+        "origin": "Moscow",
+        "destination": destination,
+        "departure_date": "2019-11-12",
+        "arrival_date": "2019-11-26",
+    }
+
+
+def test_record():
+    """Tests that the lowest exact price of every route is recorded once."""
+
+    observed_at = datetime.datetime(2019, 11, 3, 12, 0, 0)
+
+    flights = [mock_flight(4550), mock_flight(4230), mock_flight(3900, destination="LIS")]
+    assert wf.prices.record(flights, observed_at=observed_at) == 2
+    wf.prices.record([mock_flight(4510)], observed_at=observed_at)
+
+    assert wf.prices.get_stats(mock_route()) == {
+        "min_price": 4230,
+        "median_price": 4200,
+        "last_price": 4510,
+        "observations": 2,
+    }
+    assert wf.prices.get_stats(mock_route(destination="Lisbon"))["observations"] == 1
+    assert wf.prices.get_stats(mock_route(destination="Ufa")) is None
+
+
+def test_get_median():
+    """Tests get_median() function."""
+
+    assert wf.prices.get_median({"4500": 2, "4200": 1, "9000": 1}) == 4500
+    assert wf.prices.get_median({"4500": 1, "4200": 1}) == 4200
+    assert wf.prices.get_median({"4200": 3}) == 4200
+    assert wf.prices.get_median({}) is None
@@ -0,0 +1,74 @@
+"""Tests for ratelimit module."""
+
+import mock
+import pytest
+
+from freezegun import freeze_time
+
+import wf.ratelimit
+import wf.storage
+
+
+@mock.patch('time.sleep')
+@mock.patch('time.monotonic')
+def test_token_bucket(mocked_monotonic, mocked_sleep):
+    """Tests that token bucket allows a burst and then waits for new tokens."""
+
+    mocked_monotonic.return_value = 100.0
+    bucket = wf.ratelimit.TokenBucket(rate=2, capacity=2)
+
+    def sleep(delay):
+        mocked_monotonic.return_value += delay
+
+    mocked_sleep.side_effect = sleep
+
+    bucket.acquire()
+    bucket.acquire()
+    assert not mocked_sleep.called
+
+    bucket.acquire()
+    mocked_sleep.assert_called_once_with(0.5)
+
+
+def test_rate_limiter_daily_quota():
+    """Tests that daily quota is spent and restored on the next day."""
+
+    limiter = wf.ratelimit.RateLimiter(daily_quota=2)
+
+    with freeze_time("2019-11-3 23:59:00") as frozen_time:
+        limiter.acquire()
+        limiter.acquire()
+        assert limiter.remaining() == 0
+        with pytest.raises(wf.ratelimit.QuotaExceeded):
+            limiter.acquire()
+
+        frozen_time.tick(120)
+        assert limiter.remaining() == 2
+        limiter.acquire()
+
+
+@freeze_time("2019-11-3 12:00:00")
+def test_rate_limiter_daily_quota_in_storage():
+    """Tests that daily quota of a named limiter is kept in the storage backend,
+    so a new limiter, e.g. after a restart, doesn't spend it again.
+    """
+    wf.ratelimit.RateLimiter(daily_quota=2, name="travelpayouts").acquire()
+
+    limiter = wf.ratelimit.RateLimiter(daily_quota=2, name="travelpayouts")
+    assert limiter.remaining() == 1
+    limiter.acquire()
+    with pytest.raises(wf.ratelimit.QuotaExceeded):
+        limiter.acquire()
+    assert limiter.remaining() == 0
+    assert wf.storage.get_backend().add_requests("travelpayouts", "2019-11-03", 0) == 3
+
+
+def test_rate_limiter_without_limits():
+    """Tests that limiter without rate and quota doesn't limit."""
+
+    limiter = wf.ratelimit.RateLimiter()
+
+    for _ in range(100):
+        limiter.acquire()
+
+    assert limiter.remaining() is None
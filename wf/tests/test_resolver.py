@@ -0,0 +1,74 @@
+"""Tests for resolver module."""
+
+import pytest
+
+import wf.resolver
+import wf.searches
+
+
+@pytest.mark.parametrize("query, code", [
+    ("Лиссабон", "LIS"),
+    ("Lisbon", "LIS"),
+    ("lisabon", "LIS"),  # typo
+    ("Lissabon", "LIS"),  # transliteration
+    ("Шереметьево", "MOW"),  # airport
+    ("Санкт-Петербург", "LED"),
+    ("Moskva", "MOW"),
+])
+def test_resolve(query, code):
+    """Tests resolve() function on Russian and English names."""
+
+    assert wf.resolver.resolve(query) == code
+
+
+def test_resolve_unknown():
+    """Tests that nothing is resolved for names, which don't look like any place."""
+
+    assert wf.resolver.resolve("zzzz") is None
+    assert wf.resolver.suggest("!!!") == []
+
+
+@pytest.mark.parametrize("query", [
+    "Spain",  # countries are not resolved to similar cities, e.g. Port of Spain
+    "Portugal",
+    "Praha",  # weak matches
+    "Wien",
+    "München",
+    "Barcelna",  # Barcelona in Spain and in Venezuela are equally similar
+    "Alexandria",  # exact names of several places
+    "Александрия",
+    "Albany",
+    "Алтай",
+    "London",
+])
+def test_resolve_ambiguous(query):
+    """Tests that weak and ambiguous matches are not resolved."""
+
+    assert wf.resolver.resolve(query) is None
+    assert wf.resolver.suggest(query)
+
+
+def test_add_search_with_ambiguous_name():
+    """Tests that searches.add() rejects not resolved names and lists similar places."""
+
+    with pytest.raises(ValueError, match=r"'Portugal' is not resolved.*OPO \(portu\)"):
+        wf.searches.add("Portugal", ["Portugal"], 15000, "weekends", next_x_months=3)
+
+
+def test_add_search_with_names(storage_backend):
+    """Tests that searches.add() resolves names of destinations and keeps codes."""
+
+    wf.searches.add("Portugal", ["Лиссабон", "OPO", "PT", "Lisbon"], 15000, "weekends",
+                    next_x_months=3)
+
+    assert storage_backend.get_searches()[0]["destinations"] == ["LIS", "OPO", "PT"]
+
+    with pytest.raises(ValueError):
+        wf.searches.add("Nowhere", ["zzzz"], 15000, "weekends", next_x_months=3)
+
+
+def test_add_search_with_name_of_several_places():
+    """Tests that searches.add() rejects a name of several places and lists them."""
+
+    with pytest.raises(ValueError, match=r"'Александрия' is not resolved.*ALY"):
+        wf.searches.add("Egypt", ["Александрия"], 15000, "weekends", next_x_months=3)
@@ -0,0 +1,333 @@
+"""Tests for storage backends."""
+
+import datetime
+
+import mock
+import pytest
+
+from pymongo.errors import BulkWriteError
+
+import wf.storage
+
+from wf.storage.base import DuplicateSearchError, check_price_drop, is_price_drop
+from wf.storage.memory import MemoryStorage
+from wf.storage.mongo import MongoStorage
+from wf.storage.sqlite import SqliteStorage
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def storage(request, tmp_path):
+    """Returns offline storage backend."""
+
+    if request.param == "memory":
+        return MemoryStorage()
+    return SqliteStorage(str(tmp_path / "wf.sqlite"))
+
+
+def mock_flight(price, added_at=datetime.datetime(2019, 11, 3, 12, 0, 0), search_id="search"):
+    """Returns mocked flight document ready to be stored."""
+
+    return {
+        "origin": "Moscow",
+        "destination": "Porto",
+        "departure_date": "2019-11-12",
+        "arrival_date": "2019-11-26",
+        "price": price,
+        "found_at": datetime.datetime(2019, 11, 3, 9, 37, 26),
+        "search_id": search_id,
+        "added_at": added_at,
+        "is_new": True,
+    }
+
+
+def test_create_backend():
+    """Tests create_backend() function."""
+
+    assert isinstance(wf.storage.create_backend("memory"), MemoryStorage)
+    assert isinstance(wf.storage.create_backend("sqlite"), SqliteStorage)
+    with pytest.raises(ValueError):
+        wf.storage.create_backend("unknown")
+
+
+def test_searches(storage):
+    """Tests adding, getting and removing of searches."""
+
+    storage.add_search({"name": "Ufa", "is_active": True})
+    storage.add_search({"name": "Porto", "is_active": False})
+
+    with pytest.raises(DuplicateSearchError):
+        storage.add_search({"name": "Ufa"})
+
+    assert [search["name"] for search in storage.get_searches()] == ["Ufa", "Porto"]
+    assert [search["name"] for search in storage.get_searches(active_only=True)] == ["Ufa"]
+
+    storage.remove_search("Ufa")
+    assert [search["name"] for search in storage.get_searches()] == ["Porto"]
+
+
+def test_insert_unique_flights(storage):
+    """Tests that only unique flights are stored."""
+
+    inserted_flights = storage.insert_unique_flights([mock_flight(4200), mock_flight(4300)])
+    assert [flight["price"] for flight in inserted_flights] == [4200, 4300]
+
+    inserted_flights = storage.insert_unique_flights([mock_flight(4300), mock_flight(4400)])
+    assert [flight["price"] for flight in inserted_flights] == [4400]
+
+    stored_flights = storage.find_flights({"price": 4200})
+    assert len(stored_flights) == 1
+    assert stored_flights[0]["found_at"] == datetime.datetime(2019, 11, 3, 9, 37, 26)
+    assert len(storage.find_flights()) == 3
+
+
+def test_claim_new_flights(storage):
+    """Tests that new flights are claimed once."""
+
+    storage.insert_unique_flights([mock_flight(4200), mock_flight(4300)])
+    storage.insert_unique_flights([mock_flight(4400, search_id="other")])
+
+    new_flights = storage.claim_new_flights("search")
+
+    assert sorted(flight["price"] for flight in new_flights) == [4200, 4300]
+    assert all(not flight["is_new"] and flight["claim_id"] for flight in new_flights)
+    assert storage.claim_new_flights("search") == []
+    assert storage.find_flights({"is_new": True})[0]["price"] == 4400
+
+
+def test_expire_flights(storage):
+    """Tests that flights are deleted in FLIGHT_TTL seconds after adding."""
+
+    storage.insert_unique_flights([
+        mock_flight(4200, added_at=datetime.datetime(2019, 10, 1, 12, 0, 0)),
+        mock_flight(4300, added_at=datetime.datetime(2019, 11, 3, 12, 0, 0)),
+    ])
+
+    assert storage.expire_flights(now=datetime.datetime(2019, 11, 3, 12, 0, 0)) == 1
+    assert [flight["price"] for flight in storage.find_flights()] == [4300]
+
+    # expired flight can be stored again
+    assert storage.insert_unique_flights([mock_flight(4200)])
+
+
+def test_upsert_route_flights(storage):
+    """Tests that a flight of a route is kept once and is new again only on a price drop."""
+
+    new_flights = storage.upsert_route_flights([mock_flight(4500)], min_drop_amount=200)
+    assert [flight["notified_price"] for flight in new_flights] == [4500]
+    assert [flight["price"] for flight in storage.claim_new_flights("search")] == [4500]
+
+    # rise and too small drop update the price only
+    assert storage.upsert_route_flights([mock_flight(4700)], min_drop_amount=200) == []
+    assert storage.upsert_route_flights([mock_flight(4400)], min_drop_amount=200) == []
+    stored_flights = storage.find_flights()
+    assert len(stored_flights) == 1
+    assert stored_flights[0]["price"] == 4400
+    assert not stored_flights[0]["is_new"]
+
+    new_flights = storage.upsert_route_flights(
+        [mock_flight(4300, search_id="other")], min_drop_amount=200)
+    assert [flight["notified_price"] for flight in new_flights] == [4300]
+    assert storage.claim_new_flights("search") == []
+    assert [flight["price"] for flight in storage.claim_new_flights("other")] == [4300]
+    assert len(storage.find_flights()) == 1
+
+
+def test_is_price_drop():
+    """Tests is_price_drop() function."""
+
+    assert is_price_drop(4500, 4400)
+    assert not is_price_drop(4500, 4500)
+    assert not is_price_drop(4500, 4600)
+    assert is_price_drop(4500, 4000, min_drop_amount=500)
+    assert not is_price_drop(4500, 4100, min_drop_amount=500)
+    assert is_price_drop(5000, 4500, min_drop_percent=10)
+    assert not is_price_drop(5000, 4600, min_drop_percent=10)
+    assert not is_price_drop(5000, 4500, min_drop_amount=600, min_drop_percent=10)
+
+
+@pytest.mark.parametrize("min_drop_amount, min_drop_percent, is_valid", [
+    (0, 0, True),
+    (500, 99.9, True),
+    (-1, 0, False),
+    (0, -1, False),
+    (0, 100, False),
+    (0, 150, False),
+])
+def test_check_price_drop(min_drop_amount, min_drop_percent, is_valid):
+    """Tests that thresholds of a price drop are validated."""
+
+    if is_valid:
+        check_price_drop(min_drop_amount, min_drop_percent)
+        assert not is_price_drop(4500, 4500, min_drop_amount, min_drop_percent)
+    else:
+        with pytest.raises(ValueError):
+            check_price_drop(min_drop_amount, min_drop_percent)
+        with pytest.raises(ValueError):
+            is_price_drop(4500, 100, min_drop_amount, min_drop_percent)
+
+
+def test_upsert_route_flights_checks_price_drop(storage):
+    """Tests that invalid thresholds of a price drop are rejected before storing."""
+
+    with pytest.raises(ValueError):
+        storage.upsert_route_flights([mock_flight(4500)], min_drop_percent=100)
+    assert storage.find_flights() == []
+
+
+@mock.patch('wf.db.get_database')
+def test_mongo_insert_unique_flights(mocked_get_database):
+    """Tests that flights rejected by unique index are not returned."""
+
+    flights = [mock_flight(4200), mock_flight(4300), mock_flight(4400)]
+    mocked_insert_many = mocked_get_database.return_value.flights.insert_many
+    mocked_insert_many.side_effect = BulkWriteError({'writeErrors': [{'index': 1, 'code': 11000}]})
+
+    inserted_flights = MongoStorage().insert_unique_flights(flights)
+
+    mocked_insert_many.assert_called_once_with(flights, ordered=False)
+    assert [flight['price'] for flight in inserted_flights] == [4200, 4400]
+
+
+@mock.patch('wf.db.get_database')
+def test_mongo_insert_unique_flights_raises_other_errors(mocked_get_database):
+    """Tests that errors other than duplication are not hidden."""
+
+    mocked_get_database.return_value.flights.insert_many.side_effect = BulkWriteError(
+        {'writeErrors': [{'index': 0, 'code': 11000}, {'index': 1, 'code': 121}]})
+
+    with pytest.raises(BulkWriteError):
+        MongoStorage().insert_unique_flights([mock_flight(4200), mock_flight(4300)])
+
+
+@mock.patch('wf.db.get_database')
+def test_mongo_claim_new_flights(mocked_get_database):
+    """Tests that flights are claimed and read by the claim id."""
+
+    mocked_collection = mocked_get_database.return_value.flights
+    mocked_collection.update_many.return_value.modified_count = 2
+    mocked_collection.find.return_value = iter([{'price': 4200}, {'price': 4300}])
+
+    new_flights = MongoStorage().claim_new_flights('search_id')
+
+    assert new_flights == [{'price': 4200}, {'price': 4300}]
+    claim_filter, claim_update = mocked_collection.update_many.call_args.args
+    assert claim_filter == {'search_id': 'search_id', 'is_new': True}
+    assert claim_update['$set']['is_new'] is False
+    mocked_collection.find.assert_called_once_with(
+        {'claim_id': claim_update['$set']['claim_id']})
+
+
+@mock.patch('wf.db.get_database')
+def test_mongo_claim_without_new_flights(mocked_get_database):
+    """Tests that flights are not queried, if nothing was claimed."""
+
+    mocked_collection = mocked_get_database.return_value.flights
+    mocked_collection.update_many.return_value.modified_count = 0
+
+    assert MongoStorage().claim_new_flights('search_id') == []
+    assert not mocked_collection.find.called
+
+
+def test_price_history(storage):
+    """Tests that price history of a route is created and updated with observations."""
+
+    route = {
+        "origin": "Moscow",
+        "destination": "Porto",
+        "departure_date": "2019-11-12",
+        "arrival_date": "2019-11-26",
+    }
+    assert storage.get_price_history(route) is None
+
+    for price, hour in ((4550, 12), (4230, 15), (4510, 18)):
+        storage.record_prices([
+            dict(route, price=price, observed_at=datetime.datetime(2019, 11, 3, hour, 0, 0))])
+
+    history = storage.get_price_history(route)
+    assert history["min_price"] == 4230
+    assert history["last_price"] == 4510
+    assert history["observations"] == 3
+    assert history["histogram"] == {"4200": 1, "4500": 2}
+    assert history["first_observed_at"] == datetime.datetime(2019, 11, 3, 12, 0, 0)
+    assert history["last_observed_at"] == datetime.datetime(2019, 11, 3, 18, 0, 0)
+    assert storage.get_price_history(dict(route, destination="Lisbon")) is None
+
+
+def test_add_requests(storage):
+    """Tests that requests are counted by API and day."""
+
+    assert storage.add_requests("travelpayouts", "2019-11-03", 0) == 0
+    assert storage.add_requests("travelpayouts", "2019-11-03") == 1
+    assert storage.add_requests("travelpayouts", "2019-11-03", 2) == 3
+    assert storage.add_requests("travelpayouts", "2019-11-04") == 1
+    assert storage.add_requests("telegram", "2019-11-03", 0) == 0
+
+
+@mock.patch('wf.db.get_database')
+def test_mongo_add_requests(mocked_get_database):
+    """Tests that counter of the day is incremented by one upsert."""
+
+    mocked_find_one_and_update = mocked_get_database.return_value.requests.find_one_and_update
+    mocked_find_one_and_update.return_value = {"_id": "travelpayouts:2019-11-03", "spent": 3}
+
+    assert MongoStorage().add_requests("travelpayouts", "2019-11-03") == 3
+    assert mocked_find_one_and_update.call_args.args[:2] == (
+        {"_id": "travelpayouts:2019-11-03"},
+        {"$inc": {"spent": 1}, "$setOnInsert": {"name": "travelpayouts", "day": "2019-11-03"}},
+    )
+    assert mocked_find_one_and_update.call_args.kwargs["upsert"]
+
+
+@mock.patch('wf.db.get_database')
+def test_mongo_record_prices(mocked_get_database):
+    """Tests that prices of all routes are recorded with one bulk request of upserts."""
+
+    mocked_bulk_write = mocked_get_database.return_value.prices.bulk_write
+    observed_at = datetime.datetime(2019, 11, 3, 12, 0, 0)
+    flight = mock_flight(4200)
+    observations = [
+        dict(flight, price=4200, observed_at=observed_at),
+        dict(flight, destination="Lisbon", price=3950, observed_at=observed_at),
+    ]
+
+    MongoStorage().record_prices(observations)
+
+    requests = mocked_bulk_write.call_args.args[0]
+    assert mocked_bulk_write.call_args.kwargs == {'ordered': False}
+    assert len(requests) == 2
+    assert requests[1]._filter == {
+        'origin': 'Moscow',
+        'destination': 'Lisbon',
+        'departure_date': '2019-11-12',
+        'arrival_date': '2019-11-26',
+    }
+    assert requests[1]._doc['$inc'] == {'observations': 1, 'histogram.3900': 1}
+    assert requests[1]._doc['$min'] == {'min_price': 3950}
+    assert requests[1]._upsert
+
+    MongoStorage().record_prices([])
+    assert mocked_bulk_write.call_count == 1
+
+
+@mock.patch('wf.db.get_database')
+def test_mongo_upsert_route_flights(mocked_get_database):
+    """Tests that flights are upserted with one bulk request and read by the save id."""
+
+    mocked_collection = mocked_get_database.return_value.flights
+    mocked_collection.find.return_value = iter([{'price': 4000}])
+
+    new_flights = MongoStorage().upsert_route_flights([mock_flight(4000)], min_drop_amount=500)
+
+    assert new_flights == [{'price': 4000}]
+    mark_request, upsert_request = mocked_collection.bulk_write.call_args.args[0]
+    assert mark_request._filter['notified_price'] == {'$gt': 4000, '$gte': 4500}
+    assert mark_request._doc['$set']['is_new'] is True
+    assert upsert_request._filter == {
+        'destination': 'Porto', 'departure_date': '2019-11-12', 'arrival_date': '2019-11-26'}
+    assert upsert_request._doc['$set']['price'] == 4000
+    assert upsert_request._doc['$setOnInsert']['notified_price'] == 4000
+    assert upsert_request._upsert
+    save_id = mark_request._doc['$set']['save_id']
+    assert upsert_request._doc['$setOnInsert']['save_id'] == save_id
+    mocked_collection.find.assert_called_once_with(
+        {'destination': {'$in': ['Porto']}, 'save_id': save_id})
@@ -0,0 +1,111 @@
+"""Tests for transport module."""
+
+import mock
+import pytest
+import requests
+
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+import wf.ratelimit
+import wf.transport
+
+
+def mock_response(status_code, headers=None):
+    """Returns mocked response with given status code."""
+
+    response = mock.Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_get_session():
+    """Tests get_session() function: one session per host."""
+
+    session = wf.transport.get_session('https://api.example.com/v1/method')
+
+    assert wf.transport.get_session('https://api.example.com/v2/other') is session
+    assert wf.transport.get_session('https://example.org/') is not session
+
+
+@mock.patch('time.sleep')
+@mock.patch('requests.Session.request')
+def test_get_retries(mocked_request, mocked_sleep):
+    """Tests that GET is retried on connection errors and 5xx statuses
+    and that Retry-After header is respected.
+    """
+    mocked_request.side_effect = [
+        requests.ConnectionError(),
+        mock_response(503, headers={'Retry-After': '2'}),
+        mock_response(200),
+    ]
+
+    response = wf.transport.get('https://api.example.com/', params={'a': 1})
+
+    assert response.status_code == 200
+    assert mocked_request.call_count == 3
+    assert mocked_sleep.call_args_list[1] == mock.call(2.0)
+    assert mocked_request.call_args.kwargs['timeout'] == (
+        wf.transport.CONNECT_TIMEOUT, wf.transport.READ_TIMEOUT)
+
+
+@mock.patch('time.sleep')
+@mock.patch('requests.Session.request', return_value=mock_response(500))
+def test_post_is_not_retried_on_server_error(mocked_request, mocked_sleep):
+    """Tests that not idempotent POST is not retried on 5xx statuses."""
+
+    response = wf.transport.post('https://api.example.com/', json={})
+
+    assert response.status_code == 500
+    assert mocked_request.call_count == 1
+    assert not mocked_sleep.called
+
+
+@mock.patch('time.sleep')
+@mock.patch('requests.Session.request')
+def test_post_is_retried_only_if_not_connected(mocked_request, mocked_sleep):
+    """Tests that not idempotent POST is retried on refused connection,
+    but not when connection was lost after the request was sent.
+    """
+    refused_error = requests.ConnectionError(MaxRetryError(
+        None, 'https://api.example.com/', reason=NewConnectionError(None, 'Connection refused')))
+    mocked_request.side_effect = [refused_error, requests.ConnectTimeout(), mock_response(200)]
+
+    assert wf.transport.post('https://api.example.com/', json={}).status_code == 200
+    assert mocked_request.call_count == 3
+
+    mocked_request.reset_mock()
+    mocked_request.side_effect = [requests.ConnectionError('Connection aborted.')]
+
+    with pytest.raises(requests.ConnectionError):
+        wf.transport.post('https://api.example.com/', json={})
+    assert mocked_request.call_count == 1
+
+
+@mock.patch('time.sleep')
+@mock.patch('requests.Session.request', return_value=mock_response(429))
+def test_retries_are_limited(mocked_request, mocked_sleep):
+    """Tests that the last response is returned after MAX_RETRIES retries."""
+
+    response = wf.transport.post('https://api.example.com/', json={})
+
+    assert response.status_code == 429
+    assert mocked_request.call_count == wf.transport.MAX_RETRIES + 1
+    for call in mocked_sleep.call_args_list:
+        assert 0 <= call.args[0] <= wf.transport.BACKOFF_MAX
+
+
+@mock.patch('time.sleep')
+@mock.patch('requests.Session.request', return_value=mock_response(429))
+def test_retries_are_rate_limited(mocked_request, mocked_sleep):
+    """Tests that every attempt takes a token of the limiter
+    and retrying stops, when the quota is spent.
+    """
+    limiter = wf.ratelimit.RateLimiter(daily_quota=2)
+
+    with pytest.raises(wf.ratelimit.QuotaExceeded):
+        wf.transport.get('https://api.example.com/', limiter=limiter)
+
+    assert mocked_request.call_count == 2
+    assert limiter.remaining() == 0
+    assert 'limiter' not in mocked_request.call_args.kwargs
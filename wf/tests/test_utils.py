@@ -1,11 +1,70 @@
 # -*- coding: utf-8 -*-
 """Tests for utils module."""
 
+import datetime
+
 import wf.utils
 
 from freezegun import freeze_time
 
 
+@freeze_time("2019-12-02 12:00:00")
+def test_get_date_pairs_on_weekends():
+    """Tests get_date_pairs() function for weekends."""
+
+    date_pairs = wf.utils.get_date_pairs(on_weekends=True, next_x_months=1)
+
+    assert date_pairs == [
+        ('2019-12-05', '2019-12-08'),
+        ('2019-12-05', '2019-12-09'),
+        ('2019-12-05', '2019-12-10'),
+        ('2019-12-06', '2019-12-09'),
+        ('2019-12-06', '2019-12-10'),
+        ('2019-12-07', '2019-12-10'),
+        ('2019-12-12', '2019-12-15'),
+        ('2019-12-12', '2019-12-16'),
+        ('2019-12-12', '2019-12-17'),
+        ('2019-12-13', '2019-12-16'),
+        ('2019-12-13', '2019-12-17'),
+        ('2019-12-14', '2019-12-17'),
+        ('2019-12-19', '2019-12-22'),
+        ('2019-12-19', '2019-12-23'),
+        ('2019-12-19', '2019-12-24'),
+        ('2019-12-20', '2019-12-23'),
+        ('2019-12-20', '2019-12-24'),
+        ('2019-12-21', '2019-12-24'),
+        ('2019-12-26', '2019-12-29'),
+        ('2019-12-26', '2019-12-30'),
+        ('2019-12-26', '2019-12-31'),
+        ('2019-12-27', '2019-12-30'),
+        ('2019-12-27', '2019-12-31'),
+        ('2019-12-28', '2019-12-31'),
+    ]
+
+
+@freeze_time("2020-03-20 12:00:00")
+def test_date_pairs_rule():
+    """Tests that DatePairsRule checks pairs the same way as get_date_pairs() lists them."""
+
+    conditions = {
+        "departure_date": "2020-04-01",
+        "arrival_date": "2020-05-06",
+        "trip_min_length": 7,
+        "trip_max_length": 14,
+    }
+
+    rule = wf.utils.DatePairsRule(**conditions)
+    date_pairs = wf.utils.get_date_pairs(**conditions)
+
+    assert len(rule) == len(date_pairs)
+    assert list(wf.utils.iter_date_pairs(**conditions)) == date_pairs
+    assert all(date_pair in rule for date_pair in date_pairs)
+    assert ('2020-04-01', '2020-04-07') in rule
+    assert ('2020-04-01', '2020-04-16') not in rule
+    assert ('2020-04-30', '2020-05-07') not in rule
+    assert ('2020-03-25', '2020-04-01') not in rule
+
+
 @freeze_time("2019-11-3 12:00:00")
 def test_get_next_months():
     """Test get_next_months() function."""
@@ -49,3 +108,36 @@ def test_get_months_from_dates():
     }
 
     assert expected_result == result
+
+
+def test_date_pairs_index():
+    """Tests DatePairsIndex class."""
+
+    date_pairs = [
+        ('2019-12-05', '2019-12-08'),
+        ('2019-12-05', '2019-12-10'),
+        ('2019-12-30', '2020-01-02'),
+        ('2019-12-05', '2019-12-08'),
+    ]
+
+    index = wf.utils.DatePairsIndex(date_pairs)
+
+    assert len(index) == 3
+    assert ('2019-12-05', '2019-12-08') in index
+    assert ('2019-12-30', '2020-01-02') in index
+    assert ('2019-12-05', '2019-12-09') not in index
+    assert ('2019-12-06', '2019-12-08') not in index
+    assert ('2019-12-05', '2019-12-04') not in index
+    assert list(index) == sorted(set(date_pairs))
+    assert wf.utils.index_date_pairs(index) is index
+
+
+def test_parse_found_at():
+    """Tests parse_found_at() function."""
+
+    assert wf.utils.parse_found_at('2019-11-03T09:37:26') == \
+        datetime.datetime(2019, 11, 3, 9, 37, 26)
+    assert wf.utils.parse_found_at('2019-11-03T12:28:45.684687') == \
+        datetime.datetime(2019, 11, 3, 12, 28, 45, 684687)
+    assert wf.utils.parse_found_at('2019-11-03T12:28:45.6846') == \
+        datetime.datetime(2019, 11, 3, 12, 28, 45, 684600)
@@ -0,0 +1,169 @@
+"""Shared HTTP transport for all outbound calls.
+
+Keeps one pooled keep-alive session per host, so connections are reused between calls,
+sets connect and read timeouts to every request and retries failed requests
+with exponential backoff and jitter.
+
+Retry policy:
+    GET requests are retried on connection errors, timeouts and 429/5xx statuses;
+    other requests (e.g. POST) are not idempotent, so they are retried
+    only when connection couldn't be established (connect timeout, refused connection
+    or failed name resolution), so the request wasn't sent, or on 429 status.
+    Retry-After header of 429/503 responses is respected.
+Every attempt takes a token of the limiter of the request, if it is given,
+so retries are rate limited and counted against a quota as well, see wf.ratelimit.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+LOG = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT = float(os.environ.get('WF_HTTP_CONNECT_TIMEOUT', 5))  # seconds
+READ_TIMEOUT = float(os.environ.get('WF_HTTP_READ_TIMEOUT', 30))  # seconds
+MAX_RETRIES = int(os.environ.get('WF_HTTP_MAX_RETRIES', 3))
+BACKOFF_BASE = float(os.environ.get('WF_HTTP_BACKOFF_BASE', 0.5))  # seconds
+BACKOFF_MAX = 30  # seconds
+
+# maximum number of kept-alive connections to one host
+POOL_SIZE = int(os.environ.get('WF_HTTP_POOL_SIZE', 16))
+
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(url):
+    """Returns pooled session for the host of given url, creates it on the first call."""
+
+    host = urlsplit(url).netloc
+
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            LOG.debug(f"Creating HTTP session for {host}...")
+            session = _create_session()
+            _sessions[host] = session
+
+    return session
+
+
+def _create_session():
+    """Creates session with connection pool of POOL_SIZE connections."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+def close_sessions():
+    """Closes all sessions and their connections."""
+
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def get_backoff_delay(attempt):
+    """Returns delay before retry number `attempt` (starting from 0) in seconds.
+    Uses "full jitter": random delay up to exponentially growing limit.
+    """
+
+    limit = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)
+    return random.uniform(0, limit)  # nosec: not used for security
+
+
+def _get_retry_after(response):
+    """Returns delay requested by Retry-After header in seconds or None."""
+
+    try:
+        return min(BACKOFF_MAX, float(response.headers['Retry-After']))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _is_not_connected(error):
+    """Checks if the request error happened before connection was established,
+    so the request wasn't sent and can be retried even if it is not idempotent.
+    """
+
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def request(method, url, limiter=None, **kwargs):
+    """Makes HTTP request with retries, accepts the same arguments as requests.request().
+    Returns the last response, even if its status is not successful.
+    Raises connection errors if all attempts failed.
+
+    :param limiter: wf.ratelimit.RateLimiter to acquire before every attempt,
+        wf.ratelimit.QuotaExceeded stops retrying
+    """
+
+    method = method.upper()
+    kwargs.setdefault('timeout', (CONNECT_TIMEOUT, READ_TIMEOUT))
+    is_idempotent = method in IDEMPOTENT_METHODS
+    session = get_session(url)
+
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire()
+
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            can_retry = is_idempotent or _is_not_connected(e)
+            if not can_retry or attempt >= MAX_RETRIES:
+                raise
+            delay = get_backoff_delay(attempt)
+            reason = type(e).__name__
+        else:
+            can_retry = response.status_code == 429 or (
+                is_idempotent and response.status_code in RETRY_STATUSES)
+            if not can_retry or attempt >= MAX_RETRIES:
+                return response
+            delay = _get_retry_after(response)
+            if delay is None:
+                delay = get_backoff_delay(attempt)
+            reason = f"status {response.status_code}"
+
+        # neither url path nor error message are logged, since they may contain tokens
+        LOG.warning(f"{method} request to {urlsplit(url).netloc} failed with {reason}, "
+                    f"retrying in {delay:.2f}s ({attempt + 1}/{MAX_RETRIES})")
+        time.sleep(delay)
+        attempt += 1
+
+
+def get(url, **kwargs):
+    """Makes GET request, see request()."""
+
+    return request('GET', url, **kwargs)
+
+
+def post(url, **kwargs):
+    """Makes POST request, see request()."""
+
+    return request('POST', url, **kwargs)
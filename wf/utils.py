@@ -6,6 +6,7 @@ TODO:
     * add tools to convert cities and countries names
 """
 
+import functools
 import logging
 import logging.handlers
 import sys
@@ -186,54 +187,198 @@ def get_date_pairs(departure_date=None, arrival_date=None,
         Func returns all existing pairs of dates from departure date until arrival dates
         in tuples with minimum seven days of trip, and maximum 14 days of trip
     """
-    if ((next_x_months is not None and (departure_date is not None or arrival_date is not None)) or
-            (next_x_months is None and (departure_date is None or arrival_date is None))):
-        raise ValueError("Either next_x_months or both departure_date and arrival_date "
-                         "has to be specified, but not all of them.")
-
-    if next_x_months is not None:
-        departure_date = date.today()
-        arrival_month = (departure_date.year, departure_date.month)
-        for i in range(next_x_months):
-            arrival_month = nextmonth(*arrival_month)
-        arrival_date = date(*arrival_month, 1)
-    else:
-        departure_date = date(*[int(elem) for elem in departure_date.split('-')])
-        arrival_date = date(*[int(elem) for elem in arrival_date.split('-')])
-        if arrival_date < date.today():
-            raise ValueError("Given dates already passed")
-        if departure_date < date.today():
+    return list(DatePairsRule(
+        departure_date=departure_date,
+        arrival_date=arrival_date,
+        on_weekends=on_weekends,
+        next_x_months=next_x_months,
+        trip_min_length=trip_min_length,
+        trip_max_length=trip_max_length,
+    ))
+
+
+def iter_date_pairs(departure_date=None, arrival_date=None,
+                    on_weekends=False, next_x_months=None,
+                    trip_min_length=3, trip_max_length=7):
+    """Lazy version of get_date_pairs(): yields the same pairs of dates one by one."""
+
+    return iter(DatePairsRule(
+        departure_date=departure_date,
+        arrival_date=arrival_date,
+        on_weekends=on_weekends,
+        next_x_months=next_x_months,
+        trip_min_length=trip_min_length,
+        trip_max_length=trip_max_length,
+    ))
+
+
+class DatePairsRule():
+    """Pairs of dates suitable for given conditions, see get_date_pairs() for conditions.
+
+    Pairs are not stored: they are generated lazily on iteration,
+    and checks if a pair is suitable are made by arithmetic on date ordinals,
+    so the rule takes the same memory for a weekend and for a year-long vacation.
+    """
+
+    def __init__(self, departure_date=None, arrival_date=None,
+                 on_weekends=False, next_x_months=None,
+                 trip_min_length=3, trip_max_length=7):
+        if ((next_x_months is not None and
+                (departure_date is not None or arrival_date is not None)) or
+                (next_x_months is None and (departure_date is None or arrival_date is None))):
+            raise ValueError("Either next_x_months or both departure_date and arrival_date "
+                             "has to be specified, but not all of them.")
+
+        if next_x_months is not None:
             departure_date = date.today()
-        if arrival_date <= departure_date:
-            raise ValueError("Departure date must be sooner than arrival date.")
+            arrival_month = (departure_date.year, departure_date.month)
+            for i in range(next_x_months):
+                arrival_month = nextmonth(*arrival_month)
+            arrival_date = date(*arrival_month, 1)
+        else:
+            departure_date = date(*[int(elem) for elem in departure_date.split('-')])
+            arrival_date = date(*[int(elem) for elem in arrival_date.split('-')])
+            if arrival_date < date.today():
+                raise ValueError("Given dates already passed")
+            if departure_date < date.today():
+                departure_date = date.today()
+            if arrival_date <= departure_date:
+                raise ValueError("Departure date must be sooner than arrival date.")
+
+        self.on_weekends = on_weekends
+        self.trip_min_length = trip_min_length
+        self.trip_max_length = trip_max_length
+        self.__first_ordinal = departure_date.toordinal()
+        self.__last_ordinal = arrival_date.toordinal()
+
+    def __repr__(self):
+        first_date = date.fromordinal(self.__first_ordinal)
+        last_date = date.fromordinal(self.__last_ordinal)
+        return f"DatePairsRule({first_date} - {last_date}, on_weekends={self.on_weekends})"
+
+    def __iter__(self):
+        for departure_ordinal in range(self.__first_ordinal, self.__last_ordinal + 1):
+            departure_date = str(date.fromordinal(departure_ordinal))
+            for trip_length in self._get_trip_lengths(departure_ordinal):
+                arrival_date = date.fromordinal(departure_ordinal + trip_length)
+                yield departure_date, str(arrival_date)
+
+    def __len__(self):
+        return sum(
+            len(self._get_trip_lengths(departure_ordinal))
+            for departure_ordinal in range(self.__first_ordinal, self.__last_ordinal + 1)
+        )
+
+    def __contains__(self, date_pair):
+        try:
+            departure_ordinal = date.fromisoformat(date_pair[0]).toordinal()
+            arrival_ordinal = date.fromisoformat(date_pair[1]).toordinal()
+        except (TypeError, ValueError):
+            return False
+
+        if not self.__first_ordinal <= departure_ordinal <= self.__last_ordinal:
+            return False
+
+        return arrival_ordinal - departure_ordinal in self._get_trip_lengths(departure_ordinal)
+
+    def _get_trip_lengths(self, departure_ordinal):
+        """Returns range of suitable trip lengths in days for given departure date ordinal."""
+
+        if self.on_weekends:
+            # trip has to end before the next Wednesday, trips from Wednesday are not suitable
+            weekday = (departure_ordinal + 6) % 7
+            days_to_wednesday = (2 - weekday) % 7
+            return range(self.trip_min_length, days_to_wednesday)
+
+        max_trip_length = min(self.trip_max_length, self.__last_ordinal - departure_ordinal)
+        return range(self.trip_min_length - 1, max_trip_length + 1)
+
+
+class DatePairsIndex():
+    """Set of date pairs made for fast checks if a pair of dates is suitable.
+
+    For every departure date keeps a bitmap of suitable trip lengths in days,
+    so a check takes one dict lookup and parsing of the arrival date,
+    instead of a scan over the whole list of pairs from get_date_pairs().
+    Pairs are tuples of dates in YYYY-MM-DD format, e.g. ('2019-12-05', '2019-12-08').
+    """
 
-    result = []
+    def __init__(self, date_pairs=()):
+        self.__trip_lengths = {}  # departure date -> (departure date ordinal, bitmap)
+        self.__size = 0
 
-    one_day = timedelta(days=1)
-    while departure_date <= arrival_date:
-        if on_weekends:
-            week_day = WEEKDAYS[departure_date.weekday()]
+        for departure_date, arrival_date in date_pairs:
+            self.add(departure_date, arrival_date)
 
-            if week_day == "Wednesday":
-                departure_date += one_day
-                continue
+    def __repr__(self):
+        return f"DatePairsIndex({self.__size} pairs)"
 
-            diff = timedelta(days=trip_min_length)
-            while departure_date + diff < get_next_wednesday(str(departure_date)):
-                date_pair = (str(departure_date), str(departure_date + diff))
-                result.append(date_pair)
-                diff += timedelta(days=1)
+    def __len__(self):
+        return self.__size
 
-        else:
-            for trip_length in range(trip_min_length-1, trip_max_length+1):
-                trip_length = timedelta(days=trip_length)
-                if departure_date + trip_length <= arrival_date:
-                    date_pair = (str(departure_date), str(departure_date + trip_length))
-                    result.append(date_pair)
+    def __iter__(self):
+        for departure_date, (departure_ordinal, bitmap) in sorted(self.__trip_lengths.items()):
+            trip_length = 0
+            while bitmap:
+                if bitmap & 1:
+                    arrival_date = date.fromordinal(departure_ordinal + trip_length)
+                    yield departure_date, str(arrival_date)
+                bitmap >>= 1
+                trip_length += 1
+
+    def __contains__(self, date_pair):
+        departure_date, arrival_date = date_pair
+
+        entry = self.__trip_lengths.get(departure_date)
+        if entry is None:
+            return False
+
+        departure_ordinal, bitmap = entry
+        try:
+            trip_length = date.fromisoformat(arrival_date).toordinal() - departure_ordinal
+        except (TypeError, ValueError):
+            return False
 
-        departure_date += one_day
+        return trip_length >= 0 and bool(bitmap >> trip_length & 1)
 
-    return result
+    def add(self, departure_date, arrival_date):
+        """Adds a pair of dates to the index."""
+
+        departure_ordinal = date.fromisoformat(departure_date).toordinal()
+        trip_length = date.fromisoformat(arrival_date).toordinal() - departure_ordinal
+        if trip_length < 0:
+            raise ValueError(f"Arrival date {arrival_date} is before "
+                             f"departure date {departure_date}.")
+
+        _, bitmap = self.__trip_lengths.get(departure_date, (departure_ordinal, 0))
+        if not bitmap >> trip_length & 1:
+            self.__size += 1
+        self.__trip_lengths[departure_date] = (departure_ordinal, bitmap | 1 << trip_length)
+
+
+def index_date_pairs(date_pairs):
+    """Returns DatePairsIndex of given date pairs.
+    DatePairsIndex and DatePairsRule are returned as is, since they are fast to check.
+    """
+
+    if isinstance(date_pairs, (DatePairsIndex, DatePairsRule)):
+        return date_pairs
+    return DatePairsIndex(date_pairs)
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_found_at(found_at):
+    """Parses time of flight finding from '2019-11-03T09:37:26' or
+    '2019-11-03T12:28:45.684687' format to datetime.
+
+    Results are cached, so the same timestamp is parsed once,
+    even if it is needed both for filtering and formatting of a flight.
+    """
+    try:
+        return datetime.fromisoformat(found_at)
+    except ValueError:
+        # fromisoformat() doesn't accept fractions of seconds other than 3 or 6 digits
+        return datetime.strptime(found_at, '%Y-%m-%dT%H:%M:%S.%f')
 
 
 def create_aviasales_link(origin, departure_date, destination, arrival_date):
@@ -255,6 +400,7 @@ def create_aviasales_link(origin, departure_date, destination, arrival_date):
     return link
 
 
+@functools.lru_cache(maxsize=1024)
 def get_weekday(date_string):
     """Returns weekday of given date.
     Date should be in YYYY-MM-DD format.
@@ -274,6 +420,7 @@ def nextmonth(year, month):
         return year, month+1
 
 
+@functools.lru_cache(maxsize=1024)
 def get_readable_date(date):
     """Changes date format from '2020-02-02' to readable '2 февраля'."""
 